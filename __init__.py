@@ -1,65 +1,63 @@
-# Core services
-from veevavault.client import VaultClient
-from veevavault.services.authentication import AuthenticationService
-from veevavault.services.domains import DomainService
-
-# Document and binder services
-from veevavault.services.documents import DocumentService
-from veevavault.services.binders import BinderService
-
-# Object and metadata services
-from veevavault.services.objects import ObjectService
-from veevavault.services.picklists import PicklistService
-from veevavault.services.queries import QueryService
-
-# MDL and Java SDK services
-from veevavault.services.mdl import MDLService
-from veevavault.services.vault_java_sdk import VaultJavaSdkService
-
-# Workflow and lifecycle services
-from veevavault.services.workflows import (
-    WorkflowService,
-    WorkflowTaskService,
-    BulkWorkflowActionService,
-)
-from veevavault.services.lifecycle_and_workflow import (
-    DocumentLifecycleWorkflowService,
-    ObjectLifecycleWorkflowService,
-)
-
-# Application-specific services
-from veevavault.services.applications.clinical_operations import (
-    ClinicalOperationsService,
-)
-from veevavault.services.applications.quality_docs import QualityDocsService
-from veevavault.services.applications.qms import QMSService
-from veevavault.services.applications.quality_one import QualityOneService
-from veevavault.services.applications.rim_submissions import RIMSubmissionsService
-from veevavault.services.applications.rim_submissions_archive import (
-    RIMSubmissionsArchiveService,
-)
-from veevavault.services.applications.safety import SafetyService
-from veevavault.services.applications.site_vault import SiteVaultService
-
-# User and security services
-from veevavault.services.users import UserService
-from veevavault.services.groups import GroupsService
-from veevavault.services.security_policies import SecurityPoliciesService
-from veevavault.services.scim import SCIMService
-
-# Configuration and migration services
-from veevavault.services.configuration_migration import ConfigurationMigrationService
-from veevavault.services.bulk_translation import BulkTranslationService
-from veevavault.services.custom_pages import CustomPagesService
-from veevavault.services.vault_loader import VaultLoaderService
-from veevavault.services.sandbox_vaults import SandboxVaultsService
-
-# Utility services
-from veevavault.services.logs import LogsService
-from veevavault.services.jobs import JobsService
-from veevavault.services.file_staging import FileStagingService
-from veevavault.services.directdata import DirectDataService
-from veevavault.services.edl import EDLService
+"""
+Python client library for the Veeva Vault API.
+
+Service classes are exported lazily (PEP 562): ``import veevavault`` only
+defines the name-to-module table below, and each service module is imported
+the first time its class is accessed. This keeps start-up cheap for short-lived
+scripts that only touch one or two services.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+_LAZY_EXPORTS = {
+    # Core services
+    "VaultClient": "veevavault.client",
+    "AuthenticationService": "veevavault.services.authentication",
+    "DomainService": "veevavault.services.domains",
+    # Document and binder services
+    "DocumentService": "veevavault.services.documents",
+    "BinderService": "veevavault.services.binders",
+    # Object and metadata services
+    "ObjectService": "veevavault.services.objects",
+    "PicklistService": "veevavault.services.picklists",
+    "QueryService": "veevavault.services.queries",
+    # MDL and Java SDK services
+    "MDLService": "veevavault.services.mdl",
+    "VaultJavaSdkService": "veevavault.services.vault_java_sdk",
+    # Workflow and lifecycle services
+    "WorkflowService": "veevavault.services.workflows",
+    "WorkflowTaskService": "veevavault.services.workflows",
+    "BulkWorkflowActionService": "veevavault.services.workflows",
+    "DocumentLifecycleWorkflowService": "veevavault.services.lifecycle_and_workflow",
+    "ObjectLifecycleWorkflowService": "veevavault.services.lifecycle_and_workflow",
+    # Application-specific services
+    "ClinicalOperationsService": "veevavault.services.applications.clinical_operations",
+    "QualityDocsService": "veevavault.services.applications.quality_docs",
+    "QMSService": "veevavault.services.applications.qms",
+    "QualityOneService": "veevavault.services.applications.quality_one",
+    "RIMSubmissionsService": "veevavault.services.applications.rim_submissions",
+    "RIMSubmissionsArchiveService": "veevavault.services.applications.rim_submissions_archive",
+    "SafetyService": "veevavault.services.applications.safety",
+    "SiteVaultService": "veevavault.services.applications.site_vault",
+    # User and security services
+    "UserService": "veevavault.services.users",
+    "GroupsService": "veevavault.services.groups",
+    "SecurityPoliciesService": "veevavault.services.security_policies",
+    "SCIMService": "veevavault.services.scim",
+    # Configuration and migration services
+    "ConfigurationMigrationService": "veevavault.services.configuration_migration",
+    "BulkTranslationService": "veevavault.services.bulk_translation",
+    "CustomPagesService": "veevavault.services.custom_pages",
+    "VaultLoaderService": "veevavault.services.vault_loader",
+    "SandboxVaultsService": "veevavault.services.sandbox_vaults",
+    # Utility services
+    "LogsService": "veevavault.services.logs",
+    "JobsService": "veevavault.services.jobs",
+    "FileStagingService": "veevavault.services.file_staging",
+    "DirectDataService": "veevavault.services.directdata",
+    "EDLService": "veevavault.services.edl",
+}
 
 __all__ = [
     # Core services
@@ -109,3 +107,83 @@ __all__ = [
     "DirectDataService",
     "EDLService",
 ]
+
+
+def __getattr__(name):
+    """Import the module that defines ``name`` on first access and cache it."""
+    module_path = _LAZY_EXPORTS.get(name)
+    if module_path is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(module_path), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    # Core services
+    from veevavault.client import VaultClient
+    from veevavault.services.authentication import AuthenticationService
+    from veevavault.services.domains import DomainService
+
+    # Document and binder services
+    from veevavault.services.documents import DocumentService
+    from veevavault.services.binders import BinderService
+
+    # Object and metadata services
+    from veevavault.services.objects import ObjectService
+    from veevavault.services.picklists import PicklistService
+    from veevavault.services.queries import QueryService
+
+    # MDL and Java SDK services
+    from veevavault.services.mdl import MDLService
+    from veevavault.services.vault_java_sdk import VaultJavaSdkService
+
+    # Workflow and lifecycle services
+    from veevavault.services.workflows import (
+        WorkflowService,
+        WorkflowTaskService,
+        BulkWorkflowActionService,
+    )
+    from veevavault.services.lifecycle_and_workflow import (
+        DocumentLifecycleWorkflowService,
+        ObjectLifecycleWorkflowService,
+    )
+
+    # Application-specific services
+    from veevavault.services.applications.clinical_operations import (
+        ClinicalOperationsService,
+    )
+    from veevavault.services.applications.quality_docs import QualityDocsService
+    from veevavault.services.applications.qms import QMSService
+    from veevavault.services.applications.quality_one import QualityOneService
+    from veevavault.services.applications.rim_submissions import RIMSubmissionsService
+    from veevavault.services.applications.rim_submissions_archive import (
+        RIMSubmissionsArchiveService,
+    )
+    from veevavault.services.applications.safety import SafetyService
+    from veevavault.services.applications.site_vault import SiteVaultService
+
+    # User and security services
+    from veevavault.services.users import UserService
+    from veevavault.services.groups import GroupsService
+    from veevavault.services.security_policies import SecurityPoliciesService
+    from veevavault.services.scim import SCIMService
+
+    # Configuration and migration services
+    from veevavault.services.configuration_migration import ConfigurationMigrationService
+    from veevavault.services.bulk_translation import BulkTranslationService
+    from veevavault.services.custom_pages import CustomPagesService
+    from veevavault.services.vault_loader import VaultLoaderService
+    from veevavault.services.sandbox_vaults import SandboxVaultsService
+
+    # Utility services
+    from veevavault.services.logs import LogsService
+    from veevavault.services.jobs import JobsService
+    from veevavault.services.file_staging import FileStagingService
+    from veevavault.services.directdata import DirectDataService
+    from veevavault.services.edl import EDLService
@@ -0,0 +1,41 @@
+"""
+Shared helpers for the library benchmarks.
+
+The library is imported as ``veevavault`` from its parent directory. When the
+checkout lives under another directory name, a temporary symlink named
+``veevavault`` is created so the benchmarks can run from any clone.
+"""
+
+import os
+import sys
+import tempfile
+
+PACKAGE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def package_search_path():
+    """
+    Return a directory from which ``import veevavault`` resolves to this checkout.
+
+    Returns:
+        str: Directory to prepend to ``sys.path`` / ``PYTHONPATH``
+    """
+    if os.path.basename(PACKAGE_ROOT) == "veevavault":
+        return os.path.dirname(PACKAGE_ROOT)
+
+    link_dir = os.path.join(tempfile.gettempdir(), "veevavault_benchmarks")
+    link_path = os.path.join(link_dir, "veevavault")
+    os.makedirs(link_dir, exist_ok=True)
+    if os.path.realpath(link_path) != PACKAGE_ROOT:
+        if os.path.lexists(link_path):
+            os.remove(link_path)
+        os.symlink(PACKAGE_ROOT, link_path)
+    return link_dir
+
+
+def ensure_importable():
+    """Make ``import veevavault`` resolve to this checkout in the current process."""
+    search_path = package_search_path()
+    if search_path not in sys.path:
+        sys.path.insert(0, search_path)
+    return search_path
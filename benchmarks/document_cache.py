@@ -0,0 +1,82 @@
+"""
+Latency of document version downloads served from the document content cache.
+
+Fills a temporary cache with synthetic document version files (sent through
+VaultClient with _send patched out) and reports the mean and 99th
+percentile time of download_document_version_file for a cached version, in
+this process and in a second cache instance opened on the same directory.
+
+Usage:
+    python benchmarks/document_cache.py
+    python benchmarks/document_cache.py --size-kb 10240 --lookups 200
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from unittest import mock
+
+import requests
+
+from _common import ensure_importable
+
+ensure_importable()
+
+from veevavault.client import DocumentContentCache, VaultClient
+from veevavault.services.documents import DocumentRetrievalService
+
+
+def make_client(cache):
+    """Return a VaultClient whose outermost middleware is the cache."""
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.add_middleware(cache, index=0)
+    return client
+
+
+def download_ms(client, documents, lookups):
+    """Return per-call times in milliseconds of repeated cached downloads."""
+    service = DocumentRetrievalService(client)
+    times = []
+    for i in range(lookups):
+        start = time.perf_counter()
+        service.download_document_version_file(i % documents + 1, 1, 0)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-kb", type=int, default=1024)
+    parser.add_argument("--documents", type=int, default=20)
+    parser.add_argument("--lookups", type=int, default=500)
+    args = parser.parse_args(argv)
+
+    def send(self, request):
+        response = requests.Response()
+        response.status_code = 200
+        response.headers["Content-Type"] = "application/pdf"
+        response._content = request.url.encode("utf-8").ljust(args.size_kb * 1024, b"\0")
+        return response
+
+    with tempfile.TemporaryDirectory() as directory, mock.patch.object(VaultClient, "_send", send):
+        path = os.path.join(directory, "documents")
+        writer = DocumentContentCache(path)
+        download_ms(make_client(writer), args.documents, args.documents)
+
+        print(f"{args.documents} versions of {args.size_kb} KB, {args.lookups} downloads")
+        print(f"{'cache':<16} {'mean [ms]':>10} {'p99 [ms]':>10}")
+        for label, cache in (("same instance", writer), ("second instance", DocumentContentCache(path))):
+            times = sorted(download_ms(make_client(cache), args.documents, args.lookups))
+            p99 = times[int(len(times) * 0.99) - 1]
+            print(f"{label:<16} {statistics.mean(times):>10.3f} {p99:>10.3f}")
+            cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,130 @@
+"""
+Import-time benchmark for the ``veevavault`` package.
+
+Runs ``python -X importtime`` in fresh interpreters and reports the cumulative
+cost of importing the package. The run fails (exit code 1) when the median
+exceeds the budget or when a heavy optional dependency such as pandas is pulled
+in at import time, so it can guard the lazy-loading behaviour in CI.
+
+Usage:
+    python benchmarks/import_time.py
+    python benchmarks/import_time.py --runs 9
+    python benchmarks/import_time.py --budget-ms 250 \
+        --statement "import veevavault; veevavault.DocumentService"
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from _common import package_search_path
+
+# Heavy optional dependencies that importing the package or a service must not pull in
+FORBIDDEN_MODULES = ("pandas", "numpy")
+
+
+def measure(statement, search_path):
+    """
+    Run ``statement`` under ``-X importtime`` and parse the report.
+
+    Args:
+        statement (str): Python statement to execute
+        search_path (str): Directory containing the ``veevavault`` package
+
+    Returns:
+        dict: Top-level module name -> (cumulative microseconds, indentation)
+            for every module imported while running the statement
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(
+        p for p in (search_path, env.get("PYTHONPATH")) if p
+    )
+
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Benchmark statement failed:\n{result.stderr}")
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        indent = len(name) - len(name.lstrip())
+        modules[name.strip()] = (int(cumulative_us), indent)
+    return modules
+
+
+def attributable_cost(modules, startup_modules):
+    """
+    Sum the cumulative time of top-level imports not done at interpreter start.
+
+    Args:
+        modules (dict): Output of ``measure`` for the benchmark statement
+        startup_modules (dict): Output of ``measure`` for ``pass``
+
+    Returns:
+        int: Microseconds attributable to the benchmark statement
+    """
+    new = {n: v for n, v in modules.items() if n not in startup_modules}
+    if not new:
+        return 0
+    top_indent = min(indent for _, indent in new.values())
+    return sum(us for us, indent in new.values() if indent == top_indent)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--statement", default="import veevavault")
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=25.0,
+        help="Fail when the median cumulative import time exceeds this budget",
+    )
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args(argv)
+
+    search_path = package_search_path()
+
+    # Warm the bytecode cache so the first run is not penalised
+    measure(args.statement, search_path)
+    startup_modules = measure("pass", search_path)
+
+    totals = []
+    modules = {}
+    for _ in range(args.runs):
+        modules = measure(args.statement, search_path)
+        totals.append(attributable_cost(modules, startup_modules))
+    modules = {n: v for n, v in modules.items() if n not in startup_modules}
+
+    median_ms = statistics.median(totals) / 1000
+    print(f"statement: {args.statement}")
+    print(f"runs: {args.runs}  median: {median_ms:.1f} ms  min: {min(totals) / 1000:.1f} ms")
+    print(f"modules imported: {len(modules)}")
+    print("slowest modules (cumulative):")
+    slowest = sorted(modules.items(), key=lambda kv: -kv[1][0])[: args.top]
+    for name, (cumulative, _) in slowest:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+    failures = []
+    leaked = [m for m in FORBIDDEN_MODULES if m in modules]
+    if leaked:
+        failures.append(f"heavy modules imported eagerly: {', '.join(leaked)}")
+    if median_ms > args.budget_ms:
+        failures.append(f"median {median_ms:.1f} ms exceeds budget {args.budget_ms:.1f} ms")
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,118 @@
+"""
+CPU cost of decoding large Vault responses in VaultClient.api_call.
+
+Builds a synthetic VQL result page and sends it through VaultClient with
+requests.request patched, so only response handling is measured. The
+``double`` row decodes the body twice with requests' response.json(), as
+api_call did before the body was decoded once; the other rows decode it once
+through each installed JSON backend.
+
+Usage:
+    python benchmarks/json_decode.py
+    python benchmarks/json_decode.py --records 50000 --repeat 10
+"""
+
+import argparse
+import json
+import sys
+import time
+from unittest import mock
+
+import requests
+
+from _common import ensure_importable
+
+ensure_importable()
+
+from veevavault.client import VaultClient, get_json_backend, set_json_backend
+
+
+def build_body(records):
+    """
+    Build a VQL query response body.
+
+    Args:
+        records (int): Number of records in the page
+
+    Returns:
+        bytes: JSON body
+    """
+    data = [
+        {
+            "id": f"V0B{i:012d}",
+            "name__v": f"Record {i}",
+            "status__v": ["active__v"],
+            "created_date__v": "2024-05-01T10:15:30.000Z",
+            "modified_date__v": "2024-06-11T08:00:00.000Z",
+            "description__c": "Lorem ipsum dolor sit amet, consectetur adipiscing elit " * 2,
+            "quantity__c": i * 1.5,
+            "product__cr": {"responseDetails": {"size": 1}, "data": [{"name__v": "Product"}]},
+        }
+        for i in range(records)
+    ]
+    body = {
+        "responseStatus": "SUCCESS",
+        "responseDetails": {"pagesize": records, "pageoffset": 0, "size": records, "total": records},
+        "data": data,
+    }
+    return json.dumps(body).encode("utf-8")
+
+
+def make_response(body):
+    """Wrap a body in a successful JSON requests.Response."""
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.headers["Content-Type"] = "application/json;charset=UTF-8"
+    return response
+
+
+def cpu_ms(function, repeat):
+    """Return the best CPU time of one call in milliseconds."""
+    best = None
+    for _ in range(repeat):
+        start = time.process_time()
+        function()
+        elapsed = time.process_time() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1000
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    body = build_body(args.records)
+    megabytes = len(body) / 1e6
+    response = make_response(body)
+
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+
+    def double_decode():
+        response_data = response.json()
+        response_data.get("errors")
+        return response.json()
+
+    rows = [("double", cpu_ms(double_decode, args.repeat))]
+    for backend in ("json", "ujson", "orjson"):
+        try:
+            set_json_backend(backend)
+        except ImportError:
+            continue
+        with mock.patch("requests.request", return_value=response):
+            rows.append((backend, cpu_ms(lambda: client.api_call("api/v25.2/query"), args.repeat)))
+    set_json_backend("auto")
+
+    print(f"body: {megabytes:.1f} MB, {args.records} records, default backend: {get_json_backend()}")
+    print(f"{'decode':<10} {'cpu [ms]':>10} {'cpu [ms/MB]':>12}")
+    for label, millis in rows:
+        print(f"{label:<10} {millis:>10.1f} {millis / megabytes:>12.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+"""
+Peak memory of reading a large Vault response whole versus streamed.
+
+Sends a synthetic VQL page with record properties through VaultClient with
+requests.request patched to serve the body in chunks, and reports the peak
+traced memory of counting its records with a full decode and with
+api_call(..., stream_data=True).
+
+Usage:
+    python benchmarks/json_stream_memory.py
+    python benchmarks/json_stream_memory.py --records 100000
+"""
+
+import argparse
+import gc
+import io
+import sys
+import tracemalloc
+from unittest import mock
+
+import requests
+
+from _common import ensure_importable
+from json_decode import build_body
+
+ensure_importable()
+
+from veevavault.client import VaultClient, set_json_backend
+
+
+def make_response(body):
+    """Wrap a body in a successful JSON requests.Response read from a stream."""
+    response = requests.Response()
+    response.status_code = 200
+    response.raw = io.BytesIO(body)
+    response.headers["Content-Type"] = "application/json;charset=UTF-8"
+    return response
+
+
+def peak_mb(client, body, stream_data):
+    """Return the peak traced memory in MB of counting the records of one page."""
+    gc.collect()
+    with mock.patch("requests.request", return_value=make_response(body)):
+        tracemalloc.start()
+        if stream_data:
+            with client.api_call("api/v25.2/query", stream_data=True) as records:
+                count = sum(1 for _ in records)
+        else:
+            count = len(client.api_call("api/v25.2/query")["data"])
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return count, peak / 1e6
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--records", type=int, default=20000)
+    args = parser.parse_args(argv)
+
+    # The stdlib decoder's allocations are visible to tracemalloc
+    set_json_backend("json")
+    body = build_body(args.records)
+
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+
+    print(f"body: {len(body) / 1e6:.1f} MB, {args.records} records (body held outside the trace)")
+    print(f"{'mode':<10} {'records':>8} {'peak [MB]':>10}")
+    for label, stream_data in (("whole", False), ("streamed", True)):
+        count, megabytes = peak_mb(client, body, stream_data)
+        print(f"{label:<10} {count:>8} {megabytes:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
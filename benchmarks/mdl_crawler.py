@@ -0,0 +1,76 @@
+"""
+Throughput of the MDL crawler against a simulated Vault.
+
+Crawls a fake client with a fixed per-request latency (no network) into a
+temporary directory and reports records per second for several worker counts.
+With max_workers=1 the crawl is as slow as calling MDLService one record at
+a time.
+
+Usage:
+    python benchmarks/mdl_crawler.py
+    python benchmarks/mdl_crawler.py --types 20 --records 50 --latency-ms 30
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+
+from _common import ensure_importable
+
+ensure_importable()
+
+from veevavault.services.mdl import MDLCrawler
+
+
+class _Response:
+    def __init__(self, text):
+        self.text = text
+
+
+class SimulatedVault:
+    """Answers the crawler's requests after a fixed latency."""
+
+    LatestAPIversion = "v25.2"
+
+    def __init__(self, types, records, latency):
+        self.types = [f"Type{i}" for i in range(types)]
+        self.records = records
+        self.latency = latency
+
+    def api_call(self, endpoint, **kwargs):
+        time.sleep(self.latency)
+        if endpoint.endswith("/metadata/components"):
+            return {"responseStatus": "SUCCESS", "data": [{"name": t} for t in self.types]}
+        if "/configuration/" in endpoint:
+            return {
+                "responseStatus": "SUCCESS",
+                "data": [{"name__v": f"record_{i}__c"} for i in range(self.records)],
+            }
+        key = endpoint.rsplit("/", 1)[1]
+        return _Response(f"RECREATE {key} (\n  label('{key}')\n);\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--types", type=int, default=10)
+    parser.add_argument("--records", type=int, default=40)
+    parser.add_argument("--latency-ms", type=float, default=20.0)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 4, 8, 16])
+    args = parser.parse_args(argv)
+
+    vault = SimulatedVault(args.types, args.records, args.latency_ms / 1000)
+    print(
+        f"{args.types} types x {args.records} records, "
+        f"{args.latency_ms:g} ms per request"
+    )
+    print(f"{'workers':>8} {'seconds':>9} {'records/s':>10}")
+    for workers in args.workers:
+        with tempfile.TemporaryDirectory() as directory:
+            result = MDLCrawler(vault, directory, max_workers=workers).crawl()
+        print(f"{workers:>8} {result['seconds']:>9.2f} {result['records_per_second']:>10.1f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
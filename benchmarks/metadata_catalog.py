@@ -0,0 +1,104 @@
+"""
+Latency of metadata lookups served from the persistent metadata catalog.
+
+Fills a temporary catalog with one synthetic object metadata response (sent
+through VaultClient with _send patched out) and reports the mean and 99th
+percentile time of api_call for that request from a warm catalog, in this
+process and in a second catalog instance opened on the same file.
+
+Usage:
+    python benchmarks/metadata_catalog.py
+    python benchmarks/metadata_catalog.py --fields 1000 --lookups 5000
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from unittest import mock
+
+from _common import ensure_importable
+
+ensure_importable()
+
+from veevavault.client import MetadataCatalog, VaultClient
+
+URL = "api/v25.2/metadata/vobjects/product__v"
+
+
+def object_metadata(fields):
+    """Return a synthetic object metadata response with the given number of fields."""
+    return {
+        "responseStatus": "SUCCESS",
+        "object": {
+            "name": "product__v",
+            "label": "Product",
+            "fields": [
+                {
+                    "name": f"field_{i}__c",
+                    "label": f"Field {i}",
+                    "type": "String",
+                    "required": False,
+                    "editable": True,
+                    "max_length": 128,
+                }
+                for i in range(fields)
+            ],
+        },
+    }
+
+
+def make_client(catalog):
+    """Return a VaultClient whose outermost middleware is the catalog."""
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.add_middleware(catalog, index=0)
+    return client
+
+
+def lookup_ms(client, lookups):
+    """Return per-call times in milliseconds of repeated catalogued api_calls."""
+    times = []
+    for _ in range(lookups):
+        start = time.perf_counter()
+        client.api_call(URL)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--fields", type=int, default=300)
+    parser.add_argument("--lookups", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    response = object_metadata(args.fields)
+    no_versions = {"responseStatus": "FAILURE", "errors": []}
+
+    with tempfile.TemporaryDirectory() as directory, mock.patch.object(
+        VaultClient, "_send", lambda self, request: response
+    ), mock.patch(
+        "veevavault.services.mdl.MDLService.retrieve_component_record_collection",
+        return_value=no_versions,
+    ):
+        path = os.path.join(directory, "catalog.sqlite3")
+        writer = MetadataCatalog(path)
+        make_client(writer).api_call(URL)
+
+        print(f"object metadata with {args.fields} fields, {args.lookups} lookups")
+        print(f"{'catalog':<16} {'mean [ms]':>10} {'p99 [ms]':>10}")
+        for label, catalog in (("same instance", writer), ("second instance", MetadataCatalog(path))):
+            client = make_client(catalog)
+            client.api_call(URL)
+            times = sorted(lookup_ms(client, args.lookups))
+            p99 = times[int(len(times) * 0.99) - 1]
+            print(f"{label:<16} {statistics.mean(times):>10.3f} {p99:>10.3f}")
+            catalog.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,91 @@
+"""
+Construction-cost and memory benchmark for the aggregate services.
+
+Builds DocumentService, ObjectService and BinderService for many VaultClient
+instances, as a multi-vault fan-out would, and reports the time to construct
+one client's services and the memory held per client. The ``touched`` column
+forces every specialized service to be created, which is what construction
+cost before the specialized services became lazy.
+
+Usage:
+    python benchmarks/service_construction.py
+    python benchmarks/service_construction.py --clients 1000
+"""
+
+import argparse
+import gc
+import sys
+import time
+import tracemalloc
+
+from _common import ensure_importable
+
+ensure_importable()
+
+from veevavault import BinderService, DocumentService, ObjectService, VaultClient
+from veevavault.utilities.lazy_service import LazyService
+
+AGGREGATES = (DocumentService, ObjectService, BinderService)
+
+
+def build(touch_all):
+    """
+    Construct one client with its aggregate services.
+
+    Args:
+        touch_all (bool): Access every specialized service after construction
+
+    Returns:
+        tuple: The client followed by its aggregate services
+    """
+    client = VaultClient()
+    services = tuple(aggregate(client) for aggregate in AGGREGATES)
+    if touch_all:
+        for service in services:
+            for name, value in vars(type(service)).items():
+                if isinstance(value, LazyService):
+                    getattr(service, name)
+    return (client,) + services
+
+
+def time_per_client(touch_all, repeat):
+    """Return the best-of-five mean construction time in microseconds."""
+    best = None
+    for _ in range(5):
+        start = time.perf_counter()
+        for _ in range(repeat):
+            build(touch_all)
+        elapsed = (time.perf_counter() - start) / repeat
+        best = elapsed if best is None else min(best, elapsed)
+    return best * 1e6
+
+
+def memory_per_client(touch_all, clients):
+    """Return the traced memory held per client in bytes."""
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    held = [build(touch_all) for _ in range(clients)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    total = sum(stat.size_diff for stat in after.compare_to(before, "filename"))
+    del held
+    return total / clients
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=500)
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args(argv)
+
+    print(f"{'mode':<10} {'construct [us/client]':>22} {'memory [bytes/client]':>22}")
+    for label, touch_all in (("lazy", False), ("touched", True)):
+        micros = time_per_client(touch_all, args.repeat)
+        memory = memory_per_client(touch_all, args.clients)
+        print(f"{label:<10} {micros:>22.2f} {memory:>22.0f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,3 +1,49 @@
+from typing import TYPE_CHECKING
+
 from .vault_client import VaultClient
+from .retry import RetryPolicy
+from .json_backend import set_json_backend, get_json_backend
+from .json_stream import JsonItemParser, JsonItemStream
+from .middleware import (
+    VaultRequest,
+    Middleware,
+    TimingMiddleware,
+    RetryMiddleware,
+    RateLimitMiddleware,
+    CacheMiddleware,
+)
+
+if TYPE_CHECKING:
+    from .document_cache import DocumentContentCache
+    from .metadata_catalog import MetadataCatalog
+
+__all__ = [
+    "VaultClient",
+    "RetryPolicy",
+    "set_json_backend",
+    "get_json_backend",
+    "JsonItemParser",
+    "JsonItemStream",
+    "VaultRequest",
+    "Middleware",
+    "TimingMiddleware",
+    "RetryMiddleware",
+    "RateLimitMiddleware",
+    "CacheMiddleware",
+    "MetadataCatalog",
+    "DocumentContentCache",
+]
+
+
+def __getattr__(name):
+    # MetadataCatalog and DocumentContentCache pull in sqlite3 and hashlib, so they
+    # are imported on first use
+    if name == "MetadataCatalog":
+        from .metadata_catalog import MetadataCatalog
+
+        return MetadataCatalog
+    if name == "DocumentContentCache":
+        from .document_cache import DocumentContentCache
 
-__all__ = ["VaultClient"]
+        return DocumentContentCache
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
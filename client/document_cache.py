@@ -0,0 +1,376 @@
+import hashlib
+import logging
+import os
+import re
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Optional, Tuple
+from urllib.parse import urlparse
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .middleware import Handler, Middleware, VaultRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "veevavault", "documents")
+DEFAULT_MAX_BYTES = 5 * 1024**3
+
+# Downloads of one document version: source file, thumbnail or rendition
+_VERSION_DOWNLOAD = re.compile(
+    r"/objects/documents/(\d+)/versions/(\d+)/(\d+)/(file|thumbnail|renditions/[^/]+)/?$"
+)
+# Any path of one document version, or the document itself
+_DOCUMENT_PATH = re.compile(r"/objects/documents/(\d+)(?:/versions/(\d+)/(\d+))?(?:/|$)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    vault_id TEXT NOT NULL,
+    doc_id TEXT NOT NULL,
+    major INTEGER NOT NULL,
+    minor INTEGER NOT NULL,
+    item TEXT NOT NULL,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    content_disposition TEXT NOT NULL,
+    last_access REAL NOT NULL,
+    PRIMARY KEY (vault_id, doc_id, major, minor, item)
+);
+CREATE INDEX IF NOT EXISTS entries_sha256 ON entries (sha256);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+# Seconds between last_access updates of one entry; spares a write per hit
+_TOUCH_INTERVAL = 60
+
+
+class DocumentContentCache(Middleware):
+    """
+    Persistent, content-addressed cache of downloaded document version files.
+
+    Added to a client's middleware chain, it serves GET requests for the
+    source file, thumbnail or a rendition of a specific document version
+    (DocumentRetrievalService.download_document_version_file,
+    download_document_version_thumbnail and
+    DocumentRenditionsService.download_document_version_rendition_file)
+    from local disk. A given (document, major, minor, item) never changes, so
+    entries need no revalidation.
+
+    The content is stored once per SHA-256 under blobs/, however many entries
+    refer to it; an SQLite index in write-ahead logging mode maps each entry
+    to its hash and last access time. Blobs are written to a temporary file
+    and renamed into place, so every thread and process on the host can share
+    the cache and never reads a partial file. When the distinct content
+    exceeds max_bytes, the least recently used entries are evicted.
+
+    Latest-version downloads (e.g. download_document_file) are not cached, as
+    their content changes with every new version. Writes through api_call to
+    a document version (e.g. replacing or deleting a rendition) and deleting a
+    document drop its entries. Streamed requests (stream=True) are passed
+    through uncached.
+
+        client.add_middleware(DocumentContentCache(), index=0)
+    """
+
+    def __init__(
+        self,
+        directory: Optional[str] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        verify: bool = False,
+    ):
+        """
+        Args:
+            directory (str, optional): Cache directory. Defaults to ~/.cache/veevavault/documents.
+            max_bytes (int, optional): Maximum total size of cached content. Defaults to 5 GiB.
+            verify (bool, optional): Re-hash content on every hit and drop entries whose
+                blob no longer matches. Defaults to False.
+        """
+        if max_bytes < 1:
+            raise ValueError("max_bytes must be at least 1")
+
+        self.directory = directory or DEFAULT_CACHE_DIR
+        self.max_bytes = max_bytes
+        self.verify = verify
+        self.hits = 0
+        self.misses = 0
+
+        self._blob_dir = os.path.join(self.directory, "blobs")
+        os.makedirs(self._blob_dir, exist_ok=True)
+        self._conn = sqlite3.connect(
+            os.path.join(self.directory, "index.sqlite3"),
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        path = urlparse(request.url).path
+        if request.method.upper() != "GET":
+            result = call_next(request)
+            self._invalidate_path(request, path)
+            return result
+
+        key = self.key_for(request)
+        if key is None or request.stream_data or request.options.get("stream"):
+            return call_next(request)
+
+        vault_id = self._vault_id(request.client)
+        cached = self._lookup(vault_id, key)
+        if cached is not None:
+            self.hits += 1
+            content, content_type, disposition = cached
+            return self._result(request, content, content_type, disposition)
+
+        self.misses += 1
+        result = call_next(request)
+        if isinstance(result, requests.Response):
+            if result.status_code == 200:
+                self._store(
+                    vault_id,
+                    key,
+                    result.content,
+                    result.headers.get("Content-Type", ""),
+                    result.headers.get("Content-Disposition", ""),
+                )
+        elif isinstance(result, bytes):
+            self._store(vault_id, key, result, "application/octet-stream", "")
+        return result
+
+    def key_for(self, request: VaultRequest) -> Optional[Tuple[str, int, int, str]]:
+        """
+        Returns the cache key of a document version download.
+
+        Args:
+            request (VaultRequest): The request
+
+        Returns:
+            tuple: (doc_id, major, minor, item), where item is "file", "thumbnail"
+                or "renditions/{type}" plus any query string, or None if the
+                request is not a version download
+        """
+        match = _VERSION_DOWNLOAD.search(urlparse(request.url).path)
+        if match is None:
+            return None
+        doc_id, major, minor, item = match.groups()
+        if isinstance(request.params, dict) and request.params:
+            item += "?" + "&".join(f"{k}={v}" for k, v in sorted(request.params.items()))
+        return doc_id, int(major), int(minor), item
+
+    def invalidate(
+        self,
+        vault_id: Optional[str] = None,
+        doc_id: Optional[Any] = None,
+        major: Optional[int] = None,
+        minor: Optional[int] = None,
+    ) -> None:
+        """
+        Drops cache entries and the content no other entry refers to.
+
+        Args:
+            vault_id (str, optional): Only entries of this vault
+            doc_id (str, optional): Only entries of this document
+            major (int, optional): Only entries of this major version (with minor)
+            minor (int, optional): Only entries of this minor version (with major)
+        """
+        conditions, args = [], []
+        for column, value in (("vault_id", vault_id), ("doc_id", doc_id), ("major", major), ("minor", minor)):
+            if value is not None:
+                conditions.append(f"{column} = ?")
+                args.append(str(value) if column in ("vault_id", "doc_id") else int(value))
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                hashes = {
+                    row[0] for row in self._conn.execute(f"SELECT sha256 FROM entries{where}", args)
+                }
+                self._conn.execute(f"DELETE FROM entries{where}", args)
+                orphans = [sha for sha in hashes if not self._referenced(sha)]
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        for sha in orphans:
+            self._remove_blob(sha)
+
+    def clear(self) -> None:
+        """Removes all cached content."""
+        self.invalidate()
+
+    def size(self) -> int:
+        """
+        Returns the total size of the cached content.
+
+        Returns:
+            int: Bytes, counting content shared by several entries once
+        """
+        with self._lock:
+            return self._total_size()
+
+    def close(self) -> None:
+        """Closes the cache index."""
+        with self._lock:
+            self._conn.close()
+
+    def _lookup(self, vault_id: str, key: Tuple[str, int, int, str]) -> Optional[Tuple[bytes, str, str]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, size, content_type, content_disposition, last_access FROM entries "
+                "WHERE vault_id = ? AND doc_id = ? AND major = ? AND minor = ? AND item = ?",
+                (vault_id, *key),
+            ).fetchone()
+        if row is None:
+            return None
+
+        sha, size, content_type, disposition, last_access = row
+        try:
+            with open(self._blob_path(sha), "rb") as f:
+                content = f.read()
+        except FileNotFoundError:
+            # Evicted by another process since the lookup
+            content = None
+        if content is None or len(content) != size or (
+            self.verify and hashlib.sha256(content).hexdigest() != sha
+        ):
+            logger.warning(f"Cached content of document {key[0]} v{key[1]}.{key[2]} {key[3]} is missing or corrupt")
+            self.invalidate(vault_id, key[0], key[1], key[2])
+            return None
+
+        now = time.time()
+        if now - last_access > _TOUCH_INTERVAL:
+            with self._lock:
+                self._conn.execute(
+                    "UPDATE entries SET last_access = ? "
+                    "WHERE vault_id = ? AND doc_id = ? AND major = ? AND minor = ? AND item = ?",
+                    (now, vault_id, *key),
+                )
+        return content, content_type, disposition
+
+    def _store(
+        self,
+        vault_id: str,
+        key: Tuple[str, int, int, str],
+        content: bytes,
+        content_type: str,
+        disposition: str,
+    ) -> None:
+        # Vault reports some download failures as a JSON body with status 200
+        if content_type.startswith("application/json") or len(content) > self.max_bytes:
+            return
+
+        sha = hashlib.sha256(content).hexdigest()
+        path = self._blob_path(sha)
+        try:
+            if not os.path.exists(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+                fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+                try:
+                    with os.fdopen(fd, "wb") as f:
+                        f.write(content)
+                    os.replace(temp_path, path)
+                except BaseException:
+                    os.unlink(temp_path)
+                    raise
+        except OSError as e:
+            logger.warning(f"Could not cache document {key[0]} v{key[1]}.{key[2]} {key[3]}: {e}")
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (vault_id, *key, sha, len(content), content_type, disposition, time.time()),
+                )
+                evicted = self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        for evicted_sha in evicted:
+            self._remove_blob(evicted_sha)
+
+    def _evict(self) -> list:
+        """Deletes least recently used entries until the content fits; returns orphaned hashes."""
+        total = self._total_size()
+        orphans = []
+        if total <= self.max_bytes:
+            return orphans
+
+        rows = self._conn.execute(
+            "SELECT vault_id, doc_id, major, minor, item, sha256, size FROM entries "
+            "ORDER BY last_access"
+        ).fetchall()
+        for *entry_key, sha, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute(
+                "DELETE FROM entries "
+                "WHERE vault_id = ? AND doc_id = ? AND major = ? AND minor = ? AND item = ?",
+                entry_key,
+            )
+            if not self._referenced(sha):
+                orphans.append(sha)
+                total -= size
+        logger.debug(f"Evicted {len(orphans)} documents from the content cache")
+        return orphans
+
+    def _total_size(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM (SELECT MAX(size) AS size FROM entries GROUP BY sha256)"
+        ).fetchone()
+        return row[0]
+
+    def _referenced(self, sha: str) -> bool:
+        return self._conn.execute("SELECT 1 FROM entries WHERE sha256 = ? LIMIT 1", (sha,)).fetchone() is not None
+
+    def _invalidate_path(self, request: VaultRequest, path: str) -> None:
+        match = _DOCUMENT_PATH.search(path)
+        if match is None:
+            return
+        doc_id, major, minor = match.groups()
+        if major is not None:
+            self.invalidate(self._vault_id(request.client), doc_id, int(major), int(minor))
+        elif request.method.upper() == "DELETE" and path.rstrip("/").endswith(f"/documents/{doc_id}"):
+            self.invalidate(self._vault_id(request.client), doc_id)
+
+    def _remove_blob(self, sha: str) -> None:
+        try:
+            os.unlink(self._blob_path(sha))
+        except OSError:
+            # Already removed, or still open elsewhere on Windows; a later eviction retries
+            pass
+
+    def _blob_path(self, sha: str) -> str:
+        return os.path.join(self._blob_dir, sha[:2], sha)
+
+    @staticmethod
+    def _result(request: VaultRequest, content: bytes, content_type: str, disposition: str) -> Any:
+        if not request.raw_response:
+            return content
+        response = requests.Response()
+        response.status_code = 200
+        response.url = request.url
+        response.headers = CaseInsensitiveDict(
+            {"Content-Type": content_type, "Content-Length": str(len(content))}
+        )
+        if disposition:
+            response.headers["Content-Disposition"] = disposition
+        response._content = content
+        response._content_consumed = True
+        return response
+
+    @staticmethod
+    def _vault_id(client) -> str:
+        vault_id = getattr(client, "vaultId", None)
+        if vault_id:
+            return str(vault_id)
+        return urlparse(getattr(client, "vaultURL", None) or "").netloc or "default"
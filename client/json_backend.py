@@ -0,0 +1,105 @@
+import importlib
+import json
+from typing import Any, Callable, Union
+
+# Backend name -> function decoding bytes or str, in order of preference
+_BACKENDS = {
+    "orjson": lambda: importlib.import_module("orjson").loads,
+    "ujson": lambda: importlib.import_module("ujson").loads,
+    "json": lambda: json.loads,
+}
+
+# Content types whose bodies are never decoded as JSON
+BINARY_CONTENT_TYPES = (
+    "application/octet-stream",
+    "application/zip",
+    "application/x-zip-compressed",
+    "application/pdf",
+    "text/csv",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+_loads: Callable[[Union[bytes, str]], Any] = json.loads
+_backend_name = "json"
+
+
+def set_json_backend(backend: Union[str, Callable[[Union[bytes, str]], Any]] = "auto") -> str:
+    """
+    Selects the JSON decoder used for Vault API responses.
+
+    Args:
+        backend: 'auto' (the fastest installed of orjson, ujson and json), a backend
+            name, or a callable that decodes bytes
+
+    Returns:
+        str: Name of the selected backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the named backend is not installed
+    """
+    global _loads, _backend_name
+
+    if callable(backend):
+        _loads = backend
+        _backend_name = getattr(backend, "__module__", None) or "custom"
+        return _backend_name
+
+    if backend == "auto":
+        for name, load in _BACKENDS.items():
+            try:
+                _loads = load()
+            except ImportError:
+                continue
+            _backend_name = name
+            return name
+
+    if backend not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend: {backend}. Use 'auto', {', '.join(_BACKENDS)} or a callable"
+        )
+    _loads = _BACKENDS[backend]()
+    _backend_name = backend
+    return backend
+
+
+def get_json_backend() -> str:
+    """Returns the name of the selected JSON backend."""
+    return _backend_name
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decodes a JSON document with the selected backend.
+
+    Args:
+        data: Raw response body
+
+    Returns:
+        The decoded value
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return _loads(data)
+
+
+def is_json_content_type(content_type: str) -> bool:
+    """
+    Checks whether a response body should be decoded as JSON.
+
+    Bodies without a content type are treated as JSON, as Vault returns JSON by default.
+
+    Args:
+        content_type: Value of the Content-Type header
+
+    Returns:
+        bool: False for binary and CSV content types
+    """
+    content_type = (content_type or "").lower()
+    return not content_type.startswith(BINARY_CONTENT_TYPES)
+
+
+set_json_backend("auto")
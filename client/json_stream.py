@@ -0,0 +1,270 @@
+import codecs
+import json
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+# Bytes read from the response per chunk when streaming
+STREAM_CHUNK_SIZE = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_INCOMPLETE = object()
+
+
+class JsonItemParser:
+    """
+    Incremental parser for a JSON object whose items of one array are needed one at a time.
+
+    Bytes are fed as they arrive. The items of the array under array_key (data by
+    default) are returned as soon as each one is complete, so only one item is held
+    in memory at a time. Every other top-level member, such as responseStatus and
+    responseDetails, is decoded whole and kept in envelope.
+
+        parser = JsonItemParser()
+        for chunk in chunks:
+            for record in parser.feed(chunk):
+                ...
+        parser.close()
+    """
+
+    def __init__(
+        self,
+        array_key: str = "data",
+        on_value: Optional[Callable[[str, Any], None]] = None,
+    ):
+        """
+        Args:
+            array_key (str, optional): Top-level key of the array to stream. Defaults to "data".
+            on_value (callable, optional): Called with (key, value) for each other top-level
+                member as soon as it is decoded; may raise to abort parsing.
+        """
+        self.array_key = array_key
+        self.on_value = on_value
+        self.envelope: Dict[str, Any] = {}
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._raw_decode = json.JSONDecoder().raw_decode
+        self._buffer = ""
+        self._pos = 0
+        self._state = "start"
+        self._key = None
+        self._final = False
+        # An incomplete value is re-parsed only once the buffer has doubled,
+        # which keeps very large items linear to parse
+        self._min_buffer = 0
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole JSON object has been parsed."""
+        return self._state == "done"
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """
+        Adds the next chunk of the body.
+
+        Args:
+            chunk (bytes): Next bytes of the body
+
+        Returns:
+            list: Array items completed by this chunk
+
+        Raises:
+            ValueError: If the body is not a JSON object
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(chunk)
+        self._pos = 0
+        if len(self._buffer) < self._min_buffer:
+            return []
+        return self._parse()
+
+    def close(self) -> List[Any]:
+        """
+        Signals the end of the body.
+
+        Returns:
+            list: Array items completed by the end of the body
+
+        Raises:
+            ValueError: If the body is incomplete or not a JSON object
+        """
+        self._buffer = self._buffer[self._pos:] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._final = True
+        items = self._parse()
+        if self._state != "done":
+            raise ValueError("Incomplete JSON document")
+        return items
+
+    def _parse(self) -> List[Any]:
+        items = []
+        while True:
+            char = self._next_char()
+            if char is None:
+                return items
+            state = self._state
+
+            if state == "start":
+                self._expect(char, "{")
+                self._state = "key"
+
+            elif state == "key":
+                if char == "}":
+                    self._pos += 1
+                    self._state = "done"
+                    continue
+                key = self._decode_value()
+                if key is _INCOMPLETE:
+                    return items
+                if not isinstance(key, str):
+                    raise ValueError(f"Expected an object key at position {self._pos}")
+                self._key = key
+                self._state = "colon"
+
+            elif state == "colon":
+                self._expect(char, ":")
+                self._state = "value"
+
+            elif state == "value":
+                if self._key == self.array_key and char == "[":
+                    self._pos += 1
+                    self._state = "item"
+                    continue
+                value = self._decode_value()
+                if value is _INCOMPLETE:
+                    return items
+                self.envelope[self._key] = value
+                self._state = "member_end"
+                if self.on_value is not None:
+                    self.on_value(self._key, value)
+
+            elif state == "item":
+                if char == "]":
+                    self._pos += 1
+                    self._state = "member_end"
+                    continue
+                item = self._decode_value()
+                if item is _INCOMPLETE:
+                    return items
+                items.append(item)
+                self._state = "item_end"
+
+            elif state == "item_end":
+                if char == "]":
+                    self._state = "member_end"
+                else:
+                    self._expect(char, ",")
+                    self._state = "item"
+                    continue
+                self._pos += 1
+
+            elif state == "member_end":
+                if char == "}":
+                    self._state = "done"
+                else:
+                    self._expect(char, ",")
+                    self._state = "key"
+                    continue
+                self._pos += 1
+
+            else:
+                raise ValueError(f"Unexpected data after JSON document at position {self._pos}")
+
+    def _next_char(self) -> Optional[str]:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _expect(self, char: str, expected: str) -> None:
+        if char != expected:
+            raise ValueError(f"Expected '{expected}' at position {self._pos}, found '{char}'")
+        self._pos += 1
+
+    def _decode_value(self) -> Any:
+        try:
+            value, end = self._raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if self._final:
+                raise
+            self._min_buffer = 2 * (len(self._buffer) - self._pos)
+            return _INCOMPLETE
+        # A number cut off by the end of the chunk (e.g. "1." of "1.5") decodes
+        # without error, so a value counts only once a delimiter follows it
+        if not self._final and (
+            end == len(self._buffer) or self._buffer[end] not in _DELIMITERS
+        ):
+            return _INCOMPLETE
+        self._pos = end
+        self._min_buffer = 0
+        return value
+
+
+class JsonItemStream:
+    """
+    Iterator over the items of one array of a streamed JSON response.
+
+    Returned by VaultClient.api_call(..., stream_data=True). Iterating yields the
+    data items as the body arrives; the other top-level members are available in
+    envelope as they are parsed (responseDetails usually precedes data in Vault
+    responses, and is complete once iteration ends). The underlying response is
+    closed when iteration ends or close() is called.
+
+        with client.api_call(url, stream_data=True) as records:
+            for record in records:
+                ...
+            total = records.response_details.get("total")
+    """
+
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        array_key: str = "data",
+        on_value: Optional[Callable[[str, Any], None]] = None,
+        close: Optional[Callable[[], None]] = None,
+    ):
+        """
+        Args:
+            chunks (iterable): Body chunks, e.g. response.iter_content(STREAM_CHUNK_SIZE)
+            array_key (str, optional): Top-level key of the array to stream. Defaults to "data".
+            on_value (callable, optional): Called with (key, value) for each other top-level member
+            close (callable, optional): Releases the underlying response
+        """
+        self._parser = JsonItemParser(array_key, on_value)
+        self._chunks = chunks
+        self._close = close
+        self._iterator = self._iterate()
+
+    @property
+    def envelope(self) -> Dict[str, Any]:
+        """Top-level members other than the streamed array parsed so far."""
+        return self._parser.envelope
+
+    @property
+    def response_details(self) -> Dict[str, Any]:
+        """The responseDetails member, or an empty dict if not parsed (yet)."""
+        return self._parser.envelope.get("responseDetails") or {}
+
+    def __iter__(self) -> Iterator[Any]:
+        return self._iterator
+
+    def __next__(self) -> Any:
+        return next(self._iterator)
+
+    def __enter__(self) -> "JsonItemStream":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Closes the underlying response; remaining items are discarded."""
+        if self._close is not None:
+            close, self._close = self._close, None
+            close()
+
+    def _iterate(self) -> Iterator[Any]:
+        try:
+            for chunk in self._chunks:
+                yield from self._parser.feed(chunk)
+            yield from self._parser.close()
+        finally:
+            self.close()
@@ -0,0 +1,290 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode, urlparse
+
+from . import json_backend
+from .middleware import Handler, Middleware, VaultRequest
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "veevavault", "metadata_catalog.sqlite3"
+)
+
+# URL path fragment -> configuration component type whose changes invalidate it.
+# The first matching fragment wins.
+COMPONENT_PATHS: Tuple[Tuple[str, str], ...] = (
+    ("/metadata/vobjects", "Object"),
+    ("/metadata/objects/documents/properties", "Docfield"),
+    ("/metadata/objects/documents/types", "Doctype"),
+    ("/objects/picklists", "Picklist"),
+)
+
+# URL path suffixes of catalogued POST requests that only read metadata
+READ_ONLY_SUFFIXES: Tuple[str, ...] = ("/find_common",)
+
+# Component record fields that change whenever a component changes, in order of preference
+_VERSION_FIELDS = ("checksum__v", "checksum", "modified_date__v", "modified_date")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    vault_id TEXT NOT NULL,
+    request_key TEXT NOT NULL,
+    component_type TEXT NOT NULL,
+    version TEXT NOT NULL,
+    body BLOB NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (vault_id, request_key)
+);
+CREATE TABLE IF NOT EXISTS versions (
+    vault_id TEXT NOT NULL,
+    component_type TEXT NOT NULL,
+    version TEXT NOT NULL,
+    checked_at REAL NOT NULL,
+    PRIMARY KEY (vault_id, component_type)
+);
+"""
+
+
+class MetadataCatalog(Middleware):
+    """
+    Persistent, version-keyed cache of Vault metadata responses.
+
+    Added to a client's middleware chain, it serves GET requests for object,
+    document field, document type and picklist metadata (every accessor built
+    on client.api_call, such as ObjectService.retrieve_object_metadata,
+    DocumentTypesService and PicklistService.retrieve_picklist_values) from
+    an SQLite file. Entries are keyed by vault and request URL.
+
+    Each entry records the configuration version of its component type. The
+    version is a fingerprint of the checksums (or modified dates) that
+    MDLService.retrieve_component_record_collection reports for that type.
+    The fingerprint is re-checked at most every check_interval seconds; when
+    it changes, the type's entries are dropped. The file uses write-ahead
+    logging, so every process on the host shares the catalog and a check
+    made by one process serves all of them.
+
+    Writes through api_call to a catalogued path (e.g. updating a picklist)
+    invalidate the component type immediately. POST requests to paths ending
+    in one of read_only_suffixes (e.g. find_common) are passed through
+    without invalidating anything.
+
+        client.add_middleware(MetadataCatalog(), index=0)
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        check_interval: float = 300,
+        fallback_ttl: float = 86400,
+        component_paths: Tuple[Tuple[str, str], ...] = COMPONENT_PATHS,
+        read_only_suffixes: Tuple[str, ...] = READ_ONLY_SUFFIXES,
+    ):
+        """
+        Args:
+            path (str, optional): Catalog file. Defaults to ~/.cache/veevavault/metadata_catalog.sqlite3.
+            check_interval (float, optional): Seconds between configuration version checks.
+                Defaults to 300.
+            fallback_ttl (float, optional): Lifetime in seconds of entries whose component type
+                reports no versions (e.g. Object, which the component record collection does
+                not list). Defaults to one day.
+            component_paths (tuple, optional): (URL fragment, component type) pairs of
+                catalogued requests. Defaults to COMPONENT_PATHS.
+            read_only_suffixes (tuple, optional): URL path suffixes of catalogued POST
+                requests that do not change configuration. Defaults to READ_ONLY_SUFFIXES.
+        """
+        self.path = path or DEFAULT_CATALOG_PATH
+        self.check_interval = check_interval
+        self.fallback_ttl = fallback_ttl
+        self.component_paths = tuple(component_paths)
+        self.read_only_suffixes = tuple(read_only_suffixes)
+        self.hits = 0
+        self.misses = 0
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.path, timeout=30, isolation_level=None, check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+        # (vault_id, component_type) -> (version, checked_at), mirroring the versions table
+        self._versions: Dict[Tuple[str, str], Tuple[str, float]] = {}
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        component = self.component_for(request.url)
+        if component is None or request.raw_response or request.binary_response or request.stream_data:
+            return call_next(request)
+
+        method = request.method.upper()
+        if method == "POST" and urlparse(request.url).path.rstrip("/").endswith(self.read_only_suffixes):
+            return call_next(request)
+
+        vault_id = self._vault_id(request.client)
+        if method != "GET":
+            result = call_next(request)
+            self.invalidate(vault_id, component)
+            return result
+
+        key = self._request_key(request)
+        version = self.component_version(request.client, component)
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM entries WHERE vault_id = ? AND request_key = ? AND version = ?",
+                (vault_id, key, version),
+            ).fetchone()
+        if row is not None:
+            self.hits += 1
+            return json_backend.loads(row[0])
+
+        self.misses += 1
+        result = call_next(request)
+        if isinstance(result, dict) and result.get("responseStatus") != "FAILURE":
+            body = json.dumps(result, separators=(",", ":")).encode("utf-8")
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    (vault_id, key, component, version, body, time.time()),
+                )
+        return result
+
+    def component_for(self, url: str) -> Optional[str]:
+        """
+        Returns the component type of a catalogued URL.
+
+        Args:
+            url (str): Request URL
+
+        Returns:
+            str: Component type, or None if the URL is not catalogued
+        """
+        path = urlparse(url).path
+        for fragment, component in self.component_paths:
+            if fragment in path:
+                return component
+        return None
+
+    def component_version(self, client, component: str) -> str:
+        """
+        Returns the current configuration version of a component type.
+
+        The version is read from memory or the catalog file while it is younger
+        than check_interval, and fetched from Vault otherwise.
+
+        Args:
+            client: The VaultClient of the request
+            component (str): Component type, e.g. "Picklist"
+
+        Returns:
+            str: Version fingerprint
+        """
+        vault_id = self._vault_id(client)
+        now = time.time()
+        cached = self._versions.get((vault_id, component))
+        if cached is not None and now - cached[1] < self.check_interval:
+            return cached[0]
+
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, checked_at FROM versions WHERE vault_id = ? AND component_type = ?",
+                (vault_id, component),
+            ).fetchone()
+        if row is not None and now - row[1] < self.check_interval:
+            self._versions[(vault_id, component)] = (row[0], row[1])
+            return row[0]
+
+        version = self._fetch_version(client, component, now)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO versions VALUES (?, ?, ?, ?)",
+                (vault_id, component, version, now),
+            )
+            if row is not None and row[0] != version:
+                self._conn.execute(
+                    "DELETE FROM entries WHERE vault_id = ? AND component_type = ? AND version != ?",
+                    (vault_id, component, version),
+                )
+                logger.info(f"{component} configuration changed; catalog entries dropped")
+        self._versions[(vault_id, component)] = (version, now)
+        return version
+
+    def invalidate(self, vault_id: Optional[str] = None, component: Optional[str] = None) -> None:
+        """
+        Drops catalog entries and forces a version check on next use.
+
+        Args:
+            vault_id (str, optional): Only entries of this vault
+            component (str, optional): Only entries of this component type
+        """
+        conditions, args = [], []
+        if vault_id is not None:
+            conditions.append("vault_id = ?")
+            args.append(vault_id)
+        if component is not None:
+            conditions.append("component_type = ?")
+            args.append(component)
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        with self._lock:
+            self._conn.execute(f"DELETE FROM entries{where}", args)
+            self._conn.execute(f"DELETE FROM versions{where}", args)
+        self._versions = {
+            key: value
+            for key, value in self._versions.items()
+            if not (vault_id in (None, key[0]) and component in (None, key[1]))
+        }
+
+    def clear(self) -> None:
+        """Removes all catalog entries."""
+        self.invalidate()
+
+    def close(self) -> None:
+        """Closes the catalog file."""
+        with self._lock:
+            self._conn.close()
+
+    def _fetch_version(self, client, component: str, now: float) -> str:
+        from veevavault.services.mdl import MDLService
+
+        try:
+            response = MDLService(client).retrieve_component_record_collection(component)
+        except Exception as e:
+            logger.warning(f"Could not retrieve {component} component records: {e}")
+            response = {}
+
+        records = response.get("data") if isinstance(response, dict) else None
+        if response.get("responseStatus") == "FAILURE" or not isinstance(records, list):
+            # No versions to compare; entries expire after fallback_ttl instead
+            return f"ttl:{int(now // self.fallback_ttl)}"
+
+        digest = hashlib.sha1()
+        for record in sorted(records, key=lambda r: str(r.get("name__v", r.get("name", "")))):
+            marker = next((record[f] for f in _VERSION_FIELDS if record.get(f)), None)
+            if marker is None:
+                marker = json.dumps(record, sort_keys=True)
+            digest.update(f"{record.get('name__v', record.get('name'))}={marker}\n".encode("utf-8"))
+        return digest.hexdigest()
+
+    @staticmethod
+    def _vault_id(client) -> str:
+        vault_id = getattr(client, "vaultId", None)
+        if vault_id:
+            return str(vault_id)
+        return urlparse(getattr(client, "vaultURL", None) or "").netloc or "default"
+
+    @staticmethod
+    def _request_key(request: VaultRequest) -> str:
+        key = urlparse(request.url).path
+        if isinstance(request.params, dict) and request.params:
+            key += "?" + urlencode(sorted(request.params.items()), doseq=True)
+        accept_language = request.headers.get("Accept-Language") if request.headers else None
+        if accept_language:
+            key += f"#lang={accept_language}"
+        return key
@@ -0,0 +1,293 @@
+import copy
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+from .retry import RetryPolicy
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class VaultRequest:
+    """
+    A request made through VaultClient.api_call, as seen by middleware.
+
+    Middleware may change any field before passing the request on, e.g. to
+    replace the Authorization header after re-authenticating.
+
+    Attributes:
+        client: The VaultClient making the request
+        method: HTTP method
+        url: Absolute request URL
+        headers: HTTP headers
+        params: Query parameters
+        data: Form data, bytes or file-like body
+        files: Multipart files
+        json: JSON body
+        raw_response: Whether the caller wants the requests.Response instead of parsed JSON
+        binary_response: Whether the caller wants the body bytes instead of parsed JSON
+        stream_data: Whether the caller wants a JsonItemStream over the data items
+        retry_policy: Retry policy requested for this call, if any
+        idempotent: Explicit idempotency marking from the caller, if any
+        uses_client_session: Whether the Authorization header is the client's own session
+        options: Additional keyword arguments for requests.request (e.g. stream, timeout)
+        context: Scratch space for middleware to share per-request state
+    """
+
+    client: Any
+    method: str
+    url: str
+    headers: Dict[str, str]
+    params: Optional[Dict] = None
+    data: Any = None
+    files: Optional[Dict] = None
+    json: Any = None
+    raw_response: bool = False
+    binary_response: bool = False
+    stream_data: bool = False
+    retry_policy: Optional[RetryPolicy] = None
+    idempotent: Optional[bool] = None
+    uses_client_session: bool = True
+    options: Dict[str, Any] = field(default_factory=dict)
+    context: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def replayable(self) -> bool:
+        """Whether the body can be sent again; uploads and streams are consumed by the first send."""
+        return self.files is None and not hasattr(self.data, "read")
+
+
+Handler = Callable[[VaultRequest], Any]
+
+
+class Middleware:
+    """
+    Base class for VaultClient middleware.
+
+    Middleware wraps every api_call. Each one receives the request on the way
+    out and the result (or exception) of the rest of the chain on the way back:
+
+        class HeaderMiddleware(Middleware):
+            def __call__(self, request, call_next):
+                request.headers["X-VaultAPI-ClientID"] = "my-app"
+                return call_next(request)
+
+    The first middleware in VaultClient.middleware is the outermost. The end of
+    the chain sends the request and raises Vault exceptions for error responses.
+    """
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        return call_next(request)
+
+
+class TimingMiddleware(Middleware):
+    """
+    Records how long api_call requests take.
+
+    Keeps per-method totals in stats and logs each request at DEBUG level.
+    Place it first to time the whole call including retries, or after
+    RetryMiddleware to time each attempt.
+    """
+
+    def __init__(self):
+        self.stats: Dict[str, Dict[str, float]] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        start = time.perf_counter()
+        failed = False
+        try:
+            return call_next(request)
+        except Exception:
+            failed = True
+            raise
+        finally:
+            elapsed = time.perf_counter() - start
+            with self._lock:
+                entry = self.stats.setdefault(
+                    request.method, {"calls": 0, "errors": 0, "total_seconds": 0.0, "max_seconds": 0.0}
+                )
+                entry["calls"] += 1
+                entry["errors"] += int(failed)
+                entry["total_seconds"] += elapsed
+                entry["max_seconds"] = max(entry["max_seconds"], elapsed)
+            logger.debug(f"{request.method} {request.url} took {elapsed * 1000:.1f} ms")
+
+    def reset(self) -> None:
+        """Clears the recorded statistics."""
+        with self._lock:
+            self.stats.clear()
+
+
+class RetryMiddleware(Middleware):
+    """
+    Retries failed requests and recovers expired sessions (see RetryPolicy).
+
+    Uses the call's retry_policy, then this middleware's policy, then the
+    client's retry_policy. Middleware after this one runs once per attempt.
+    """
+
+    def __init__(self, retry_policy: Optional[RetryPolicy] = None):
+        """
+        Args:
+            retry_policy (RetryPolicy, optional): Policy overriding the client's retry_policy
+        """
+        self.retry_policy = retry_policy
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        from veevavault.exceptions import (
+            VaultAPIError,
+            VaultAuthenticationError,
+            VaultSessionError,
+        )
+
+        client = request.client
+        policy = (
+            request.retry_policy
+            or self.retry_policy
+            or client.retry_policy
+            or RetryPolicy.disabled()
+        )
+
+        attempt = 0
+        reauthenticated = False
+        while True:
+            attempt += 1
+            try:
+                return call_next(request)
+
+            except (VaultSessionError, VaultAuthenticationError):
+                if not (
+                    policy.reauthenticate
+                    and request.replayable
+                    and request.uses_client_session
+                    and not reauthenticated
+                ):
+                    raise
+                if not client.reauthenticate(
+                    expired_session_id=request.headers.get("Authorization")
+                ):
+                    raise
+                reauthenticated = True
+                request.headers["Authorization"] = f"{client.sessionId}"
+                # The replay does not count against the retry budget
+                attempt -= 1
+                logger.warning(
+                    f"Session expired; re-authenticated and replaying {request.method} {request.url}"
+                )
+
+            except VaultAPIError as err:
+                delay = None
+                if request.replayable:
+                    delay = policy.retry_delay(attempt, err, request.method, request.idempotent)
+                if delay is None:
+                    raise
+                logger.warning(
+                    f"{request.method} {request.url} failed ({err.message}); retrying in {delay:.1f}s "
+                    f"(attempt {attempt + 1} of {policy.max_attempts})"
+                )
+                policy.sleep(delay)
+
+
+class RateLimitMiddleware(Middleware):
+    """
+    Waits for a rate limiter before each request is sent.
+
+    Uses the given limiter, or the client's rate_limiter when none is given,
+    so one utilities.RateLimiter can be shared by every call on a client.
+    """
+
+    def __init__(self, rate_limiter=None):
+        """
+        Args:
+            rate_limiter (RateLimiter, optional): Limiter to use instead of the client's rate_limiter
+        """
+        self.rate_limiter = rate_limiter
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        limiter = self.rate_limiter or getattr(request.client, "rate_limiter", None)
+        if limiter is not None:
+            limiter.acquire()
+        return call_next(request)
+
+
+class CacheMiddleware(Middleware):
+    """
+    Caches parsed JSON responses of GET requests to matching paths.
+
+    Only successful, non-raw GET responses whose URL contains one of
+    path_fragments are cached, so record data is never served stale by
+    default. Cached values are deep-copied so callers may modify them.
+    """
+
+    DEFAULT_PATH_FRAGMENTS = ("/metadata/",)
+
+    def __init__(
+        self,
+        ttl: float = 300,
+        max_entries: int = 1024,
+        path_fragments: Tuple[str, ...] = DEFAULT_PATH_FRAGMENTS,
+    ):
+        """
+        Args:
+            ttl (float, optional): Seconds a response stays cached. Defaults to 300.
+            max_entries (int, optional): Maximum cached responses before the least recently
+                used is evicted. Defaults to 1024.
+            path_fragments (tuple, optional): URL fragments of cacheable requests.
+                Defaults to metadata endpoints.
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.path_fragments = tuple(path_fragments)
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, request: VaultRequest, call_next: Handler) -> Any:
+        if not self._is_cacheable(request):
+            return call_next(request)
+
+        key = self._key(request)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return copy.deepcopy(entry[1])
+            self.misses += 1
+
+        result = call_next(request)
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, copy.deepcopy(result))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Removes all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def _is_cacheable(self, request: VaultRequest) -> bool:
+        return (
+            request.method.upper() == "GET"
+            and not request.raw_response
+            and not request.binary_response
+            and not request.options.get("stream")
+            and any(fragment in request.url for fragment in self.path_fragments)
+        )
+
+    @staticmethod
+    def _key(request: VaultRequest) -> str:
+        key = request.url
+        if isinstance(request.params, dict) and request.params:
+            key += "?" + urlencode(sorted(request.params.items()), doseq=True)
+        return key
@@ -0,0 +1,191 @@
+import email.utils
+import random
+import time
+from datetime import datetime, timezone
+from typing import Callable, Optional, Tuple
+
+import requests
+
+
+class RetryPolicy:
+    """
+    Decides whether and when VaultClient.api_call retries a failed request.
+
+    Rules:
+        - 429 (rate limited) responses are retried for every method, because Vault
+          rejected the request without processing it. Retry-After is honored.
+        - 5xx responses and connection errors are retried only for idempotent
+          requests: methods in idempotent_methods (GET, HEAD, OPTIONS and PUT by
+          default), or any request made with api_call(..., idempotent=True).
+          Non-idempotent requests such as POST are never replayed unless marked.
+        - Connection timeouts are retried for every method; the request never
+          reached Vault.
+        - Expired sessions (INVALID_SESSION_ID or HTTP 401) trigger one
+          re-authentication and a replay of the request when reauthenticate is True.
+
+    Delays grow exponentially from backoff_base, capped at backoff_max, with full
+    jitter so parallel workers do not retry in lockstep.
+
+    A policy can be set for the whole client (VaultClient.retry_policy), for one
+    service (service = LogsService(client.with_retry_policy(policy))) or for one
+    call (api_call(..., retry_policy=policy)).
+    """
+
+    RETRY_STATUSES = (429, 500, 502, 503, 504)
+    IDEMPOTENT_METHODS = ("GET", "HEAD", "OPTIONS", "PUT")
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        jitter: bool = True,
+        max_retry_after: float = 300.0,
+        retry_statuses: Tuple[int, ...] = RETRY_STATUSES,
+        idempotent_methods: Tuple[str, ...] = IDEMPOTENT_METHODS,
+        reauthenticate: bool = True,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """
+        Initialize the retry policy.
+
+        Args:
+            max_attempts (int, optional): Total attempts per request, including the first.
+                1 disables retries. Defaults to 4.
+            backoff_base (float, optional): Delay before the first retry in seconds. Defaults to 1.0.
+            backoff_max (float, optional): Maximum delay between attempts in seconds. Defaults to 60.0.
+            jitter (bool, optional): Randomize delays between 0 and the backoff delay. Defaults to True.
+            max_retry_after (float, optional): Longest Retry-After delay to wait for; longer
+                delays fail the request instead. Defaults to 300.0.
+            retry_statuses (tuple, optional): HTTP status codes that may be retried.
+            idempotent_methods (tuple, optional): HTTP methods that are safe to replay.
+            reauthenticate (bool, optional): Re-authenticate and replay once on session expiry.
+                Defaults to True.
+            sleep (callable, optional): Function used to wait between attempts.
+        """
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+
+        self.max_attempts = max_attempts
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.jitter = jitter
+        self.max_retry_after = max_retry_after
+        self.retry_statuses = tuple(retry_statuses)
+        self.idempotent_methods = tuple(m.upper() for m in idempotent_methods)
+        self.reauthenticate = reauthenticate
+        self.sleep = sleep
+
+    @classmethod
+    def disabled(cls) -> "RetryPolicy":
+        """Returns a policy that never retries or re-authenticates."""
+        return cls(max_attempts=1, reauthenticate=False)
+
+    def is_idempotent(self, method: str, idempotent: Optional[bool] = None) -> bool:
+        """
+        Checks whether a request may be replayed after it possibly reached Vault.
+
+        Args:
+            method (str): HTTP method
+            idempotent (bool, optional): Explicit marking from the caller; overrides the method rule
+
+        Returns:
+            bool: True if the request is safe to replay
+        """
+        if idempotent is not None:
+            return idempotent
+        return method.upper() in self.idempotent_methods
+
+    def retry_delay(
+        self,
+        attempt: int,
+        error: Exception,
+        method: str,
+        idempotent: Optional[bool] = None,
+    ) -> Optional[float]:
+        """
+        Returns how long to wait before retrying a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1
+            error (Exception): The error raised by the attempt
+            method (str): HTTP method
+            idempotent (bool, optional): Explicit idempotency marking from the caller
+
+        Returns:
+            float: Seconds to wait, or None if the request must not be retried
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        response = getattr(error, "response", None)
+        status_code = getattr(response, "status_code", None)
+        cause = error.__cause__ if error.__cause__ is not None else error
+
+        if status_code == 429 and 429 in self.retry_statuses:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after if retry_after <= self.max_retry_after else None
+            return self.backoff(attempt)
+
+        if isinstance(cause, requests.exceptions.ConnectTimeout):
+            return self.backoff(attempt)
+
+        if not self.is_idempotent(method, idempotent):
+            return None
+
+        if status_code in self.retry_statuses:
+            retry_after = self.retry_after(response)
+            if retry_after is not None and retry_after <= self.max_retry_after:
+                return max(retry_after, self.backoff(attempt))
+            return self.backoff(attempt)
+
+        if isinstance(
+            cause, (requests.exceptions.ConnectionError, requests.exceptions.Timeout)
+        ):
+            return self.backoff(attempt)
+
+        return None
+
+    def backoff(self, attempt: int) -> float:
+        """
+        Returns the exponential backoff delay after a failed attempt.
+
+        Args:
+            attempt (int): Number of the attempt that failed, starting at 1
+
+        Returns:
+            float: Seconds to wait
+        """
+        delay = min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    @staticmethod
+    def retry_after(response) -> Optional[float]:
+        """
+        Parses the Retry-After header of a response.
+
+        Args:
+            response (requests.Response): The response, if any
+
+        Returns:
+            float: Seconds to wait, or None if the header is missing or invalid
+        """
+        if response is None:
+            return None
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            retry_at = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
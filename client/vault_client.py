@@ -1,10 +1,23 @@
 from urllib.parse import urlparse
 import requests
-from typing import Dict, Any, Optional, Union
+import threading
+from typing import TYPE_CHECKING, Dict, Any, Optional, Union
 import logging
 
+from . import json_backend
+from .json_stream import STREAM_CHUNK_SIZE, JsonItemStream
+from .middleware import Middleware, RateLimitMiddleware, RetryMiddleware, VaultRequest
+from .retry import RetryPolicy
+
+if TYPE_CHECKING:
+    from .document_cache import DocumentContentCache
+    from .metadata_catalog import MetadataCatalog
+
 logger = logging.getLogger(__name__)
 
+# Marks a response body that has not been decoded
+_NOT_DECODED = object()
+
 
 class VaultClient:
     """
@@ -27,6 +40,20 @@ class VaultClient:
         # Property alias for service classes that expect session_id vs sessionId
         self._session_id = None
 
+        # Optional utilities.RateLimiter shared by every call made through this client
+        self.rate_limiter = None
+
+        # Retries, backoff and session recovery for api_call
+        self.retry_policy = RetryPolicy()
+
+        # Middleware wrapping every api_call, outermost first (see client.middleware).
+        # Rate limiting sits inside retries so every attempt is paced.
+        self.middleware = [RetryMiddleware(), RateLimitMiddleware()]
+        # Optional callable(client) that replaces an expired session (e.g. for OAuth);
+        # defaults to logging in again with vaultUserName and vaultPassword
+        self.session_refresher = None
+        self._auth_lock = threading.Lock()
+
     @property
     def session_id(self):
         """
@@ -52,11 +79,23 @@ class VaultClient:
         files: Dict = None,
         json: Any = None,
         raw_response: bool = False,
+        binary_response: bool = False,
+        stream_data: bool = False,
+        retry_policy: Optional[RetryPolicy] = None,
+        idempotent: Optional[bool] = None,
         **kwargs,
     ) -> Union[Dict[str, Any], requests.Response]:
         """
         This function is used to make API calls to the Veeva Vault API. It is a wrapper around the requests library.
 
+        Every call is passed as a VaultRequest through the client's middleware chain
+        (see add_middleware and client.middleware). By default the chain retries failed
+        requests according to the retry policy (see RetryPolicy): rate-limited requests,
+        and server and connection errors on idempotent requests, are retried with
+        exponential backoff, and an expired session is re-authenticated and the request
+        replayed. Requests with file uploads or streamed bodies are never replayed.
+        The default chain also applies the client's rate_limiter, if set.
+
         Args:
             endpoint: API endpoint to call
             method: HTTP method (GET, POST, PUT, DELETE)
@@ -66,10 +105,19 @@ class VaultClient:
             files: Dictionary of file-like objects for multipart encoding upload
             json: JSON data to send in the body
             raw_response: Whether to return the raw response object instead of parsed JSON
+            binary_response: Whether to return the body as bytes without decoding it. Bodies with
+                a binary or CSV content type are always returned as bytes.
+            stream_data: Whether to return a JsonItemStream that yields the data items as the
+                body arrives instead of decoding the whole body. Memory stays proportional to
+                one record; use for very large pages. Errors while iterating are not retried.
+            retry_policy: Retry policy for this call (defaults to the client's retry_policy)
+            idempotent: Mark the request as safe (True) or unsafe (False) to replay after a
+                server or connection error; by default only GET, HEAD, OPTIONS and PUT are
             kwargs: Additional arguments for requests.request
 
         Returns:
-            Either a JSON parsed dictionary or the raw response object if raw_response is True
+            The JSON parsed response, the raw response object if raw_response is True, the
+            body bytes for binary responses, or a JsonItemStream if stream_data is True
 
         Raises:
             VaultAuthenticationError: For 401 authentication errors
@@ -86,7 +134,8 @@ class VaultClient:
         # Add default headers if not already provided
         if "Accept" not in headers:
             headers["Accept"] = "application/json"
-        if "Authorization" not in headers and self.sessionId:
+        uses_client_session = "Authorization" not in headers
+        if uses_client_session and self.sessionId:
             headers["Authorization"] = f"{self.sessionId}"
 
         # Construct the full URL - handle both absolute and relative paths
@@ -98,7 +147,101 @@ class VaultClient:
             clean_endpoint = endpoint.lstrip("/")
             api_url = f"{baseUrl}/{clean_endpoint}"
 
-        # Import exceptions here to avoid circular imports
+        request = VaultRequest(
+            client=self,
+            method=method,
+            url=api_url,
+            headers=headers,
+            params=params,
+            data=data,
+            files=files,
+            json=json,
+            raw_response=raw_response,
+            binary_response=binary_response,
+            stream_data=stream_data,
+            retry_policy=retry_policy,
+            idempotent=idempotent,
+            uses_client_session=uses_client_session,
+            options=kwargs,
+        )
+        if stream_data:
+            request.options["stream"] = True
+        return self._dispatch(request, 0)
+
+    def _dispatch(self, request: VaultRequest, index: int):
+        """Passes a request to the middleware at index, or sends it at the end of the chain."""
+        if index == len(self.middleware):
+            return self._send(request)
+        return self.middleware[index](
+            request, lambda next_request: self._dispatch(next_request, index + 1)
+        )
+
+    def add_middleware(self, middleware: Middleware, index: Optional[int] = None) -> None:
+        """
+        Adds a middleware to the api_call chain.
+
+        Args:
+            middleware: The middleware (any callable taking request and call_next)
+            index: Position in the chain; 0 is outermost. Appends (innermost) if omitted.
+        """
+        if index is None:
+            self.middleware.append(middleware)
+        else:
+            self.middleware.insert(index, middleware)
+
+    def use_metadata_catalog(self, path: Optional[str] = None, **kwargs) -> "MetadataCatalog":
+        """
+        Serves metadata requests from a persistent catalog shared by all processes on the host.
+
+        The catalog is added as the outermost middleware, so catalog hits skip retries
+        and rate limiting. See client.metadata_catalog.MetadataCatalog.
+
+        Args:
+            path: Catalog file; defaults to ~/.cache/veevavault/metadata_catalog.sqlite3
+            **kwargs: Further MetadataCatalog options (check_interval, fallback_ttl, ...)
+
+        Returns:
+            The catalog, e.g. to call invalidate() after deploying configuration
+        """
+        from .metadata_catalog import MetadataCatalog
+
+        catalog = MetadataCatalog(path, **kwargs)
+        self.add_middleware(catalog, index=0)
+        return catalog
+
+    def use_document_cache(self, directory: Optional[str] = None, **kwargs) -> "DocumentContentCache":
+        """
+        Serves downloads of specific document versions from a persistent local cache.
+
+        The cache is added as the outermost middleware, so repeat downloads of a version's
+        file, thumbnail or renditions make no request at all. See
+        client.document_cache.DocumentContentCache.
+
+        Args:
+            directory: Cache directory; defaults to ~/.cache/veevavault/documents
+            **kwargs: Further DocumentContentCache options (max_bytes, verify)
+
+        Returns:
+            The cache, e.g. to call invalidate() or clear()
+        """
+        from .document_cache import DocumentContentCache
+
+        cache = DocumentContentCache(directory, **kwargs)
+        self.add_middleware(cache, index=0)
+        return cache
+
+    def _send(
+        self, request: VaultRequest
+    ) -> Union[Dict[str, Any], requests.Response, bytes, JsonItemStream]:
+        """
+        Sends one request and maps error responses to Vault exceptions.
+
+        This is the end of the middleware chain. See api_call for the return value
+        and exceptions.
+
+        Args:
+            request: The request to send
+        """
         from veevavault.exceptions import (
             VaultAPIError,
             VaultAuthenticationError,
@@ -111,16 +254,16 @@ class VaultClient:
         )
 
         try:
-            logger.debug(f"{method} {api_url}")
+            logger.debug(f"{request.method} {request.url}")
             response = requests.request(
-                method=method,
-                url=api_url,
-                headers=headers,
-                params=params,
-                data=data,
-                files=files,
-                json=json,
-                **kwargs,
+                method=request.method,
+                url=request.url,
+                headers=request.headers,
+                params=request.params,
+                data=request.data,
+                files=request.files,
+                json=request.json,
+                **request.options,
             )
 
             # Check for specific HTTP status codes and raise appropriate exceptions
@@ -147,7 +290,7 @@ class VaultClient:
                 raise VaultPermissionError(error_msg, response=response)
 
             elif response.status_code == 404:
-                error_msg = f"Resource not found: {api_url}"
+                error_msg = f"Resource not found: {request.url}"
                 logger.error(error_msg)
                 raise VaultNotFoundError(error_msg, response=response)
 
@@ -175,26 +318,49 @@ class VaultClient:
             # For any other error status
             response.raise_for_status()
 
-            # Check for INVALID_SESSION_ID in successful response
-            if response.status_code == 200:
+            if request.stream_data:
+                logger.debug(f"Response: {response.status_code} - Streaming")
+                return JsonItemStream(
+                    response.iter_content(chunk_size=STREAM_CHUNK_SIZE),
+                    on_value=lambda key, value: self._check_streamed_session(key, value, response),
+                    close=response.close,
+                )
+
+            # Decode the body once, with the configured JSON backend. Binary and CSV
+            # bodies are never decoded, and streamed responses are left unread so
+            # downloads are not buffered in memory.
+            is_json = json_backend.is_json_content_type(response.headers.get("Content-Type"))
+            response_data = _NOT_DECODED
+            if is_json and not request.binary_response and not request.options.get("stream"):
                 try:
-                    response_data = response.json()
-                    if isinstance(response_data, dict) and "errors" in response_data:
-                        for error in response_data["errors"]:
-                            if isinstance(error, dict) and error.get("type") == "INVALID_SESSION_ID":
-                                error_msg = "Session ID is invalid or expired"
-                                logger.error(error_msg)
-                                raise VaultSessionError(error_msg, response=response)
-                except (ValueError, AttributeError):
-                    # Response is not JSON, continue
-                    pass
-
-            if raw_response:
+                    response_data = json_backend.loads(response.content)
+                except ValueError as json_err:
+                    if not request.raw_response:
+                        raise VaultAPIError(
+                            f"Invalid JSON response: {json_err}", response=response
+                        ) from json_err
+
+            # Check for INVALID_SESSION_ID in successful response
+            if response.status_code == 200 and isinstance(response_data, dict):
+                for error in response_data.get("errors") or []:
+                    if isinstance(error, dict) and error.get("type") == "INVALID_SESSION_ID":
+                        error_msg = "Session ID is invalid or expired"
+                        logger.error(error_msg)
+                        raise VaultSessionError(error_msg, response=response)
+
+            if request.raw_response:
                 logger.debug(f"Response: {response.status_code}")
                 return response
 
+            if request.binary_response or not is_json:
+                logger.debug(f"Response: {response.status_code} - Binary")
+                return response.content
+
+            if response_data is _NOT_DECODED:
+                response_data = json_backend.loads(response.content)
+
             logger.debug(f"Response: {response.status_code} - Success")
-            return response.json()  # Return JSON response
+            return response_data
 
         except requests.exceptions.HTTPError as http_err:
             # This catches any HTTP errors not handled above
@@ -208,6 +374,9 @@ class VaultClient:
             logger.error(error_msg)
             raise VaultAPIError(error_msg, response=http_err.response) from http_err
 
+        except VaultAPIError:
+            raise
+
         except requests.exceptions.RequestException as req_err:
             # This catches connection errors, timeouts, etc.
             error_msg = f"Request error occurred: {req_err}"
@@ -220,6 +389,67 @@ class VaultClient:
             logger.error(error_msg)
             raise VaultAPIError(error_msg) from err
 
+    @staticmethod
+    def _check_streamed_session(key: str, value: Any, response: requests.Response) -> None:
+        """Raises VaultSessionError when a streamed response reports an invalid session."""
+        from veevavault.exceptions import VaultSessionError
+
+        if key != "errors" or not isinstance(value, list):
+            return
+        for error in value:
+            if isinstance(error, dict) and error.get("type") == "INVALID_SESSION_ID":
+                logger.error("Session ID is invalid or expired")
+                raise VaultSessionError("Session ID is invalid or expired", response=response)
+
+    def reauthenticate(self, expired_session_id: Optional[str] = None) -> bool:
+        """
+        Replaces an expired session with a new one.
+
+        Uses session_refresher if set (a callable taking the client and setting its
+        session_id), otherwise logs in again with the stored user name and password.
+        Concurrent callers that hit the same expired session share one re-authentication.
+
+        Args:
+            expired_session_id: The session ID that was rejected
+
+        Returns:
+            bool: True if a new session is available
+        """
+        with self._auth_lock:
+            if expired_session_id and self.sessionId and self.sessionId != expired_session_id:
+                # Another caller already replaced the expired session
+                return True
+
+            if self.session_refresher is not None:
+                self.session_refresher(self)
+                return bool(self.sessionId) and self.sessionId != expired_session_id
+
+            if not (self.vaultUserName and self.vaultPassword and self.vaultURL):
+                return False
+
+            from veevavault.services.authentication import AuthenticationService
+
+            result = AuthenticationService(self).authenticate_with_username_password(
+                username=self.vaultUserName, password=self.vaultPassword
+            )
+            return result.get("responseStatus") == "SUCCESS"
+
+    def with_retry_policy(self, retry_policy: RetryPolicy) -> "VaultClient":
+        """
+        Returns a view of this client that uses a different retry policy.
+
+        The view shares the session and all other state with this client, so it can be
+        passed to a service to configure retries for that service only, e.g.
+        LogsService(client.with_retry_policy(RetryPolicy(max_attempts=8))).
+
+        Args:
+            retry_policy: Retry policy for calls made through the view
+
+        Returns:
+            A client view using retry_policy
+        """
+        return _RetryPolicyView(self, retry_policy)
+
     def authenticate(
         self,
         vaultURL=None,
@@ -304,3 +534,26 @@ class VaultClient:
 
         auth_service = AuthenticationService(self)
         return auth_service.keep_alive()
+
+
+class _RetryPolicyView:
+    """
+    A VaultClient that shares all state with another client but uses its own retry policy.
+    """
+
+    def __init__(self, client: VaultClient, retry_policy: RetryPolicy):
+        object.__setattr__(self, "_client", client)
+        object.__setattr__(self, "retry_policy", retry_policy)
+
+    def __getattr__(self, name):
+        return getattr(self._client, name)
+
+    def __setattr__(self, name, value):
+        if name == "retry_policy":
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self._client, name, value)
+
+    def api_call(self, *args, **kwargs):
+        kwargs.setdefault("retry_policy", self.retry_policy)
+        return self._client.api_call(*args, **kwargs)
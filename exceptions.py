@@ -28,7 +28,8 @@ class VaultAPIError(Exception):
         super().__init__(message)
         self.message = message
         self.response = response
-        self.status_code = response.status_code if response else None
+        # requests.Response is falsy for error statuses, so compare with None
+        self.status_code = response.status_code if response is not None else None
         self.vault_errors = []
 
         # Try to extract Vault-specific errors from response
@@ -95,6 +96,19 @@ class VaultQueryError(VaultAPIError):
     pass
 
 
+class VQLSyntaxError(VaultQueryError):
+    """
+    Raised when a VQL query cannot be parsed locally.
+
+    Attributes:
+        position (int): Character position of the error in the query
+    """
+
+    def __init__(self, message, position=None):
+        super().__init__(message)
+        self.position = position
+
+
 class VaultSessionError(VaultAPIError):
     """Raised when session is invalid or expired."""
     pass
@@ -1,5 +1,6 @@
 import json
 import requests
+from veevavault.utilities.lazy_service import LazyService
 from .retrieval_service import BinderRetrievalService
 from .creation_service import BinderCreationService
 from .update_service import BinderUpdateService
@@ -20,6 +21,21 @@ class BinderService:
     This class aggregates all specialized binder service classes.
     """
 
+    # Specialized services are constructed on first access and cached on the
+    # instance; see LazyService.
+    retrieval = LazyService(BinderRetrievalService)
+    creation = LazyService(BinderCreationService)
+    update = LazyService(BinderUpdateService)
+    deletion = LazyService(BinderDeletionService)
+    export = LazyService(BinderExportService)
+    relationships = LazyService(BinderRelationshipsService)
+    sections = LazyService(BinderSectionsService)
+    documents = LazyService(BinderDocumentsService)
+    templates = LazyService(BinderTemplatesService)
+    binding_rules = LazyService(BinderBindingRulesService)
+    roles = LazyService(BinderRolesService)
+    lifecycle = LazyService(BinderLifecycleService)
+
     def __init__(self, client):
         """
         Initialize with a VaultClient instance
@@ -28,17 +44,3 @@ class BinderService:
             client: An initialized VaultClient instance
         """
         self.client = client
-
-        # Initialize specialized services
-        self.retrieval = BinderRetrievalService(client)
-        self.creation = BinderCreationService(client)
-        self.update = BinderUpdateService(client)
-        self.deletion = BinderDeletionService(client)
-        self.export = BinderExportService(client)
-        self.relationships = BinderRelationshipsService(client)
-        self.sections = BinderSectionsService(client)
-        self.documents = BinderDocumentsService(client)
-        self.templates = BinderTemplatesService(client)
-        self.binding_rules = BinderBindingRulesService(client)
-        self.roles = BinderRolesService(client)
-        self.lifecycle = BinderLifecycleService(client)
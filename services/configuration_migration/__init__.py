@@ -1,3 +1,4 @@
 from .configuration_migration import ConfigurationMigrationService
+from .snapshot import SnapshotStore, diff_snapshots, take_snapshot
 
-__all__ = ["ConfigurationMigrationService"]
+__all__ = ["ConfigurationMigrationService", "SnapshotStore", "diff_snapshots", "take_snapshot"]
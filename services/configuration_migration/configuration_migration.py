@@ -1,6 +1,5 @@
 import os
-import pandas as pd
-from typing import Dict, List, Optional, Union, BinaryIO, Any
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Union
 
 
 class ConfigurationMigrationService:
@@ -43,7 +42,9 @@ class ConfigurationMigrationService:
 
         return self.client.api_call(url, method="POST", data=data)
 
-    def import_package(self, file_path: Union[str, BinaryIO]) -> Dict[str, Any]:
+    def import_package(
+        self, file_path: Union[str, BinaryIO], progress: Optional[Callable[[int, int], None]] = None
+    ) -> Dict[str, Any]:
         """
         Asynchronously imports and validates a VPK package.
 
@@ -60,21 +61,26 @@ class ConfigurationMigrationService:
 
         Args:
             file_path (Union[str, BinaryIO]): The path to the .vpk file or a file-like object.
+                                             The package is streamed, not read into memory.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the package uploads.
 
         Returns:
             dict: The JSON response containing import job information.
         """
+        from veevavault.utilities.multipart import send_multipart
+
         url = f"api/{self.client.LatestAPIversion}/services/package"
 
         # Handle both file path strings and file-like objects
         if isinstance(file_path, str):
             with open(file_path, "rb") as f:
-                files = {"file": (os.path.basename(file_path), f)}
-                return self.client.api_call(url, method="PUT", files=files)
+                fields = {"file": (os.path.basename(file_path), f)}
+                return send_multipart(self.client, url, fields, method="PUT", progress=progress)
         else:
             # Assume file_path is a file-like object
-            files = {"file": file_path}
-            return self.client.api_call(url, method="PUT", files=files)
+            filename = os.path.basename(getattr(file_path, "name", "") or "file")
+            fields = {"file": (filename, file_path)}
+            return send_multipart(self.client, url, fields, method="PUT", progress=progress)
 
     def deploy_package(self, package_id: str) -> Dict[str, Any]:
         """
@@ -297,6 +303,86 @@ class ConfigurationMigrationService:
 
         return self.client.api_call(url, method="POST", data=data)
 
+    def snapshot_configuration(
+        self,
+        store_dir: str,
+        component_types: Optional[List[str]] = None,
+        max_workers: int = 8,
+    ) -> Dict[str, Any]:
+        """
+        Takes a local snapshot of the MDL of every component in this Vault.
+
+        Runs entirely through the API (no compare or report job). Components whose
+        checksum is unchanged since this Vault's previous snapshot in store_dir are
+        not fetched again. See configuration_migration.snapshot for the store layout.
+
+        Args:
+            store_dir (str): Directory of the content-addressed snapshot store,
+                            shared by all Vaults being compared
+            component_types (list, optional): Only these component types, e.g. ["Doctype", "Picklist"].
+                                             Defaults to all components. Other types keep
+                                             their entries from the previous snapshot.
+            max_workers (int, optional): Maximum concurrent MDL requests. Defaults to 8.
+
+        Returns:
+            dict: The snapshot manifest (vault, taken_at, component_types, components,
+                 errors, stats, path)
+        """
+        from .snapshot import SnapshotStore, take_snapshot
+
+        return take_snapshot(
+            self.client,
+            SnapshotStore(store_dir),
+            component_types=component_types,
+            max_workers=max_workers,
+        )
+
+    def diff_configuration_snapshots(
+        self,
+        store_dir: str,
+        source: str,
+        target: str,
+        component_types: Optional[List[str]] = None,
+        include_mdl_diffs: Optional[bool] = True,
+    ) -> Dict[str, Any]:
+        """
+        Compares two configuration snapshots locally.
+
+        A local alternative to compare_vaults: take a snapshot of each Vault with
+        snapshot_configuration, then diff them in seconds without a server-side job.
+
+        Args:
+            store_dir (str): Directory of the snapshot store
+            source (str): Reference Vault (ID or host) or manifest path, e.g. production
+            target (str): Compared Vault (ID or host) or manifest path, e.g. a sandbox
+            component_types (list, optional): Only these component types. Defaults to all.
+            include_mdl_diffs (bool, optional): Include a unified MDL diff per changed
+                                               component. Defaults to True.
+
+        Returns:
+            dict: added, removed and changed component keys, the unchanged count,
+                 unknown (unfetchable) keys and, optionally, diffs
+
+        Raises:
+            ValueError: If either snapshot does not exist
+        """
+        from .snapshot import SnapshotStore, diff_snapshots
+
+        store = SnapshotStore(store_dir)
+        manifests = []
+        for name in (source, target):
+            manifest = store.load_manifest(name)
+            if manifest is None:
+                raise ValueError(f"No configuration snapshot for {name} in {store_dir}")
+            manifests.append(manifest)
+
+        return diff_snapshots(
+            manifests[0],
+            manifests[1],
+            store=store if include_mdl_diffs else None,
+            component_types=component_types,
+        )
+
     def validate_package(self, file_path: Union[str, BinaryIO]) -> Dict[str, Any]:
         """
         Validates a VPK package without importing it.
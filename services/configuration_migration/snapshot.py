@@ -0,0 +1,391 @@
+import difflib
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+COMPONENT_QUERY = (
+    "SELECT component_type__v, component_name__v, checksum__v FROM vault_component__v"
+)
+
+
+class SnapshotStore:
+    """
+    Content-addressed on-disk store of configuration snapshots.
+
+    Each component's MDL is stored once under the SHA-256 of its text, so
+    unchanged components cost nothing across snapshots and vaults. A
+    snapshot is a small JSON manifest mapping component keys
+    ("Picklist.color__c") to their checksum and content hash.
+
+        root/
+            objects/ab/cdef...         MDL text by SHA-256
+            snapshots/<vault>/<ts>.json
+            snapshots/<vault>/latest.json
+    """
+
+    def __init__(self, root: str):
+        """
+        Args:
+            root (str): Store directory; created if missing
+        """
+        self.root = root
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+        os.makedirs(os.path.join(root, "snapshots"), exist_ok=True)
+
+    def put(self, text: str) -> str:
+        """
+        Stores MDL text.
+
+        Args:
+            text (str): MDL text
+
+        Returns:
+            str: SHA-256 of the text, its address in the store
+        """
+        data = text.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            _write_atomic(path, data)
+        return digest
+
+    def get(self, digest: str) -> str:
+        """
+        Reads MDL text by address.
+
+        Args:
+            digest (str): SHA-256 returned by put
+
+        Returns:
+            str: MDL text
+        """
+        with open(self._object_path(digest), "rb") as f:
+            return f.read().decode("utf-8")
+
+    def has(self, digest: str) -> bool:
+        """Whether the store holds the text with this address."""
+        return os.path.exists(self._object_path(digest))
+
+    def save_manifest(self, manifest: Dict[str, Any]) -> str:
+        """
+        Saves a snapshot manifest and marks it the vault's latest.
+
+        Args:
+            manifest (dict): Manifest with vault and taken_at keys
+
+        Returns:
+            str: Path of the saved manifest
+        """
+        directory = os.path.join(self.root, "snapshots", _safe_name(manifest["vault"]))
+        os.makedirs(directory, exist_ok=True)
+        data = json.dumps(manifest, indent=1, sort_keys=True).encode("utf-8")
+        stamp = time.strftime("%Y%m%dT%H%M%SZ", time.gmtime(manifest["taken_at"]))
+        path = os.path.join(directory, f"{stamp}.json")
+        _write_atomic(path, data)
+        _write_atomic(os.path.join(directory, "latest.json"), data)
+        return path
+
+    def load_manifest(self, vault_or_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Loads a manifest.
+
+        Args:
+            vault_or_path (str): Path of a manifest file, or a vault whose latest
+                snapshot to load
+
+        Returns:
+            dict: The manifest, or None if the vault has no snapshot
+        """
+        path = vault_or_path
+        if not os.path.isfile(path):
+            path = os.path.join(self.root, "snapshots", _safe_name(vault_or_path), "latest.json")
+            if not os.path.isfile(path):
+                return None
+        with open(path, "rb") as f:
+            return json.loads(f.read())
+
+    def list_snapshots(self, vault: str) -> List[str]:
+        """
+        Lists a vault's snapshot manifests, oldest first.
+
+        Args:
+            vault (str): Vault ID or host
+
+        Returns:
+            list: Manifest paths
+        """
+        directory = os.path.join(self.root, "snapshots", _safe_name(vault))
+        if not os.path.isdir(directory):
+            return []
+        return sorted(
+            os.path.join(directory, name)
+            for name in os.listdir(directory)
+            if name.endswith(".json") and name != "latest.json"
+        )
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], digest[2:])
+
+
+def vault_key(client) -> str:
+    """Returns the key a client's snapshots are stored under: its vault ID, or else its host."""
+    vault_id = getattr(client, "vaultId", None)
+    if vault_id:
+        return str(vault_id)
+    return urlparse(getattr(client, "vaultURL", None) or "").netloc or "default"
+
+
+def list_components(client, component_types: Optional[Iterable[str]] = None) -> Dict[str, str]:
+    """
+    Lists the vault's components and their checksums.
+
+    Args:
+        client: An authenticated VaultClient instance
+        component_types (iterable, optional): Only these component types
+
+    Returns:
+        dict: Component key ("Type.name") -> checksum
+    """
+    query = COMPONENT_QUERY
+    types = list(component_types or [])
+    if types:
+        query += " WHERE component_type__v CONTAINS (" + ",".join(f"'{t}'" for t in types) + ")"
+
+    response = client.api_call(
+        f"api/{client.LatestAPIversion}/query",
+        method="POST",
+        data={"q": query},
+        headers={"Content-Type": "application/x-www-form-urlencoded"},
+        idempotent=True,
+    )
+    components = {}
+    while True:
+        if response.get("responseStatus") == "FAILURE":
+            from veevavault.exceptions import VaultQueryError
+
+            raise VaultQueryError(f"Component query failed: {response.get('errors', response)}")
+        for row in response.get("data") or []:
+            key = f"{row.get('component_type__v')}.{row.get('component_name__v')}"
+            components[key] = row.get("checksum__v") or ""
+        next_page = (response.get("responseDetails") or {}).get("next_page")
+        if not next_page:
+            return components
+        response = client.api_call(next_page)
+
+
+def take_snapshot(
+    client,
+    store: SnapshotStore,
+    component_types: Optional[Iterable[str]] = None,
+    max_workers: int = 8,
+) -> Dict[str, Any]:
+    """
+    Snapshots the MDL of every component of a vault into a store.
+
+    Components whose checksum matches the vault's previous snapshot are
+    taken from it; only new and changed components are fetched, concurrently,
+    with MDLService.retrieve_component_record_mdl.
+
+    A snapshot of some component types carries the previous snapshot's
+    entries for all other types forward, so it can still serve as the base
+    of the next snapshot. The manifest's component_types lists the types it
+    covers, or is None when it covers all of them.
+
+    Args:
+        client: An authenticated VaultClient instance
+        store (SnapshotStore): Store to write to
+        component_types (iterable, optional): Only these component types
+        max_workers (int, optional): Maximum concurrent MDL requests. Defaults to 8.
+
+    Returns:
+        dict: The manifest, with vault, taken_at, component_types, components
+            (key -> {checksum, sha256}), errors (key -> message), stats and path
+
+    Raises:
+        VaultQueryError: If the components cannot be listed
+    """
+    from veevavault.services.mdl import MDLService
+    from veevavault.services.mdl.crawler import mdl_error
+
+    start = time.monotonic()
+    vault = vault_key(client)
+    types = sorted(set(component_types or []))
+    checksums = list_components(client, types)
+    previous_manifest = store.load_manifest(vault) or {}
+    previous = previous_manifest.get("components", {})
+
+    components: Dict[str, Dict[str, str]] = {}
+    errors: Dict[str, str] = {}
+    covered = None
+    if types:
+        # Keep the previous snapshot's view of the types not listed this time
+        def other_type(key: str) -> bool:
+            return key.split(".", 1)[0] not in types
+
+        components = {key: entry for key, entry in previous.items() if other_type(key)}
+        errors = {
+            key: error
+            for key, error in previous_manifest.get("errors", {}).items()
+            if other_type(key)
+        }
+        if previous_manifest:
+            previous_types = previous_manifest.get("component_types")
+            if previous_types is not None:
+                covered = sorted(set(previous_types) | set(types))
+        else:
+            covered = types
+    carried = len(components)
+
+    to_fetch = []
+    for key, checksum in checksums.items():
+        old = previous.get(key)
+        if old and checksum and old.get("checksum") == checksum and store.has(old["sha256"]):
+            components[key] = old
+        else:
+            to_fetch.append(key)
+
+    mdl = MDLService(client)
+
+    def fetch(key: str) -> Tuple[str, Optional[str], Optional[str]]:
+        try:
+            text = mdl.retrieve_component_record_mdl(key)
+        except Exception as e:
+            return key, None, str(e)
+        error = mdl_error(text)
+        return (key, None, error) if error else (key, text, None)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+        for key, text, error in executor.map(fetch, to_fetch):
+            if error is not None:
+                errors[key] = error
+                failed += 1
+                continue
+            components[key] = {"checksum": checksums[key], "sha256": store.put(text)}
+
+    manifest = {
+        "vault": vault,
+        "taken_at": time.time(),
+        "component_types": covered,
+        "components": components,
+        "errors": errors,
+        "stats": {
+            "components": len(checksums),
+            "fetched": len(to_fetch) - failed,
+            "reused": len(checksums) - len(to_fetch),
+            "failed": failed,
+            "carried": carried,
+            "seconds": round(time.monotonic() - start, 2),
+        },
+    }
+    manifest["path"] = store.save_manifest(manifest)
+    logger.info(
+        f"Snapshot of {vault}: {len(checksums)} components, "
+        f"{manifest['stats']['fetched']} fetched, {manifest['stats']['reused']} unchanged, "
+        f"{failed} failed"
+    )
+    return manifest
+
+
+def diff_snapshots(
+    source: Dict[str, Any],
+    target: Dict[str, Any],
+    store: Optional[SnapshotStore] = None,
+    component_types: Optional[Iterable[str]] = None,
+    context_lines: int = 3,
+) -> Dict[str, Any]:
+    """
+    Compares two snapshot manifests locally.
+
+    Components are compared by content hash, so identical definitions are
+    never read. With a store, a unified diff of the MDL is included for
+    each changed component. Only component types covered by both snapshots
+    are compared (see take_snapshot).
+
+    Args:
+        source (dict): Manifest of the reference vault (e.g. production)
+        target (dict): Manifest of the compared vault (e.g. a sandbox)
+        store (SnapshotStore, optional): Store holding both snapshots' MDL
+        component_types (iterable, optional): Only these component types
+        context_lines (int, optional): Context lines in the diffs. Defaults to 3.
+
+    Returns:
+        dict:
+            - component_types: The compared types, or None for all
+            - added: Keys only in target
+            - removed: Keys only in source
+            - changed: Keys in both with different MDL
+            - unchanged: Number of identical components
+            - unknown: Keys whose MDL could not be fetched in either snapshot
+            - diffs: Key -> unified diff of changed components (with a store)
+    """
+    types = set(component_types) if component_types else None
+    for manifest in (source, target):
+        covered = manifest.get("component_types")
+        if covered is not None:
+            types = set(covered) if types is None else types & set(covered)
+
+    def included(key: str) -> bool:
+        return types is None or key.split(".", 1)[0] in types
+
+    def selected(manifest: Dict[str, Any]) -> Dict[str, str]:
+        return {
+            key: entry["sha256"]
+            for key, entry in manifest.get("components", {}).items()
+            if included(key)
+        }
+
+    a, b = selected(source), selected(target)
+    # Components whose MDL could not be fetched are neither added nor removed
+    failed = {key for key in (*source.get("errors", {}), *target.get("errors", {})) if included(key)}
+    changed = sorted(key for key in a.keys() & b.keys() if a[key] != b[key])
+    result: Dict[str, Any] = {
+        "source": source.get("vault"),
+        "target": target.get("vault"),
+        "component_types": sorted(types) if types is not None else None,
+        "added": sorted(b.keys() - a.keys() - failed),
+        "removed": sorted(a.keys() - b.keys() - failed),
+        "changed": changed,
+        "unchanged": len(a.keys() & b.keys()) - len(changed),
+        "unknown": sorted(failed),
+    }
+    if store is not None:
+        result["diffs"] = {
+            key: "".join(
+                difflib.unified_diff(
+                    store.get(a[key]).splitlines(keepends=True),
+                    store.get(b[key]).splitlines(keepends=True),
+                    fromfile=f"{source.get('vault')}/{key}",
+                    tofile=f"{target.get('vault')}/{key}",
+                    n=context_lines,
+                )
+            )
+            for key in changed
+        }
+    return result
+
+
+def _safe_name(name: str) -> str:
+    return "".join(c if c.isalnum() or c in "-_." else "_" for c in str(name))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    directory = os.path.dirname(path)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
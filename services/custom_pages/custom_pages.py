@@ -1,3 +1,6 @@
+import os
+
+
 class CustomPagesService:
     """
     Service class for managing Custom Pages in Veeva Vault.
@@ -85,7 +88,7 @@ class CustomPagesService:
         # Set raw_response=True to get the binary content directly
         return self.client.api_call(url, raw_response=True)
 
-    def upload_client_code_distribution(self, zip_file_path):
+    def upload_client_code_distribution(self, zip_file_path, progress=None):
         """
         Add or replace client code in Vault by uploading a ZIP file of the client code distribution.
 
@@ -99,6 +102,7 @@ class CustomPagesService:
         Args:
             zip_file_path (str): The file path to the ZIP file containing the client code distribution.
                                 The maximum allowed total file size for all distributions in a Vault is 50 MB.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads.
 
         Returns:
             dict: The JSON response containing:
@@ -110,9 +114,11 @@ class CustomPagesService:
         url = f"api/{self.client.LatestAPIversion}/uicode/distributions/"
 
         # Prepare file for upload
+        from veevavault.utilities.multipart import send_multipart
+
         with open(zip_file_path, "rb") as f:
-            files = {"file": f}
-            return self.client.api_call(url, method="POST", files=files)
+            fields = {"file": (os.path.basename(zip_file_path), f)}
+            return send_multipart(self.client, url, fields, progress=progress)
 
     def delete_client_code_distribution(self, distribution_name):
         """
@@ -16,6 +16,7 @@ from .templates_service import DocumentTemplatesService
 from .signatures_service import DocumentSignaturesService
 from .tokens_service import DocumentTokensService
 from .roles_service import DocumentRolesService
+from .batch_builder import DocumentBatch
 
 
 __all__ = [
@@ -37,4 +38,5 @@ __all__ = [
     "DocumentSignaturesService",
     "DocumentTokensService",
     "DocumentRolesService",
+    "DocumentBatch",
 ]
@@ -0,0 +1,258 @@
+import csv
+import io
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# operation -> (HTTP method, endpoint below /api/{version}/)
+BATCH_OPERATIONS = {
+    "create": ("POST", "objects/documents/batch"),
+    "create_versions": ("POST", "objects/documents/versions/batch"),
+    "update": ("PUT", "objects/documents/batch"),
+    "reclassify": ("PUT", "objects/documents/batch/actions/reclassify"),
+    "add_renditions": ("POST", "objects/documents/renditions/batch"),
+}
+
+
+def csv_value(value: Any) -> str:
+    """
+    Formats a field value for a Vault CSV input.
+
+    Args:
+        value: Field value. Lists (multi-value fields) are comma-joined,
+            booleans are lower-case and None is empty.
+
+    Returns:
+        str: The cell text
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple, set)):
+        return ",".join(csv_value(v) for v in value)
+    return str(value)
+
+
+def encode_csv(records: Sequence[Dict[str, Any]], columns: Optional[Sequence[str]] = None) -> bytes:
+    """
+    Encodes records as one RFC 4180, UTF-8 CSV body.
+
+    Args:
+        records (sequence): Records as dicts of field name -> value
+        columns (sequence, optional): Column order. Defaults to the fields of the
+            records in first-seen order.
+
+    Returns:
+        bytes: CSV with a header row
+    """
+    if columns is None:
+        columns = list(dict.fromkeys(name for record in records for name in record))
+    buffer = io.StringIO()
+    writer = csv.writer(buffer, lineterminator="\r\n")
+    writer.writerow(columns)
+    for record in records:
+        writer.writerow([csv_value(record.get(name)) for name in columns])
+    return buffer.getvalue().encode("utf-8")
+
+
+def iter_csv_batches(
+    records: Iterable[Dict[str, Any]],
+    batch_size: int = 500,
+    columns: Optional[Sequence[str]] = None,
+) -> Iterator[Tuple[int, List[Dict[str, Any]], bytes]]:
+    """
+    Encodes records as CSV bodies of up to batch_size rows.
+
+    Only one batch of records is held at a time, so any number of records
+    can be streamed from a generator.
+
+    Args:
+        records (iterable): Records as dicts of field name -> value
+        batch_size (int, optional): Rows per body. Defaults to 500.
+        columns (sequence, optional): Column order for every batch. Defaults to
+            the fields of each batch's records.
+
+    Yields:
+        tuple: (index of the batch's first record, batch records, CSV body)
+    """
+    iterator = iter(records)
+    offset = 0
+    while True:
+        batch = list(islice(iterator, batch_size))
+        if not batch:
+            return
+        yield offset, batch, encode_csv(batch, columns)
+        offset += len(batch)
+
+
+class DocumentBatch:
+    """
+    Runs a document bulk endpoint over any number of records.
+
+    Records are streamed from an iterable, encoded as RFC 4180 CSV in chunks
+    of up to 500 rows (the batch limit of these endpoints) and submitted
+    concurrently through client.api_call, with at most max_workers chunks
+    encoded or in flight at a time. Each row of a chunk's response is mapped
+    back to the input record it belongs to.
+
+    Operations:
+
+    - create: Create Multiple Documents
+    - create_versions: Create Multiple Document Versions
+    - update: Update Multiple Documents
+    - reclassify: Reclassify Multiple Documents
+    - add_renditions: Add Multiple Document Renditions
+
+        batch = DocumentBatch(client, "update")
+        for result in batch.iter_results({"id": i, "title__v": t} for i, t in rows):
+            if result["responseStatus"] != "SUCCESS":
+                print(result["row"], result["errors"])
+    """
+
+    MAX_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        client,
+        operation: str,
+        id_param: Optional[str] = None,
+        columns: Optional[Sequence[str]] = None,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the batch.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            operation (str): One of the BATCH_OPERATIONS keys, e.g. "create" or "update"
+            id_param (str, optional): Unique field identifying documents, sent as idParam
+                (create_versions and add_renditions)
+            columns (sequence, optional): CSV column order. Defaults to the record fields.
+            batch_size (int, optional): Rows per request, at most 500. Defaults to 500.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            params (dict, optional): Further query parameters, e.g. {"largeSizeAsset": "true"}
+            headers (dict, optional): Further headers, e.g. X-VaultAPI-MigrationMode
+
+        Raises:
+            ValueError: If operation, batch_size or max_workers is invalid
+        """
+        if operation not in BATCH_OPERATIONS:
+            raise ValueError(f"operation must be one of {', '.join(BATCH_OPERATIONS)}")
+        if not 1 <= batch_size <= self.MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {self.MAX_BATCH_SIZE}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.operation = operation
+        self.method, endpoint = BATCH_OPERATIONS[operation]
+        self.url = f"api/{client.LatestAPIversion}/{endpoint}"
+        self.columns = columns
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.params = dict(params or {})
+        if id_param:
+            self.params["idParam"] = id_param
+        self.headers = {"Content-Type": "text/csv", "Accept": "application/json", **(headers or {})}
+
+    def iter_results(self, records: Iterable[Dict[str, Any]]) -> Iterator[Dict[str, Any]]:
+        """
+        Submits the records and yields one result per record as chunks complete.
+
+        Chunks complete in any order; the row index identifies the input record.
+
+        Args:
+            records (iterable): Records as dicts of field name -> value
+
+        Yields:
+            dict: The response row for the record (responseStatus, id, errors, ...),
+                plus row (0-based index in the input) and record (the input record)
+        """
+        batches = iter_csv_batches(records, self.batch_size, self.columns)
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+
+            def submit_next() -> bool:
+                item = next(batches, None)
+                if item is None:
+                    return False
+                offset, batch, body = item
+                in_flight[executor.submit(self._submit, body)] = (offset, batch)
+                return True
+
+            for _ in range(self.max_workers):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    offset, batch = in_flight.pop(future)
+                    submit_next()
+                    for i, row in enumerate(self._rows(future, len(batch))):
+                        yield {**row, "row": offset + i, "record": batch[i]}
+
+    def run(self, records: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Submits the records and collects the results.
+
+        Args:
+            records (iterable): Records as dicts of field name -> value
+
+        Returns:
+            dict:
+                - results: One result per record, in input order (see iter_results)
+                - succeeded, failed: Record counts
+                - failed_rows: Input indexes of failed records
+        """
+        results = sorted(self.iter_results(records), key=lambda result: result["row"])
+        failed_rows = [r["row"] for r in results if r.get("responseStatus") != "SUCCESS"]
+        logger.info(
+            f"Document batch {self.operation}: {len(results) - len(failed_rows)} succeeded, "
+            f"{len(failed_rows)} failed"
+        )
+        return {
+            "results": results,
+            "succeeded": len(results) - len(failed_rows),
+            "failed": len(failed_rows),
+            "failed_rows": failed_rows,
+        }
+
+    def _submit(self, body: bytes) -> Any:
+        return self.client.api_call(
+            self.url,
+            method=self.method,
+            headers=dict(self.headers),
+            params=self.params or None,
+            data=body,
+        )
+
+    @staticmethod
+    def _rows(future, count: int) -> List[Dict[str, Any]]:
+        """Returns one response row per record of a chunk."""
+        try:
+            response = future.result()
+        except Exception as e:
+            logger.warning(f"Document batch of {count} rows failed: {e}")
+            return [_failure(str(e))] * count
+
+        rows = response.get("data") if isinstance(response, dict) else None
+        if isinstance(rows, list) and len(rows) == count:
+            return rows
+        if isinstance(response, dict) and response.get("errors"):
+            errors = response["errors"]
+            message = errors[0].get("message", str(errors[0])) if isinstance(errors[0], dict) else str(errors[0])
+        else:
+            message = f"Unexpected batch response: {str(response)[:200]}"
+        return [_failure(message)] * count
+
+
+def _failure(message: str) -> Dict[str, Any]:
+    return {"responseStatus": "FAILURE", "errors": [{"type": "BATCH_FAILED", "message": message}]}
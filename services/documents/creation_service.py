@@ -1,6 +1,12 @@
+import io
 import os
 import json
 from typing import Dict, Any, Optional, Union, BinaryIO, List
+from veevavault.utilities.multipart import (
+    STAGING_THRESHOLD,
+    send_multipart,
+    staged_upload,
+)
 from .base_service import BaseDocumentService
 
 
@@ -32,6 +38,7 @@ class DocumentCreationService(BaseDocumentService):
         content_creation_cost_v=None,
         suppress_rendition=False,
         options=None,
+        progress=None,
     ):
         """
         Creates a new document in the Vault.
@@ -72,11 +79,16 @@ class DocumentCreationService(BaseDocumentService):
             content_creation_cost_v (str, optional): For PromoMats Vaults. The id of the content creation cost.
             suppress_rendition (bool, optional): Whether to suppress generation of viewable renditions. Default is False.
             options (dict, optional): Additional document options or fields.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads.
 
         Returns:
             dict: API response containing details of the created document.
                  On SUCCESS, returns the document id in "id" field.
                  Example: {"responseStatus": "SUCCESS", "responseMessage": "successfully created document", "id": 773}
+
+        Note:
+            The file is streamed from disk. Files larger than STAGING_THRESHOLD (1GB) are first
+            uploaded to file staging through a resumable upload session and referenced by path.
         """
         url = f"api/{self.client.LatestAPIversion}/objects/documents"
 
@@ -136,20 +148,21 @@ class DocumentCreationService(BaseDocumentService):
                     data[key] = value
 
         # Different handling based on document creation type
-        if file_path:
+        if file_path and os.path.getsize(file_path) > STAGING_THRESHOLD:
+            # Create document from a file uploaded to file staging
+            with staged_upload(self.client, file_path, progress=progress) as staging_path:
+                data["file"] = staging_path
+                headers = {"Accept": "application/json"}
+                return send_multipart(self.client, url, data, headers=headers)
+        elif file_path:
             # Create document from uploaded file
             with open(file_path, "rb") as file:
-                files = {
-                    "file": (os.path.basename(file_path), file),
-                }
-
-                # Add all data fields as form fields
-                for key, value in data.items():
-                    files[key] = (None, str(value))
+                fields = [(key, str(value)) for key, value in data.items()]
+                fields.append(("file", (os.path.basename(file_path), file)))
 
                 headers = {"Accept": "application/json"}
-                return self.client.api_call(
-                    url, method="POST", headers=headers, files=files
+                return send_multipart(
+                    self.client, url, fields, headers=headers, progress=progress
                 )
         else:
             # Create placeholder, template-based, or CrossLink document
@@ -181,6 +194,7 @@ class DocumentCreationService(BaseDocumentService):
         product_v=None,
         suppress_rendition=False,
         options=None,
+        progress=None,
     ):
         """
         Creates a new document using binary data instead of a file path.
@@ -200,6 +214,7 @@ class DocumentCreationService(BaseDocumentService):
             product_v (str, optional): The product reference for the document.
             suppress_rendition (bool, optional): Whether to suppress generation of viewable renditions. Default is False.
             options (dict, optional): Additional document options or fields.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads.
 
         Returns:
             dict: API response containing details of the created document.
@@ -232,16 +247,12 @@ class DocumentCreationService(BaseDocumentService):
                 if key not in data:
                     data[key] = value
 
-        files = {
-            "file": (filename, binary_data),
-        }
-
-        # Add all data fields as form fields
-        for key, value in data.items():
-            files[key] = (None, str(value))
+        # Stream the bytes instead of copying them into a multipart body
+        fields = [(key, str(value)) for key, value in data.items()]
+        fields.append(("file", (filename, io.BytesIO(binary_data))))
 
         headers = {"Accept": "application/json"}
-        return self.client.api_call(url, method="POST", headers=headers, files=files)
+        return send_multipart(self.client, url, fields, headers=headers, progress=progress)
 
     def create_multiple_documents(self, csv_data):
         """
@@ -310,6 +321,7 @@ class DocumentCreationService(BaseDocumentService):
         file_path=None,
         description=None,
         suppress_rendition=False,
+        progress=None,
     ):
         """
         Creates a new version of an existing document.
@@ -317,9 +329,11 @@ class DocumentCreationService(BaseDocumentService):
         Args:
             doc_id (str): ID of the document
             create_draft (bool): Whether to create a draft version. Default is True.
-            file_path (str, optional): Path to the file for the new version
+            file_path (str, optional): Path to the file for the new version. Files larger than
+                                       STAGING_THRESHOLD (1GB) are uploaded through file staging.
             description (str, optional): Description of the new version
             suppress_rendition (bool): Whether to suppress rendition generation. Default is False.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads.
 
         Returns:
             dict: API response with details of the created document version
@@ -338,19 +352,17 @@ class DocumentCreationService(BaseDocumentService):
             data["description__v"] = description
 
         # Prepare headers and files
-        if file_path:
+        if file_path and os.path.getsize(file_path) > STAGING_THRESHOLD:
+            with staged_upload(self.client, file_path, progress=progress) as staging_path:
+                data["file"] = staging_path
+                return send_multipart(self.client, url, data, params=params)
+        elif file_path:
             with open(file_path, "rb") as file:
-                files = {
-                    "file": (os.path.basename(file_path), file),
-                }
-
-                # Add data fields as form fields if present
-                if data:
-                    for key, value in data.items():
-                        files[key] = (None, str(value))
+                fields = [(key, str(value)) for key, value in data.items()]
+                fields.append(("file", (os.path.basename(file_path), file)))
 
-                return self.client.api_call(
-                    url, method="POST", params=params, files=files
+                return send_multipart(
+                    self.client, url, fields, params=params, progress=progress
                 )
         else:
             headers = {"Content-Type": "application/json", "Accept": "application/json"}
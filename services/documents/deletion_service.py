@@ -103,6 +103,25 @@ class DocumentDeletionService(BaseDocumentService):
             url, method="DELETE", headers=headers, params=params, data=csv_data
         )
 
+    def bulk_delete_documents(
+        self, ids: List[Union[str, int]], id_param: Optional[str] = None, max_workers: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Deletes all versions of any number of documents in concurrent batches of 500.
+
+        Args:
+            ids (List[Union[str, int]]): Document IDs, or values of the id_param field.
+            id_param (str, optional): Unique field identifying the documents, e.g. "external_id__v".
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+
+        Returns:
+            Dict[str, Any]: Summary with deleted and failed counts, failures counted by
+                error message and the failed IDs. See BulkDelete.
+        """
+        from veevavault.services.objects.bulk_delete import BulkDelete
+
+        return BulkDelete(self.client, max_workers=max_workers).delete_documents(ids, id_param)
+
     def delete_single_document_version(
         self,
         doc_id: Union[str, int],
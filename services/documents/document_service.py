@@ -1,8 +1,8 @@
 import os
 import json
 import requests
-import pandas as pd
 from typing import List, Dict, Any, Optional, Union, BinaryIO
+from veevavault.utilities.lazy_service import LazyService
 from .fields_service import DocumentFieldsService
 from .types_service import DocumentTypesService
 from .retrieval_service import DocumentRetrievalService
@@ -28,6 +28,26 @@ class DocumentService:
     This class delegates to specialized services for different document management operations.
     """
 
+    # Specialized services are constructed on first access and cached on the
+    # instance; see LazyService.
+    fields = LazyService(DocumentFieldsService)
+    types = LazyService(DocumentTypesService)
+    retrieval = LazyService(DocumentRetrievalService)
+    creation = LazyService(DocumentCreationService)
+    update = LazyService(DocumentUpdateService)
+    deletion = LazyService(DocumentDeletionService)
+    locks = LazyService(DocumentLocksService)
+    renditions = LazyService(DocumentRenditionsService)
+    attachments = LazyService(DocumentAttachmentsService)
+    annotations = LazyService(DocumentAnnotationsService)
+    relationships = LazyService(DocumentRelationshipsService)
+    exports = LazyService(DocumentExportsService)
+    events = LazyService(DocumentEventsService)
+    templates = LazyService(DocumentTemplatesService)
+    signatures = LazyService(DocumentSignaturesService)
+    tokens = LazyService(DocumentTokensService)
+    roles = LazyService(DocumentRolesService)
+
     def __init__(self, client):
         """
         Initialize with a VaultClient instance
@@ -35,23 +55,11 @@ class DocumentService:
         Args:
             client: An initialized VaultClient instance
         """
-        self._client = client
+        self.client = client
 
-        # Initialize specialized service instances
-        self.fields = DocumentFieldsService(client)
-        self.types = DocumentTypesService(client)
-        self.retrieval = DocumentRetrievalService(client)
-        self.creation = DocumentCreationService(client)
-        self.update = DocumentUpdateService(client)
-        self.deletion = DocumentDeletionService(client)
-        self.locks = DocumentLocksService(client)
-        self.renditions = DocumentRenditionsService(client)
-        self.attachments = DocumentAttachmentsService(client)
-        self.annotations = DocumentAnnotationsService(client)
-        self.relationships = DocumentRelationshipsService(client)
-        self.exports = DocumentExportsService(client)
-        self.events = DocumentEventsService(client)
-        self.templates = DocumentTemplatesService(client)
-        self.signatures = DocumentSignaturesService(client)
-        self.tokens = DocumentTokensService(client)
-        self.roles = DocumentRolesService(client)
+    @property
+    def _client(self):
+        """
+        Alias of client kept for backward compatibility
+        """
+        return self.client
@@ -155,26 +155,29 @@ class DocumentRenditionsService(BaseDocumentService):
                 url, method="POST", params=params, headers=headers, data=file
             )
 
-    def add_single_document_rendition(self, doc_id, rendition_type, file_path):
+    def add_single_document_rendition(self, doc_id, rendition_type, file_path, progress=None):
         """
         Adds a rendition to a document.
 
         If you need to add more than one document rendition, it is best practice to use the bulk API.
-        The maximum allowed file size is 4GB.
+        The maximum allowed file size is 4GB. The file is streamed from disk.
 
         Args:
             doc_id (str): ID of the document
             rendition_type (str): Type of rendition to add
             file_path (str): Path to rendition file
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads
 
         Returns:
             dict: API response with details of added rendition
         """
+        from veevavault.utilities.multipart import send_multipart
+
         url = f"api/{self.client.LatestAPIversion}/objects/documents/{doc_id}/renditions/{rendition_type}"
 
         with open(file_path, "rb") as file:
-            files = {"file": (os.path.basename(file_path), file)}
-            return self.client.api_call(url, method="POST", files=files)
+            fields = {"file": (os.path.basename(file_path), file)}
+            return send_multipart(self.client, url, fields, progress=progress)
 
     def upload_document_version_rendition(
         self, doc_id, major_version, minor_version, rendition_type, file_path
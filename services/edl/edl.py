@@ -1,6 +1,5 @@
 # edl_service.py
 import json
-import pandas as pd
 
 
 class EDLService:
@@ -1,4 +1,3 @@
-import pandas as pd
 import asyncio
 import requests
 
@@ -290,7 +289,8 @@ class FileStagingService:
         if content_md5:
             headers["Content-MD5"] = content_md5
 
-        if isinstance(file_part, bytes):
+        if isinstance(file_part, bytes) or hasattr(file_part, "__len__"):
+            # Streamed parts must not be sent chunked; Vault requires the part size
             headers["Content-Length"] = str(len(file_part))
 
         return self.client.api_call(url, method="PUT", data=file_part, headers=headers)
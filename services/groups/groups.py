@@ -1,6 +1,3 @@
-import pandas as pd
-
-
 class GroupsService:
     """
     Service class for managing groups in Veeva Vault
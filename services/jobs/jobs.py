@@ -1,6 +1,3 @@
-import pandas as pd
-
-
 class JobsService:
     """
     Service class for managing jobs in Veeva Vault.
@@ -1,3 +1,6 @@
 from .logs import LogsService
+from .audit_harvester import AuditTrailHarvester
+from .audit_export import AuditExportJob
+from .audit_history import AuditHistoryFanOut
 
-__all__ = ["LogsService"]
+__all__ = ["LogsService", "AuditTrailHarvester", "AuditExportJob", "AuditHistoryFanOut"]
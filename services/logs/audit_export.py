@@ -0,0 +1,412 @@
+import csv
+import io
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from .audit_harvester import format_vault_datetime, parse_vault_datetime
+from .logs import LogsService
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = os.path.join(
+    os.path.expanduser("~"), ".veevavault", "audit_export_state.json"
+)
+
+
+class AuditExportJob:
+    """
+    Drives audit trail CSV exports through Vault's asynchronous job flow.
+
+    An export is started with retrieve_audit_details(format_result="csv"),
+    which returns a job ID. The job status is polled no more often than Vault
+    allows (once every 10 seconds per job), and once the job finishes the
+    files linked from the job status are streamed to disk. Downloaded files
+    can be parsed incrementally into typed batches with iter_batches.
+
+    A full export (all_dates=True) can only run once every 24 hours per audit
+    type. The time each full export was started is recorded in a local state
+    file, and start refuses to spend the daily slot again within 24 hours.
+    """
+
+    JOB_STATUS_INTERVAL = 10
+    FULL_EXPORT_INTERVAL = timedelta(hours=24)
+    TERMINAL_STATUSES = ("SUCCESS", "ERRORS_ENCOUNTERED", "CANCELLED", "MISSED_SCHEDULE")
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(self, client, state_path: str = DEFAULT_STATE_PATH):
+        """
+        Initialize the export job driver.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            state_path (str, optional): JSON file recording the last full export per
+                audit type. Defaults to ~/.veevavault/audit_export_state.json.
+        """
+        self.client = client
+        self.state_path = state_path
+        self._last_polled: Dict[str, float] = {}
+
+    def start(
+        self,
+        audit_trail_type: str,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        all_dates: bool = False,
+        force: bool = False,
+    ) -> str:
+        """
+        Starts a CSV export job.
+
+        Args:
+            audit_trail_type (str): The audit type to export (document_audit_trail,
+                object_audit_trail, etc).
+            start_date (datetime, optional): Start of the range (within the past 30 days).
+            end_date (datetime, optional): End of the range.
+            all_dates (bool, optional): Export the full audit trail. start_date and
+                end_date must be omitted. Limited to once every 24 hours per audit type.
+            force (bool, optional): Start a full export even if the local state records
+                one within the past 24 hours. Defaults to False.
+
+        Returns:
+            str: The export job ID
+
+        Raises:
+            ValueError: If all_dates is combined with start_date or end_date
+            VaultRateLimitError: If a full export of this type ran within the past 24 hours
+            VaultAPIError: If Vault does not return a job ID
+        """
+        from veevavault.exceptions import VaultAPIError, VaultRateLimitError
+
+        if all_dates and (start_date or end_date):
+            raise ValueError("start_date and end_date must be omitted when all_dates is True")
+
+        if all_dates and not force:
+            next_run = self.next_full_export_time(audit_trail_type)
+            if next_run and next_run > datetime.now(timezone.utc):
+                raise VaultRateLimitError(
+                    f"A full {audit_trail_type} export already ran in the past 24 hours; "
+                    f"the next one can start after {format_vault_datetime(next_run)}"
+                )
+
+        response = LogsService(self.client).retrieve_audit_details(
+            audit_trail_type,
+            start_date=format_vault_datetime(start_date) if start_date else None,
+            end_date=format_vault_datetime(end_date) if end_date else None,
+            all_dates=all_dates,
+            format_result="csv",
+        )
+        job_id = response.get("jobId") or response.get("job_id")
+        if not job_id:
+            raise VaultAPIError(f"Audit export did not return a job ID: {response}")
+
+        if all_dates:
+            self._record_full_export(audit_trail_type, str(job_id))
+
+        logger.info(f"Started {audit_trail_type} CSV export job {job_id}")
+        return str(job_id)
+
+    def wait(
+        self,
+        job_id: str,
+        timeout: float = 3600,
+        poll_interval: float = JOB_STATUS_INTERVAL,
+    ) -> Dict[str, Any]:
+        """
+        Waits for an export job to finish.
+
+        The job status is never requested more than once per JOB_STATUS_INTERVAL
+        seconds for the same job, whatever poll_interval is given.
+
+        Args:
+            job_id (str): The export job ID
+            timeout (float, optional): Maximum seconds to wait. Defaults to one hour.
+            poll_interval (float, optional): Seconds between status requests. Defaults to 10.
+
+        Returns:
+            dict: The job status data of the finished job
+
+        Raises:
+            TimeoutError: If the job does not finish within timeout
+            VaultAPIError: If the job finishes with a status other than SUCCESS
+        """
+        from veevavault.exceptions import VaultAPIError
+        from veevavault.services.jobs import JobsService
+
+        jobs = JobsService(self.client)
+        poll_interval = max(poll_interval, self.JOB_STATUS_INTERVAL)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            last_polled = self._last_polled.get(job_id)
+            if last_polled is not None:
+                delay = last_polled + poll_interval - time.monotonic()
+                if time.monotonic() + max(delay, 0) > deadline:
+                    raise TimeoutError(f"Audit export job {job_id} did not finish in {timeout}s")
+                if delay > 0:
+                    time.sleep(delay)
+
+            self._last_polled[job_id] = time.monotonic()
+            status = jobs.retrieve_job_status(job_id).get("data", {})
+            state = status.get("status")
+            logger.debug(f"Audit export job {job_id}: {state}")
+
+            if state in self.TERMINAL_STATUSES:
+                self._last_polled.pop(job_id, None)
+                if state != "SUCCESS":
+                    raise VaultAPIError(f"Audit export job {job_id} finished with status {state}")
+                return status
+
+    def download(self, job_status: Dict[str, Any], output_dir: str) -> List[str]:
+        """
+        Streams the files linked from a finished job's status to disk.
+
+        Args:
+            job_status (dict): Job status data returned by wait
+            output_dir (str): Directory to write the files to
+
+        Returns:
+            list: Paths of the downloaded files
+
+        Raises:
+            VaultAPIError: If the job status has no download links
+        """
+        from veevavault.exceptions import VaultAPIError
+
+        links = self.download_links(job_status)
+        if not links:
+            raise VaultAPIError(
+                f"Audit export job {job_status.get('id')} has no download links; "
+                "full exports are delivered by email"
+            )
+
+        os.makedirs(output_dir, exist_ok=True)
+        paths = []
+        for index, href in enumerate(links):
+            response = self.client.api_call(href, stream=True, raw_response=True)
+            filename = self._filename(response, f"audit_export_{job_status.get('id')}_{index}.csv")
+            path = os.path.join(output_dir, filename)
+            part_path = f"{path}.part"
+            with open(part_path, "wb") as f:
+                for chunk in response.iter_content(chunk_size=self.CHUNK_SIZE):
+                    f.write(chunk)
+            os.replace(part_path, path)
+            paths.append(path)
+            logger.info(f"Downloaded audit export to {path}")
+        return paths
+
+    def run(
+        self,
+        audit_trail_type: str,
+        output_dir: str,
+        start_date: datetime = None,
+        end_date: datetime = None,
+        all_dates: bool = False,
+        timeout: float = 3600,
+        force: bool = False,
+    ) -> List[str]:
+        """
+        Starts an export, waits for it and downloads its files.
+
+        Args:
+            audit_trail_type (str): The audit type to export
+            output_dir (str): Directory to write the files to
+            start_date (datetime, optional): Start of the range (within the past 30 days)
+            end_date (datetime, optional): End of the range
+            all_dates (bool, optional): Export the full audit trail
+            timeout (float, optional): Maximum seconds to wait for the job
+            force (bool, optional): Ignore the local record of the last full export
+
+        Returns:
+            list: Paths of the downloaded files
+        """
+        job_id = self.start(
+            audit_trail_type,
+            start_date=start_date,
+            end_date=end_date,
+            all_dates=all_dates,
+            force=force,
+        )
+        return self.download(self.wait(job_id, timeout=timeout), output_dir)
+
+    def field_types(self, audit_trail_type: str) -> Dict[str, str]:
+        """
+        Retrieves the field types of an audit type for typed parsing.
+
+        Args:
+            audit_trail_type (str): The audit type
+
+        Returns:
+            dict: Field name -> Vault field type (Number, DateTime, String, ...)
+        """
+        metadata = LogsService(self.client).retrieve_audit_metadata(audit_trail_type)
+        fields = metadata.get("data", {}).get("fields", [])
+        return {field["name"]: field.get("type", "String") for field in fields}
+
+    @classmethod
+    def iter_batches(
+        cls,
+        path: str,
+        batch_size: int = 1000,
+        field_types: Optional[Dict[str, str]] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Parses a downloaded export incrementally into batches of rows.
+
+        ZIP files are read member by member without extracting them. When
+        field_types is given (see field_types), Number values become ints and
+        DateTime values become UTC datetimes; empty values become None.
+
+        Args:
+            path (str): Path of a downloaded CSV or ZIP file
+            batch_size (int, optional): Rows per batch. Defaults to 1000.
+            field_types (dict, optional): Field name -> Vault field type
+
+        Yields:
+            list: Batches of row dictionaries
+        """
+        converters = {
+            name: cls._converter(field_type)
+            for name, field_type in (field_types or {}).items()
+        }
+
+        batch = []
+        for row in cls._iter_rows(path):
+            for name, convert in converters.items():
+                if name in row:
+                    row[name] = convert(row[name])
+            batch.append(row)
+            if len(batch) >= batch_size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def last_full_export(self, audit_trail_type: str) -> Optional[datetime]:
+        """
+        Returns when a full export of an audit type was last started from this machine.
+
+        Args:
+            audit_trail_type (str): The audit type
+
+        Returns:
+            datetime: Start time of the last full export, or None if none is recorded
+        """
+        entry = self._load_state().get(audit_trail_type)
+        if not entry:
+            return None
+        return parse_vault_datetime(entry["started_at"])
+
+    def next_full_export_time(self, audit_trail_type: str) -> Optional[datetime]:
+        """
+        Returns the earliest time the next full export of an audit type may start.
+
+        Args:
+            audit_trail_type (str): The audit type
+
+        Returns:
+            datetime: Earliest start time, or None if no full export is recorded
+        """
+        last_run = self.last_full_export(audit_trail_type)
+        if last_run is None:
+            return None
+        return last_run + self.FULL_EXPORT_INTERVAL
+
+    @staticmethod
+    def download_links(job_status: Dict[str, Any]) -> List[str]:
+        """
+        Extracts the file download links from a job status.
+
+        Args:
+            job_status (dict): Job status data
+
+        Returns:
+            list: Hrefs of the non-JSON GET links, excluding the job's own status link
+        """
+        links = []
+        for link in job_status.get("links", []):
+            if link.get("rel") == "self" or link.get("method", "GET").upper() != "GET":
+                continue
+            if link.get("accept") == "application/json":
+                continue
+            if link.get("href"):
+                links.append(link["href"])
+        return links
+
+    @staticmethod
+    def _iter_rows(path: str) -> Iterator[Dict[str, Any]]:
+        """Yields CSV rows from a CSV file or from every CSV member of a ZIP file."""
+        if zipfile.is_zipfile(path):
+            with zipfile.ZipFile(path) as archive:
+                for name in archive.namelist():
+                    if not name.lower().endswith(".csv"):
+                        continue
+                    with archive.open(name) as member:
+                        text = io.TextIOWrapper(member, encoding="utf-8-sig", newline="")
+                        yield from csv.DictReader(text)
+            return
+
+        with open(path, encoding="utf-8-sig", newline="") as f:
+            yield from csv.DictReader(f)
+
+    @staticmethod
+    def _converter(field_type: str) -> Callable[[str], Any]:
+        """Returns the converter for a Vault audit field type."""
+
+        def convert_number(value):
+            if value in ("", None):
+                return None
+            try:
+                return int(value)
+            except ValueError:
+                return float(value)
+
+        def convert_datetime(value):
+            return parse_vault_datetime(value) if value else None
+
+        def convert_string(value):
+            return value if value != "" else None
+
+        if field_type == "Number":
+            return convert_number
+        if field_type == "DateTime":
+            return convert_datetime
+        return convert_string
+
+    @staticmethod
+    def _filename(response, default: str) -> str:
+        """Returns the file name from the Content-Disposition header, or the default."""
+        disposition = response.headers.get("Content-Disposition", "")
+        match = re.search(r'filename="?([^";]+)"?', disposition)
+        if match:
+            return os.path.basename(match.group(1))
+        return default
+
+    def _load_state(self) -> Dict[str, Any]:
+        """Loads the local export state file."""
+        try:
+            with open(self.state_path, encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+
+    def _record_full_export(self, audit_trail_type: str, job_id: str) -> None:
+        """Records that a full export of an audit type was started."""
+        state = self._load_state()
+        state[audit_trail_type] = {
+            "started_at": format_vault_datetime(datetime.now(timezone.utc)),
+            "job_id": job_id,
+        }
+
+        directory = os.path.dirname(self.state_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.state_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.state_path)
@@ -0,0 +1,437 @@
+import json
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterator, List, Tuple
+
+from .logs import LogsService
+
+logger = logging.getLogger(__name__)
+
+VAULT_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+def parse_vault_datetime(value: str) -> datetime:
+    """
+    Parses a Vault audit timestamp to a UTC datetime with second precision.
+
+    Audit logs support a precision to one second, so fractional seconds and
+    offsets after the seconds field are ignored.
+
+    Args:
+        value (str): Timestamp such as 2016-01-15T07:00:00Z or 2016-01-15T07:00:00.000Z
+
+    Returns:
+        datetime: Timezone-aware UTC datetime
+    """
+    return datetime.strptime(value[:19], "%Y-%m-%dT%H:%M:%S").replace(
+        tzinfo=timezone.utc
+    )
+
+
+def format_vault_datetime(value: datetime) -> str:
+    """
+    Formats a datetime in the YYYY-MM-DDTHH:MM:SSZ format expected by audit APIs.
+
+    Args:
+        value (datetime): Naive datetimes are treated as UTC
+
+    Returns:
+        str: Formatted timestamp
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return value.strftime(VAULT_DATETIME_FORMAT)
+
+
+class AuditTrailHarvester:
+    """
+    Harvests a full audit trail over a date range in parallel time windows.
+
+    The range is split into windows that are paged concurrently with
+    retrieve_audit_details. Each window streams its rows to its own output
+    file and is recorded in a checkpoint file once complete, so a rerun over
+    the same range and window size only fetches the windows that are missing.
+
+    Adjacent windows share their boundary second, because audit logs only
+    have second precision. A row whose timestamp equals a window's end is
+    left to the next window, so every row is written exactly once.
+
+    Output layout for an output_dir of ``exports``::
+
+        exports/document_audit_trail.checkpoint.json
+        exports/document_audit_trail/20250101T000000Z_20250102T000000Z.jsonl
+        ...
+    """
+
+    MAX_PAGE_SIZE = 1000
+    OUTPUT_FORMATS = ("jsonl", "parquet")
+
+    def __init__(
+        self,
+        client,
+        audit_trail_type: str,
+        output_dir: str,
+        window: timedelta = timedelta(days=1),
+        page_size: int = MAX_PAGE_SIZE,
+        max_workers: int = 4,
+        output_format: str = "jsonl",
+        objects: str = None,
+        events: str = None,
+    ):
+        """
+        Initialize the harvester.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            audit_trail_type (str): The audit type to harvest (document_audit_trail,
+                object_audit_trail, etc).
+            output_dir (str): Directory for the window files and the checkpoint file.
+            window (timedelta, optional): Length of each time window. Defaults to one day.
+            page_size (int, optional): Rows per page, between 1 and 1000. Defaults to 1000.
+            max_workers (int, optional): Number of windows paged concurrently. Defaults to 4.
+            output_format (str, optional): 'jsonl' or 'parquet'. Parquet requires pyarrow.
+            objects (str, optional): Comma-separated object names (object_audit_trail only).
+            events (str, optional): Comma-separated audit events to include.
+
+        Raises:
+            ValueError: If window, page_size, max_workers or output_format is invalid
+        """
+        if window <= timedelta(0):
+            raise ValueError("window must be a positive timedelta")
+        if not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {self.MAX_PAGE_SIZE}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if output_format not in self.OUTPUT_FORMATS:
+            raise ValueError(
+                f"output_format must be one of {', '.join(self.OUTPUT_FORMATS)}"
+            )
+        if output_format == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError as e:
+                raise ImportError(
+                    "Parquet output requires pyarrow; install it or use output_format='jsonl'"
+                ) from e
+
+        self.client = client
+        self.audit_trail_type = audit_trail_type
+        self.output_dir = output_dir
+        self.window = window
+        self.page_size = page_size
+        self.max_workers = max_workers
+        self.output_format = output_format
+        self.objects = objects
+        self.events = events
+
+        self.checkpoint_path = os.path.join(
+            output_dir, f"{audit_trail_type}.checkpoint.json"
+        )
+        self._checkpoint_lock = threading.Lock()
+
+    def plan_windows(
+        self, start_date: datetime, end_date: datetime
+    ) -> List[Tuple[datetime, datetime]]:
+        """
+        Splits a date range into consecutive windows.
+
+        Args:
+            start_date (datetime): Start of the range (naive datetimes are treated as UTC)
+            end_date (datetime): End of the range
+
+        Returns:
+            list: (window_start, window_end) tuples; the last window ends at end_date
+
+        Raises:
+            ValueError: If end_date is not after start_date
+        """
+        start_date = self._to_utc(start_date)
+        end_date = self._to_utc(end_date)
+        if end_date <= start_date:
+            raise ValueError("end_date must be after start_date")
+
+        windows = []
+        window_start = start_date
+        while window_start < end_date:
+            window_end = min(window_start + self.window, end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end
+        return windows
+
+    def harvest(self, start_date: datetime, end_date: datetime) -> Dict[str, Any]:
+        """
+        Harvests all audit rows between start_date and end_date.
+
+        Windows already recorded in the checkpoint are skipped. A failed window
+        is reported and left out of the checkpoint so the next run retries it;
+        the other windows still complete.
+
+        Audit details can only be retrieved for the past 30 days.
+
+        Args:
+            start_date (datetime): Start of the range (naive datetimes are treated as UTC)
+            end_date (datetime): End of the range
+
+        Returns:
+            dict: Harvest summary with:
+                - audit_trail_type: The harvested audit type
+                - windows: Number of windows in the range
+                - completed: Windows harvested by this run
+                - skipped: Windows already complete in the checkpoint
+                - rows: Rows written by this run
+                - files: Output files of every complete window, in time order
+                - failed: Window key -> error message for windows that failed
+        """
+        os.makedirs(os.path.join(self.output_dir, self.audit_trail_type), exist_ok=True)
+
+        windows = self.plan_windows(start_date, end_date)
+        checkpoint = self.load_checkpoint()
+        done = checkpoint["windows"]
+
+        pending = [w for w in windows if self._window_key(*w) not in done]
+        summary = {
+            "audit_trail_type": self.audit_trail_type,
+            "windows": len(windows),
+            "completed": 0,
+            "skipped": len(windows) - len(pending),
+            "rows": 0,
+            "files": [],
+            "failed": {},
+        }
+        last_end = windows[-1][1]
+
+        logger.info(
+            f"Harvesting {self.audit_trail_type}: {len(pending)} of {len(windows)} windows pending"
+        )
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(
+                    self._harvest_window, window_start, window_end, window_end == last_end
+                ): self._window_key(window_start, window_end)
+                for window_start, window_end in pending
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    entry = future.result()
+                except Exception as e:
+                    logger.error(f"Audit window {key} failed: {e}")
+                    summary["failed"][key] = str(e)
+                    continue
+
+                with self._checkpoint_lock:
+                    done[key] = entry
+                    self._write_checkpoint(checkpoint)
+                summary["completed"] += 1
+                summary["rows"] += entry["rows"]
+
+        summary["files"] = [
+            done[key]["file"]
+            for key in (self._window_key(*w) for w in windows)
+            if key in done
+        ]
+        logger.info(
+            f"Harvested {summary['rows']} {self.audit_trail_type} rows "
+            f"({summary['completed']} windows, {summary['skipped']} skipped, "
+            f"{len(summary['failed'])} failed)"
+        )
+        return summary
+
+    def load_checkpoint(self) -> Dict[str, Any]:
+        """
+        Loads the checkpoint file for this audit type.
+
+        Returns:
+            dict: Checkpoint with 'audit_trail_type' and 'windows' (window key -> entry)
+        """
+        try:
+            with open(self.checkpoint_path, encoding="utf-8") as f:
+                checkpoint = json.load(f)
+        except FileNotFoundError:
+            return {"audit_trail_type": self.audit_trail_type, "windows": {}}
+
+        checkpoint.setdefault("windows", {})
+        return checkpoint
+
+    def iter_pages(
+        self, window_start: datetime, window_end: datetime
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Yields the pages of audit rows for one window, following next_page links.
+
+        Args:
+            window_start (datetime): Window start
+            window_end (datetime): Window end
+
+        Yields:
+            list: Audit rows of one page
+
+        Raises:
+            VaultAPIError: If Vault rejects the first or any later page, e.g. a
+                window outside the audit retention period
+        """
+        response = LogsService(self.client).retrieve_audit_details(
+            self.audit_trail_type,
+            start_date=format_vault_datetime(window_start),
+            end_date=format_vault_datetime(window_end),
+            limit=self.page_size,
+            objects=self.objects,
+            events=self.events,
+        )
+        while True:
+            _check_page(response)
+            yield response.get("data", [])
+
+            next_page = response.get("responseDetails", {}).get("next_page")
+            if not next_page:
+                return
+            response = self.client.api_call(next_page)
+
+    def _harvest_window(
+        self, window_start: datetime, window_end: datetime, is_last: bool
+    ) -> Dict[str, Any]:
+        """
+        Pages one window into its output file.
+
+        Returns:
+            dict: Checkpoint entry with the output file, row count and completion time
+        """
+        path = self._window_path(window_start, window_end)
+        part_path = f"{path}.part"
+        if self.output_format == "parquet":
+            writer = _ParquetWriter(part_path)
+        else:
+            writer = _JsonlWriter(part_path)
+
+        rows = 0
+        try:
+            for page in self.iter_pages(window_start, window_end):
+                kept = [
+                    row
+                    for row in page
+                    if self._in_window(row, window_end, is_last)
+                ]
+                writer.write(kept)
+                rows += len(kept)
+            writer.close()
+        except BaseException:
+            writer.discard()
+            if os.path.exists(part_path):
+                os.remove(part_path)
+            raise
+
+        os.replace(part_path, path)
+        logger.debug(f"Audit window {self._window_key(window_start, window_end)}: {rows} rows")
+        return {
+            "file": path,
+            "rows": rows,
+            "completed_at": format_vault_datetime(datetime.now(timezone.utc)),
+        }
+
+    @staticmethod
+    def _in_window(row: Dict[str, Any], window_end: datetime, is_last: bool) -> bool:
+        """
+        Checks whether a row belongs to a window.
+
+        Rows stamped with the window's end second belong to the next window,
+        except in the last window. Rows without a parseable timestamp are kept.
+        """
+        timestamp = row.get("timestamp")
+        if not timestamp:
+            return True
+        try:
+            moment = parse_vault_datetime(timestamp)
+        except ValueError:
+            return True
+        return moment != window_end or is_last
+
+    def _window_key(self, window_start: datetime, window_end: datetime) -> str:
+        """Returns the checkpoint key of a window."""
+        return f"{format_vault_datetime(window_start)}/{format_vault_datetime(window_end)}"
+
+    def _window_path(self, window_start: datetime, window_end: datetime) -> str:
+        """Returns the output file path of a window."""
+        name = "{}_{}.{}".format(
+            window_start.strftime("%Y%m%dT%H%M%SZ"),
+            window_end.strftime("%Y%m%dT%H%M%SZ"),
+            self.output_format,
+        )
+        return os.path.join(self.output_dir, self.audit_trail_type, name)
+
+    def _write_checkpoint(self, checkpoint: Dict[str, Any]) -> None:
+        """Atomically writes the checkpoint file."""
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f, indent=2, sort_keys=True)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    @staticmethod
+    def _to_utc(value: datetime) -> datetime:
+        """Normalizes a datetime to UTC with second precision."""
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+class _JsonlWriter:
+    """Appends rows to a JSON Lines file page by page."""
+
+    def __init__(self, path: str):
+        self._file = open(path, "w", encoding="utf-8")
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        for row in rows:
+            self._file.write(json.dumps(row, default=str))
+            self._file.write("\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+    def discard(self) -> None:
+        self._file.close()
+
+
+class _ParquetWriter:
+    """
+    Writes rows to a Parquet file.
+
+    Rows are buffered for the whole window so the file has one schema even
+    when early pages leave a column empty.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._rows: List[Dict[str, Any]] = []
+
+    def write(self, rows: List[Dict[str, Any]]) -> None:
+        self._rows.extend(rows)
+
+    def close(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        pq.write_table(pa.Table.from_pylist(self._rows), self.path)
+        self._rows = []
+
+    def discard(self) -> None:
+        self._rows = []
+
+
+def _check_page(response: Any) -> None:
+    """Raises for a page Vault rejected with HTTP 200, so the window is not recorded as complete."""
+    from veevavault.exceptions import VaultAPIError
+
+    if not isinstance(response, dict):
+        raise VaultAPIError(f"Unexpected audit page response: {str(response)[:200]}")
+    if response.get("responseStatus") == "FAILURE":
+        errors = response.get("errors") or []
+        message = "; ".join(
+            f"{e.get('type', 'ERROR')}: {e.get('message', '')}" if isinstance(e, dict) else str(e)
+            for e in errors
+        )
+        raise VaultAPIError(f"Audit page request failed: {message or response}")
@@ -0,0 +1,174 @@
+import logging
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+from .audit_harvester import _check_page
+from .logs import LogsService
+
+logger = logging.getLogger(__name__)
+
+
+class AuditHistoryFanOut:
+    """
+    Retrieves the complete audit history of many documents or object records.
+
+    Histories are fetched on a bounded pool of worker threads, each following
+    the next_page links until the history of its ID is complete. At most
+    max_workers requests are in flight and IDs are submitted only as workers
+    free up, so large ID lists do not queue thousands of futures at once.
+    Every call goes through client.api_call, so a RateLimiter assigned to the
+    client paces the fan-out together with all other calls on that client.
+
+    Results are yielded as each ID completes. IDs whose history could not be
+    retrieved are collected in the errors map instead of stopping the run.
+    """
+
+    MAX_PAGE_SIZE = 1000
+
+    def __init__(
+        self,
+        client,
+        object_name: str = None,
+        max_workers: int = 8,
+        page_size: int = MAX_PAGE_SIZE,
+        start_date: str = None,
+        end_date: str = None,
+        events: str = None,
+    ):
+        """
+        Initialize the fan-out.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            object_name (str, optional): Object name (e.g. product__v) to retrieve object
+                record histories. If omitted, the IDs are document IDs.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            page_size (int, optional): Histories per page, between 1 and 1000. Defaults to 1000.
+            start_date (str, optional): Start date in YYYY-MM-DDTHH:MM:SSZ format.
+            end_date (str, optional): End date in YYYY-MM-DDTHH:MM:SSZ format.
+            events (str, optional): Comma-separated audit events to include.
+
+        Raises:
+            ValueError: If max_workers or page_size is invalid
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if not 1 <= page_size <= self.MAX_PAGE_SIZE:
+            raise ValueError(f"page_size must be between 1 and {self.MAX_PAGE_SIZE}")
+
+        self.client = client
+        self.object_name = object_name
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.start_date = start_date
+        self.end_date = end_date
+        self.events = events
+        self.errors: Dict[str, str] = {}
+
+    def iter_histories(
+        self, record_ids: Iterable[Any]
+    ) -> Iterator[Tuple[str, List[Dict[str, Any]]]]:
+        """
+        Yields the complete audit history of each ID as it completes.
+
+        Completion order is not input order. Failed IDs are not yielded; they
+        are recorded in the errors attribute with their error message.
+
+        Args:
+            record_ids (iterable): Document IDs, or object record IDs if object_name is set.
+                Duplicate IDs are fetched once.
+
+        Yields:
+            tuple: (record_id, audit history rows)
+        """
+        self.errors = {}
+        pending_ids = iter(dict.fromkeys(str(record_id) for record_id in record_ids))
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+
+            def submit_next() -> bool:
+                record_id = next(pending_ids, None)
+                if record_id is None:
+                    return False
+                in_flight[executor.submit(self.retrieve_history, record_id)] = record_id
+                return True
+
+            for _ in range(self.max_workers):
+                if not submit_next():
+                    break
+
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    record_id = in_flight.pop(future)
+                    submit_next()
+                    try:
+                        rows = future.result()
+                    except Exception as e:
+                        logger.warning(f"Audit history for {record_id} failed: {e}")
+                        self.errors[record_id] = str(e)
+                        continue
+                    yield record_id, rows
+
+    def retrieve_all(self, record_ids: Iterable[Any]) -> Dict[str, Any]:
+        """
+        Retrieves the audit histories of all IDs.
+
+        Args:
+            record_ids (iterable): Document IDs, or object record IDs if object_name is set.
+
+        Returns:
+            dict: Merged results with:
+                - data: Audit rows of every ID, each with a record_id field, in completion order
+                - counts: record_id -> number of rows
+                - errors: record_id -> error message for IDs that failed
+        """
+        data = []
+        counts = {}
+        for record_id, rows in self.iter_histories(record_ids):
+            counts[record_id] = len(rows)
+            data.extend({**row, "record_id": record_id} for row in rows)
+        return {"data": data, "counts": counts, "errors": dict(self.errors)}
+
+    def retrieve_history(self, record_id: str) -> List[Dict[str, Any]]:
+        """
+        Retrieves every page of one ID's audit history.
+
+        Args:
+            record_id (str): Document ID, or object record ID if object_name is set
+
+        Returns:
+            list: All audit history rows of the ID
+
+        Raises:
+            VaultAPIError: If Vault rejects a page, e.g. for an unknown or inaccessible ID
+        """
+        logs = LogsService(self.client)
+        if self.object_name:
+            response = logs.retrieve_object_audit_history(
+                self.object_name,
+                record_id,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                limit=self.page_size,
+                events=self.events,
+            )
+        else:
+            response = logs.retrieve_document_audit_history(
+                record_id,
+                start_date=self.start_date,
+                end_date=self.end_date,
+                limit=self.page_size,
+                events=self.events,
+            )
+
+        _check_page(response)
+        rows = list(response.get("data", []))
+        next_page = response.get("responseDetails", {}).get("next_page")
+        while next_page:
+            response = self.client.api_call(next_page)
+            _check_page(response)
+            rows.extend(response.get("data", []))
+            next_page = response.get("responseDetails", {}).get("next_page")
+        return rows
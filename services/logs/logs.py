@@ -1,5 +1,4 @@
 # logs_service.py
-import pandas as pd
 import asyncio
 import requests
 from typing import Dict, List, Optional, Union, Any
@@ -139,6 +138,104 @@ class LogsService:
 
         return self.client.api_call(url, params=params)
 
+    def harvest_audit_trail(
+        self,
+        audit_trail_type: str,
+        start_date,
+        end_date,
+        output_dir: str,
+        window=None,
+        max_workers: int = 4,
+        output_format: str = "jsonl",
+        objects: str = None,
+        events: str = None,
+    ):
+        """
+        Harvests all audit details in a date range into files, in parallel time windows.
+
+        Splits the range into windows, pages the windows concurrently with
+        retrieve_audit_details at 1000 rows per page, and writes each window to its
+        own JSONL or Parquet file. Completed windows are checkpointed, so calling this
+        again with the same range resumes instead of starting over.
+        See AuditTrailHarvester for details.
+
+        Args:
+            audit_trail_type (str): The name of the specified audit type
+                (document_audit_trail, object_audit_trail, etc).
+            start_date (datetime): Start of the range. This date cannot be more than 30 days ago.
+            end_date (datetime): End of the range.
+            output_dir (str): Directory for the window files and the checkpoint file.
+            window (timedelta, optional): Length of each time window. Defaults to one day.
+            max_workers (int, optional): Number of windows paged concurrently. Defaults to 4.
+            output_format (str, optional): 'jsonl' or 'parquet'. Parquet requires pyarrow.
+            objects (str, optional): Comma-separated object names (object_audit_trail only).
+            events (str, optional): Comma-separated audit events to include.
+
+        Returns:
+            dict: Harvest summary with window counts, rows written, output files and failed windows
+        """
+        from .audit_harvester import AuditTrailHarvester
+
+        kwargs = {}
+        if window is not None:
+            kwargs["window"] = window
+
+        harvester = AuditTrailHarvester(
+            self.client,
+            audit_trail_type,
+            output_dir,
+            max_workers=max_workers,
+            output_format=output_format,
+            objects=objects,
+            events=events,
+            **kwargs,
+        )
+        return harvester.harvest(start_date, end_date)
+
+    def export_audit_trail_csv(
+        self,
+        audit_trail_type: str,
+        output_dir: str,
+        start_date=None,
+        end_date=None,
+        all_dates: bool = False,
+        timeout: float = 3600,
+        force: bool = False,
+    ):
+        """
+        Runs a CSV audit export job and streams its files to disk.
+
+        Starts the job with retrieve_audit_details(format_result="csv"), polls the job
+        status no more than once every 10 seconds, and downloads the linked files.
+        Full exports (all_dates=True) are recorded locally and refused within 24 hours
+        of the last one unless force is set. See AuditExportJob to run the steps
+        separately or to parse the files into typed batches.
+
+        Args:
+            audit_trail_type (str): The name of the specified audit type
+                (document_audit_trail, object_audit_trail, etc).
+            output_dir (str): Directory to write the files to.
+            start_date (datetime, optional): Start of the range (within the past 30 days).
+            end_date (datetime, optional): End of the range.
+            all_dates (bool, optional): Export the full audit trail.
+            timeout (float, optional): Maximum seconds to wait for the job. Defaults to one hour.
+            force (bool, optional): Ignore the local record of the last full export.
+
+        Returns:
+            list: Paths of the downloaded files
+        """
+        from .audit_export import AuditExportJob
+
+        return AuditExportJob(self.client).run(
+            audit_trail_type,
+            output_dir,
+            start_date=start_date,
+            end_date=end_date,
+            all_dates=all_dates,
+            timeout=timeout,
+            force=force,
+        )
+
     def retrieve_document_audit_history(
         self,
         doc_id: str,
@@ -253,6 +350,49 @@ class LogsService:
 
         return self.client.api_call(url, params=params)
 
+    def retrieve_audit_histories(
+        self,
+        record_ids,
+        object_name: str = None,
+        max_workers: int = 8,
+        start_date: str = None,
+        end_date: str = None,
+        events: str = None,
+    ):
+        """
+        Retrieves the complete audit history of many documents or object records concurrently.
+
+        Fans out retrieve_document_audit_history (or retrieve_object_audit_history when
+        object_name is given) over at most max_workers concurrent requests, following
+        every page of each history. Use AuditHistoryFanOut.iter_histories to process
+        histories as they complete instead of collecting them all.
+
+        Args:
+            record_ids (list): Document IDs, or object record IDs if object_name is set.
+            object_name (str, optional): The object name (e.g. product__v) for object record IDs.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            start_date (str, optional): Start date in YYYY-MM-DDTHH:MM:SSZ format.
+            end_date (str, optional): End date in YYYY-MM-DDTHH:MM:SSZ format.
+            events (str, optional): Comma-separated audit events to include.
+
+        Returns:
+            dict: Merged results with:
+                - data: Audit rows of every ID, each with a record_id field
+                - counts: record_id -> number of rows
+                - errors: record_id -> error message for IDs that failed
+        """
+        from .audit_history import AuditHistoryFanOut
+
+        fan_out = AuditHistoryFanOut(
+            self.client,
+            object_name=object_name,
+            max_workers=max_workers,
+            start_date=start_date,
+            end_date=end_date,
+            events=events,
+        )
+        return fan_out.retrieve_all(record_ids)
+
     def retrieve_all_debug_logs(
         self, user_id: str = None, include_inactive: bool = False
     ):
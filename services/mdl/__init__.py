@@ -1,3 +1,11 @@
 from .mdl_service import MDLService
+from .batch_executor import MDLBatchExecutor, plan_mdl_batches, split_mdl_statements
+from .crawler import MDLCrawler
 
-__all__ = ["MDLService"]
+__all__ = [
+    "MDLService",
+    "MDLBatchExecutor",
+    "MDLCrawler",
+    "plan_mdl_batches",
+    "split_mdl_statements",
+]
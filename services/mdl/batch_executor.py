@@ -0,0 +1,383 @@
+import logging
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set
+
+logger = logging.getLogger(__name__)
+
+COMMANDS = ("CREATE", "RECREATE", "RENAME", "ALTER", "DROP")
+
+_HEADER = re.compile(
+    r"\s*(CREATE|RECREATE|RENAME|ALTER|DROP)\s+(\w+)\s+(\w+)(?:\s+TO\s+(\w+))?",
+    re.IGNORECASE,
+)
+# Component references inside attribute values, e.g. picklist('Picklist.color__c')
+_REFERENCE = re.compile(r"'([A-Z]\w*)\.(\w+)'")
+
+
+@dataclass
+class MDLStatement:
+    """One statement of an MDL script."""
+
+    index: int
+    line: int
+    command: str
+    component: str
+    text: str
+    renamed_to: Optional[str] = None
+
+    @property
+    def references(self) -> Set[str]:
+        """Component keys referenced in the statement's attribute values."""
+        return {f"{t}.{n}" for t, n in _REFERENCE.findall(self.text)} - {self.component}
+
+
+@dataclass
+class MDLGroup:
+    """Statements on one component, executed together as one script in file order."""
+
+    component: str
+    statements: List[MDLStatement] = field(default_factory=list)
+    depends_on: Set[str] = field(default_factory=set)
+
+    @property
+    def script(self) -> str:
+        return "\n".join(statement.text for statement in self.statements)
+
+
+def split_mdl_statements(script: str) -> List[MDLStatement]:
+    """
+    Splits an MDL script into statements.
+
+    Statements end with a semicolon outside quoted strings and parentheses.
+    A final statement without a semicolon is accepted.
+
+    Args:
+        script (str): MDL script with one or more CREATE, RECREATE, RENAME, ALTER
+            or DROP statements
+
+    Returns:
+        list: MDLStatement per statement, in script order
+
+    Raises:
+        ValueError: If a statement does not start with an MDL command and component,
+            or a string or parenthesis is not closed
+    """
+    statements = []
+    start = 0
+    depth = 0
+    quote = False
+    i = 0
+    while i < len(script):
+        char = script[i]
+        if quote:
+            if char == "\\":
+                i += 1
+            elif char == "'":
+                quote = False
+        elif char == "'":
+            quote = True
+        elif char == "(":
+            depth += 1
+        elif char == ")":
+            depth -= 1
+        elif char == ";" and depth == 0:
+            _append_statement(statements, script, start, i + 1)
+            start = i + 1
+        i += 1
+
+    if quote or depth:
+        line = script.count("\n", 0, start) + 1
+        raise ValueError(f"Unterminated MDL statement starting on line {line}")
+    _append_statement(statements, script, start, len(script))
+    return statements
+
+
+def plan_mdl_batches(statements: List[MDLStatement]) -> List[List[MDLGroup]]:
+    """
+    Groups statements by component and orders the groups into levels.
+
+    All statements on one component form one group, so they never run
+    concurrently with each other. A group depends on the groups of the
+    components its statements reference (e.g. a field using a picklist
+    defined in the same script). Groups in one level are independent of each
+    other; every group's dependencies are in earlier levels. Groups in a
+    dependency cycle are placed one per level, in script order.
+
+    Args:
+        statements (list): Statements from split_mdl_statements
+
+    Returns:
+        list: Levels, each a list of MDLGroup
+    """
+    groups: Dict[str, MDLGroup] = {}
+    aliases: Dict[str, str] = {}
+    for statement in statements:
+        key = aliases.get(statement.component, statement.component)
+        group = groups.setdefault(key, MDLGroup(component=key))
+        group.statements.append(statement)
+        if statement.renamed_to:
+            component_type = statement.component.split(".", 1)[0]
+            aliases[f"{component_type}.{statement.renamed_to}"] = key
+
+    for key, group in groups.items():
+        for statement in group.statements:
+            for reference in statement.references:
+                target = aliases.get(reference, reference)
+                if target in groups and target != key:
+                    group.depends_on.add(target)
+
+    levels: List[List[MDLGroup]] = []
+    placed: Set[str] = set()
+    remaining = list(groups.values())
+    while remaining:
+        level = [g for g in remaining if g.depends_on <= placed]
+        if not level:
+            # Cycle: run the first remaining group on its own and carry on
+            level = remaining[:1]
+        levels.append(level)
+        placed.update(g.component for g in level)
+        remaining = [g for g in remaining if g.component not in placed]
+    return levels
+
+
+class MDLBatchExecutor:
+    """
+    Executes a large MDL script as concurrent per-component scripts.
+
+    The script is split into statements and grouped by component with
+    plan_mdl_batches. Independent groups are executed concurrently, each as
+    one script; groups that reference components changed earlier in the
+    script wait for them. If a group fails, the groups that depend on it are
+    skipped rather than run against a half-applied change.
+
+    With use_async, each group is executed with Execute MDL Script
+    Asynchronously and its job awaited. Vault queues one asynchronous MDL
+    change at a time, so asynchronous groups run one after another.
+
+    Results are reported per statement, in script order.
+    """
+
+    JOB_STATUS_INTERVAL = 10
+    TERMINAL_STATUSES = ("SUCCESS", "ERRORS_ENCOUNTERED", "CANCELLED", "MISSED_SCHEDULE")
+
+    def __init__(
+        self,
+        client,
+        max_workers: int = 4,
+        use_async: bool = False,
+        timeout: float = 3600,
+        poll_interval: float = JOB_STATUS_INTERVAL,
+    ):
+        """
+        Initialize the executor.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            max_workers (int, optional): Maximum groups executed concurrently. Defaults to 4.
+            use_async (bool, optional): Execute groups as asynchronous MDL jobs, as
+                required for changes to raw objects with 10,000+ records. Defaults to False.
+            timeout (float, optional): Maximum seconds to wait for one asynchronous job.
+                Defaults to one hour.
+            poll_interval (float, optional): Seconds between job status requests, at least 10.
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.max_workers = 1 if use_async else max_workers
+        self.use_async = use_async
+        self.timeout = timeout
+        self.poll_interval = max(poll_interval, self.JOB_STATUS_INTERVAL)
+
+    def execute_file(self, path: str) -> Dict[str, Any]:
+        """
+        Executes the MDL script in a file. See execute.
+
+        Args:
+            path (str): Path of the MDL file
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            return self.execute(f.read())
+
+    def execute(self, script: str) -> Dict[str, Any]:
+        """
+        Executes an MDL script.
+
+        Args:
+            script (str): MDL script with any number of statements
+
+        Returns:
+            dict: Execution results with:
+                - statements: Per statement, in script order: index, line, command,
+                  component, response (SUCCESS, FAILURE or SKIPPED) and message
+                - succeeded, failed, skipped: Statement counts
+                - groups, levels: Number of component groups and dependency levels
+                - seconds: Elapsed time
+
+        Raises:
+            ValueError: If the script cannot be split into statements
+        """
+        start = time.monotonic()
+        statements = split_mdl_statements(script)
+        levels = plan_mdl_batches(statements)
+        results: Dict[int, Dict[str, Any]] = {}
+        failed: Set[str] = set()
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for level in levels:
+                runnable = []
+                for group in level:
+                    blocked = group.depends_on & failed
+                    if blocked:
+                        failed.add(group.component)
+                        message = f"Skipped: depends on failed {', '.join(sorted(blocked))}"
+                        for statement in group.statements:
+                            results[statement.index] = _result(statement, "SKIPPED", message)
+                    else:
+                        runnable.append(group)
+
+                for group, group_results in zip(runnable, executor.map(self.run_group, runnable)):
+                    results.update(group_results)
+                    if any(results[s.index]["response"] != "SUCCESS" for s in group.statements):
+                        failed.add(group.component)
+
+        ordered = [results[statement.index] for statement in statements]
+        counts = {
+            status: sum(1 for r in ordered if r["response"] == status)
+            for status in ("SUCCESS", "FAILURE", "SKIPPED")
+        }
+        summary = {
+            "statements": ordered,
+            "succeeded": counts["SUCCESS"],
+            "failed": counts["FAILURE"],
+            "skipped": counts["SKIPPED"],
+            "groups": sum(len(level) for level in levels),
+            "levels": len(levels),
+            "seconds": round(time.monotonic() - start, 2),
+        }
+        logger.info(
+            f"Executed {len(statements)} MDL statements in {summary['groups']} groups: "
+            f"{summary['succeeded']} succeeded, {summary['failed']} failed, "
+            f"{summary['skipped']} skipped"
+        )
+        return summary
+
+    def run_group(self, group: MDLGroup) -> Dict[int, Dict[str, Any]]:
+        """
+        Executes one group's statements as one script.
+
+        Args:
+            group (MDLGroup): The group to execute
+
+        Returns:
+            dict: Statement index -> statement result
+        """
+        try:
+            if self.use_async:
+                response = self._execute_async(group.script)
+            else:
+                response = self.client.api_call(
+                    "api/mdl/execute",
+                    method="POST",
+                    data=group.script.encode("utf-8"),
+                    headers={"Content-Type": "application/json", "Accept": "application/json"},
+                )
+        except Exception as e:
+            logger.warning(f"MDL for {group.component} failed: {e}")
+            return {s.index: _result(s, "FAILURE", str(e)) for s in group.statements}
+        return _statement_results(group, response)
+
+    def _execute_async(self, script: str) -> Dict[str, Any]:
+        """Executes a script asynchronously and returns the job's results."""
+        from veevavault.exceptions import VaultAPIError
+        from veevavault.services.jobs import JobsService
+
+        response = self.client.api_call(
+            "api/mdl/execute_async",
+            method="POST",
+            data=script.encode("utf-8"),
+            headers={"Content-Type": "application/json", "Accept": "application/json"},
+        )
+        job_id = response.get("job_id") or (response.get("data") or {}).get("job_id")
+        if not job_id:
+            return response
+
+        jobs = JobsService(self.client)
+        deadline = time.monotonic() + self.timeout
+        while True:
+            time.sleep(min(self.poll_interval, max(deadline - time.monotonic(), 0)))
+            state = jobs.retrieve_job_status(job_id).get("data", {}).get("status")
+            logger.debug(f"MDL job {job_id}: {state}")
+            if state in self.TERMINAL_STATUSES:
+                break
+            if time.monotonic() >= deadline:
+                raise VaultAPIError(f"MDL job {job_id} did not finish in {self.timeout}s")
+
+        return self.client.api_call(f"api/mdl/execute_async/{job_id}/results")
+
+
+def _append_statement(statements: List[MDLStatement], script: str, start: int, end: int) -> None:
+    text = script[start:end].strip()
+    if not text or text == ";":
+        return
+    offset = start + (len(script[start:end]) - len(script[start:end].lstrip()))
+    line = script.count("\n", 0, offset) + 1
+    match = _HEADER.match(text)
+    if not match:
+        raise ValueError(
+            f"MDL statement on line {line} does not start with one of "
+            f"{', '.join(COMMANDS)} and a component: {text[:60]!r}"
+        )
+    command, component_type, name, renamed_to = match.groups()
+    statements.append(
+        MDLStatement(
+            index=len(statements),
+            line=line,
+            command=command.upper(),
+            component=f"{component_type}.{name}",
+            text=text,
+            renamed_to=renamed_to if command.upper() == "RENAME" else None,
+        )
+    )
+
+
+def _result(statement: MDLStatement, response: str, message: str) -> Dict[str, Any]:
+    return {
+        "index": statement.index,
+        "line": statement.line,
+        "command": statement.command,
+        "component": statement.component,
+        "response": response,
+        "message": message,
+    }
+
+
+def _statement_results(group: MDLGroup, response: Dict[str, Any]) -> Dict[int, Dict[str, Any]]:
+    """Maps a script execution response back to the group's statements."""
+    executions = response.get("statement_execution") or []
+    by_number = {e.get("statement"): e for e in executions if isinstance(e.get("statement"), int)}
+    failure = response.get("responseStatus") == "FAILURE"
+    errors = response.get("errors") or []
+    default_message = (
+        errors[0].get("message", str(errors[0])) if errors
+        else (response.get("script_execution") or {}).get("message", "")
+    )
+
+    results = {}
+    for number, statement in enumerate(group.statements, start=1):
+        execution = by_number.get(number)
+        if execution is None and len(executions) == len(group.statements):
+            execution = executions[number - 1]
+        if execution is not None:
+            status = "SUCCESS" if execution.get("response") == "SUCCESS" else "FAILURE"
+            results[statement.index] = _result(statement, status, execution.get("message", ""))
+        else:
+            status = "FAILURE" if failure else "SUCCESS"
+            results[statement.index] = _result(statement, status, default_message)
+    return results
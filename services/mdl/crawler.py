@@ -0,0 +1,373 @@
+import json
+import logging
+import os
+import tempfile
+import time
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def mdl_error(text: str) -> Optional[str]:
+    """
+    Returns the error message if an MDL response is a JSON failure.
+
+    Retrieve Component Record MDL answers with MDL text on success and with a
+    JSON error body otherwise.
+
+    Args:
+        text (str): Body of an MDL retrieval response
+
+    Returns:
+        str: The error message, or None if the text is MDL
+    """
+    if not text or not text.lstrip().startswith("{"):
+        return None if text else "Empty MDL response"
+    try:
+        body = json.loads(text)
+    except ValueError:
+        return None
+    if isinstance(body, dict) and body.get("responseStatus") == "FAILURE":
+        errors = body.get("errors") or []
+        return errors[0].get("message", str(errors[0])) if errors else "MDL retrieval failed"
+    return None
+
+
+class MDLCrawler:
+    """
+    Exports the MDL of every component record of a Vault.
+
+    Walks component types -> records -> MDL. Record collections and MDL are
+    fetched on a bounded pool of worker threads; at most max_workers requests
+    are in flight and each record's MDL is written as soon as it arrives, so
+    memory stays flat however many records the Vault has. Every call goes
+    through client.api_call, so the client's retry policy and rate limiter
+    apply.
+
+    The output is a directory tree, or a zip archive if the output path ends
+    in .zip::
+
+        <output>/Picklist/color__c.mdl
+        <output>/Doctype/protocol__c.mdl
+        ...
+
+    Records already present in the output are skipped, so rerunning an
+    interrupted crawl only fetches what is missing. A zip archive can be
+    resumed if the interrupted run closed it (e.g. after KeyboardInterrupt).
+
+    Object records cannot be listed with Retrieve Component Record Collection;
+    they are listed from the object metadata instead.
+    """
+
+    def __init__(
+        self,
+        client,
+        output: str,
+        component_types: Optional[Iterable[str]] = None,
+        max_workers: int = 8,
+        progress: Optional[Callable[[Dict[str, Any]], None]] = None,
+        progress_interval: float = 5.0,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            output (str): Output directory, or a path ending in .zip for an archive
+            component_types (iterable, optional): Only these component types, e.g.
+                ["Picklist", "Doctype"]. Defaults to every type in the Vault.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            progress (callable, optional): Called with the current stats at most
+                every progress_interval seconds and once at the end
+            progress_interval (float, optional): Seconds between progress reports. Defaults to 5.
+
+        Raises:
+            ValueError: If max_workers is less than 1
+        """
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.output = output
+        self.component_types = list(component_types) if component_types else None
+        self.max_workers = max_workers
+        self.progress = progress
+        self.progress_interval = progress_interval
+        self.errors: Dict[str, str] = {}
+        self.stats: Dict[str, Any] = {}
+
+    def crawl(self) -> Dict[str, Any]:
+        """
+        Exports the MDL of every component record to the output.
+
+        Returns:
+            dict: Crawl results with:
+                - output: The output path
+                - types: Number of component types crawled
+                - records: Number of component records found
+                - written: Records whose MDL was written in this run
+                - skipped: Records already in the output
+                - failed: Records or types that failed
+                - bytes: MDL bytes written in this run
+                - seconds: Elapsed time
+                - records_per_second: Fetched records per second
+                - errors: Component type or key -> error message
+        """
+        self.errors = {}
+        self.stats = {
+            "output": self.output,
+            "types": 0,
+            "records": 0,
+            "written": 0,
+            "skipped": 0,
+            "failed": 0,
+            "bytes": 0,
+            "seconds": 0.0,
+            "records_per_second": 0.0,
+        }
+        start = time.monotonic()
+        last_report = start
+
+        with _open_sink(self.output) as sink:
+            types = self.component_types or self.list_component_types()
+            self.stats["types"] = len(types)
+            done = sink.existing()
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for key, outcome in self._pipeline(executor, types, done):
+                    if outcome is None:
+                        self.stats["skipped"] += 1
+                    elif isinstance(outcome, Exception):
+                        logger.warning(f"MDL crawl of {key} failed: {outcome}")
+                        self.errors[key] = str(outcome)
+                        self.stats["failed"] += 1
+                    else:
+                        self.stats["bytes"] += sink.write(_record_path(key), outcome)
+                        self.stats["written"] += 1
+
+                    now = time.monotonic()
+                    if now - last_report >= self.progress_interval:
+                        last_report = now
+                        self._report(start)
+
+        self._report(start, final=True)
+        return {**self.stats, "errors": dict(self.errors)}
+
+    def list_component_types(self) -> List[str]:
+        """
+        Lists the names of all component types in the Vault.
+
+        Returns:
+            list: Component type names, e.g. ["Doctype", "Object", "Picklist", ...]
+        """
+        response = self.client.api_call(
+            f"api/{self.client.LatestAPIversion}/metadata/components"
+        )
+        _raise_on_failure(response, "component types")
+        return sorted(item["name"] for item in response.get("data") or [] if item.get("name"))
+
+    def list_records(self, component_type: str) -> List[str]:
+        """
+        Lists the record names of one component type.
+
+        Args:
+            component_type (str): Component type name, e.g. Picklist
+
+        Returns:
+            list: Record names
+        """
+        if component_type == "Object":
+            response = self.client.api_call(
+                f"api/{self.client.LatestAPIversion}/metadata/vobjects"
+            )
+            _raise_on_failure(response, "Object records")
+            return sorted(item["name"] for item in response.get("objects") or [] if item.get("name"))
+
+        response = self.client.api_call(
+            f"api/{self.client.LatestAPIversion}/configuration/{component_type}"
+        )
+        _raise_on_failure(response, f"{component_type} records")
+        names = []
+        for item in response.get("data") or []:
+            name = item.get("name__v") or item.get("name")
+            if name:
+                names.append(name)
+        return sorted(names)
+
+    def retrieve_mdl(self, key: str) -> str:
+        """
+        Retrieves the RECREATE MDL of one component record.
+
+        Args:
+            key (str): Component key in the {Componenttype}.{record_name} format
+
+        Returns:
+            str: MDL text
+
+        Raises:
+            VaultAPIError: If Vault returns an error instead of MDL
+        """
+        response = self.client.api_call(
+            f"api/mdl/components/{key}", raw_response=True, idempotent=True
+        )
+        text = response.text
+        error = mdl_error(text)
+        if error:
+            from veevavault.exceptions import VaultAPIError
+
+            raise VaultAPIError(error)
+        return text
+
+    def _pipeline(
+        self, executor: ThreadPoolExecutor, types: List[str], done: set
+    ) -> Iterator[Tuple[str, Any]]:
+        """
+        Yields (key, outcome) for every record as its MDL arrives.
+
+        The outcome is the MDL text, None for a record already in the output,
+        or the exception that failed the record or its type. Record listings
+        and MDL requests share the pool; listings are submitted first so the
+        pool fills with MDL requests as soon as records are known.
+        """
+        pending_types = iter(types)
+        pending_keys: List[str] = []
+        skipped: List[str] = []
+        in_flight = {}
+
+        def submit_next() -> bool:
+            while pending_keys:
+                key = pending_keys.pop()
+                if _record_path(key) in done:
+                    skipped.append(key)
+                    continue
+                in_flight[executor.submit(self.retrieve_mdl, key)] = ("record", key)
+                return True
+            component_type = next(pending_types, None)
+            if component_type is None:
+                return False
+            in_flight[executor.submit(self.list_records, component_type)] = ("type", component_type)
+            return True
+
+        for _ in range(self.max_workers):
+            if not submit_next():
+                break
+
+        while in_flight or skipped:
+            while skipped:
+                yield skipped.pop(), None
+            if not in_flight:
+                break
+            finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+            for future in finished:
+                kind, name = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as e:
+                    result = e
+
+                if kind == "type":
+                    if isinstance(result, Exception):
+                        yield name, result
+                    else:
+                        self.stats["records"] += len(result)
+                        pending_keys.extend(f"{name}.{record}" for record in reversed(result))
+                else:
+                    yield name, result
+
+                while len(in_flight) < self.max_workers and submit_next():
+                    pass
+
+    def _report(self, start: float, final: bool = False) -> None:
+        seconds = time.monotonic() - start
+        self.stats["seconds"] = round(seconds, 2)
+        fetched = self.stats["written"] + self.stats["failed"]
+        self.stats["records_per_second"] = round(fetched / seconds, 1) if seconds else 0.0
+        logger.info(
+            f"MDL crawl{' finished' if final else ''}: {self.stats['written']} written, "
+            f"{self.stats['skipped']} skipped, {self.stats['failed']} failed of "
+            f"{self.stats['records']} records, {self.stats['records_per_second']} records/s"
+        )
+        if self.progress:
+            self.progress(dict(self.stats))
+
+
+def _record_path(key: str) -> str:
+    component_type, _, name = key.partition(".")
+    return f"{component_type}/{name}.mdl"
+
+
+def _raise_on_failure(response: Dict[str, Any], what: str) -> None:
+    if response.get("responseStatus") == "FAILURE":
+        from veevavault.exceptions import VaultAPIError
+
+        raise VaultAPIError(f"Failed to list {what}: {response.get('errors', response)}")
+
+
+class _DirectorySink:
+    """Writes records as files below a directory."""
+
+    def __init__(self, root: str):
+        self.root = root
+        os.makedirs(root, exist_ok=True)
+
+    def existing(self) -> set:
+        found = set()
+        for directory, _, files in os.walk(self.root):
+            relative = os.path.relpath(directory, self.root)
+            for name in files:
+                if name.endswith(".mdl"):
+                    found.add(f"{relative}/{name}".replace(os.sep, "/"))
+        return found
+
+    def write(self, path: str, text: str) -> int:
+        data = text.encode("utf-8")
+        target = os.path.join(self.root, *path.split("/"))
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target), prefix=".tmp-")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, target)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return len(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class _ZipSink:
+    """Appends records to a zip archive."""
+
+    def __init__(self, path: str):
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        self.archive = zipfile.ZipFile(path, "a", compression=zipfile.ZIP_DEFLATED)
+
+    def existing(self) -> set:
+        return set(self.archive.namelist())
+
+    def write(self, path: str, text: str) -> int:
+        data = text.encode("utf-8")
+        self.archive.writestr(path, data)
+        return len(data)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.archive.close()
+        return False
+
+
+def _open_sink(output: str):
+    if output.lower().endswith(".zip"):
+        return _ZipSink(output)
+    return _DirectorySink(output)
@@ -1,6 +1,8 @@
 import requests
 import os
 
+from veevavault.utilities.multipart import MultipartEncoder
+
 
 class MDLService:
     """
@@ -85,6 +87,31 @@ class MDLService:
         response = requests.post(url, headers=headers, data=mdl_script)
         return response.json()
 
+    def execute_mdl_batch(self, mdl_script, max_workers=4, use_async=False):
+        """
+        Executes a large MDL script as concurrent per-component scripts.
+
+        The script is split into statements and grouped by component. Independent
+        components are executed concurrently; components that reference others
+        changed in the same script are executed after them, and skipped if those
+        fail. Asynchronous jobs are awaited. See MDLBatchExecutor for details.
+
+        Args:
+            mdl_script (str): MDL script with any number of statements.
+            max_workers (int, optional): Maximum components executed concurrently. Defaults to 4.
+            use_async (bool, optional): Execute each component as an asynchronous MDL job
+                                       and wait for it. Jobs run one at a time. Defaults to False.
+
+        Returns:
+            dict: Per-statement results (index, line, command, component, response,
+                 message) in script order, with succeeded, failed and skipped counts
+        """
+        from .batch_executor import MDLBatchExecutor
+
+        return MDLBatchExecutor(self.client, max_workers=max_workers, use_async=use_async).execute(
+            mdl_script
+        )
+
     def retrieve_async_mdl_script_results(self, job_id):
         """
         Retrieves the results of an asynchronously executed MDL script.
@@ -256,14 +283,42 @@ class MDLService:
                 the specified component record. Metadata returned varies based on component type.
                 If a field returns as blank, it means the record currently has no value for that field.
         """
-        url = f"{self.client.vaultURL}/api/mdl/components/{component_type_and_record_name}"
+        response = self.client.api_call(
+            f"api/mdl/components/{component_type_and_record_name}",
+            raw_response=True,
+            idempotent=True,
+        )
+        return response.text
 
-        headers = {"Authorization": self.client.sessionId, "Accept": "application/json"}
+    def crawl_component_mdl(self, output, component_types=None, max_workers=8, progress=None):
+        """
+        Exports the MDL of every component record to a directory tree or zip archive.
 
-        response = requests.get(url, headers=headers)
-        return response.text
+        Walks component types, their records and each record's MDL concurrently
+        instead of one call at a time. Rerunning with the same output resumes an
+        interrupted export. See MDLCrawler for details.
+
+        Args:
+            output (str): Output directory, or a path ending in .zip for an archive
+            component_types (list, optional): Only these component types. Defaults to all.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 8.
+            progress (callable, optional): Called periodically with the crawl stats
+
+        Returns:
+            dict: Counts of records written, skipped and failed, bytes written,
+                 elapsed seconds, records_per_second and errors
+        """
+        from .crawler import MDLCrawler
+
+        return MDLCrawler(
+            self.client,
+            output,
+            component_types=component_types,
+            max_workers=max_workers,
+            progress=progress,
+        ).crawl()
 
-    def upload_content_file(self, file_path):
+    def upload_content_file(self, file_path, progress=None):
         """
         Uploads a content file to be referenced by a component.
 
@@ -273,7 +328,8 @@ class MDLService:
 
         Args:
             file_path (str): The local file path of the content file to be uploaded.
-                           For example, 'C:\\Quote.pdf'.
+                           For example, 'C:\\Quote.pdf'. The file is streamed from disk.
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads.
 
         Returns:
             dict: On SUCCESS, the response includes the following:
@@ -290,8 +346,12 @@ class MDLService:
         }
 
         with open(file_path, "rb") as file:
-            files = {"file": (os.path.basename(file_path), file)}
-            response = requests.post(url, headers=headers, files=files)
+            body = MultipartEncoder(
+                {"file": (os.path.basename(file_path), file)}, progress=progress
+            )
+            headers["Content-Type"] = body.content_type
+            headers["Content-Length"] = str(len(body))
+            response = requests.post(url, headers=headers, data=body)
 
         return response.json()
 
@@ -11,6 +11,8 @@ from .attachments_service import ObjectAttachmentsService
 from .layouts_service import ObjectLayoutsService
 from .attachment_fields_service import ObjectAttachmentFieldsService
 from .actions_service import ObjectActionsService
+from .record_upsert import ObjectRecordUpsert
+from .bulk_delete import BulkDelete
 
 __all__ = [
     "ObjectService",
@@ -26,4 +28,6 @@ __all__ = [
     "ObjectLayoutsService",
     "ObjectAttachmentFieldsService",
     "ObjectActionsService",
+    "ObjectRecordUpsert",
+    "BulkDelete",
 ]
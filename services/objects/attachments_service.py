@@ -261,7 +261,7 @@ class ObjectAttachmentsService(BaseObjectService):
         return download_summary
 
     def create_object_record_attachment(
-        self, object_name, object_record_id, file_path, description=None
+        self, object_name, object_record_id, file_path, description=None, progress=None
     ):
         """
         Creates a new attachment for an object record.
@@ -273,29 +273,30 @@ class ObjectAttachmentsService(BaseObjectService):
             object_record_id (str): The object record id field value
             file_path (str): Path to the file to attach
             description (str, optional): Description for the attachment
+            progress (callable, optional): Called with (bytes_sent, total_bytes) while the file uploads
 
         Returns:
             dict: Response from the API with attachment details including id and version
 
         Notes:
             - If the attachment already exists, Vault uploads it as a new version of the existing attachment
-            - Maximum allowed file size is 4GB
+            - Maximum allowed file size is 4GB; the file is streamed from disk
             - The following attributes are determined based on the file: filename__v, format__v, size__v
             - If an attachment with the same filename already exists, it's added as a new version
             - If an attachment with the same MD5 checksum exists, the new attachment is not added
         """
         import os
+        from veevavault.utilities.multipart import send_multipart
 
         url = f"api/{self.client.LatestAPIversion}/vobjects/{object_name}/{object_record_id}/attachments"
 
         with open(file_path, "rb") as f:
-            files = {"file": (os.path.basename(file_path), f)}
-
-            data = {}
+            fields = []
             if description:
-                data["description"] = description
+                fields.append(("description", description))
+            fields.append(("file", (os.path.basename(file_path), f)))
 
-            return self.client.api_call(url, method="POST", files=files, data=data)
+            return send_multipart(self.client, url, fields, progress=progress)
 
     def create_multiple_object_record_attachments(
         self, object_name, staged_files_payload
@@ -0,0 +1,274 @@
+import csv
+import io
+import logging
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class BulkDelete:
+    """
+    Deletes large numbers of object records or documents.
+
+    Bulk deletes split the IDs into chunks of up to 500 (the batch limit of
+    the bulk delete endpoints) and send the chunks concurrently through
+    client.api_call.
+
+    Cascade deletes start one asynchronous job per record. Jobs are run from
+    a queue with at most max_jobs active at a time; each job's status is
+    polled no more often than Vault allows (once every 10 seconds per job)
+    and its result retrieved when it finishes.
+
+    Every run returns one summary with failures counted by error message and
+    the failed IDs, instead of a response per chunk or job.
+    """
+
+    MAX_BATCH_SIZE = 500
+    JOB_STATUS_INTERVAL = 10
+    TERMINAL_STATUSES = ("SUCCESS", "ERRORS_ENCOUNTERED", "CANCELLED", "MISSED_SCHEDULE")
+
+    def __init__(
+        self,
+        client,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4,
+        max_jobs: int = 4,
+        poll_interval: float = JOB_STATUS_INTERVAL,
+        job_timeout: float = 3600,
+    ):
+        """
+        Initialize the bulk delete.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            batch_size (int, optional): IDs per bulk delete request, at most 500. Defaults to 500.
+            max_workers (int, optional): Maximum concurrent bulk delete requests. Defaults to 4.
+            max_jobs (int, optional): Maximum cascade delete jobs active at a time. Defaults to 4.
+            poll_interval (float, optional): Seconds between job status requests, at least 10.
+            job_timeout (float, optional): Maximum seconds to wait for one cascade delete job.
+                Defaults to one hour.
+
+        Raises:
+            ValueError: If batch_size, max_workers or max_jobs is invalid
+        """
+        if not 1 <= batch_size <= self.MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {self.MAX_BATCH_SIZE}")
+        if max_workers < 1 or max_jobs < 1:
+            raise ValueError("max_workers and max_jobs must be at least 1")
+
+        self.client = client
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.max_jobs = max_jobs
+        self.poll_interval = max(poll_interval, self.JOB_STATUS_INTERVAL)
+        self.job_timeout = job_timeout
+
+    def delete_object_records(
+        self, object_name: str, ids: Iterable[Any], id_param: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Deletes object records in concurrent chunks.
+
+        DELETE /api/{version}/vobjects/{object_name}
+
+        Args:
+            object_name (str): API name of the object
+            ids (iterable): Record IDs, or values of the id_param field
+            id_param (str, optional): Unique field identifying the records, e.g. external_id__v
+
+        Returns:
+            dict: requested, deleted and failed counts, batches, failures (error
+                message -> count), errors (id and message per failed ID) and seconds
+        """
+        return self._delete_in_chunks(
+            f"api/{self.client.LatestAPIversion}/vobjects/{object_name}", ids, id_param
+        )
+
+    def delete_documents(self, ids: Iterable[Any], id_param: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Deletes all versions of documents in concurrent chunks.
+
+        DELETE /api/{version}/objects/documents/batch
+
+        Args:
+            ids (iterable): Document IDs, or values of the id_param field
+            id_param (str, optional): Unique field identifying the documents, e.g. external_id__v
+
+        Returns:
+            dict: requested, deleted and failed counts, batches, failures (error
+                message -> count), errors (id and message per failed ID) and seconds
+        """
+        return self._delete_in_chunks(
+            f"api/{self.client.LatestAPIversion}/objects/documents/batch", ids, id_param
+        )
+
+    def cascade_delete_object_records(
+        self, object_name: str, record_ids: Iterable[Any]
+    ) -> Dict[str, Any]:
+        """
+        Cascade deletes records with their children and grandchildren.
+
+        Starts one cascade delete job per record, at most max_jobs at a time,
+        and waits for all of them.
+
+        POST /api/{version}/vobjects/{object_name}/{object_record_id}/actions/cascadedelete
+
+        Args:
+            object_name (str): API name of the object
+            record_ids (iterable): IDs of the parent records to delete
+
+        Returns:
+            dict: requested, deleted and failed counts, failures (error message ->
+                count), errors (id and message per failed record), seconds and
+                jobs (record ID -> job ID)
+        """
+        ids = list(dict.fromkeys(str(record_id) for record_id in record_ids))
+        start = time.monotonic()
+        jobs: Dict[str, str] = {}
+        failures: List[Tuple[str, str]] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_jobs) as executor:
+            for record_id, job_id, error in executor.map(
+                lambda record_id: self._cascade_delete(object_name, record_id), ids
+            ):
+                if job_id:
+                    jobs[record_id] = job_id
+                if error:
+                    failures.append((record_id, error))
+
+        summary = self._summary(len(ids), failures, start)
+        summary["jobs"] = jobs
+        logger.info(
+            f"Cascade deleted {summary['deleted']} of {len(ids)} {object_name} records "
+            f"in {summary['seconds']}s; {summary['failed']} failed"
+        )
+        return summary
+
+    def _delete_in_chunks(
+        self, url: str, ids: Iterable[Any], id_param: Optional[str]
+    ) -> Dict[str, Any]:
+        ids = list(dict.fromkeys(str(value) for value in ids))
+        chunks = [ids[i : i + self.batch_size] for i in range(0, len(ids), self.batch_size)]
+        start = time.monotonic()
+        failures: List[Tuple[str, str]] = []
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for chunk_failures in executor.map(
+                lambda chunk: self._delete_chunk(url, chunk, id_param), chunks
+            ):
+                failures.extend(chunk_failures)
+
+        summary = self._summary(len(ids), failures, start)
+        summary["batches"] = len(chunks)
+        logger.info(
+            f"Deleted {summary['deleted']} of {len(ids)} in {len(chunks)} batches "
+            f"in {summary['seconds']}s; {summary['failed']} failed"
+        )
+        return summary
+
+    def _delete_chunk(
+        self, url: str, chunk: List[str], id_param: Optional[str]
+    ) -> List[Tuple[str, str]]:
+        """Deletes one chunk; returns (id, message) per failed ID."""
+        column = id_param or "id"
+        body = io.StringIO()
+        writer = csv.writer(body, lineterminator="\n")
+        writer.writerow([column])
+        writer.writerows([value] for value in chunk)
+
+        try:
+            response = self.client.api_call(
+                url,
+                method="DELETE",
+                headers={"Content-Type": "text/csv", "Accept": "application/json"},
+                params={"idParam": id_param} if id_param else None,
+                data=body.getvalue().encode("utf-8"),
+                # Not replayed: a replay after Vault applied the delete would
+                # report the deleted records as not found, i.e. failed
+                idempotent=False,
+            )
+        except Exception as e:
+            logger.warning(f"Bulk delete of {len(chunk)} IDs failed: {e}")
+            return [(value, str(e)) for value in chunk]
+
+        rows = response.get("data") if isinstance(response, dict) else None
+        if not isinstance(rows, list) or len(rows) != len(chunk):
+            message = _error_message(response) if isinstance(response, dict) else str(response)
+            return [(value, message) for value in chunk]
+
+        return [
+            (value, _error_message(row))
+            for value, row in zip(chunk, rows)
+            if row.get("responseStatus") != "SUCCESS"
+        ]
+
+    def _cascade_delete(
+        self, object_name: str, record_id: str
+    ) -> Tuple[str, Optional[str], Optional[str]]:
+        """Runs one cascade delete job; returns (record_id, job_id, error)."""
+        from veevavault.services.jobs import JobsService
+
+        try:
+            response = self.client.api_call(
+                f"api/{self.client.LatestAPIversion}/vobjects/{object_name}/{record_id}"
+                "/actions/cascadedelete",
+                method="POST",
+                headers={"Accept": "application/json"},
+            )
+            job_id = response.get("job_id", (response.get("data") or {}).get("job_id"))
+            if response.get("responseStatus") == "FAILURE" or job_id is None:
+                return record_id, None, _error_message(response)
+            job_id = str(job_id)
+
+            jobs = JobsService(self.client)
+            deadline = time.monotonic() + self.job_timeout
+            while True:
+                time.sleep(min(self.poll_interval, max(deadline - time.monotonic(), 0)))
+                state = jobs.retrieve_job_status(job_id).get("data", {}).get("status")
+                if state in self.TERMINAL_STATUSES:
+                    break
+                if time.monotonic() >= deadline:
+                    return record_id, job_id, f"Job did not finish in {self.job_timeout}s"
+        except Exception as e:
+            logger.warning(f"Cascade delete of {object_name} {record_id} failed: {e}")
+            return record_id, None, str(e)
+
+        if state == "SUCCESS":
+            return record_id, job_id, None
+
+        message = f"Job {job_id} finished with status {state}"
+        try:
+            results = self.client.api_call(
+                f"api/{self.client.LatestAPIversion}/vobjects/cascadedelete/results/"
+                f"{object_name}/failure/{job_id}",
+                headers={"Accept": "application/json"},
+            )
+            if isinstance(results, (bytes, str)):
+                text = results.decode("utf-8", "replace") if isinstance(results, bytes) else results
+                message += f": {text.strip()[:500]}"
+            elif isinstance(results, dict) and (results.get("errors") or results.get("data")):
+                message += f": {_error_message(results)}"
+        except Exception as e:
+            logger.debug(f"Cascade delete results for job {job_id} unavailable: {e}")
+        return record_id, job_id, message
+
+    @staticmethod
+    def _summary(requested: int, failures: List[Tuple[str, str]], start: float) -> Dict[str, Any]:
+        return {
+            "requested": requested,
+            "deleted": requested - len(failures),
+            "failed": len(failures),
+            "failures": dict(Counter(message for _, message in failures).most_common()),
+            "errors": [{"id": value, "message": message} for value, message in failures],
+            "seconds": round(time.monotonic() - start, 2),
+        }
+
+
+def _error_message(response: Dict[str, Any]) -> str:
+    errors = response.get("errors") or []
+    if errors and isinstance(errors[0], dict):
+        return errors[0].get("message") or errors[0].get("type") or str(errors[0])
+    return str(errors[0]) if errors else str(response.get("responseMessage", "Unknown error"))
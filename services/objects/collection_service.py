@@ -1,5 +1,4 @@
 import json
-import pandas as pd
 from .base_service import BaseObjectService
 
 
@@ -67,6 +66,8 @@ class ObjectCollectionService(BaseObjectService):
         Returns:
             pandas.DataFrame: DataFrame containing the object records
         """
+        import pandas as pd
+
         response = self.retrieve_object_record_collection(
             object_name, fields, limit, offset, sort
         )
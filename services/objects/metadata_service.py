@@ -1,4 +1,3 @@
-import pandas as pd
 from .base_service import BaseObjectService
 
 
@@ -106,6 +105,8 @@ class ObjectMetadataService(BaseObjectService):
         Returns:
             pandas.DataFrame: A DataFrame containing object metadata sorted by name
         """
+        import pandas as pd
+
         url = f"api/{self.client.LatestAPIversion}/metadata/vobjects"
 
         response = self.client.api_call(url)
@@ -125,6 +126,8 @@ class ObjectMetadataService(BaseObjectService):
         Returns:
             pandas.DataFrame: A DataFrame containing field metadata
         """
+        import pandas as pd
+
         url = f"api/{self.client.LatestAPIversion}/metadata/vobjects/{object_api_name}"
 
         response = self.client.api_call(url)
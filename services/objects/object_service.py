@@ -1,6 +1,6 @@
-import pandas as pd
 import requests
 import json
+from veevavault.utilities.lazy_service import LazyService
 from .base_service import BaseObjectService
 from .metadata_service import ObjectMetadataService
 from .crud_service import ObjectCRUDService
@@ -21,6 +21,20 @@ class ObjectService:
     This class aggregates all specialized object service classes.
     """
 
+    # Specialized services are constructed on first access and cached on the
+    # instance; see LazyService.
+    metadata = LazyService(ObjectMetadataService)
+    crud = LazyService(ObjectCRUDService)
+    collection = LazyService(ObjectCollectionService)
+    rollup = LazyService(ObjectRollupService)
+    merge = LazyService(ObjectMergeService)
+    types = LazyService(ObjectTypesService)
+    roles = LazyService(ObjectRolesService)
+    attachments = LazyService(ObjectAttachmentsService)
+    layouts = LazyService(ObjectLayoutsService)
+    attachment_fields = LazyService(ObjectAttachmentFieldsService)
+    actions = LazyService(ObjectActionsService)
+
     def __init__(self, client):
         """
         Initialize with a VaultClient instance
@@ -30,19 +44,6 @@ class ObjectService:
         """
         self.client = client
 
-        # Initialize specialized services
-        self.metadata = ObjectMetadataService(client)
-        self.crud = ObjectCRUDService(client)
-        self.collection = ObjectCollectionService(client)
-        self.rollup = ObjectRollupService(client)
-        self.merge = ObjectMergeService(client)
-        self.types = ObjectTypesService(client)
-        self.roles = ObjectRolesService(client)
-        self.attachments = ObjectAttachmentsService(client)
-        self.layouts = ObjectLayoutsService(client)
-        self.attachment_fields = ObjectAttachmentFieldsService(client)
-        self.actions = ObjectActionsService(client)
-
     # ===================================================================
     # Convenience methods that directly call methods on specialized services
     # These are kept for backward compatibility and ease of use
@@ -246,6 +247,39 @@ class ObjectService:
             object_name, data, id_param, migration_mode
         )
 
+    def upsert_changed_object_records(
+        self, object_name, records, key_field="external_id__v", baseline="cache", **kwargs
+    ):
+        """
+        Upserts only the records that are new or changed since the last upsert.
+
+        POST /api/{version}/vobjects/{object_name}?idParam={key_field}
+
+        Args:
+            object_name (str): API name of the object
+            records (iterable): Records as dicts of field name -> value, each with key_field
+            key_field (str): Unique field identifying records. Defaults to external_id__v.
+            baseline (str): Compare with hashes recorded locally by the previous upsert
+                           ("cache") or with the current values in Vault ("vault")
+            **kwargs: Further ObjectRecordUpsert options, e.g. hash_store_path,
+                     max_workers or additional_headers
+
+        Returns:
+            dict: Counts of new, changed, unchanged, succeeded and failed records,
+                 and the errors of failed records
+
+        Notes:
+            - Unchanged records are not sent at all
+            - See ObjectRecordUpsert for how records are compared
+        """
+        from .record_upsert import ObjectRecordUpsert
+
+        upsert = ObjectRecordUpsert(self.client, object_name, key_field=key_field, **kwargs)
+        try:
+            return upsert.upsert(records, baseline=baseline)
+        finally:
+            upsert.close()
+
     # ------ Delete Operations ------
 
     def delete_object_records(self, object_name, data, id_param=None):
@@ -272,6 +306,52 @@ class ObjectService:
         """
         return self.crud.delete_object_records(object_name, data, id_param)
 
+    def bulk_delete_object_records(self, object_name, ids, id_param=None, max_workers=4):
+        """
+        Deletes any number of object records in concurrent batches of 500.
+
+        DELETE /api/{version}/vobjects/{object_name}
+
+        Args:
+            object_name (str): API name of the object
+            ids (iterable): Record IDs, or values of the id_param field
+            id_param (str): Field name to use as record identifier (if not the default 'id')
+            max_workers (int): Maximum concurrent requests. Defaults to 4.
+
+        Returns:
+            dict: Summary with deleted and failed counts, failures counted by
+                 error message and the failed IDs
+
+        Notes:
+            - See BulkDelete for details
+        """
+        from .bulk_delete import BulkDelete
+
+        return BulkDelete(self.client, max_workers=max_workers).delete_object_records(
+            object_name, ids, id_param
+        )
+
+    def cascade_delete_object_records(self, object_name, record_ids, max_jobs=4):
+        """
+        Cascade deletes many records and waits for all jobs to finish.
+
+        Starts one cascade delete job per record, at most max_jobs at a time.
+
+        Args:
+            object_name (str): API name of the object
+            record_ids (iterable): IDs of the parent records to delete
+            max_jobs (int): Maximum jobs active at a time. Defaults to 4.
+
+        Returns:
+            dict: Summary with deleted and failed counts, failures counted by
+                 error message, the failed IDs and the job ID per record
+        """
+        from .bulk_delete import BulkDelete
+
+        return BulkDelete(self.client, max_jobs=max_jobs).cascade_delete_object_records(
+            object_name, record_ids
+        )
+
     def cascade_delete_object_record(self, object_name, object_record_id):
         """
         Performs a cascade delete operation on a single object record.
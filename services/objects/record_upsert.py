@@ -0,0 +1,366 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional
+from urllib.parse import urlparse
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HASH_STORE_PATH = os.path.join(
+    os.path.expanduser("~"), ".veevavault", "record_hashes.sqlite3"
+)
+BASELINES = ("cache", "vault")
+
+
+def normalize_value(value: Any) -> str:
+    """
+    Returns the comparable text of a field value.
+
+    None and "" are equal, booleans are lower-case and multi-value fields
+    (lists, as returned by VQL for picklists) are comma-joined, so a value
+    read from Vault compares equal to the same value read from a CSV file.
+
+    Args:
+        value: Field value
+
+    Returns:
+        str: Normalized value
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (list, tuple)):
+        return ",".join(normalize_value(v) for v in value)
+    if isinstance(value, float) and value.is_integer():
+        return str(int(value))
+    return str(value)
+
+
+def record_hash(record: Dict[str, Any], fields: Optional[Iterable[str]] = None) -> str:
+    """
+    Returns the SHA-256 of a record's normalized field values.
+
+    Args:
+        record (dict): Field name -> value
+        fields (iterable, optional): Fields to hash. Defaults to all fields of the record.
+
+    Returns:
+        str: Hex digest
+    """
+    names = sorted(fields if fields is not None else record)
+    canonical = json.dumps([[name, normalize_value(record.get(name))] for name in names])
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ObjectRecordUpsert:
+    """
+    Upserts object records, sending only those that are new or changed.
+
+    Each incoming record is hashed and compared with a baseline:
+
+    - "cache": the hashes recorded by the previous upsert, kept in a local
+      SQLite file per Vault and object
+    - "vault": the current values in Vault, read with packed VQL IN-lists on
+      the key field (see InListQuery) for just the incoming keys
+
+    New and changed records are sent in batches of up to 500 with Create
+    Object Records and idParam set to the key field, which upserts them by
+    that unique (e.g. external ID) field. Batches run concurrently through
+    client.api_call. The hashes of records Vault accepted are recorded, so
+    the next run with baseline "cache" needs no Vault reads at all.
+
+    Records changed in Vault outside this process are not noticed with the
+    "cache" baseline; use "vault" (e.g. once a week) to resynchronize.
+    """
+
+    MAX_BATCH_SIZE = 500
+
+    def __init__(
+        self,
+        client,
+        object_name: str,
+        key_field: str = "external_id__v",
+        hash_store_path: str = DEFAULT_HASH_STORE_PATH,
+        batch_size: int = MAX_BATCH_SIZE,
+        max_workers: int = 4,
+        additional_headers: Optional[Dict[str, str]] = None,
+    ):
+        """
+        Initialize the upsert.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            object_name (str): API name of the object, e.g. product__v
+            key_field (str, optional): Unique field identifying records, sent as idParam.
+                Every record must have it. Defaults to external_id__v.
+            hash_store_path (str, optional): SQLite file for recorded hashes.
+                Defaults to ~/.veevavault/record_hashes.sqlite3.
+            batch_size (int, optional): Records per request, at most 500. Defaults to 500.
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            additional_headers (dict, optional): Headers for every upsert request, such as
+                X-VaultAPI-MigrationMode or X-VaultAPI-NoTriggers
+
+        Raises:
+            ValueError: If batch_size or max_workers is invalid
+        """
+        if not 1 <= batch_size <= self.MAX_BATCH_SIZE:
+            raise ValueError(f"batch_size must be between 1 and {self.MAX_BATCH_SIZE}")
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+
+        self.client = client
+        self.object_name = object_name
+        self.key_field = key_field
+        self.hash_store_path = hash_store_path
+        self.batch_size = batch_size
+        self.max_workers = max_workers
+        self.additional_headers = additional_headers or {}
+        self.vault = urlparse(getattr(client, "vaultURL", None) or "").netloc
+        self._db: Optional[sqlite3.Connection] = None
+
+    def plan(self, records: Iterable[Dict[str, Any]], baseline: str = "cache") -> Dict[str, Any]:
+        """
+        Compares records with the baseline without sending anything.
+
+        Args:
+            records (iterable): Records as dicts of field name -> value
+            baseline (str, optional): "cache" or "vault". Defaults to "cache".
+
+        Returns:
+            dict:
+                - new: Records whose key is not in the baseline
+                - changed: Records whose values differ from the baseline
+                - unchanged: Number of records equal to the baseline
+                - hashes: Key -> hash of every incoming record
+
+        Raises:
+            ValueError: If baseline is unknown or a record has no key value
+            VaultQueryError: If the baseline is "vault" and a query fails
+        """
+        if baseline not in BASELINES:
+            raise ValueError(f"baseline must be one of {', '.join(BASELINES)}")
+
+        incoming: Dict[str, Dict[str, Any]] = {}
+        for record in records:
+            key = normalize_value(record.get(self.key_field))
+            if not key:
+                raise ValueError(f"Record has no {self.key_field} value: {record}")
+            incoming[key] = record
+
+        hashes = {key: record_hash(record) for key, record in incoming.items()}
+        if baseline == "cache":
+            known = self._cached_hashes(list(incoming))
+        else:
+            known = self._vault_hashes(incoming)
+
+        new, changed = [], []
+        for key, record in incoming.items():
+            if key not in known:
+                new.append(record)
+            elif known[key] != hashes[key]:
+                changed.append(record)
+        return {
+            "new": new,
+            "changed": changed,
+            "unchanged": len(incoming) - len(new) - len(changed),
+            "hashes": hashes,
+        }
+
+    def upsert(
+        self,
+        records: Iterable[Dict[str, Any]],
+        baseline: str = "cache",
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """
+        Upserts the new and changed records and records their hashes.
+
+        Args:
+            records (iterable): Records as dicts of field name -> value. Every record
+                must include key_field.
+            baseline (str, optional): "cache" or "vault". Defaults to "cache".
+            dry_run (bool, optional): Only compare; send nothing. Defaults to False.
+
+        Returns:
+            dict:
+                - total, new, changed, unchanged: Record counts
+                - sent, succeeded, failed: Counts of records sent to Vault
+                - batches: Number of requests
+                - errors: Per failed record: key and message
+                - seconds: Elapsed time
+
+        Raises:
+            ValueError: If baseline is unknown or a record has no key value
+        """
+        start = time.monotonic()
+        plan = self.plan(records, baseline)
+        to_send = plan["new"] + plan["changed"]
+        batches = [
+            to_send[i : i + self.batch_size] for i in range(0, len(to_send), self.batch_size)
+        ]
+
+        succeeded: Dict[str, str] = {}
+        errors: List[Dict[str, str]] = []
+        if not dry_run and batches:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                for batch, outcomes in zip(batches, executor.map(self._send_batch, batches)):
+                    accepted = {}
+                    for record, (ok, message) in zip(batch, outcomes):
+                        key = normalize_value(record.get(self.key_field))
+                        if ok:
+                            accepted[key] = plan["hashes"][key]
+                        else:
+                            errors.append({"key": key, "message": message})
+                    self._record_hashes(accepted)
+                    succeeded.update(accepted)
+
+        if baseline == "vault" and not dry_run:
+            # Seed the cache with the records that already matched Vault
+            sent_keys = {normalize_value(r.get(self.key_field)) for r in to_send}
+            self._record_hashes(
+                {k: h for k, h in plan["hashes"].items() if k not in sent_keys}
+            )
+
+        result = {
+            "total": len(plan["hashes"]),
+            "new": len(plan["new"]),
+            "changed": len(plan["changed"]),
+            "unchanged": plan["unchanged"],
+            "sent": 0 if dry_run else len(to_send),
+            "succeeded": len(succeeded),
+            "failed": len(errors),
+            "batches": 0 if dry_run else len(batches),
+            "errors": errors,
+            "seconds": round(time.monotonic() - start, 2),
+        }
+        logger.info(
+            f"Upsert of {self.object_name}: {result['total']} records, {result['new']} new, "
+            f"{result['changed']} changed, {result['unchanged']} unchanged, "
+            f"{result['failed']} failed"
+        )
+        return result
+
+    def forget(self, keys: Optional[Iterable[Any]] = None) -> None:
+        """
+        Removes recorded hashes so those records are sent again by the next upsert.
+
+        Args:
+            keys (iterable, optional): Key values to forget. Defaults to all records
+                of the object.
+        """
+        db = self._connection()
+        with db:
+            if keys is None:
+                db.execute(
+                    "DELETE FROM record_hashes WHERE vault = ? AND object = ?",
+                    (self.vault, self.object_name),
+                )
+            else:
+                db.executemany(
+                    "DELETE FROM record_hashes WHERE vault = ? AND object = ? AND key = ?",
+                    [(self.vault, self.object_name, normalize_value(k)) for k in keys],
+                )
+
+    def close(self) -> None:
+        """Closes the hash store."""
+        if self._db is not None:
+            self._db.close()
+            self._db = None
+
+    def _send_batch(self, batch: List[Dict[str, Any]]) -> List[tuple]:
+        """Upserts one batch; returns (succeeded, message) per record."""
+        try:
+            response = self.client.api_call(
+                f"api/{self.client.LatestAPIversion}/vobjects/{self.object_name}",
+                method="POST",
+                params={"idParam": self.key_field},
+                data=json.dumps(batch),
+                headers={
+                    "Content-Type": "application/json",
+                    "Accept": "application/json",
+                    **self.additional_headers,
+                },
+                # Upserting by a unique key is safe to replay
+                idempotent=True,
+            )
+        except Exception as e:
+            logger.warning(f"Upsert batch of {len(batch)} {self.object_name} records failed: {e}")
+            return [(False, str(e))] * len(batch)
+
+        rows = response.get("data") if isinstance(response, dict) else None
+        if not isinstance(rows, list) or len(rows) != len(batch):
+            message = str(response.get("errors", response)) if isinstance(response, dict) else str(response)
+            return [(False, message)] * len(batch)
+
+        outcomes = []
+        for row in rows:
+            if row.get("responseStatus") == "SUCCESS":
+                outcomes.append((True, ""))
+            else:
+                errors = row.get("errors") or [{}]
+                outcomes.append((False, errors[0].get("message", str(errors[0]))))
+        return outcomes
+
+    def _vault_hashes(self, incoming: Dict[str, Dict[str, Any]]) -> Dict[str, str]:
+        """Hashes the current Vault values of the incoming records' fields."""
+        from veevavault.services.queries import InListQuery
+
+        fields = sorted({name for record in incoming.values() for name in record})
+        rows = InListQuery(
+            self.client,
+            self.object_name,
+            list(incoming),
+            fields=fields,
+            id_field=self.key_field,
+            max_workers=self.max_workers,
+        ).run()["records"]
+        return {
+            key: record_hash(rows[key], fields=incoming[key].keys())
+            for key in incoming
+            if key in rows
+        }
+
+    def _cached_hashes(self, keys: List[str]) -> Dict[str, str]:
+        db = self._connection()
+        hashes = {}
+        # Stay well below SQLite's host parameter limit
+        for i in range(0, len(keys), 900):
+            chunk = keys[i : i + 900]
+            rows = db.execute(
+                "SELECT key, hash FROM record_hashes WHERE vault = ? AND object = ? "
+                f"AND key IN ({','.join('?' * len(chunk))})",
+                [self.vault, self.object_name, *chunk],
+            )
+            hashes.update(rows)
+        return hashes
+
+    def _record_hashes(self, hashes: Dict[str, str]) -> None:
+        if not hashes:
+            return
+        db = self._connection()
+        now = time.time()
+        with db:
+            db.executemany(
+                "INSERT OR REPLACE INTO record_hashes (vault, object, key, hash, updated) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(self.vault, self.object_name, k, h, now) for k, h in hashes.items()],
+            )
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._db is None:
+            directory = os.path.dirname(os.path.abspath(self.hash_store_path))
+            os.makedirs(directory, exist_ok=True)
+            self._db = sqlite3.connect(self.hash_store_path)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS record_hashes ("
+                "vault TEXT NOT NULL, object TEXT NOT NULL, key TEXT NOT NULL, "
+                "hash TEXT NOT NULL, updated REAL NOT NULL, "
+                "PRIMARY KEY (vault, object, key))"
+            )
+        return self._db
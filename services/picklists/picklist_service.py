@@ -1,4 +1,3 @@
-import pandas as pd
 import asyncio
 import requests
 
@@ -60,6 +59,8 @@ class PicklistService:
         Raises:
             Exception: If the API request fails
         """
+        import pandas as pd
+
         url = f"api/{self.client.LatestAPIversion}/objects/picklists/{picklist_name}"
         response = self.client.api_call(url)
 
@@ -207,6 +208,8 @@ class PicklistService:
         Returns:
             pandas.DataFrame: DataFrame containing the combined picklist values
         """
+        import pandas as pd
+
         tasks = []
 
         # Create tasks for each picklist
@@ -242,6 +245,8 @@ class PicklistService:
         Returns:
             pandas.DataFrame: DataFrame containing the picklist values
         """
+        import pandas as pd
+
         try:
             df = self.retrieve_picklist_values(picklist_name)
             return df
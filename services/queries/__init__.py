@@ -1,3 +1,13 @@
 from .query_service import QueryService
+from .in_list_query import InListQuery, pack_in_lists
+from .sharded_query import ShardedQuery
+from .vql import VQLQuery, parse_vql
 
-__all__ = ["QueryService"]
+__all__ = [
+    "QueryService",
+    "InListQuery",
+    "ShardedQuery",
+    "VQLQuery",
+    "pack_in_lists",
+    "parse_vql",
+]
@@ -0,0 +1,184 @@
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .sharded_query import vql_literal
+
+logger = logging.getLogger(__name__)
+
+# Longest VQL statement Vault accepts
+MAX_VQL_LENGTH = 50000
+
+
+def pack_in_lists(
+    prefix: str,
+    values: Iterable[Any],
+    suffix: str = "",
+    max_length: int = MAX_VQL_LENGTH,
+) -> List[List[Any]]:
+    """
+    Packs values into as few IN-lists as fit the VQL length limit.
+
+    Each batch renders as prefix + "(v1,v2,...)" + suffix with at most max_length
+    characters. Values keep their order; duplicates are dropped.
+
+    Args:
+        prefix (str): Query text before the list, e.g. "SELECT id FROM documents WHERE id CONTAINS "
+        values (iterable): Values for the list
+        suffix (str, optional): Query text after the list. Defaults to "".
+        max_length (int, optional): Maximum statement length. Defaults to MAX_VQL_LENGTH.
+
+    Returns:
+        list: Batches of values
+
+    Raises:
+        ValueError: If a single value does not fit the limit
+    """
+    budget = max_length - len(prefix) - len(suffix) - 2
+    batches: List[List[Any]] = []
+    batch: List[Any] = []
+    used = 0
+    seen = set()
+    for value in values:
+        key = str(value)
+        if key in seen:
+            continue
+        seen.add(key)
+        size = len(vql_literal(value))
+        if size > budget:
+            raise ValueError(f"Value {value!r} does not fit in a {max_length}-character query")
+        # Every value after the first in a batch is preceded by a comma
+        if batch and used + 1 + size > budget:
+            batches.append(batch)
+            batch, used = [], 0
+        used += size + (1 if batch else 0)
+        batch.append(value)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+class InListQuery:
+    """
+    Fetches many records by ID with as few VQL queries as the length limit allows.
+
+    The IDs are packed into maximal WHERE id CONTAINS (...) lists under the
+    50,000-character VQL limit and the batches run concurrently through
+    client.api_call, so the client's retry and rate limiting apply.
+
+        result = InListQuery(client, "documents", document_ids, ["id", "name__v"]).run()
+        result["records"]["123"], result["missing"]
+    """
+
+    def __init__(
+        self,
+        client,
+        target: str,
+        ids: Iterable[Any],
+        fields: Sequence[str] = ("id",),
+        id_field: str = "id",
+        where: Optional[str] = None,
+        max_workers: int = 4,
+        max_length: int = MAX_VQL_LENGTH,
+    ):
+        """
+        Args:
+            client: An authenticated VaultClient instance
+            target (str): Query target, e.g. "documents" or "product__v"
+            ids (iterable): IDs to fetch; ints for documents, strings for object records
+            fields (sequence, optional): Fields to select. id_field is always selected.
+            id_field (str, optional): Field the IDs refer to. Defaults to "id".
+            where (str, optional): Additional VQL condition for every batch
+            max_workers (int, optional): Maximum concurrent queries. Defaults to 4.
+            max_length (int, optional): Maximum statement length. Defaults to MAX_VQL_LENGTH.
+        """
+        self.client = client
+        self.target = target
+        self.ids = list(ids)
+        self.id_field = id_field
+        self.fields = [id_field] + [f for f in fields if f != id_field]
+        self.where = where
+        self.max_workers = max(max_workers, 1)
+        self.max_length = max_length
+
+    @property
+    def prefix(self) -> str:
+        """Query text preceding the IN-list."""
+        condition = f"({self.where}) AND " if self.where else ""
+        return (
+            f"SELECT {', '.join(self.fields)} FROM {self.target} "
+            f"WHERE {condition}{self.id_field} CONTAINS "
+        )
+
+    def queries(self) -> List[str]:
+        """
+        Builds the batch queries.
+
+        Returns:
+            list: VQL statements, each within max_length characters
+        """
+        prefix = self.prefix
+        return [
+            prefix + "(" + ",".join(vql_literal(v) for v in batch) + ")"
+            for batch in pack_in_lists(prefix, self.ids, max_length=self.max_length)
+        ]
+
+    def run(self) -> Dict[str, Any]:
+        """
+        Runs the batches and merges their records.
+
+        Returns:
+            dict:
+                - records: Records keyed by str(ID)
+                - missing: Requested IDs that no record matched, in request order
+                - batches: Number of queries run
+
+        Raises:
+            VaultQueryError: If a batch query fails
+        """
+        queries = self.queries()
+        records: Dict[str, Dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            for rows in executor.map(self._fetch_all, queries):
+                for row in rows:
+                    records[str(row.get(self.id_field))] = row
+
+        seen = set()
+        missing = []
+        for value in self.ids:
+            key = str(value)
+            if key not in records and key not in seen:
+                missing.append(value)
+            seen.add(key)
+
+        logger.info(
+            f"Fetched {len(records)} {self.target} records in {len(queries)} queries; "
+            f"{len(missing)} missing"
+        )
+        return {"records": records, "missing": missing, "batches": len(queries)}
+
+    def _fetch_all(self, vql: str) -> List[Dict[str, Any]]:
+        response = self._check(
+            self.client.api_call(
+                f"api/{self.client.LatestAPIversion}/query",
+                method="POST",
+                data={"q": vql},
+                headers={"Content-Type": "application/x-www-form-urlencoded"},
+                idempotent=True,
+            )
+        )
+        rows = list(response.get("data") or [])
+        next_page = (response.get("responseDetails") or {}).get("next_page")
+        while next_page:
+            response = self._check(self.client.api_call(next_page))
+            rows.extend(response.get("data") or [])
+            next_page = (response.get("responseDetails") or {}).get("next_page")
+        return rows
+
+    @staticmethod
+    def _check(response: Dict[str, Any]) -> Dict[str, Any]:
+        if response.get("responseStatus") == "FAILURE":
+            from veevavault.exceptions import VaultQueryError
+
+            raise VaultQueryError(f"Query failed: {response.get('errors', response)}")
+        return response
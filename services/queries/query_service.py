@@ -1,4 +1,3 @@
-import pandas as pd
 import re
 import requests
 import logging
@@ -101,6 +100,8 @@ class QueryService:
         Raises:
             VaultQueryError: If the query fails
         """
+        import pandas as pd
+
         # Check if PAGESIZE is in the query
         page_count = None
         if re.search(r"(?i)PAGESIZE", query):
@@ -152,3 +153,90 @@ class QueryService:
             logger.warning(f"Pagination may be incomplete due to: {e}")
 
         return output
+
+    def sharded_query(
+        self,
+        query,
+        shards=8,
+        shard_field="id",
+        max_workers=4,
+        page_size=1000,
+    ):
+        """
+        Run a large VQL extract as concurrent ID-range shards and stream the records.
+
+        The range of shard_field is probed first, the query is split into disjoint
+        WHERE shard_field >= a AND shard_field < b shards, and the shards are fetched
+        concurrently through client.api_call (paced by the client's rate_limiter, if
+        set). Shards that turn out much larger than expected are split again.
+        See ShardedQuery for details.
+
+        Args:
+            query (str): VQL query without MAXROWS, SKIP, LIMIT or OFFSET
+            shards (int, optional): Number of shards to plan. Defaults to 8.
+            shard_field (str, optional): Monotonic integer, datetime or ID field. Defaults to "id".
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            page_size (int, optional): PAGESIZE of each shard query. Defaults to 1000.
+
+        Returns:
+            Iterator[dict]: Records in no particular order
+
+        Raises:
+            VQLSyntaxError: If the query is not valid VQL
+            VaultQueryError: If a shard query fails
+        """
+        from .sharded_query import ShardedQuery
+
+        return ShardedQuery(
+            self.client,
+            query,
+            shards=shards,
+            shard_field=shard_field,
+            max_workers=max_workers,
+            page_size=page_size,
+        ).iter_records()
+
+    def get_many(
+        self,
+        target,
+        ids,
+        fields=("id",),
+        id_field="id",
+        where=None,
+        max_workers=4,
+    ):
+        """
+        Fetch many records by ID with as few VQL queries as possible.
+
+        The IDs are packed into maximal WHERE id_field CONTAINS (...) lists under the
+        50,000-character VQL limit, and the batches are queried concurrently through
+        client.api_call. See InListQuery for details.
+
+        Args:
+            target (str): Query target, e.g. "documents" or "product__v"
+            ids (iterable): IDs to fetch; ints for documents, strings for object records
+            fields (sequence, optional): Fields to select. id_field is always selected.
+            id_field (str, optional): Field the IDs refer to. Defaults to "id".
+            where (str, optional): Additional VQL condition, e.g. "status__v = 'active__v'"
+            max_workers (int, optional): Maximum concurrent queries. Defaults to 4.
+
+        Returns:
+            dict:
+                - records: Records keyed by str(ID)
+                - missing: Requested IDs that no record matched
+                - batches: Number of queries run
+
+        Raises:
+            VaultQueryError: If a batch query fails
+        """
+        from .in_list_query import InListQuery
+
+        return InListQuery(
+            self.client,
+            target,
+            ids,
+            fields=fields,
+            id_field=id_field,
+            where=where,
+            max_workers=max_workers,
+        ).run()
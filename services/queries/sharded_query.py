@@ -0,0 +1,362 @@
+import logging
+import math
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from .vql import parse_vql
+
+logger = logging.getLogger(__name__)
+
+# Characters of Vault record IDs and other keys, in ASCII (sort) order
+_DIGITS_UPPER = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS_MIXED = _DIGITS_UPPER + "abcdefghijklmnopqrstuvwxyz"
+
+
+def split_range(lower: Any, upper: Any, parts: int) -> List[Any]:
+    """
+    Returns boundaries splitting [lower, upper] into roughly equal parts.
+
+    Integers and ISO datetimes are split arithmetically. Other strings, such as
+    object record IDs, are split as numbers in base 36 (or 62 with lowercase
+    letters) after their common prefix.
+
+    Args:
+        lower: Smallest value
+        upper: Largest value
+        parts (int): Number of parts
+
+    Returns:
+        list: Ascending boundaries strictly above lower and at most upper; fewer than
+            parts - 1 (possibly none) when the range cannot be split that finely
+    """
+    if parts < 2 or lower is None or upper is None or not lower < upper:
+        return []
+
+    if isinstance(lower, int) and isinstance(upper, int):
+        return _split_numbers(lower, upper, parts)
+
+    if isinstance(lower, str) and isinstance(upper, str):
+        lower_time, upper_time = _parse_datetime(lower), _parse_datetime(upper)
+        if lower_time is not None and upper_time is not None:
+            lower_ms = int(lower_time.timestamp() * 1000)
+            upper_ms = int(upper_time.timestamp() * 1000)
+            return [_format_datetime(ms) for ms in _split_numbers(lower_ms, upper_ms, parts)]
+        return _split_strings(lower, upper, parts)
+
+    return []
+
+
+def vql_literal(value: Any) -> str:
+    """
+    Formats a value as a VQL literal.
+
+    Args:
+        value: Integer, float or string value
+
+    Returns:
+        str: The literal, quoted and escaped for strings
+    """
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+class ShardedQuery:
+    """
+    Runs one large VQL query as many concurrent range queries.
+
+    A single VQL cursor is limited by how fast Vault serves its pages. This
+    executor splits the query on a monotonic field (id by default):
+
+        1. A probe learns the smallest and largest value of the field and the
+           total row count (two single-row queries).
+        2. The query is rewritten into disjoint shards with
+           WHERE (original) AND field >= a AND field < b. The first and last
+           shards are open-ended, so rows created after the probe are not missed.
+        3. Shard pages are fetched on a bounded pool of worker threads through
+           client.api_call, so a RateLimiter assigned to the client paces them.
+        4. Records are yielded as each page arrives, in no particular order.
+        5. A shard whose first page reports many more rows than its fair share
+           (skew_factor times the expected rows per shard) is split again and
+           its sub-shards are queued instead.
+
+    The query must not contain ORDER BY ordering that matters to the caller,
+    or MAXROWS, SKIP, LIMIT or OFFSET, as these have no meaning across shards.
+    """
+
+    def __init__(
+        self,
+        client,
+        query: str,
+        shards: int = 8,
+        shard_field: str = "id",
+        max_workers: int = 4,
+        page_size: int = 1000,
+        skew_factor: float = 2.0,
+        max_splits: int = 3,
+    ):
+        """
+        Initialize the sharded query.
+
+        Args:
+            client: An initialized VaultClient instance for API communication
+            query (str): VQL query to run
+            shards (int, optional): Number of shards to plan. Defaults to 8.
+            shard_field (str, optional): Monotonic field to split on: an integer, datetime or
+                ID field that supports range comparisons. Defaults to "id".
+            max_workers (int, optional): Maximum concurrent requests. Defaults to 4.
+            page_size (int, optional): PAGESIZE of each shard query. Defaults to 1000.
+            skew_factor (float, optional): How many times its expected row count a shard may
+                hold before it is split again. Defaults to 2.0.
+            max_splits (int, optional): How many times a shard may be split again. Defaults to 3.
+
+        Raises:
+            VQLSyntaxError: If the query is not valid VQL
+            ValueError: If the query cannot be sharded or a parameter is invalid
+        """
+        if shards < 1 or max_workers < 1 or page_size < 1:
+            raise ValueError("shards, max_workers and page_size must be at least 1")
+        if skew_factor <= 1:
+            raise ValueError("skew_factor must be greater than 1")
+
+        parsed = parse_vql(query)
+        unsupported = [
+            clause
+            for clause in ("MAXROWS", "SKIP", "LIMIT", "OFFSET", "PAGEOFFSET")
+            if clause in parsed.clauses
+        ]
+        if unsupported:
+            raise ValueError(f"Cannot shard a query with {', '.join(unsupported)}")
+
+        self.client = client
+        self.query = query
+        self.shards = shards
+        self.shard_field = shard_field
+        self.max_workers = max_workers
+        self.page_size = page_size
+        self.skew_factor = skew_factor
+        self.max_splits = max_splits
+        self.base_query = parsed.without_tail()
+        self.bounds: Optional[Tuple[Any, Any]] = None
+        self.total: Optional[int] = None
+        self.stats: Dict[str, int] = {}
+
+    def probe(self) -> Tuple[Any, Any, int]:
+        """
+        Learns the range of the shard field and the total row count.
+
+        Returns:
+            tuple: (smallest value, largest value, total rows); the values are None
+                if the query matches no rows
+        """
+        parsed = parse_vql(self.base_query)
+        probe_query = parsed.with_select(self.shard_field)
+
+        first = self._query(f"{probe_query} ORDER BY {self.shard_field} ASC PAGESIZE 1")
+        rows = first.get("data") or []
+        total = int((first.get("responseDetails") or {}).get("total", len(rows)))
+        if not rows:
+            self.bounds, self.total = (None, None), 0
+            return None, None, 0
+
+        last = self._query(f"{probe_query} ORDER BY {self.shard_field} DESC PAGESIZE 1")
+        lower = rows[0].get(self.shard_field)
+        upper = ((last.get("data") or [{}])[0]).get(self.shard_field)
+
+        self.bounds, self.total = (lower, upper), total
+        logger.info(f"Sharding {total} rows on {self.shard_field} from {lower} to {upper}")
+        return lower, upper, total
+
+    def plan(self) -> List[Tuple[Any, Any]]:
+        """
+        Splits the probed range into shards.
+
+        Returns:
+            list: (lower, upper) bounds per shard; lower is inclusive, upper exclusive,
+                and None means unbounded
+        """
+        if self.bounds is None:
+            self.probe()
+        lower, upper = self.bounds
+        if lower is None:
+            return []
+        boundaries = split_range(lower, upper, self.shards)
+        edges = [None] + boundaries + [None]
+        return list(zip(edges[:-1], edges[1:]))
+
+    def shard_query(self, lower: Any, upper: Any) -> str:
+        """
+        Returns the VQL of one shard.
+
+        Args:
+            lower: Inclusive lower bound, or None
+            upper: Exclusive upper bound, or None
+
+        Returns:
+            str: Shard VQL
+        """
+        conditions = []
+        if lower is not None:
+            conditions.append(f"{self.shard_field} >= {vql_literal(lower)}")
+        if upper is not None:
+            conditions.append(f"{self.shard_field} < {vql_literal(upper)}")
+        query = self.base_query
+        if conditions:
+            query = parse_vql(query).and_where(" AND ".join(conditions))
+        return f"{query} PAGESIZE {self.page_size}"
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """
+        Runs the shards and yields their records as pages arrive.
+
+        Yields:
+            dict: Query records, in no particular order
+        """
+        shards = self.plan()
+        self.stats = {"shards": len(shards), "splits": 0, "pages": 0, "records": 0}
+        if not shards:
+            return
+
+        expected = max(1, math.ceil(self.total / len(shards)))
+        range_lower, range_upper = self.bounds
+        pending: List[Tuple[str, Any, Any, Any, int]] = [
+            ("shard", lower, upper, None, 0) for lower, upper in shards
+        ]
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            in_flight = {}
+
+            def submit_pending():
+                while pending and len(in_flight) < self.max_workers:
+                    task = pending.pop(0)
+                    kind, lower, upper, next_page, depth = task
+                    if kind == "shard":
+                        future = executor.submit(self._query, self.shard_query(lower, upper))
+                    else:
+                        future = executor.submit(self.client.api_call, next_page)
+                    in_flight[future] = task
+
+            submit_pending()
+            while in_flight:
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    kind, lower, upper, _, depth = in_flight.pop(future)
+                    response = future.result()
+                    self._raise_for_failure(response)
+                    details = response.get("responseDetails") or {}
+
+                    if kind == "shard" and depth < self.max_splits:
+                        shard_total = int(details.get("total", 0))
+                        if shard_total > self.skew_factor * expected:
+                            parts = math.ceil(shard_total / expected)
+                            boundaries = split_range(
+                                range_lower if lower is None else lower,
+                                range_upper if upper is None else upper,
+                                parts,
+                            )
+                            # Only boundaries inside the shard split it
+                            boundaries = [
+                                b for b in boundaries
+                                if (lower is None or b > lower) and (upper is None or b < upper)
+                            ]
+                            if boundaries:
+                                edges = [lower] + boundaries + [upper]
+                                pending[:0] = [
+                                    ("shard", a, b, None, depth + 1)
+                                    for a, b in zip(edges[:-1], edges[1:])
+                                ]
+                                self.stats["splits"] += 1
+                                self.stats["shards"] += len(edges) - 2
+                                logger.info(
+                                    f"Shard [{lower}, {upper}) holds {shard_total} rows; "
+                                    f"split into {len(edges) - 1} shards"
+                                )
+                                submit_pending()
+                                continue
+
+                    if details.get("next_page"):
+                        pending.insert(0, ("page", lower, upper, details["next_page"], depth))
+                    submit_pending()
+
+                    rows = response.get("data") or []
+                    self.stats["pages"] += 1
+                    self.stats["records"] += len(rows)
+                    yield from rows
+
+    def run(self) -> List[Dict[str, Any]]:
+        """
+        Runs the shards and returns all records.
+
+        Returns:
+            list: Query records, in no particular order
+        """
+        return list(self.iter_records())
+
+    def _query(self, vql: str) -> Dict[str, Any]:
+        url = f"api/{self.client.LatestAPIversion}/query"
+        response = self.client.api_call(
+            url,
+            method="POST",
+            data={"q": vql},
+            headers={"Content-Type": "application/x-www-form-urlencoded"},
+            idempotent=True,
+        )
+        self._raise_for_failure(response)
+        return response
+
+    @staticmethod
+    def _raise_for_failure(response: Dict[str, Any]) -> None:
+        if response.get("responseStatus") == "FAILURE":
+            from veevavault.exceptions import VaultQueryError
+
+            raise VaultQueryError(f"Query failed: {response.get('errors', response)}")
+
+
+def _split_numbers(lower: int, upper: int, parts: int) -> List[int]:
+    boundaries = {lower + (upper - lower) * i // parts for i in range(1, parts)}
+    return sorted(b for b in boundaries if lower < b <= upper)
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    if len(value) < 10 or value[4:5] != "-":
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_datetime(milliseconds: int) -> str:
+    value = datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def _split_strings(lower: str, upper: str, parts: int) -> List[str]:
+    prefix = 0
+    while prefix < min(len(lower), len(upper)) and lower[prefix] == upper[prefix]:
+        prefix += 1
+    width = max(len(lower), len(upper)) - prefix
+    digits = _DIGITS_MIXED if any(c.islower() for c in lower + upper) else _DIGITS_UPPER
+    if width == 0 or any(c not in digits for c in lower[prefix:] + upper[prefix:]):
+        return []
+
+    def to_number(value: str) -> int:
+        number = 0
+        for char in value[prefix:].ljust(width, digits[0]):
+            number = number * len(digits) + digits.index(char)
+        return number
+
+    def to_string(number: int) -> str:
+        chars = []
+        for _ in range(width):
+            number, remainder = divmod(number, len(digits))
+            chars.append(digits[remainder])
+        return lower[:prefix] + "".join(reversed(chars))
+
+    boundaries = [to_string(n) for n in _split_numbers(to_number(lower), to_number(upper), parts)]
+    return [b for b in boundaries if lower < b <= upper]
@@ -1,4 +1,3 @@
-import pandas as pd
 import requests
 from typing import Dict, List, Optional, Union, Any
 
@@ -1,6 +1,3 @@
-import pandas as pd
-
-
 class SecurityPoliciesService:
     """
     Service class for managing security policies in Veeva Vault
@@ -81,6 +78,8 @@ class SecurityPoliciesService:
         Returns:
             pandas.DataFrame: DataFrame containing all security policy information
         """
+        import pandas as pd
+
         response = self.retrieve_all_security_policies()
 
         if response["responseStatus"] == "SUCCESS":
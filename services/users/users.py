@@ -1,4 +1,3 @@
-import pandas as pd
 from typing import Dict, List, Union, Optional, Any
 
 
@@ -0,0 +1,15 @@
+"""
+Pytest configuration for the library tests.
+
+The library is imported as ``veevavault``; the benchmark helper links this
+checkout under that name when the directory is named differently.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"))
+
+from _common import ensure_importable  # noqa: E402
+
+ensure_importable()
@@ -0,0 +1,56 @@
+"""
+Tests for AuditTrailHarvester failure handling.
+"""
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+from veevavault.client import VaultClient
+from veevavault.services.logs.audit_harvester import AuditTrailHarvester
+
+START = datetime(2026, 10, 1, tzinfo=timezone.utc)
+
+
+def make_client(pages):
+    """Return a VaultClient whose api_call answers every request with the next page."""
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.api_call = mock.Mock(side_effect=lambda *args, **kwargs: pages.pop(0))
+    return client
+
+
+def test_rejected_window_is_failed_and_not_checkpointed(tmp_path):
+    client = make_client(
+        [{"responseStatus": "FAILURE", "errors": [{"type": "INVALID_DATA", "message": "Outside retention"}]}]
+    )
+    harvester = AuditTrailHarvester(
+        client, "document_audit_trail", str(tmp_path), window=timedelta(days=1), max_workers=1
+    )
+
+    summary = harvester.harvest(START, START + timedelta(days=1))
+
+    assert list(summary["failed"].values()) == ["Audit page request failed: INVALID_DATA: Outside retention"]
+    assert harvester.load_checkpoint()["windows"] == {}
+    assert not list(tmp_path.glob("*.jsonl*"))
+
+
+def test_rejected_next_page_fails_the_window(tmp_path):
+    client = make_client(
+        [
+            {
+                "responseStatus": "SUCCESS",
+                "responseDetails": {"next_page": "/api/v25.2/audittrail/document_audit_trail?offset=1"},
+                "data": [{"id": "1", "timestamp": "2026-10-01T01:00:00Z"}],
+            },
+            {"responseStatus": "FAILURE", "errors": [{"type": "OPERATION_NOT_ALLOWED", "message": "Expired"}]},
+        ]
+    )
+    harvester = AuditTrailHarvester(
+        client, "document_audit_trail", str(tmp_path), window=timedelta(days=1), max_workers=1
+    )
+
+    summary = harvester.harvest(START, START + timedelta(days=1))
+
+    assert len(summary["failed"]) == 1
+    assert harvester.load_checkpoint()["windows"] == {}
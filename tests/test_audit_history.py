@@ -0,0 +1,42 @@
+"""
+Tests for AuditHistoryFanOut failure handling.
+"""
+
+from unittest import mock
+
+from veevavault.client import VaultClient
+from veevavault.services.logs import AuditHistoryFanOut
+
+PAGES = {
+    "objects/documents/1/audittrail": {
+        "responseStatus": "FAILURE",
+        "errors": [{"type": "INVALID_DATA", "message": "Invalid document id"}],
+    },
+    "objects/documents/2/audittrail": {
+        "responseStatus": "SUCCESS",
+        "responseDetails": {"next_page": "/api/v25.2/objects/documents/2/audittrail?offset=1"},
+        "data": [{"id": "a"}],
+    },
+    "objects/documents/2/audittrail?offset=1": {
+        "responseStatus": "SUCCESS",
+        "responseDetails": {},
+        "data": [{"id": "b"}],
+    },
+}
+
+
+def answer(url, *args, **kwargs):
+    return next(page for suffix, page in PAGES.items() if url.endswith(suffix))
+
+
+def test_rejected_id_is_an_error_not_an_empty_history():
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.api_call = mock.Mock(side_effect=answer)
+
+    result = AuditHistoryFanOut(client, max_workers=2).retrieve_all([1, 2])
+
+    assert result["counts"] == {"2": 2}
+    assert [row["id"] for row in result["data"]] == ["a", "b"]
+    assert result["errors"] == {"1": "Audit page request failed: INVALID_DATA: Invalid document id"}
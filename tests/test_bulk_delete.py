@@ -0,0 +1,27 @@
+"""
+Tests for BulkDelete chunk requests.
+"""
+
+from unittest import mock
+
+import requests
+
+from veevavault.client import VaultClient
+from veevavault.client.retry import RetryPolicy
+from veevavault.services.objects.bulk_delete import BulkDelete
+
+
+def test_failed_chunk_delete_is_not_replayed():
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.retry_policy = RetryPolicy(sleep=lambda delay: None)
+    response = requests.Response()
+    response.status_code = 503
+    response._content = b"Service Unavailable"
+
+    with mock.patch("veevavault.client.vault_client.requests.request", return_value=response) as request:
+        summary = BulkDelete(client).delete_object_records("product__v", ["1", "2"])
+
+    assert request.call_count == 1
+    assert (summary["deleted"], summary["failed"]) == (0, 2)
@@ -0,0 +1,36 @@
+"""
+Tests for MDLService component record retrieval.
+"""
+
+from unittest import mock
+
+import requests
+
+from veevavault.client import VaultClient
+from veevavault.client.retry import RetryPolicy
+from veevavault.services.mdl import MDLService
+
+MDL = "RECREATE Picklist color__c (label('Color'));"
+
+
+def make_response(status_code, text):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = text.encode("utf-8")
+    return response
+
+
+def test_component_record_mdl_is_retried():
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.retry_policy = RetryPolicy(sleep=lambda delay: None)
+    responses = [make_response(503, "Service Unavailable"), make_response(200, MDL)]
+
+    with mock.patch("veevavault.client.vault_client.requests.request", side_effect=responses) as request:
+        text = MDLService(client).retrieve_component_record_mdl("Picklist.color__c")
+
+    assert text == MDL
+    assert request.call_count == 2
+    assert request.call_args.kwargs["url"].endswith("/api/mdl/components/Picklist.color__c")
+    assert request.call_args.kwargs["headers"]["Authorization"] == "session"
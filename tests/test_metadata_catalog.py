@@ -0,0 +1,32 @@
+"""
+Tests for MetadataCatalog invalidation.
+"""
+
+from unittest import mock
+
+from veevavault.client import MetadataCatalog, VaultClient
+from veevavault.services.documents.fields_service import DocumentFieldsService
+
+PROPERTIES = "api/v25.2/metadata/objects/documents/properties"
+RESPONSE = {"responseStatus": "SUCCESS", "properties": [{"name": "title__v"}]}
+
+
+def test_find_common_does_not_invalidate_docfields(tmp_path):
+    catalog = MetadataCatalog(str(tmp_path / "catalog.sqlite3"))
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    client.add_middleware(catalog, index=0)
+    no_versions = {"responseStatus": "FAILURE", "errors": []}
+
+    with mock.patch.object(VaultClient, "_send", lambda self, request: RESPONSE), mock.patch(
+        "veevavault.services.mdl.MDLService.retrieve_component_record_collection",
+        return_value=no_versions,
+    ) as versions, mock.patch.object(catalog, "invalidate", wraps=catalog.invalidate) as invalidate:
+        client.api_call(PROPERTIES)
+        DocumentFieldsService(client).retrieve_common_document_fields("1,2")
+        client.api_call(PROPERTIES)
+
+    assert invalidate.call_count == 0
+    assert versions.call_count == 1
+    assert (catalog.hits, catalog.misses) == (1, 1)
@@ -0,0 +1,104 @@
+"""
+Tests for streamed multipart bodies and staging parts.
+"""
+
+import io
+from unittest import mock
+
+import requests
+
+from veevavault.client import VaultClient
+from veevavault.services.documents.creation_service import DocumentCreationService
+from veevavault.services.file_staging.file_staging import FileStagingService
+from veevavault.utilities.multipart import MultipartEncoder, _FileSlice, send_multipart
+
+
+def prepare(body, headers=None):
+    return requests.Request("POST", "https://example.com/upload", data=body, headers=headers).prepare()
+
+
+def make_client(sent):
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+
+    def send(self, request):
+        sent.append(
+            requests.Request(
+                request.method, request.url, headers=request.headers, data=request.data
+            ).prepare()
+        )
+        return {"responseStatus": "SUCCESS"}
+
+    return client, mock.patch.object(VaultClient, "_send", send)
+
+
+def test_encoder_is_sent_with_content_length():
+    body = MultipartEncoder({"name__v": "Protocol", "file": ("protocol.pdf", io.BytesIO(b"x" * 5000))})
+
+    prepared = prepare(body, {"Content-Type": body.content_type})
+
+    assert prepared.headers["Content-Length"] == str(len(body))
+    assert "Transfer-Encoding" not in prepared.headers
+    assert len(prepared.body.read()) == len(body)
+
+
+def test_file_slice_is_sent_with_content_length():
+    stream = io.BytesIO(b"a" * 100 + b"b" * 50)
+    stream.seek(100)
+
+    prepared = prepare(_FileSlice(stream, 30))
+
+    assert prepared.headers["Content-Length"] == "30"
+    assert "Transfer-Encoding" not in prepared.headers
+    assert prepared.body.read() == b"b" * 30
+
+
+def test_send_multipart_sets_content_length():
+    sent = []
+    client, patch = make_client(sent)
+    with patch:
+        send_multipart(client, "api/v25.2/objects/documents", {"file": ("a.txt", b"hello")})
+
+    assert sent[0].headers["Content-Type"].startswith("multipart/form-data; boundary=")
+    assert int(sent[0].headers["Content-Length"]) > len(b"hello")
+    assert "Transfer-Encoding" not in sent[0].headers
+
+
+def test_staging_part_upload_sets_content_length():
+    sent = []
+    client, patch = make_client(sent)
+    with patch:
+        FileStagingService(client).upload_to_session("s1", _FileSlice(io.BytesIO(b"z" * 64), 64), 1)
+
+    assert sent[0].headers["Content-Length"] == "64"
+    assert "Transfer-Encoding" not in sent[0].headers
+
+
+def test_large_version_is_staged_in_its_own_folder_and_removed(tmp_path):
+    path = tmp_path / "protocol.pdf"
+    path.write_bytes(b"%PDF" * 1000)
+    client = VaultClient()
+    client.vaultURL = "https://example.veevavault.com"
+    client.sessionId = "session"
+    calls = []
+
+    def send(self, request):
+        calls.append((request.method, request.url.split("/api/v25.2/", 1)[-1], request.data, request.params))
+        return {"responseStatus": "SUCCESS", "data": {"id": "session-1"}}
+
+    service = DocumentCreationService(client)
+    with mock.patch.object(VaultClient, "_send", send), mock.patch(
+        "veevavault.services.documents.creation_service.STAGING_THRESHOLD", 0
+    ):
+        service.create_single_document_version(1, file_path=str(path))
+        service.create_single_document_version(2, file_path=str(path))
+
+    folders = [data["path"] for method, url, data, _ in calls if url == "services/file_staging/items" and method == "POST"]
+    deleted = [(url, params) for method, url, _, params in calls if method == "DELETE"]
+    assert len(set(folders)) == 2
+    assert deleted == [(f"services/file_staging/items/{folder.lstrip('/')}", {"recursive": "true"}) for folder in folders]
+    # Each staged copy is removed after the request that used it
+    creates = [i for i, (method, url, _, _) in enumerate(calls) if url.endswith("/versions")]
+    removes = [i for i, (method, _, _, _) in enumerate(calls) if method == "DELETE"]
+    assert all(create < remove for create, remove in zip(creates, removes, strict=True))
@@ -0,0 +1,66 @@
+"""
+Tests for configuration snapshots of some component types.
+"""
+
+from unittest import mock
+
+from veevavault.services.configuration_migration import SnapshotStore, diff_snapshots, take_snapshot
+
+
+class FakeVault:
+    """Answers the component query and MDL requests of take_snapshot."""
+
+    LatestAPIversion = "v25.2"
+
+    def __init__(self, vault_id, checksums):
+        self.vaultId = vault_id
+        self.checksums = checksums
+        self.fetched = []
+
+    def api_call(self, url, method="GET", data=None, raw_response=False, **kwargs):
+        if raw_response:
+            key = url.rsplit("/", 1)[1]
+            self.fetched.append(key)
+            return mock.Mock(text=f"RECREATE {key} ({self.checksums[key]});")
+        rows = [
+            {"component_type__v": key.split(".")[0], "component_name__v": key.split(".")[1], "checksum__v": checksum}
+            for key, checksum in self.checksums.items()
+            if "CONTAINS" not in data["q"] or f"'{key.split('.')[0]}'" in data["q"]
+        ]
+        return {"responseStatus": "SUCCESS", "data": rows}
+
+
+def test_filtered_snapshot_keeps_other_types_for_the_next_snapshot(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    vault = FakeVault("prod", {"Picklist.a__c": "1", "Picklist.b__c": "1", "Doctype.x__c": "1"})
+    take_snapshot(vault, store)
+
+    vault.checksums["Picklist.a__c"] = "2"
+    vault.fetched.clear()
+    filtered = take_snapshot(vault, store, component_types=["Picklist"])
+
+    assert vault.fetched == ["Picklist.a__c"]
+    assert set(filtered["components"]) == {"Picklist.a__c", "Picklist.b__c", "Doctype.x__c"}
+    assert filtered["component_types"] is None
+    assert filtered["stats"]["carried"] == 1
+
+    vault.fetched.clear()
+    full = take_snapshot(vault, store)
+
+    assert vault.fetched == []
+    assert full["stats"]["reused"] == 3
+
+
+def test_diff_compares_only_types_both_snapshots_cover(tmp_path):
+    store = SnapshotStore(str(tmp_path))
+    prod = FakeVault("prod", {"Picklist.a__c": "1", "Doctype.x__c": "1"})
+    sandbox = FakeVault("sandbox", {"Picklist.a__c": "2", "Doctype.x__c": "1"})
+    take_snapshot(prod, store)
+    partial = take_snapshot(sandbox, store, component_types=["Picklist"])
+
+    result = diff_snapshots(store.load_manifest("prod"), store.load_manifest("sandbox"))
+
+    assert partial["component_types"] == ["Picklist"]
+    assert result["component_types"] == ["Picklist"]
+    assert result["changed"] == ["Picklist.a__c"]
+    assert result["added"] == result["removed"] == []
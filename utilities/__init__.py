@@ -1,4 +1,8 @@
 try:
     from veevavault.utilities.async_utils import *
+    from veevavault.utilities.lazy_service import LazyService
+    from veevavault.utilities.rate_limiter import RateLimiter
 except:
-    from utilities.async_utils import *
\ No newline at end of file
+    from utilities.async_utils import *
+    from utilities.lazy_service import LazyService
+    from utilities.rate_limiter import RateLimiter
@@ -0,0 +1,36 @@
+class LazyService:
+    """
+    Descriptor that constructs a specialized service on first access.
+
+    Aggregate services such as DocumentService expose many specialized
+    services as attributes. Declaring them with LazyService means constructing
+    the aggregate only stores the client; each specialized service is built
+    from that shared client the first time it is used and then cached in the
+    instance ``__dict__``, so later lookups bypass the descriptor entirely.
+
+    Example:
+        class DocumentService:
+            fields = LazyService(DocumentFieldsService)
+
+            def __init__(self, client):
+                self.client = client
+    """
+
+    def __init__(self, service_class):
+        """
+        Args:
+            service_class: Class to instantiate with the owner's ``client``
+        """
+        self.service_class = service_class
+        self.name = None
+        self.__doc__ = service_class.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        service = self.service_class(instance.client)
+        instance.__dict__[self.name] = service
+        return service
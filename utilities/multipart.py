@@ -0,0 +1,442 @@
+"""
+Streaming multipart/form-data bodies and large-file staging uploads.
+
+requests builds a multipart body from files= in memory before sending it,
+so uploading a multi-GB file needs as much memory as the file. A
+MultipartEncoder is a file-like body with a known length: it reads each
+file in chunks as the connection sends it, so memory stays constant, and
+reports progress as it goes. Pass it as data= with its content_type:
+
+    body = MultipartEncoder({"name__v": "Protocol", "file": ("protocol.pdf", f)})
+    client.api_call(url, method="POST", data=body,
+                    headers={"Content-Type": body.content_type})
+
+Files above STAGING_THRESHOLD can instead be uploaded to file staging with
+upload_to_staging, which sends them in parts through a resumable upload
+session; endpoints that accept a staging path then reference the file.
+staged_upload does the same for a single request and removes the staged
+file afterwards.
+"""
+
+import io
+import logging
+import mimetypes
+import os
+import time
+import uuid
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+ProgressCallback = Callable[[int, int], None]
+
+CHUNK_SIZE = 1024 * 1024
+# Files larger than this are uploaded through file staging where supported
+STAGING_THRESHOLD = 1024 * 1024 * 1024
+# Resumable upload parts must be 5 MB to 50 MB, all the same size except the last
+STAGING_PART_SIZE = 50 * 1024 * 1024
+
+FieldValue = Union[str, int, float, bytes, Tuple[Any, ...]]
+
+
+class MultipartEncoder(io.RawIOBase):
+    """
+    Streams a multipart/form-data body.
+
+    Fields are given as a dict or a list of (name, value) pairs. A value is
+    either a plain form value (str, number) or a file tuple
+    (filename, content[, content_type]) where content is bytes or str, an
+    open binary file or a pathlib.Path. A filename of None sends the content as a
+    plain form value, as with requests' files=.
+
+    The total length is computed up front (files are measured by seeking),
+    so requests sends a Content-Length header instead of chunked encoding.
+    File contents are read only while the body is read.
+    """
+
+    def __init__(
+        self,
+        fields: Union[Dict[str, FieldValue], Iterable[Tuple[str, FieldValue]]],
+        boundary: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ):
+        """
+        Args:
+            fields (dict or iterable): Form fields and files, in body order
+            boundary (str, optional): Multipart boundary. Defaults to a random one.
+            progress (callable, optional): Called with (bytes_read, total_bytes) as the
+                body is read
+        """
+        super().__init__()
+        self.boundary = boundary or uuid.uuid4().hex
+        self.progress = progress
+        self._parts: List[Union[bytes, Tuple[BinaryIO, int]]] = []
+        self._opened: List[BinaryIO] = []
+
+        items = fields.items() if isinstance(fields, dict) else fields
+        for name, value in items:
+            self._add(name, value)
+        self._parts.append(f"--{self.boundary}--\r\n".encode("utf-8"))
+
+        self.len = sum(len(part) if isinstance(part, bytes) else part[1] for part in self._parts)
+        self._index = 0
+        self._buffer = b""
+        self._read = 0
+
+    @property
+    def content_type(self) -> str:
+        """Content-Type header value for the body."""
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self.len
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        # requests measures the body as len - tell(); RawIOBase.tell() would raise
+        # and make it fall back to chunked encoding
+        return self._read
+
+    def read(self, size: int = -1) -> bytes:
+        """Returns up to size bytes of the body (all remaining bytes if size < 0)."""
+        if size is None or size < 0:
+            chunks = []
+            while True:
+                chunk = self.read(CHUNK_SIZE)
+                if not chunk:
+                    return b"".join(chunks)
+                chunks.append(chunk)
+
+        while len(self._buffer) < size and self._index < len(self._parts):
+            part = self._parts[self._index]
+            if isinstance(part, bytes):
+                self._buffer += part
+                self._index += 1
+                continue
+            stream, _ = part
+            data = stream.read(max(size - len(self._buffer), CHUNK_SIZE))
+            if data:
+                self._buffer += data
+            else:
+                self._index += 1
+
+        data, self._buffer = self._buffer[:size], self._buffer[size:]
+        if data:
+            self._read += len(data)
+            if self.progress:
+                self.progress(self._read, self.len)
+        return data
+
+    def readinto(self, buffer) -> int:
+        data = self.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def close(self) -> None:
+        """Closes the files this encoder opened from paths."""
+        for stream in self._opened:
+            stream.close()
+        self._opened = []
+        super().close()
+
+    def _add(self, name: str, value: FieldValue) -> None:
+        if not isinstance(value, tuple):
+            self._add_bytes(name, None, _as_bytes(value), None)
+            return
+
+        filename, content = value[0], value[1]
+        content_type = value[2] if len(value) > 2 else None
+        if filename is None:
+            if hasattr(content, "read"):
+                content = content.read()
+            self._add_bytes(name, None, _as_bytes(content), content_type)
+            return
+
+        if content_type is None:
+            content_type = mimetypes.guess_type(str(filename))[0] or "application/octet-stream"
+        if isinstance(content, os.PathLike):
+            content = open(content, "rb")
+            self._opened.append(content)
+        if isinstance(content, str):
+            content = content.encode("utf-8")
+        if isinstance(content, (bytes, bytearray)):
+            self._add_bytes(name, filename, bytes(content), content_type)
+            return
+
+        self._parts.append(_part_header(self.boundary, name, filename, content_type))
+        self._parts.append((content, _remaining_length(content)))
+        self._parts.append(b"\r\n")
+
+    def _add_bytes(
+        self, name: str, filename: Optional[str], data: bytes, content_type: Optional[str]
+    ) -> None:
+        self._parts.append(
+            _part_header(self.boundary, name, filename, content_type) + data + b"\r\n"
+        )
+
+
+def send_multipart(
+    client,
+    url: str,
+    fields: Union[Dict[str, FieldValue], Iterable[Tuple[str, FieldValue]]],
+    method: str = "POST",
+    progress: Optional[ProgressCallback] = None,
+    headers: Optional[Dict[str, str]] = None,
+    **kwargs,
+):
+    """
+    Sends a streamed multipart/form-data request through client.api_call.
+
+    Args:
+        client: An initialized VaultClient instance for API communication
+        url (str): Endpoint
+        fields (dict or iterable): Form fields and files, see MultipartEncoder
+        method (str, optional): HTTP method. Defaults to POST.
+        progress (callable, optional): Called with (bytes_sent, total_bytes)
+        headers (dict, optional): Further headers
+        **kwargs: Further api_call arguments, e.g. params
+
+    Returns:
+        The api_call result
+    """
+    body = MultipartEncoder(fields, progress=progress)
+    try:
+        return client.api_call(
+            url,
+            method=method,
+            data=body,
+            headers={
+                **(headers or {}),
+                "Content-Type": body.content_type,
+                "Content-Length": str(len(body)),
+            },
+            **kwargs,
+        )
+    finally:
+        body.close()
+
+
+def file_size(file: Union[str, bytes, BinaryIO]) -> int:
+    """
+    Returns the size in bytes of a file path, bytes or the rest of an open file.
+
+    Args:
+        file: File path, bytes or seekable binary file
+
+    Returns:
+        int: Size in bytes
+    """
+    if isinstance(file, (bytes, bytearray)):
+        return len(file)
+    if isinstance(file, (str, os.PathLike)):
+        return os.path.getsize(file)
+    return _remaining_length(file)
+
+
+def upload_to_staging(
+    client,
+    file_path: str,
+    staging_path: Optional[str] = None,
+    part_size: int = STAGING_PART_SIZE,
+    progress: Optional[ProgressCallback] = None,
+    part_attempts: int = 3,
+    timeout: float = 3600,
+) -> str:
+    """
+    Uploads a file of any size to file staging through a resumable upload session.
+
+    Parts are read from disk one at a time and streamed, and a failed part is
+    sent again (up to part_attempts times) rather than restarting the upload.
+    After the last part the session is committed and the commit job awaited.
+
+    Args:
+        client: An initialized VaultClient instance for API communication
+        file_path (str): Local file to upload
+        staging_path (str, optional): Destination in file staging. Defaults to
+            /<random folder>/<file name> in the user's staging directory, so
+            concurrent uploads of files with the same name do not collide.
+        part_size (int, optional): Bytes per part, 5 MB to 50 MB. Defaults to 50 MB.
+        progress (callable, optional): Called with (bytes_uploaded, total_bytes)
+        part_attempts (int, optional): Attempts per part. Defaults to 3.
+        timeout (float, optional): Maximum seconds to wait for the commit job.
+
+    Returns:
+        str: The staging path of the uploaded file
+
+    Raises:
+        ValueError: If part_size is outside 5 MB to 50 MB
+        VaultAPIError: If the session cannot be created, a part keeps failing or
+            the commit fails
+    """
+    from veevavault.exceptions import VaultAPIError
+    from veevavault.services.file_staging.file_staging import FileStagingService
+    from veevavault.services.jobs import JobsService
+
+    if not 5 * 1024 * 1024 <= part_size <= STAGING_PART_SIZE:
+        raise ValueError("part_size must be between 5 MB and 50 MB")
+
+    staging = FileStagingService(client)
+    size = os.path.getsize(file_path)
+    if staging_path is None:
+        folder = f"/{uuid.uuid4().hex}"
+        response = staging.create_folder_or_file(folder, "folder")
+        if response.get("responseStatus") == "FAILURE":
+            raise VaultAPIError(f"Could not create staging folder: {response.get('errors', response)}")
+        staging_path = f"{folder}/{os.path.basename(file_path)}"
+
+    session = staging.create_resumable_upload_session(staging_path, size, overwrite=True)
+    session_id = (session.get("data") or session).get("id")
+    if session.get("responseStatus") == "FAILURE" or not session_id:
+        raise VaultAPIError(f"Could not create upload session: {session.get('errors', session)}")
+
+    uploaded = 0
+    try:
+        with open(file_path, "rb") as f:
+            for part_number, offset in enumerate(range(0, max(size, 1), part_size), start=1):
+                length = min(part_size, size - offset)
+                for attempt in range(1, part_attempts + 1):
+                    f.seek(offset)
+                    try:
+                        response = staging.upload_to_session(
+                            session_id, _FileSlice(f, length), part_number
+                        )
+                        if response.get("responseStatus") == "FAILURE":
+                            raise VaultAPIError(str(response.get("errors", response)))
+                        break
+                    except Exception as e:
+                        if attempt == part_attempts:
+                            raise VaultAPIError(
+                                f"Upload of part {part_number} of {file_path} failed: {e}"
+                            ) from e
+                        logger.warning(f"Part {part_number} failed ({e}); sending it again")
+                uploaded += length
+                if progress:
+                    progress(uploaded, size)
+
+        commit = staging.commit_upload_session(session_id)
+    except BaseException:
+        try:
+            staging.abort_upload_session(session_id)
+        except Exception as e:
+            logger.debug(f"Could not abort upload session {session_id}: {e}")
+        raise
+
+    job_id = (commit.get("data") or {}).get("job_id") or commit.get("job_id")
+    if commit.get("responseStatus") == "FAILURE":
+        raise VaultAPIError(f"Commit of upload session failed: {commit.get('errors', commit)}")
+    if job_id:
+        jobs = JobsService(client)
+        deadline = time.monotonic() + timeout
+        while True:
+            time.sleep(10)
+            state = jobs.retrieve_job_status(job_id).get("data", {}).get("status")
+            if state == "SUCCESS":
+                break
+            if state in ("ERRORS_ENCOUNTERED", "CANCELLED") or time.monotonic() > deadline:
+                raise VaultAPIError(f"Commit job {job_id} for {staging_path} ended with {state}")
+
+    logger.info(f"Uploaded {file_path} ({size} bytes) to file staging at {staging_path}")
+    return staging_path
+
+
+@contextmanager
+def staged_upload(
+    client, file_path: str, progress: Optional[ProgressCallback] = None
+) -> Iterator[str]:
+    """
+    Uploads a file to its own folder in file staging for the duration of a with block.
+
+    The folder is deleted when the block exits, whether or not the request
+    that used the file succeeded:
+
+        with staged_upload(client, path) as staging_path:
+            send_multipart(client, url, {"file": staging_path, ...})
+
+    Args:
+        client: An initialized VaultClient instance for API communication
+        file_path (str): Local file to upload
+        progress (callable, optional): Called with (bytes_uploaded, total_bytes)
+
+    Yields:
+        str: The staging path of the uploaded file
+    """
+    from veevavault.services.file_staging.file_staging import FileStagingService
+
+    staging_path = upload_to_staging(client, file_path, progress=progress)
+    try:
+        yield staging_path
+    finally:
+        folder = staging_path.rsplit("/", 1)[0].lstrip("/")
+        try:
+            FileStagingService(client).delete_file_or_folder(folder, recursive=True)
+        except Exception as e:
+            logger.warning(f"Could not delete staging folder {folder}: {e}")
+
+
+class _FileSlice(io.RawIOBase):
+    """Reads at most length bytes from the current position of a file."""
+
+    def __init__(self, stream: BinaryIO, length: int):
+        super().__init__()
+        self.stream = stream
+        self.len = length
+        self._remaining = length
+
+    def __len__(self) -> int:
+        return self.len
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self.len - self._remaining
+
+    def read(self, size: int = -1) -> bytes:
+        if size is None or size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self.stream.read(size)
+        self._remaining -= len(data)
+        return data
+
+
+def _part_header(
+    boundary: str, name: str, filename: Optional[str], content_type: Optional[str]
+) -> bytes:
+    disposition = f'form-data; name="{_quote(name)}"'
+    if filename is not None:
+        disposition += f'; filename="{_quote(os.path.basename(str(filename)))}"'
+    header = f"--{boundary}\r\nContent-Disposition: {disposition}\r\n"
+    if content_type:
+        header += f"Content-Type: {content_type}\r\n"
+    return (header + "\r\n").encode("utf-8")
+
+
+def _quote(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', "%22").replace("\r", "%0D").replace("\n", "%0A")
+
+
+def _as_bytes(value: Any) -> bytes:
+    if isinstance(value, (bytes, bytearray)):
+        return bytes(value)
+    return str(value).encode("utf-8")
+
+
+def _remaining_length(stream: BinaryIO) -> int:
+    if hasattr(stream, "fileno"):
+        try:
+            return os.fstat(stream.fileno()).st_size - stream.tell()
+        except (OSError, io.UnsupportedOperation):
+            pass
+    position = stream.tell()
+    end = stream.seek(0, os.SEEK_END)
+    stream.seek(position)
+    return end - position
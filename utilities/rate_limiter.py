@@ -0,0 +1,55 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket limiting how many API calls start per period.
+
+    Assign one to VaultClient.rate_limiter to share it across every service and
+    worker thread using that client. The bucket starts full, so up to max_calls
+    requests may burst before calls are spaced out evenly over the period.
+    """
+
+    def __init__(self, max_calls: int, period: float = 1.0):
+        """
+        Initialize the limiter.
+
+        Args:
+            max_calls (int): Maximum number of calls per period
+            period (float, optional): Period length in seconds. Defaults to 1.0.
+
+        Raises:
+            ValueError: If max_calls or period is not positive
+        """
+        if max_calls < 1 or period <= 0:
+            raise ValueError("max_calls and period must be positive")
+
+        self.max_calls = max_calls
+        self.period = period
+        self._rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Blocks until a call may start.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_calls, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return waited
+                delay = (1 - self._tokens) / self._rate
+            time.sleep(delay)
+            waited += delay
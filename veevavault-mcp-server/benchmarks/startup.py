@@ -0,0 +1,106 @@
+"""
+Startup-latency benchmark for the MCP server.
+
+Each measurement runs in a fresh interpreter and reports:
+- import: time to import ``veevavault_mcp.server``
+- initialize: ``VeevaVaultMCPServer.initialize()`` (no network access)
+- list_tools (first/cached): building and re-serving the MCP tool descriptors
+- first call: importing and instantiating one tool on first use
+- eager specs: importing and instantiating every tool, as registration did
+  before tools were loaded from the manifest
+
+Usage:
+    python benchmarks/startup.py
+    python benchmarks/startup.py --runs 10
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+PROBE = r"""
+import asyncio, json, os, sys, time
+
+os.environ.setdefault("VAULT_URL", "https://benchmark.veevavault.com")
+os.environ.setdefault("VAULT_USERNAME", "benchmark@example.com")
+os.environ.setdefault("VAULT_PASSWORD", "benchmark")
+
+start = time.perf_counter()
+from veevavault_mcp.server import VeevaVaultMCPServer
+from veevavault_mcp.tools.registry import build_tool_specs
+timings = {"import": time.perf_counter() - start}
+
+
+async def probe():
+    server = VeevaVaultMCPServer()
+
+    start = time.perf_counter()
+    await server.initialize()
+    timings["initialize"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    server.get_tool_descriptors()
+    timings["list_tools (first)"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    server.get_tool_descriptors()
+    timings["list_tools (cached)"] = time.perf_counter() - start
+
+    timings["tool modules loaded"] = sum(
+        1 for name in sys.modules
+        if name.startswith("veevavault_mcp.tools.")
+        and name.rsplit(".", 1)[1] not in ("base", "registry")
+    )
+
+    start = time.perf_counter()
+    server.get_tool("vault_documents_get")
+    timings["first call"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    build_tool_specs()
+    timings["eager specs"] = time.perf_counter() - start
+
+    await server.cleanup()
+
+
+asyncio.run(probe())
+print(json.dumps(timings))
+"""
+
+
+def run_probe():
+    """Run the probe in a fresh interpreter and return its timings."""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE], capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Startup probe failed:\n{result.stderr}")
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    # Warm the bytecode cache
+    run_probe()
+    runs = [run_probe() for _ in range(args.runs)]
+
+    print(f"{'phase':<22} {'median':>12} {'min':>12}")
+    for phase in runs[0]:
+        values = [run[phase] for run in runs]
+        if phase == "tool modules loaded":
+            print(f"{phase:<22} {statistics.median(values):>12.0f}")
+            continue
+        print(
+            f"{phase:<22} {statistics.median(values) * 1000:>9.2f} ms"
+            f" {min(values) * 1000:>9.2f} ms"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
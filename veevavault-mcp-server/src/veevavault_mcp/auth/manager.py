@@ -2,6 +2,7 @@
 Base authentication manager for VeevaVault MCP Server.
 """
 
+import asyncio
 from abc import ABC, abstractmethod
 from typing import Optional
 import structlog
@@ -29,6 +30,9 @@ class AuthenticationManager(ABC):
         """
         self.config = config
         self._current_session: Optional[VaultSession] = None
+        # Serializes session creation so concurrent callers (e.g. startup
+        # warm-up and the first tool call) share one authentication
+        self._session_lock = asyncio.Lock()
         self.logger = logger.bind(auth_mode=config.auth_mode.value)
 
     @abstractmethod
@@ -67,6 +71,11 @@ class AuthenticationManager(ABC):
         Raises:
             AuthenticationError: If authentication fails
         """
+        async with self._session_lock:
+            return await self._get_or_create_session()
+
+    async def _get_or_create_session(self) -> VaultSession:
+        """Return a valid session; callers must hold ``_session_lock``."""
         # No session exists - create new one
         if self._current_session is None:
             self.logger.info("no_session_exists", action="creating_new")
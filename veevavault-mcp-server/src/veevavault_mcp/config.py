@@ -1,5 +1,7 @@
 """Configuration management for VeevaVault MCP Server."""
 
+import os
+import tempfile
 from enum import Enum
 from typing import Optional
 
@@ -108,6 +110,70 @@ class Config(BaseSettings):
     rate_limit_calls: int = Field(
         default=100, description="Max calls per minute per user"
     )
+    api_rate_limit_calls: int = Field(
+        default=2000,
+        ge=1,
+        description="Max outbound Vault API calls per api_rate_limit_period "
+        "(Vault's default burst limit is 2000 calls per 5 minutes)",
+    )
+    api_rate_limit_period: int = Field(
+        default=300, ge=1, description="Outbound rate limit period in seconds"
+    )
+
+    # ==========================================
+    # Response Handling
+    # ==========================================
+
+    json_backend: str = Field(
+        default="auto",
+        description="JSON decoder for Vault responses: 'auto', 'orjson', 'ujson' or 'json'",
+    )
+
+    # ==========================================
+    # Downloads
+    # ==========================================
+
+    download_dir: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "veevavault-mcp", "downloads"),
+        description="Directory for downloaded files; a tool's save_path must lie inside it",
+    )
+    download_chunk_size: int = Field(
+        default=1024 * 1024,
+        ge=4096,
+        description="Bytes read and written per step of a streamed download",
+    )
+    download_cache_enabled: bool = Field(
+        default=True,
+        description="Keep downloaded document version files in an on-disk cache",
+    )
+    download_cache_dir: str = Field(
+        default=os.path.join(os.path.expanduser("~"), ".cache", "veevavault-mcp", "downloads"),
+        description="Directory of the download cache",
+    )
+    download_cache_max_bytes: int = Field(
+        default=5 * 1024**3,
+        ge=1,
+        description="Maximum total size of the download cache in bytes",
+    )
+
+    # ==========================================
+    # Startup Warm-up
+    # ==========================================
+
+    warmup_enabled: bool = Field(
+        default=False,
+        description="Open connections, authenticate and prefetch metadata at startup",
+    )
+    warmup_prefetch: str = Field(
+        default="objects,document_types",
+        description="Comma-separated metadata to prefetch: objects, document_types",
+    )
+    warmup_picklists: str = Field(
+        default="", description="Comma-separated picklist names to prefetch"
+    )
+    warmup_timeout: int = Field(
+        default=60, description="Maximum seconds to spend warming up"
+    )
 
     # ==========================================
     # Kubernetes Configuration (Optional)
@@ -122,6 +188,11 @@ class Config(BaseSettings):
     pod_namespace: Optional[str] = Field(
         default=None, description="Kubernetes namespace"
     )
+    readiness_file: str = Field(
+        default="/tmp/veevavault-mcp-ready",
+        description="File written with the readiness report once the server is ready "
+        "(kubernetes_mode only; use with an exec readiness probe)",
+    )
 
     @field_validator("url")
     @classmethod
@@ -149,6 +220,18 @@ class Config(BaseSettings):
             raise ValueError(f"Invalid cache_backend: {v}. Must be 'memory' or 'valkey'")
         return v
 
+    @field_validator("json_backend")
+    @classmethod
+    def validate_json_backend(cls, v: str) -> str:
+        """Validate JSON backend value."""
+        v = v.lower()
+        valid_backends = ("auto", "orjson", "ujson", "json")
+        if v not in valid_backends:
+            raise ValueError(
+                f"Invalid json_backend: {v}. Must be one of {valid_backends}"
+            )
+        return v
+
     @field_validator("log_level")
     @classmethod
     def validate_log_level(cls, v: str) -> str:
@@ -161,6 +244,19 @@ class Config(BaseSettings):
             )
         return v
 
+    @field_validator("warmup_prefetch")
+    @classmethod
+    def validate_warmup_prefetch(cls, v: str) -> str:
+        """Validate warm-up prefetch targets."""
+        valid_targets = ("objects", "document_types")
+        for target in (t.strip() for t in v.split(",") if t.strip()):
+            if target not in valid_targets:
+                raise ValueError(
+                    f"Invalid warmup_prefetch target: {target}. "
+                    f"Must be one of {valid_targets}"
+                )
+        return v
+
     @field_validator("log_format")
     @classmethod
     def validate_log_format(cls, v: str) -> str:
@@ -200,6 +296,16 @@ class Config(BaseSettings):
                     "valkey_url is required when cache_backend='valkey'"
                 )
 
+    @property
+    def warmup_prefetch_targets(self) -> list[str]:
+        """Metadata prefetch targets as a list."""
+        return [t.strip() for t in self.warmup_prefetch.split(",") if t.strip()]
+
+    @property
+    def warmup_picklist_names(self) -> list[str]:
+        """Picklist names to prefetch as a list."""
+        return [p.strip() for p in self.warmup_picklists.split(",") if p.strip()]
+
     def validate_all(self) -> None:
         """Run all validation checks."""
         self.validate_auth_config()
@@ -218,5 +324,6 @@ class Config(BaseSettings):
             "log_format": self.log_format,
             "enable_metrics": self.enable_metrics,
             "metrics_port": self.metrics_port,
+            "warmup_enabled": self.warmup_enabled,
             "kubernetes_mode": self.kubernetes_mode,
         }
@@ -13,89 +13,21 @@ from mcp.types import Tool, TextContent
 from .config import Config, AuthMode
 from .auth.manager import AuthenticationManager
 from .auth.username_password import UsernamePasswordAuthManager
+from .utils.cache import MemoryCache, create_cache
+from .utils.content_cache import create_content_cache
 from .utils.http import VaultHTTPClient
+from .utils.jsonlib import set_json_backend
+from .utils.rate_limit import create_rate_limiter
 from .tools.base import BaseTool, ToolResult
-
-# Import all tool classes
-from .tools.users import (
-    ListUsersTool,
-    GetUserTool,
-    CreateUserTool,
-    UpdateUserTool,
-)
-from .tools.groups import (
-    ListGroupsTool,
-    GetGroupTool,
-    CreateGroupTool,
-    AddGroupMembersTool,
-    RemoveGroupMembersTool,
-)
-from .tools.metadata import (
-    GetMetadataTool,
-    ListObjectTypesTool,
-    GetPicklistValuesTool,
-)
-from .tools.audit import (
-    QueryAuditTrailTool,
-    GetDocumentAuditTool,
-    GetUserActivityTool,
-)
-from .tools.documents import (
-    DocumentsQueryTool,
-    DocumentsGetTool,
-    DocumentsCreateTool,
-    DocumentsUpdateTool,
-    DocumentsDeleteTool,
-    DocumentsLockTool,
-    DocumentsUnlockTool,
-    DocumentsDownloadFileTool,
-    DocumentsDownloadVersionFileTool,
-    DocumentsBatchCreateTool,
-    DocumentsBatchUpdateTool,
-    DocumentsGetActionsTool,
-    DocumentsExecuteActionTool,
-    DocumentsUploadFileTool,
-    DocumentsCreateVersionTool,
-    DocumentsAttachmentsListTool,
-    DocumentsAttachmentsUploadTool,
-    DocumentsAttachmentsDownloadTool,
-    DocumentsAttachmentsDeleteTool,
-    DocumentsRenditionsListTool,
-    DocumentsRenditionsGenerateTool,
-    DocumentsRenditionsDownloadTool,
-    DocumentsRenditionsDeleteTool,
-)
-from .tools.objects import (
-    ObjectsQueryTool,
-    ObjectsGetTool,
-    ObjectsCreateTool,
-    ObjectsUpdateTool,
-    ObjectsBatchCreateTool,
-    ObjectsBatchUpdateTool,
-    ObjectsGetActionsTool,
-    ObjectsExecuteActionTool,
-)
-from .tools.vql import (
-    VQLExecuteTool,
-    VQLValidateTool,
-)
-from .tools.file_staging import (
-    FileStagingUploadTool,
-    FileStagingListTool,
-    FileStagingDownloadTool,
-    FileStagingDeleteTool,
-)
-from .tools.workflows import (
-    WorkflowsListTool,
-    WorkflowsGetTool,
-    DocumentsGetWorkflowDetailsTool,
-)
-from .tools.tasks import (
-    TasksListTool,
-    TasksGetTool,
-    TasksExecuteActionTool,
+from .tools.registry import ToolSpec, load_tool_specs
+from .warmup import (
+    ReadinessReport,
+    ServerWarmup,
+    remove_readiness_file,
+    write_readiness_file,
 )
 
+
 logger = structlog.get_logger(__name__)
 
 
@@ -128,9 +60,18 @@ class VeevaVaultMCPServer:
         # Core components
         self.auth_manager: Optional[AuthenticationManager] = None
         self.http_client: Optional[VaultHTTPClient] = None
+        self.cache: Optional[MemoryCache] = None
+
+        # Startup warm-up and readiness
+        self.readiness: Optional[ReadinessReport] = None
+        self._warmup_task: Optional[asyncio.Task] = None
+        self._ready_event = asyncio.Event()
 
-        # Tool registry
+        # Tool registry: specs for every advertised tool, instances created
+        # on first call, MCP descriptors built once and cached
+        self.tool_specs: dict[str, ToolSpec] = {}
         self.tools: dict[str, BaseTool] = {}
+        self._tool_descriptors: Optional[list[Tool]] = None
 
         # Logger
         self.logger = logger.bind(
@@ -149,11 +90,18 @@ class VeevaVaultMCPServer:
         else:
             raise NotImplementedError("OAuth2 authentication not yet implemented")
 
-        # Initialize HTTP client
+        # Initialize response cache and HTTP client
+        set_json_backend(self.config.json_backend)
+        self.cache = create_cache(self.config)
         self.http_client = VaultHTTPClient(
             base_url=self.config.url,
             timeout=30,
             max_retries=3,
+            cache=self.cache,
+            rate_limiter=create_rate_limiter(self.config),
+            content_cache=create_content_cache(self.config),
+            download_dir=self.config.download_dir,
+            download_chunk_size=self.config.download_chunk_size,
         )
         await self.http_client.__aenter__()
 
@@ -163,101 +111,102 @@ class VeevaVaultMCPServer:
         # Set up MCP handlers
         self._setup_handlers()
 
-        self.logger.info("server_initialized", tool_count=len(self.tools))
+        self.logger.info("server_initialized", tool_count=len(self.tool_specs))
+
+        # Warm up in the background so the server can answer initialize and
+        # list_tools while connections and the session are being established
+        if self.config.warmup_enabled:
+            self._warmup_task = asyncio.create_task(self._warm_up())
+        else:
+            report = ReadinessReport()
+            report.ready = True
+            report.completed_at = report.started_at
+            self._set_readiness(report)
+
+    async def _warm_up(self) -> None:
+        """Run the startup warm-up and publish its readiness report."""
+        warmup = ServerWarmup(self.config, self.auth_manager, self.http_client)
+        self._set_readiness(await warmup.run())
+
+    def _set_readiness(self, report: ReadinessReport) -> None:
+        """
+        Publish a readiness report.
+
+        In Kubernetes mode the report is also written to the readiness file
+        so an exec readiness probe can wait on it.
+
+        Args:
+            report: Readiness report to publish
+        """
+        self.readiness = report
+        self._ready_event.set()
+
+        if self.config.kubernetes_mode:
+            try:
+                write_readiness_file(self.config.readiness_file, report)
+            except OSError as e:
+                self.logger.error(
+                    "readiness_file_write_failed",
+                    path=self.config.readiness_file,
+                    error=str(e),
+                )
+
+        self.logger.info("server_readiness", **report.to_dict())
+
+    async def wait_until_ready(
+        self, timeout: Optional[float] = None
+    ) -> Optional[ReadinessReport]:
+        """
+        Wait for the readiness report.
+
+        Args:
+            timeout: Maximum seconds to wait (waits indefinitely if None)
+
+        Returns:
+            ReadinessReport, or None if the timeout elapsed first
+        """
+        try:
+            await asyncio.wait_for(self._ready_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            return None
+        return self.readiness
 
     def _register_tools(self) -> None:
-        """Register all available tools with the server."""
+        """
+        Register all available tools with the server.
+
+        Tools are registered from the manifest in ``tools/registry.py``, so no
+        tool module is imported here; each tool is imported and instantiated
+        the first time it is called (see ``get_tool``).
+        """
         self.logger.info("registering_tools")
 
-        # User management tools
-        self._register_tool(ListUsersTool)
-        self._register_tool(GetUserTool)
-        self._register_tool(CreateUserTool)
-        self._register_tool(UpdateUserTool)
-
-        # Group management tools
-        self._register_tool(ListGroupsTool)
-        self._register_tool(GetGroupTool)
-        self._register_tool(CreateGroupTool)
-        self._register_tool(AddGroupMembersTool)
-        self._register_tool(RemoveGroupMembersTool)
-
-        # Metadata tools
-        self._register_tool(GetMetadataTool)
-        self._register_tool(ListObjectTypesTool)
-        self._register_tool(GetPicklistValuesTool)
-
-        # Audit trail tools
-        self._register_tool(QueryAuditTrailTool)
-        self._register_tool(GetDocumentAuditTool)
-        self._register_tool(GetUserActivityTool)
-
-        # Document tools
-        self._register_tool(DocumentsQueryTool)
-        self._register_tool(DocumentsGetTool)
-        self._register_tool(DocumentsCreateTool)
-        self._register_tool(DocumentsUpdateTool)
-        self._register_tool(DocumentsDeleteTool)
-        self._register_tool(DocumentsLockTool)
-        self._register_tool(DocumentsUnlockTool)
-        self._register_tool(DocumentsDownloadFileTool)
-        self._register_tool(DocumentsDownloadVersionFileTool)
-        self._register_tool(DocumentsBatchCreateTool)
-        self._register_tool(DocumentsBatchUpdateTool)
-        self._register_tool(DocumentsGetActionsTool)
-        self._register_tool(DocumentsExecuteActionTool)
-        self._register_tool(DocumentsUploadFileTool)
-        self._register_tool(DocumentsCreateVersionTool)
-        self._register_tool(DocumentsAttachmentsListTool)
-        self._register_tool(DocumentsAttachmentsUploadTool)
-        self._register_tool(DocumentsAttachmentsDownloadTool)
-        self._register_tool(DocumentsAttachmentsDeleteTool)
-        self._register_tool(DocumentsRenditionsListTool)
-        self._register_tool(DocumentsRenditionsGenerateTool)
-        self._register_tool(DocumentsRenditionsDownloadTool)
-        self._register_tool(DocumentsRenditionsDeleteTool)
-
-        # Object tools
-        self._register_tool(ObjectsQueryTool)
-        self._register_tool(ObjectsGetTool)
-        self._register_tool(ObjectsCreateTool)
-        self._register_tool(ObjectsUpdateTool)
-        self._register_tool(ObjectsBatchCreateTool)
-        self._register_tool(ObjectsBatchUpdateTool)
-        self._register_tool(ObjectsGetActionsTool)
-        self._register_tool(ObjectsExecuteActionTool)
-
-        # VQL tools
-        self._register_tool(VQLExecuteTool)
-        self._register_tool(VQLValidateTool)
-
-        # File staging tools
-        self._register_tool(FileStagingUploadTool)
-        self._register_tool(FileStagingListTool)
-        self._register_tool(FileStagingDownloadTool)
-        self._register_tool(FileStagingDeleteTool)
-
-        # Workflow tools
-        self._register_tool(WorkflowsListTool)
-        self._register_tool(WorkflowsGetTool)
-        self._register_tool(DocumentsGetWorkflowDetailsTool)
-
-        # Task tools
-        self._register_tool(TasksListTool)
-        self._register_tool(TasksGetTool)
-        self._register_tool(TasksExecuteActionTool)
-
-        self.logger.info("tools_registered", count=len(self.tools))
+        for spec in load_tool_specs():
+            self.tool_specs[spec.name] = spec
+        self._tool_descriptors = None
+
+        self.logger.info("tools_registered", count=len(self.tool_specs))
 
     def _register_tool(self, tool_class: type[BaseTool]) -> None:
         """
-        Register a single tool with the server.
+        Register a single tool class with the server.
+
+        Unlike manifest tools, the tool is instantiated immediately. Useful for
+        tools that are not part of the registry.
 
         Args:
             tool_class: Tool class to instantiate and register
         """
         tool_instance = tool_class(self.auth_manager, self.http_client)
         self.tools[tool_instance.name] = tool_instance
+        self.tool_specs[tool_instance.name] = ToolSpec(
+            name=tool_instance.name,
+            module=tool_class.__module__,
+            class_name=tool_class.__name__,
+            description=tool_instance.description,
+            input_schema=tool_instance.get_parameters_schema(),
+        )
+        self._tool_descriptors = None
 
         self.logger.debug(
             "tool_registered",
@@ -265,6 +214,49 @@ class VeevaVaultMCPServer:
             description=tool_instance.description[:50] + "...",
         )
 
+    def get_tool(self, name: str) -> Optional[BaseTool]:
+        """
+        Get a tool instance, importing and instantiating it on first use.
+
+        Args:
+            name: Tool name
+
+        Returns:
+            Tool instance, or None if no tool with that name is registered
+        """
+        tool = self.tools.get(name)
+        if tool is not None:
+            return tool
+
+        spec = self.tool_specs.get(name)
+        if spec is None:
+            return None
+
+        tool = spec.load_class()(self.auth_manager, self.http_client)
+        self.tools[name] = tool
+        self.logger.debug("tool_loaded", name=name, module=spec.module)
+        return tool
+
+    def get_tool_descriptors(self) -> list[Tool]:
+        """
+        Get MCP descriptors for all registered tools.
+
+        Descriptors are built once from the tool specs and cached.
+
+        Returns:
+            List of MCP Tool descriptors
+        """
+        if self._tool_descriptors is None:
+            self._tool_descriptors = [
+                Tool(
+                    name=spec.name,
+                    description=spec.description,
+                    inputSchema=spec.input_schema,
+                )
+                for spec in self.tool_specs.values()
+            ]
+        return self._tool_descriptors
+
     def _setup_handlers(self) -> None:
         """Set up MCP protocol handlers."""
 
@@ -272,18 +264,7 @@ class VeevaVaultMCPServer:
         async def list_tools() -> list[Tool]:
             """List all available tools."""
             self.logger.info("list_tools_called")
-
-            tools = []
-            for tool_name, tool_instance in self.tools.items():
-                tools.append(
-                    Tool(
-                        name=tool_name,
-                        description=tool_instance.description,
-                        inputSchema=tool_instance.get_parameters_schema(),
-                    )
-                )
-
-            return tools
+            return self.get_tool_descriptors()
 
         @self.mcp_server.call_tool()
         async def call_tool(name: str, arguments: dict) -> Sequence[TextContent]:
@@ -300,7 +281,7 @@ class VeevaVaultMCPServer:
             self.logger.info("tool_called", tool=name, args_count=len(arguments))
 
             # Get tool instance
-            tool = self.tools.get(name)
+            tool = self.get_tool(name)
             if not tool:
                 error_msg = f"Unknown tool: {name}"
                 self.logger.error("tool_not_found", tool=name)
@@ -384,9 +365,22 @@ class VeevaVaultMCPServer:
         self.logger.info("server_cleanup_starting")
 
         try:
-            # Close HTTP client
+            # Stop warm-up and withdraw readiness
+            if self._warmup_task and not self._warmup_task.done():
+                self._warmup_task.cancel()
+            if self.config.kubernetes_mode:
+                remove_readiness_file(self.config.readiness_file)
+
+            # Stop tools' background work
+            for tool in self.tools.values():
+                if hasattr(tool, "close"):
+                    await tool.close()
+
+            # Close HTTP client and its download cache
             if self.http_client:
                 await self.http_client.__aexit__(None, None, None)
+                if self.http_client.content_cache is not None:
+                    self.http_client.content_cache.close()
 
             # Close auth manager
             if self.auth_manager and hasattr(self.auth_manager, 'close'):
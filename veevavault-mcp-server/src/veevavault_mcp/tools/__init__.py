@@ -1,104 +1,90 @@
-"""MCP Tools for VeevaVault operations."""
-
-from .base import BaseTool, ToolResult
-
-# User management tools
-from .users import (
-    ListUsersTool,
-    GetUserTool,
-    CreateUserTool,
-    UpdateUserTool,
-)
-
-# Group management tools
-from .groups import (
-    ListGroupsTool,
-    GetGroupTool,
-    CreateGroupTool,
-    AddGroupMembersTool,
-    RemoveGroupMembersTool,
-)
-
-# Metadata tools
-from .metadata import (
-    GetMetadataTool,
-    ListObjectTypesTool,
-    GetPicklistValuesTool,
-)
-
-# Audit trail tools
-from .audit import (
-    QueryAuditTrailTool,
-    GetDocumentAuditTool,
-    GetUserActivityTool,
-)
-
-# Document tools
-from .documents import (
-    DocumentsQueryTool,
-    DocumentsGetTool,
-    DocumentsCreateTool,
-    DocumentsUpdateTool,
-    DocumentsDeleteTool,
-    DocumentsLockTool,
-    DocumentsUnlockTool,
-    DocumentsDownloadFileTool,
-    DocumentsDownloadVersionFileTool,
-    DocumentsBatchCreateTool,
-    DocumentsBatchUpdateTool,
-    DocumentsGetActionsTool,
-    DocumentsExecuteActionTool,
-    DocumentsUploadFileTool,
-    DocumentsCreateVersionTool,
-    DocumentsAttachmentsListTool,
-    DocumentsAttachmentsUploadTool,
-    DocumentsAttachmentsDownloadTool,
-    DocumentsAttachmentsDeleteTool,
-    DocumentsRenditionsListTool,
-    DocumentsRenditionsGenerateTool,
-    DocumentsRenditionsDownloadTool,
-    DocumentsRenditionsDeleteTool,
-)
-
-# Object tools
-from .objects import (
-    ObjectsQueryTool,
-    ObjectsGetTool,
-    ObjectsCreateTool,
-    ObjectsUpdateTool,
-    ObjectsBatchCreateTool,
-    ObjectsBatchUpdateTool,
-    ObjectsGetActionsTool,
-    ObjectsExecuteActionTool,
-)
-
-# VQL tools
-from .vql import (
-    VQLExecuteTool,
-    VQLValidateTool,
-)
-
-# File staging tools
-from .file_staging import (
-    FileStagingUploadTool,
-    FileStagingListTool,
-    FileStagingDownloadTool,
-    FileStagingDeleteTool,
-)
-
-# Workflow tools
-from .workflows import (
-    WorkflowsListTool,
-    WorkflowsGetTool,
-    DocumentsGetWorkflowDetailsTool,
-)
-
-# Task tools
-from .tasks import (
-    TasksListTool,
-    TasksGetTool,
-    TasksExecuteActionTool,
-)
+"""
+MCP Tools for VeevaVault operations.
+
+Tool classes are exported lazily (PEP 562) so importing one tool module, or the
+registry, does not import every other tool module.
+"""
+
+import importlib
+from typing import TYPE_CHECKING
+
+# Public name -> submodule that defines it
+_LAZY_EXPORTS = {
+    "BaseTool": "base",
+    "ToolResult": "base",
+    # User management tools
+    "ListUsersTool": "users",
+    "GetUserTool": "users",
+    "CreateUserTool": "users",
+    "UpdateUserTool": "users",
+    # Group management tools
+    "ListGroupsTool": "groups",
+    "GetGroupTool": "groups",
+    "CreateGroupTool": "groups",
+    "AddGroupMembersTool": "groups",
+    "RemoveGroupMembersTool": "groups",
+    # Metadata tools
+    "GetMetadataTool": "metadata",
+    "ListObjectTypesTool": "metadata",
+    "GetPicklistValuesTool": "metadata",
+    "MetadataSearchTool": "metadata",
+    # Audit trail tools
+    "QueryAuditTrailTool": "audit",
+    "GetDocumentAuditTool": "audit",
+    "GetUserActivityTool": "audit",
+    "BulkAuditHistoryTool": "audit",
+    # Document tools
+    "DocumentsQueryTool": "documents",
+    "DocumentsGetTool": "documents",
+    "DocumentsGetManyTool": "documents",
+    "DocumentsCreateTool": "documents",
+    "DocumentsUpdateTool": "documents",
+    "DocumentsDeleteTool": "documents",
+    "DocumentsLockTool": "documents",
+    "DocumentsUnlockTool": "documents",
+    "DocumentsDownloadFileTool": "documents",
+    "DocumentsDownloadVersionFileTool": "documents",
+    "DocumentsBatchCreateTool": "documents",
+    "DocumentsBatchUpdateTool": "documents",
+    "DocumentsGetActionsTool": "documents",
+    "DocumentsExecuteActionTool": "documents",
+    "DocumentsUploadFileTool": "documents",
+    "DocumentsCreateVersionTool": "documents",
+    "DocumentsAttachmentsListTool": "documents",
+    "DocumentsAttachmentsUploadTool": "documents",
+    "DocumentsAttachmentsDownloadTool": "documents",
+    "DocumentsAttachmentsDeleteTool": "documents",
+    "DocumentsRenditionsListTool": "documents",
+    "DocumentsRenditionsGenerateTool": "documents",
+    "DocumentsRenditionsDownloadTool": "documents",
+    "DocumentsRenditionsDeleteTool": "documents",
+    # Object tools
+    "ObjectsQueryTool": "objects",
+    "ObjectsGetTool": "objects",
+    "ObjectsGetManyTool": "objects",
+    "ObjectsCreateTool": "objects",
+    "ObjectsUpdateTool": "objects",
+    "ObjectsBatchCreateTool": "objects",
+    "ObjectsBatchUpdateTool": "objects",
+    "ObjectsGetActionsTool": "objects",
+    "ObjectsExecuteActionTool": "objects",
+    # VQL tools
+    "VQLExecuteTool": "vql",
+    "VQLValidateTool": "vql",
+    # File staging tools
+    "FileStagingUploadTool": "file_staging",
+    "FileStagingListTool": "file_staging",
+    "FileStagingDownloadTool": "file_staging",
+    "FileStagingDeleteTool": "file_staging",
+    # Workflow tools
+    "WorkflowsListTool": "workflows",
+    "WorkflowsGetTool": "workflows",
+    "DocumentsGetWorkflowDetailsTool": "workflows",
+    # Task tools
+    "TasksListTool": "tasks",
+    "TasksGetTool": "tasks",
+    "TasksExecuteActionTool": "tasks",
+}
 
 __all__ = [
     # Base
@@ -119,13 +105,16 @@ __all__ = [
     "GetMetadataTool",
     "ListObjectTypesTool",
     "GetPicklistValuesTool",
+    "MetadataSearchTool",
     # Audit
     "QueryAuditTrailTool",
     "GetDocumentAuditTool",
     "GetUserActivityTool",
+    "BulkAuditHistoryTool",
     # Documents
     "DocumentsQueryTool",
     "DocumentsGetTool",
+    "DocumentsGetManyTool",
     "DocumentsCreateTool",
     "DocumentsUpdateTool",
     "DocumentsDeleteTool",
@@ -150,6 +139,7 @@ __all__ = [
     # Objects
     "ObjectsQueryTool",
     "ObjectsGetTool",
+    "ObjectsGetManyTool",
     "ObjectsCreateTool",
     "ObjectsUpdateTool",
     "ObjectsBatchCreateTool",
@@ -173,3 +163,124 @@ __all__ = [
     "TasksGetTool",
     "TasksExecuteActionTool",
 ]
+
+
+def __getattr__(name: str):
+    """Import the submodule that defines ``name`` on first access."""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
+
+
+if TYPE_CHECKING:
+    from .base import BaseTool, ToolResult
+
+    # User management tools
+    from .users import (
+        ListUsersTool,
+        GetUserTool,
+        CreateUserTool,
+        UpdateUserTool,
+    )
+
+    # Group management tools
+    from .groups import (
+        ListGroupsTool,
+        GetGroupTool,
+        CreateGroupTool,
+        AddGroupMembersTool,
+        RemoveGroupMembersTool,
+    )
+
+    # Metadata tools
+    from .metadata import (
+        GetMetadataTool,
+        ListObjectTypesTool,
+        GetPicklistValuesTool,
+        MetadataSearchTool,
+    )
+
+    # Audit trail tools
+    from .audit import (
+        QueryAuditTrailTool,
+        GetDocumentAuditTool,
+        GetUserActivityTool,
+        BulkAuditHistoryTool,
+    )
+
+    # Document tools
+    from .documents import (
+        DocumentsQueryTool,
+        DocumentsGetTool,
+        DocumentsGetManyTool,
+        DocumentsCreateTool,
+        DocumentsUpdateTool,
+        DocumentsDeleteTool,
+        DocumentsLockTool,
+        DocumentsUnlockTool,
+        DocumentsDownloadFileTool,
+        DocumentsDownloadVersionFileTool,
+        DocumentsBatchCreateTool,
+        DocumentsBatchUpdateTool,
+        DocumentsGetActionsTool,
+        DocumentsExecuteActionTool,
+        DocumentsUploadFileTool,
+        DocumentsCreateVersionTool,
+        DocumentsAttachmentsListTool,
+        DocumentsAttachmentsUploadTool,
+        DocumentsAttachmentsDownloadTool,
+        DocumentsAttachmentsDeleteTool,
+        DocumentsRenditionsListTool,
+        DocumentsRenditionsGenerateTool,
+        DocumentsRenditionsDownloadTool,
+        DocumentsRenditionsDeleteTool,
+    )
+
+    # Object tools
+    from .objects import (
+        ObjectsQueryTool,
+        ObjectsGetTool,
+        ObjectsGetManyTool,
+        ObjectsCreateTool,
+        ObjectsUpdateTool,
+        ObjectsBatchCreateTool,
+        ObjectsBatchUpdateTool,
+        ObjectsGetActionsTool,
+        ObjectsExecuteActionTool,
+    )
+
+    # VQL tools
+    from .vql import (
+        VQLExecuteTool,
+        VQLValidateTool,
+    )
+
+    # File staging tools
+    from .file_staging import (
+        FileStagingUploadTool,
+        FileStagingListTool,
+        FileStagingDownloadTool,
+        FileStagingDeleteTool,
+    )
+
+    # Workflow tools
+    from .workflows import (
+        WorkflowsListTool,
+        WorkflowsGetTool,
+        DocumentsGetWorkflowDetailsTool,
+    )
+
+    # Task tools
+    from .tasks import (
+        TasksListTool,
+        TasksGetTool,
+        TasksExecuteActionTool,
+    )
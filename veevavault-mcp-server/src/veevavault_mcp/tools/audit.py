@@ -2,10 +2,11 @@
 Audit trail and compliance reporting tools for VeevaVault.
 """
 
-from typing import Optional
+import asyncio
+from typing import Any, Optional
 from datetime import datetime, timedelta
 from .base import BaseTool, ToolResult
-from ..utils.errors import APIError
+from ..utils.errors import APIError, VeevaVaultError
 
 
 class QueryAuditTrailTool(BaseTool):
@@ -363,3 +364,206 @@ Useful for:
                 error=f"Failed to get user activity: {e.message}",
                 metadata={"error_code": e.error_code, "user_id": user_id},
             )
+
+
+class BulkAuditHistoryTool(BaseTool):
+    """Get complete audit histories for many documents or object records."""
+
+    MAX_IDS = 5000
+    MAX_CONCURRENCY = 32
+    PAGE_SIZE = 1000
+
+    @property
+    def name(self) -> str:
+        return "vault_audit_history_bulk_get"
+
+    @property
+    def description(self) -> str:
+        return """Get the complete audit history of many Veeva Vault documents or object records at once.
+
+Fetches the histories concurrently (bounded by max_concurrency and the server's
+shared API rate limit), following every page of each history, and merges them:
+- Each audit record is tagged with its record_id
+- Per-ID record counts
+- Per-ID error messages for IDs whose history could not be retrieved
+
+Provide object_name to fetch object record histories; otherwise the IDs are
+document IDs. Up to 5000 IDs per call.
+
+Useful for investigations spanning many documents or records."""
+
+    def get_parameters_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "record_ids": {
+                    "type": "array",
+                    "items": {"type": ["string", "integer"]},
+                    "description": "Document IDs, or object record IDs when object_name is set",
+                    "minItems": 1,
+                    "maxItems": self.MAX_IDS,
+                },
+                "object_name": {
+                    "type": "string",
+                    "description": "Object name (e.g., product__v) for object record histories",
+                },
+                "start_date": {
+                    "type": "string",
+                    "description": "Start date (format: YYYY-MM-DDTHH:MM:SSZ)",
+                },
+                "end_date": {
+                    "type": "string",
+                    "description": "End date (format: YYYY-MM-DDTHH:MM:SSZ)",
+                },
+                "events": {
+                    "type": "string",
+                    "description": "Comma-separated audit events to include (e.g., Edit,Delete)",
+                },
+                "max_concurrency": {
+                    "type": "integer",
+                    "description": "Maximum number of concurrent history requests",
+                    "default": 8,
+                    "minimum": 1,
+                    "maximum": self.MAX_CONCURRENCY,
+                },
+                "max_records": {
+                    "type": "integer",
+                    "description": "Maximum number of merged audit records to return",
+                    "default": 10000,
+                    "minimum": 1,
+                    "maximum": 100000,
+                },
+            },
+            "required": ["record_ids"],
+        }
+
+    async def execute(
+        self,
+        record_ids: list,
+        object_name: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        events: Optional[str] = None,
+        max_concurrency: int = 8,
+        max_records: int = 10000,
+    ) -> ToolResult:
+        """
+        Execute bulk audit history retrieval.
+
+        Args:
+            record_ids: Document or object record IDs
+            object_name: Object name for object record histories (optional)
+            start_date: Start date filter (optional)
+            end_date: End date filter (optional)
+            events: Audit event filter (optional)
+            max_concurrency: Maximum concurrent history requests
+            max_records: Maximum merged records to return
+
+        Returns:
+            ToolResult with merged audit records, per-ID counts and errors
+        """
+        ids = list(dict.fromkeys(str(record_id) for record_id in record_ids))
+        if len(ids) > self.MAX_IDS:
+            return ToolResult(
+                success=False,
+                error=f"Too many record IDs: {len(ids)} (maximum {self.MAX_IDS})",
+            )
+
+        headers = await self._get_auth_headers()
+        params: dict[str, Any] = {"limit": self.PAGE_SIZE}
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+        if events:
+            params["events"] = events
+
+        semaphore = asyncio.Semaphore(min(max(max_concurrency, 1), self.MAX_CONCURRENCY))
+
+        async def fetch(record_id: str) -> tuple[str, list[dict], Optional[str]]:
+            async with semaphore:
+                try:
+                    records = await self._fetch_history(record_id, object_name, headers, params)
+                except VeevaVaultError as e:
+                    return record_id, [], e.message
+            return record_id, records, None
+
+        audit_records: list[dict] = []
+        counts: dict[str, int] = {}
+        errors: dict[str, str] = {}
+        truncated = False
+
+        for completed in asyncio.as_completed([fetch(record_id) for record_id in ids]):
+            record_id, records, error = await completed
+            if error is not None:
+                errors[record_id] = error
+                continue
+
+            counts[record_id] = len(records)
+            room = max_records - len(audit_records)
+            if len(records) > room:
+                truncated = True
+                records = records[:room]
+            audit_records.extend({**record, "record_id": record_id} for record in records)
+
+        self.logger.info(
+            "bulk_audit_history_retrieved",
+            id_count=len(ids),
+            record_count=len(audit_records),
+            error_count=len(errors),
+            truncated=truncated,
+        )
+
+        all_failed = len(errors) == len(ids)
+        return ToolResult(
+            success=not all_failed,
+            data={
+                "audit_records": audit_records,
+                "count": len(audit_records),
+                "counts": counts,
+                "errors": errors,
+                "truncated": truncated,
+            },
+            error=f"Failed to get audit history for all {len(ids)} IDs" if all_failed else None,
+            metadata={
+                "id_count": len(ids),
+                "record_count": len(audit_records),
+                "error_count": len(errors),
+            },
+        )
+
+    async def _fetch_history(
+        self,
+        record_id: str,
+        object_name: Optional[str],
+        headers: dict[str, str],
+        params: dict[str, Any],
+    ) -> list[dict]:
+        """
+        Fetch every page of one document or object record audit history.
+
+        Args:
+            record_id: Document or object record ID
+            object_name: Object name for object record histories (optional)
+            headers: Authentication headers
+            params: Query parameters for the first page
+
+        Returns:
+            All audit records of the ID
+        """
+        if object_name:
+            path = self._build_api_path(f"/vobjects/{object_name}/{record_id}/audittrail")
+        else:
+            path = self._build_api_path(f"/objects/documents/{record_id}/audittrail")
+
+        response = await self.http_client.get(path=path, headers=headers, params=params)
+        records = list(response.get("data", []))
+
+        # next_page carries its own query string
+        next_page = response.get("responseDetails", {}).get("next_page")
+        while next_page:
+            response = await self.http_client.get(path=next_page, headers=headers)
+            records.extend(response.get("data", []))
+            next_page = response.get("responseDetails", {}).get("next_page")
+
+        return records
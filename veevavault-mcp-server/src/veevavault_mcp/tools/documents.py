@@ -5,6 +5,7 @@ Document management tools for VeevaVault.
 from typing import Optional
 from .base import BaseTool, ToolResult
 from ..utils.errors import APIError
+from ..utils.vql_batch import fetch_by_ids
 
 
 class DocumentsQueryTool(BaseTool):
@@ -298,6 +299,84 @@ Use after documents_query to get full details."""
             )
 
 
+class DocumentsGetManyTool(BaseTool):
+    """Get many documents by ID with batched VQL queries."""
+
+    @property
+    def name(self) -> str:
+        return "vault_documents_get_many"
+
+    @property
+    def description(self) -> str:
+        return """Get fields of many Veeva Vault documents by ID in one call.
+
+The IDs are packed into as few VQL queries as fit Vault's 50,000-character
+limit, and the queries run concurrently. Much faster than one documents_get
+call per document for hundreds or thousands of IDs.
+
+Returns:
+- Documents keyed by ID (latest versions)
+- IDs that matched no document (missing or not visible)"""
+
+    def get_parameters_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "document_ids": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Document IDs to fetch",
+                    "minItems": 1,
+                    "maxItems": 100000,
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return (default: id, name__v, title__v, status__v, type__v)",
+                },
+            },
+            "required": ["document_ids"],
+        }
+
+    async def execute(
+        self,
+        document_ids: list[int],
+        fields: Optional[list[str]] = None,
+    ) -> ToolResult:
+        """Execute batched document retrieval."""
+        try:
+            headers = await self._get_auth_headers()
+            result = await fetch_by_ids(
+                self.http_client,
+                path=self._build_api_path("/query"),
+                headers=headers,
+                target="documents",
+                ids=document_ids,
+                fields=fields or ["id", "name__v", "title__v", "status__v", "type__v"],
+            )
+
+            return ToolResult(
+                success=True,
+                data={
+                    "documents": result["records"],
+                    "missing": result["missing"],
+                    "count": len(result["records"]),
+                },
+                metadata={
+                    "requested": len(document_ids),
+                    "missing_count": len(result["missing"]),
+                    "queries": result["batches"],
+                },
+            )
+
+        except (APIError, ValueError) as e:
+            return ToolResult(
+                success=False,
+                error=f"Failed to get documents: {getattr(e, 'message', str(e))}",
+                metadata={"error_code": getattr(e, "error_code", "INVALID_PARAMETER")},
+            )
+
+
 class DocumentsCreateTool(BaseTool):
     """Create a new document in Veeva Vault."""
 
@@ -721,8 +800,8 @@ class DocumentsDownloadFileTool(BaseTool):
     def description(self) -> str:
         return """Download the source file from a Veeva Vault document.
 
-Downloads the actual file content (PDF, Word, Excel, etc.) from a document.
-Returns file metadata and download information.
+Downloads the file (PDF, Word, Excel, etc.) of the latest version of a
+document to local disk. The file is streamed, so any size can be downloaded.
 
 Use this to:
 - Download document files for review
@@ -730,7 +809,8 @@ Use this to:
 - Archive document files locally
 - Verify document file integrity
 
-Note: Returns file metadata. Actual file download happens via returned URL."""
+Returns the local path, file name, size, SHA-256 and content type. The
+file content itself is not returned."""
 
     def get_parameters_schema(self) -> dict:
         return {
@@ -742,42 +822,47 @@ Note: Returns file metadata. Actual file download happens via returned URL."""
                 },
                 "save_path": {
                     "type": "string",
-                    "description": "Optional local path to save file",
+                    "description": "Optional file or directory to save to, inside the "
+                    "server's download directory (the default); relative paths are taken from it",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
                 },
             },
             "required": ["document_id"],
         }
 
     async def execute(
-        self, document_id: int, save_path: Optional[str] = None
+        self, document_id: int, save_path: Optional[str] = None, overwrite: bool = False
     ) -> ToolResult:
         """Execute document file download."""
         try:
             headers = await self._get_auth_headers()
-            path = self._build_api_path(f"/documents/{document_id}/file")
+            path = self._build_api_path(f"/objects/documents/{document_id}/file")
 
-            # Get file metadata first
-            response = await self.http_client.get(
+            # The latest version changes over time, so it is never cached
+            file_info = await self.http_client.stream(
                 path=path,
+                destination=save_path,
+                overwrite=overwrite,
                 headers=headers,
             )
 
-            # Extract file information from response
-            # Vault API returns file metadata and download URL
-            file_info = {
-                "document_id": document_id,
-                "download_url": path,
-                "response": response,
-            }
-
             self.logger.info(
-                "document_file_retrieved",
+                "document_file_downloaded",
                 document_id=document_id,
+                size=file_info["size"],
             )
 
             return ToolResult(
                 success=True,
-                data=file_info,
+                data={
+                    "document_id": document_id,
+                    "download_url": path,
+                    "file": file_info,
+                },
                 metadata={
                     "document_id": document_id,
                     "operation": "download_file",
@@ -803,10 +888,13 @@ class DocumentsDownloadVersionFileTool(BaseTool):
     def description(self) -> str:
         return """Download file from a specific document version.
 
-Downloads the source file from a particular version of a document.
-Useful for accessing historical versions of documents.
+Downloads the source file from a particular version of a document to local
+disk. Useful for accessing historical versions of documents.
+
+A document version's file never changes, so repeat downloads are served
+from the server's download cache without contacting Vault.
 
-Returns file metadata and download information for the specified version."""
+Returns the local path, file name, size, SHA-256 and content type."""
 
     def get_parameters_schema(self) -> dict:
         return {
@@ -824,41 +912,57 @@ Returns file metadata and download information for the specified version."""
                     "type": "integer",
                     "description": "Minor version number",
                 },
+                "save_path": {
+                    "type": "string",
+                    "description": "Optional file or directory to save to, inside the "
+                    "server's download directory (the default); relative paths are taken from it",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
+                },
             },
             "required": ["document_id", "major_version", "minor_version"],
         }
 
     async def execute(
-        self, document_id: int, major_version: int, minor_version: int
+        self,
+        document_id: int,
+        major_version: int,
+        minor_version: int,
+        save_path: Optional[str] = None,
+        overwrite: bool = False,
     ) -> ToolResult:
         """Execute version file download."""
         try:
             headers = await self._get_auth_headers()
-            path = self._build_api_path(
-                f"/documents/{document_id}/versions/{major_version}/{minor_version}/file"
-            )
+            version_path = f"/objects/documents/{document_id}/versions/{major_version}/{minor_version}/file"
+            path = self._build_api_path(version_path)
 
-            response = await self.http_client.get(
+            file_info = await self.http_client.stream(
                 path=path,
+                destination=save_path,
+                overwrite=overwrite,
                 headers=headers,
+                cache_key=version_path,
             )
 
-            file_info = {
-                "document_id": document_id,
-                "version": f"{major_version}.{minor_version}",
-                "download_url": path,
-                "response": response,
-            }
-
             self.logger.info(
-                "document_version_file_retrieved",
+                "document_version_file_downloaded",
                 document_id=document_id,
                 version=f"{major_version}.{minor_version}",
+                cached=file_info["cached"],
             )
 
             return ToolResult(
                 success=True,
-                data=file_info,
+                data={
+                    "document_id": document_id,
+                    "version": f"{major_version}.{minor_version}",
+                    "download_url": path,
+                    "file": file_info,
+                },
                 metadata={
                     "document_id": document_id,
                     "version": f"{major_version}.{minor_version}",
@@ -1667,7 +1771,8 @@ class DocumentsAttachmentsDownloadTool(BaseTool):
     def description(self) -> str:
         return """Download a specific attachment from a document.
 
-Returns download URL and file metadata.
+Downloads the latest version of the attachment file to local disk and
+returns its local path, file name, size, SHA-256 and content type.
 
 Use this to retrieve supporting files associated with documents."""
 
@@ -1683,20 +1788,38 @@ Use this to retrieve supporting files associated with documents."""
                     "type": "string",
                     "description": "The attachment ID",
                 },
+                "save_path": {
+                    "type": "string",
+                    "description": "Optional file or directory to save to, inside the "
+                    "server's download directory (the default); relative paths are taken from it",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
+                },
             },
             "required": ["document_id", "attachment_id"],
         }
 
-    async def execute(self, document_id: int, attachment_id: str) -> ToolResult:
+    async def execute(
+        self,
+        document_id: int,
+        attachment_id: str,
+        save_path: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> ToolResult:
         """Download document attachment."""
         try:
             headers = await self._get_auth_headers()
             path = self._build_api_path(
-                f"/objects/documents/{document_id}/attachments/{attachment_id}"
+                f"/objects/documents/{document_id}/attachments/{attachment_id}/file"
             )
 
-            response = await self.http_client.get(
+            file_info = await self.http_client.stream(
                 path=path,
+                destination=save_path,
+                overwrite=overwrite,
                 headers=headers,
             )
 
@@ -1704,6 +1827,7 @@ Use this to retrieve supporting files associated with documents."""
                 "document_attachment_downloaded",
                 document_id=document_id,
                 attachment_id=attachment_id,
+                size=file_info["size"],
             )
 
             return ToolResult(
@@ -1712,7 +1836,7 @@ Use this to retrieve supporting files associated with documents."""
                     "document_id": document_id,
                     "attachment_id": attachment_id,
                     "download_url": path,
-                    "response": response,
+                    "file": file_info,
                 },
                 metadata={
                     "document_id": document_id,
@@ -2007,7 +2131,9 @@ class DocumentsRenditionsDownloadTool(BaseTool):
 
 Use after checking rendition availability with list_renditions.
 
-Returns download URL and file metadata.
+Downloads the rendition to local disk and returns its local path, file
+name, size, SHA-256 and content type. Renditions of a specific doc_version
+are cached, so repeat downloads do not contact Vault.
 
 Common uses:
 - Download PDF version of Word doc
@@ -2024,11 +2150,22 @@ Common uses:
                 },
                 "rendition_type": {
                     "type": "string",
-                    "description": "Rendition type: 'pdf', 'thumbnail', 'viewable'",
+                    "description": "Rendition type, e.g. 'viewable_rendition__v'",
                 },
                 "doc_version": {
                     "type": "string",
-                    "description": "Specific document version (optional)",
+                    "description": "Specific document version, e.g. '1.0' (optional; "
+                    "defaults to the latest version)",
+                },
+                "save_path": {
+                    "type": "string",
+                    "description": "Optional file or directory to save to, inside the "
+                    "server's download directory (the default); relative paths are taken from it",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
                 },
             },
             "required": ["document_id", "rendition_type"],
@@ -2039,29 +2176,42 @@ Common uses:
         document_id: int,
         rendition_type: str,
         doc_version: Optional[str] = None,
+        save_path: Optional[str] = None,
+        overwrite: bool = False,
     ) -> ToolResult:
         """Download document rendition."""
+        cache_key = None
+        if doc_version:
+            major, _, minor = doc_version.replace("/", ".").partition(".")
+            if not (major.isdigit() and minor.isdigit()):
+                return ToolResult(
+                    success=False,
+                    error=f"Invalid doc_version {doc_version!r}; expected major.minor, e.g. '1.0'",
+                    metadata={"error_type": "validation", "document_id": document_id},
+                )
+            cache_key = f"/objects/documents/{document_id}/versions/{major}/{minor}/renditions/{rendition_type}"
+            path = self._build_api_path(cache_key)
+        else:
+            path = self._build_api_path(
+                f"/objects/documents/{document_id}/renditions/{rendition_type}"
+            )
+
         try:
             headers = await self._get_auth_headers()
-            
-            if doc_version:
-                path = self._build_api_path(
-                    f"/objects/documents/{document_id}/versions/{doc_version}/renditions/{rendition_type}/file"
-                )
-            else:
-                path = self._build_api_path(
-                    f"/objects/documents/{document_id}/renditions/{rendition_type}/file"
-                )
 
-            response = await self.http_client.get(
+            file_info = await self.http_client.stream(
                 path=path,
+                destination=save_path,
+                overwrite=overwrite,
                 headers=headers,
+                cache_key=cache_key,
             )
 
             self.logger.info(
                 "document_rendition_downloaded",
                 document_id=document_id,
                 rendition_type=rendition_type,
+                cached=file_info["cached"],
             )
 
             return ToolResult(
@@ -2071,7 +2221,7 @@ Common uses:
                     "rendition_type": rendition_type,
                     "doc_version": doc_version,
                     "download_url": path,
-                    "response": response,
+                    "file": file_info,
                 },
                 metadata={
                     "document_id": document_id,
@@ -178,7 +178,10 @@ class FileStagingDownloadTool(BaseTool):
     def description(self) -> str:
         return """Download a file from Vault's staging area.
 
-Retrieve files that were previously uploaded to staging.
+Retrieve files that were previously uploaded to staging. The file is
+streamed to local disk; its local path, size, SHA-256 and content type are
+returned.
+
 Useful for:
 - Downloading extracted document files
 - Retrieving batch export results
@@ -192,24 +195,41 @@ Useful for:
                     "type": "string",
                     "description": "Path to file in staging area",
                 },
+                "save_path": {
+                    "type": "string",
+                    "description": "Optional file or directory to save to, inside the "
+                    "server's download directory (the default); relative paths are taken from it",
+                },
+                "overwrite": {
+                    "type": "boolean",
+                    "description": "Replace an existing file (default: false)",
+                    "default": False,
+                },
             },
             "required": ["staging_path"],
         }
 
-    async def execute(self, staging_path: str) -> ToolResult:
+    async def execute(
+        self, staging_path: str, save_path: Optional[str] = None, overwrite: bool = False
+    ) -> ToolResult:
         """Download file from staging."""
         try:
             headers = await self._get_auth_headers()
-            path = self._build_api_path(f"/services/file_staging/{staging_path}")
+            path = self._build_api_path(
+                f"/services/file_staging/items/content/{staging_path.lstrip('/')}"
+            )
 
-            response = await self.http_client.get(
+            file_info = await self.http_client.stream(
                 path=path,
+                destination=save_path,
+                overwrite=overwrite,
                 headers=headers,
             )
 
             self.logger.info(
                 "file_staging_downloaded",
                 staging_path=staging_path,
+                size=file_info["size"],
             )
 
             return ToolResult(
@@ -217,7 +237,7 @@ Useful for:
                 data={
                     "staging_path": staging_path,
                     "download_url": path,
-                    "response": response,
+                    "file": file_info,
                 },
                 metadata={
                     "staging_path": staging_path,
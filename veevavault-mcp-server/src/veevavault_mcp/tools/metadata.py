@@ -2,9 +2,10 @@
 Metadata configuration tools for VeevaVault.
 """
 
-from typing import Optional
+from typing import Any, Optional
 from .base import BaseTool, ToolResult
 from ..utils.errors import APIError
+from ..utils.metadata_index import KINDS, SEARCH_MODES, MetadataIndex
 
 
 class GetMetadataTool(BaseTool):
@@ -233,3 +234,142 @@ Useful for validating values before creating/updating records."""
                     "field_name": field_name,
                 },
             )
+
+
+class MetadataSearchTool(BaseTool):
+    """Search objects, fields, document types/fields and picklists by name or label."""
+
+    # Seconds between incremental background refreshes of the index
+    REFRESH_INTERVAL = 900
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.index = MetadataIndex(self._fetch_metadata)
+
+    @property
+    def name(self) -> str:
+        return "vault_metadata_search"
+
+    @property
+    def description(self) -> str:
+        return """Search Vault metadata by name, name prefix, label words or a misspelling.
+
+Finds objects, object fields, document types, document fields, picklists and
+picklist values in one call, returning compact hits (kind, name, label,
+parent object/picklist, field type) instead of whole schemas.
+
+Examples:
+- "study country" -> study_country__v object and fields labelled Study Country
+- "prod" -> product__v and fields starting with prod
+- "lifecyle state" -> fuzzy match for lifecycle state fields
+
+The index is built from all metadata on first use (this first call can take a
+while on large Vaults) and refreshed incrementally in the background."""
+
+    def get_parameters_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "query": {
+                    "type": "string",
+                    "description": "Name, name prefix, label words or approximate spelling",
+                },
+                "kinds": {
+                    "type": "array",
+                    "items": {"type": "string", "enum": list(KINDS)},
+                    "description": "Only return these kinds of metadata (default: all)",
+                },
+                "parent": {
+                    "type": "string",
+                    "description": "Only return entries of this object or picklist (e.g., product__v, documents)",
+                },
+                "mode": {
+                    "type": "string",
+                    "enum": list(SEARCH_MODES),
+                    "description": "Match strategy (default: auto, which combines prefix, label and fuzzy)",
+                    "default": "auto",
+                },
+                "limit": {
+                    "type": "integer",
+                    "description": "Maximum hits (default: 20)",
+                    "minimum": 1,
+                    "maximum": 200,
+                    "default": 20,
+                },
+                "refresh": {
+                    "type": "boolean",
+                    "description": "Rebuild the whole index before searching (default: false)",
+                    "default": False,
+                },
+            },
+            "required": ["query"],
+        }
+
+    async def execute(
+        self,
+        query: str,
+        kinds: Optional[list[str]] = None,
+        parent: Optional[str] = None,
+        mode: str = "auto",
+        limit: int = 20,
+        refresh: bool = False,
+    ) -> ToolResult:
+        """
+        Execute metadata search.
+
+        Args:
+            query: Search text
+            kinds: Kinds of metadata to return
+            parent: Owning object or picklist
+            mode: Match strategy
+            limit: Maximum hits
+            refresh: Rebuild the index first
+
+        Returns:
+            ToolResult with compact hits
+        """
+        try:
+            if refresh or not self.index.ready:
+                await self.index.refresh(full=True)
+                self.index.start_background_refresh(self.REFRESH_INTERVAL)
+
+            hits = self.index.search(query, mode=mode, kinds=kinds, parent=parent, limit=limit)
+
+            self.logger.info(
+                "metadata_searched",
+                query=query,
+                mode=mode,
+                hit_count=len(hits),
+            )
+
+            return ToolResult(
+                success=True,
+                data={"query": query, "hits": hits, "count": len(hits)},
+                metadata={"index": self.index.stats()},
+            )
+
+        except APIError as e:
+            return ToolResult(
+                success=False,
+                error=f"Failed to build metadata index: {e.message}",
+                metadata={"error_code": e.error_code},
+            )
+
+    async def close(self) -> None:
+        """Stop the background index refresh."""
+        await self.index.stop()
+
+    async def _fetch_metadata(self, endpoint: str) -> dict[str, Any]:
+        """
+        Fetch a metadata endpoint.
+
+        The first build may use the HTTP client's response cache (e.g. filled by
+        warm-up); refreshes bypass it so they see configuration just changed in
+        Vault, and update the cached responses as they go.
+        """
+        headers = await self._get_auth_headers()
+        return await self.http_client.get(
+            path=self._build_api_path(endpoint),
+            headers=headers,
+            use_cache=not self.index.ready,
+        )
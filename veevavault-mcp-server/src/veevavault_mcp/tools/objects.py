@@ -7,6 +7,7 @@ Objects are custom Vault records like products, studies, quality events, etc.
 from typing import Optional
 from .base import BaseTool, ToolResult
 from ..utils.errors import APIError
+from ..utils.vql_batch import fetch_by_ids
 
 
 class ObjectsQueryTool(BaseTool):
@@ -228,6 +229,93 @@ Use after objects_query to get full record details."""
             )
 
 
+class ObjectsGetManyTool(BaseTool):
+    """Get many object records by ID with batched VQL queries."""
+
+    @property
+    def name(self) -> str:
+        return "vault_objects_get_many"
+
+    @property
+    def description(self) -> str:
+        return """Get fields of many Vault object records by ID in one call.
+
+The IDs are packed into as few VQL queries as fit Vault's 50,000-character
+limit, and the queries run concurrently. Much faster than one objects_get
+call per record for hundreds or thousands of IDs.
+
+Returns:
+- Records keyed by ID
+- IDs that matched no record (missing or not visible)"""
+
+    def get_parameters_schema(self) -> dict:
+        return {
+            "type": "object",
+            "properties": {
+                "object_name": {
+                    "type": "string",
+                    "description": "Object API name (e.g., 'product__v')",
+                },
+                "record_ids": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Record IDs to fetch (e.g., 'V0P000000001001')",
+                    "minItems": 1,
+                    "maxItems": 100000,
+                },
+                "fields": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Fields to return (default: id, name__v, status__v)",
+                },
+            },
+            "required": ["object_name", "record_ids"],
+        }
+
+    async def execute(
+        self,
+        object_name: str,
+        record_ids: list[str],
+        fields: Optional[list[str]] = None,
+    ) -> ToolResult:
+        """Execute batched object record retrieval."""
+        try:
+            headers = await self._get_auth_headers()
+            result = await fetch_by_ids(
+                self.http_client,
+                path=self._build_api_path("/query"),
+                headers=headers,
+                target=object_name,
+                ids=record_ids,
+                fields=fields or ["id", "name__v", "status__v"],
+            )
+
+            return ToolResult(
+                success=True,
+                data={
+                    "records": result["records"],
+                    "missing": result["missing"],
+                    "count": len(result["records"]),
+                },
+                metadata={
+                    "object_name": object_name,
+                    "requested": len(record_ids),
+                    "missing_count": len(result["missing"]),
+                    "queries": result["batches"],
+                },
+            )
+
+        except (APIError, ValueError) as e:
+            return ToolResult(
+                success=False,
+                error=f"Failed to get {object_name} records: {getattr(e, 'message', str(e))}",
+                metadata={
+                    "error_code": getattr(e, "error_code", "INVALID_PARAMETER"),
+                    "object_name": object_name,
+                },
+            )
+
+
 class ObjectsCreateTool(BaseTool):
     """Create a new object record."""
 
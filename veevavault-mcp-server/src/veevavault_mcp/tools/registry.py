@@ -0,0 +1,241 @@
+"""
+Lightweight registry of the MCP tools exposed by the server.
+
+The registry maps every tool name to the module and class that implement it,
+so the server can advertise tools without importing their modules. Tool
+descriptors (name, description and input schema) are read from
+``manifest.json``, which is generated from the tool classes; a tool's module
+is only imported the first time that tool is called.
+
+Regenerate the manifest after adding a tool or changing a tool's name,
+description or parameters schema:
+
+    python -m veevavault_mcp.tools.registry
+"""
+
+import importlib
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .base import BaseTool
+
+MANIFEST_PATH = Path(__file__).with_name("manifest.json")
+
+# Tool classes in registration order, grouped by the module that defines them
+TOOL_CLASSES: dict[str, tuple[str, ...]] = {
+    # User management tools
+    "users": (
+        "ListUsersTool",
+        "GetUserTool",
+        "CreateUserTool",
+        "UpdateUserTool",
+    ),
+    # Group management tools
+    "groups": (
+        "ListGroupsTool",
+        "GetGroupTool",
+        "CreateGroupTool",
+        "AddGroupMembersTool",
+        "RemoveGroupMembersTool",
+    ),
+    # Metadata tools
+    "metadata": (
+        "GetMetadataTool",
+        "ListObjectTypesTool",
+        "GetPicklistValuesTool",
+        "MetadataSearchTool",
+    ),
+    # Audit trail tools
+    "audit": (
+        "QueryAuditTrailTool",
+        "GetDocumentAuditTool",
+        "GetUserActivityTool",
+        "BulkAuditHistoryTool",
+    ),
+    # Document tools
+    "documents": (
+        "DocumentsQueryTool",
+        "DocumentsGetTool",
+        "DocumentsGetManyTool",
+        "DocumentsCreateTool",
+        "DocumentsUpdateTool",
+        "DocumentsDeleteTool",
+        "DocumentsLockTool",
+        "DocumentsUnlockTool",
+        "DocumentsDownloadFileTool",
+        "DocumentsDownloadVersionFileTool",
+        "DocumentsBatchCreateTool",
+        "DocumentsBatchUpdateTool",
+        "DocumentsGetActionsTool",
+        "DocumentsExecuteActionTool",
+        "DocumentsUploadFileTool",
+        "DocumentsCreateVersionTool",
+        "DocumentsAttachmentsListTool",
+        "DocumentsAttachmentsUploadTool",
+        "DocumentsAttachmentsDownloadTool",
+        "DocumentsAttachmentsDeleteTool",
+        "DocumentsRenditionsListTool",
+        "DocumentsRenditionsGenerateTool",
+        "DocumentsRenditionsDownloadTool",
+        "DocumentsRenditionsDeleteTool",
+    ),
+    # Object tools
+    "objects": (
+        "ObjectsQueryTool",
+        "ObjectsGetTool",
+        "ObjectsGetManyTool",
+        "ObjectsCreateTool",
+        "ObjectsUpdateTool",
+        "ObjectsBatchCreateTool",
+        "ObjectsBatchUpdateTool",
+        "ObjectsGetActionsTool",
+        "ObjectsExecuteActionTool",
+    ),
+    # VQL tools
+    "vql": (
+        "VQLExecuteTool",
+        "VQLValidateTool",
+    ),
+    # File staging tools
+    "file_staging": (
+        "FileStagingUploadTool",
+        "FileStagingListTool",
+        "FileStagingDownloadTool",
+        "FileStagingDeleteTool",
+    ),
+    # Workflow tools
+    "workflows": (
+        "WorkflowsListTool",
+        "WorkflowsGetTool",
+        "DocumentsGetWorkflowDetailsTool",
+    ),
+    # Task tools
+    "tasks": (
+        "TasksListTool",
+        "TasksGetTool",
+        "TasksExecuteActionTool",
+    ),
+}
+
+
+@dataclass(frozen=True)
+class ToolSpec:
+    """
+    Static description of a registered tool.
+
+    Attributes:
+        name: Tool name for MCP registration
+        module: Submodule of ``veevavault_mcp.tools`` defining the tool, or an
+            absolute module path for tools registered from elsewhere
+        class_name: Name of the tool class
+        description: Tool description for the LLM
+        input_schema: JSON schema for the tool parameters
+    """
+
+    name: str
+    module: str
+    class_name: str
+    description: str
+    input_schema: dict[str, Any] = field(default_factory=dict)
+
+    def load_class(self) -> type["BaseTool"]:
+        """Import the tool module and return the tool class."""
+        module_path = self.module
+        if "." not in module_path:
+            module_path = f"{__package__}.{module_path}"
+        return getattr(importlib.import_module(module_path), self.class_name)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert spec to a manifest entry."""
+        return {
+            "name": self.name,
+            "module": self.module,
+            "class": self.class_name,
+            "description": self.description,
+            "inputSchema": self.input_schema,
+        }
+
+    @classmethod
+    def from_dict(cls, entry: dict[str, Any]) -> "ToolSpec":
+        """Create spec from a manifest entry."""
+        return cls(
+            name=entry["name"],
+            module=entry["module"],
+            class_name=entry["class"],
+            description=entry["description"],
+            input_schema=entry["inputSchema"],
+        )
+
+
+def build_tool_specs() -> list[ToolSpec]:
+    """
+    Build tool specs by importing and instantiating every registered tool.
+
+    This is the slow path used to generate the manifest; the server uses
+    ``load_tool_specs``.
+
+    Returns:
+        List of ToolSpec in registration order
+    """
+    specs = []
+    for module_name, class_names in TOOL_CLASSES.items():
+        module = importlib.import_module(f"{__package__}.{module_name}")
+        for class_name in class_names:
+            # Descriptors do not depend on auth or HTTP state
+            tool = getattr(module, class_name)(None, None)
+            specs.append(
+                ToolSpec(
+                    name=tool.name,
+                    module=module_name,
+                    class_name=class_name,
+                    description=tool.description,
+                    input_schema=tool.get_parameters_schema(),
+                )
+            )
+    return specs
+
+
+def load_tool_specs(manifest_path: Path = MANIFEST_PATH) -> list[ToolSpec]:
+    """
+    Load tool specs from the manifest without importing any tool module.
+
+    Falls back to ``build_tool_specs`` when the manifest is missing.
+
+    Args:
+        manifest_path: Path to the manifest file
+
+    Returns:
+        List of ToolSpec in registration order
+    """
+    try:
+        with open(manifest_path, encoding="utf-8") as f:
+            entries = json.load(f)
+    except FileNotFoundError:
+        return build_tool_specs()
+
+    return [ToolSpec.from_dict(entry) for entry in entries]
+
+
+def write_manifest(manifest_path: Path = MANIFEST_PATH) -> list[ToolSpec]:
+    """
+    Regenerate the manifest from the tool classes.
+
+    Args:
+        manifest_path: Path to write the manifest to
+
+    Returns:
+        List of ToolSpec written
+    """
+    specs = build_tool_specs()
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump([spec.to_dict() for spec in specs], f, indent=2)
+        f.write("\n")
+    return specs
+
+
+if __name__ == "__main__":
+    written = write_manifest()
+    print(f"Wrote {len(written)} tools to {MANIFEST_PATH}")
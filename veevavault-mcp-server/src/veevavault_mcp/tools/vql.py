@@ -2,9 +2,37 @@
 VQL (Vault Query Language) execution tools.
 """
 
-from typing import Optional
+from contextlib import aclosing
+from typing import Any, Optional
 from .base import BaseTool, ToolResult
-from ..utils.errors import APIError
+from ..utils.cache import MemoryCache
+from ..utils.errors import (
+    APIError,
+    FieldNotFoundError,
+    NotFoundError,
+    QuerySyntaxError,
+    ValidationError,
+)
+from ..utils.vql import (
+    VQLQuery,
+    check_fields as check_fields_against,
+    metadata_names,
+    metadata_path,
+    parse_vql,
+)
+from ..utils.vql_shard import ShardedVQLExecutor
+
+# Most rows one sharded query returns in a tool result
+MAX_SHARDED_ROWS = 10000
+
+
+def _cached_metadata(tool: BaseTool, target: str) -> Optional[dict[str, Any]]:
+    """Return the target's field metadata if it is already in the response cache."""
+    path = metadata_path(target, tool.API_VERSION)
+    cache = getattr(tool.http_client, "cache", None)
+    if path is None or not isinstance(cache, MemoryCache):
+        return None
+    return cache.get(cache.make_key("GET", path))
 
 
 class VQLExecuteTool(BaseTool):
@@ -25,6 +53,14 @@ Examples:
 - SELECT id, name__v, status__v FROM product__v WHERE active__v = true
 - SELECT id, title__v FROM documents WHERE created_date__v >= '2025-01-01'
 
+The query is parsed locally first; syntax errors (and unknown fields, when the
+target's metadata is cached) are reported without calling Vault.
+
+For very large extracts, set shards to split the query into disjoint ranges of
+shard_field (id by default) that are fetched concurrently. Rows are returned
+in no particular order, up to max_rows (default 10000); is_complete is false
+when more rows matched.
+
 Power user feature for complex queries.
 Use specific tools (documents_query, objects_query) for simple queries."""
 
@@ -62,6 +98,23 @@ Use specific tools (documents_query, objects_query) for simple queries."""
                     "description": "Enable faceted search results (default: false)",
                     "default": False,
                 },
+                "shards": {
+                    "type": "integer",
+                    "description": "Fetch all rows as this many concurrent range queries (optional). Cannot be combined with limit, ORDER BY or paging clauses.",
+                    "minimum": 2,
+                    "maximum": 32,
+                },
+                "shard_field": {
+                    "type": "string",
+                    "description": "Monotonic field to shard on: an ID, number or datetime (default: id)",
+                    "default": "id",
+                },
+                "max_rows": {
+                    "type": "integer",
+                    "description": "Maximum rows returned by a sharded query (default: 10000)",
+                    "minimum": 1,
+                    "maximum": MAX_SHARDED_ROWS,
+                },
             },
             "required": ["query"],
         }
@@ -74,21 +127,31 @@ Use specific tools (documents_query, objects_query) for simple queries."""
         describe_query: bool = False,
         record_properties: bool = False,
         enable_facets: bool = False,
+        shards: Optional[int] = None,
+        shard_field: str = "id",
+        max_rows: Optional[int] = None,
     ) -> ToolResult:
         """Execute VQL query."""
         try:
+            # Parse locally so malformed queries never reach Vault
+            parsed = parse_vql(query)
+            field_errors = self._check_cached_fields(parsed)
+            if field_errors:
+                raise field_errors[0]
+
             headers = await self._get_auth_headers()
 
+            if shards and shards > 1:
+                if limit:
+                    raise ValidationError(message="limit cannot be combined with shards")
+                return await self._execute_sharded(
+                    query, headers, shards, shard_field, max_rows or MAX_SHARDED_ROWS
+                )
+
             # Optionally add/override LIMIT
             query_to_execute = query
             if limit:
-                # Simple limit override - remove existing LIMIT if present
-                import re
-
-                query_to_execute = re.sub(
-                    r"\s+LIMIT\s+\d+", "", query, flags=re.IGNORECASE
-                )
-                query_to_execute += f" LIMIT {limit}"
+                query_to_execute = parsed.with_clause("LIMIT", limit)
 
             # Execute query using POST (required by Vault API)
             path = self._build_api_path("/query")
@@ -185,16 +248,85 @@ Use specific tools (documents_query, objects_query) for simple queries."""
                 },
             )
 
-        except APIError as e:
+        except (APIError, QuerySyntaxError, FieldNotFoundError, ValidationError) as e:
             return ToolResult(
                 success=False,
                 error=f"VQL query failed: {e.message}",
                 metadata={"error_code": e.error_code, "query": query},
             )
 
+    async def _execute_sharded(
+        self,
+        query: str,
+        headers: dict[str, str],
+        shards: int,
+        shard_field: str,
+        max_rows: int,
+    ) -> ToolResult:
+        """Fetch up to max_rows rows of the query as concurrent range shards."""
+        if parse_vql(query).order_by:
+            raise ValidationError(message="ORDER BY cannot be combined with shards")
+
+        executor = ShardedVQLExecutor(
+            http_client=self.http_client,
+            path=self._build_api_path("/query"),
+            headers=headers,
+            query=query,
+            shards=shards,
+            shard_field=shard_field,
+        )
+        data = []
+        is_complete = True
+        # Closing the stream early cancels the shard queries still in flight
+        async with aclosing(executor.iter_records()) as records:
+            async for record in records:
+                if len(data) == max_rows:
+                    is_complete = False
+                    break
+                data.append(record)
+
+        self.logger.info(
+            "vql_executed_sharded",
+            query_length=len(query),
+            result_count=len(data),
+            total_available=executor.total,
+            is_complete=is_complete,
+            **executor.stats,
+        )
+
+        return ToolResult(
+            success=True,
+            data={
+                "results": data,
+                "count": len(data),
+                "total": executor.total,
+                "query": query,
+                "sharding": {"shard_field": shard_field, **executor.stats},
+                "pagination": {
+                    "pagesize": executor.page_size,
+                    "pages_fetched": executor.stats["pages"],
+                    "total_available": executor.total,
+                    "is_complete": is_complete,
+                },
+            },
+            metadata={
+                "result_count": len(data),
+                "query_type": "vql",
+                "shards": shards,
+            },
+        )
+
+    def _check_cached_fields(self, parsed: VQLQuery) -> list[FieldNotFoundError]:
+        """Check field references against the target's metadata, if cached."""
+        metadata = _cached_metadata(self, parsed.target)
+        if metadata is None:
+            return []
+        field_names, relationship_names = metadata_names(metadata)
+        return check_fields_against(parsed, field_names, relationship_names)
+
 
 class VQLValidateTool(BaseTool):
-    """Validate VQL query syntax without executing it."""
+    """Validate VQL query syntax and fields without executing it."""
 
     @property
     def name(self) -> str:
@@ -202,14 +334,17 @@ class VQLValidateTool(BaseTool):
 
     @property
     def description(self) -> str:
-        return """Validate VQL query syntax without executing.
+        return """Validate a VQL query without executing it.
+
+Checks the syntax locally, then checks the queried fields against the
+target's metadata (documents and objects; metadata is cached).
 
 Useful for:
 - Checking query syntax before execution
 - Learning VQL
 - Debugging complex queries
 
-Returns validation errors if syntax is incorrect."""
+Returns validation errors with their position if the query is invalid."""
 
     def get_parameters_schema(self) -> dict:
         return {
@@ -219,68 +354,96 @@ Returns validation errors if syntax is incorrect."""
                     "type": "string",
                     "description": "The VQL query to validate",
                 },
+                "check_fields": {
+                    "type": "boolean",
+                    "description": "Check field names against the target's metadata (default: true)",
+                    "default": True,
+                },
             },
             "required": ["query"],
         }
 
-    async def execute(self, query: str) -> ToolResult:
+    async def execute(self, query: str, check_fields: bool = True) -> ToolResult:
         """Execute VQL validation."""
         try:
-            headers = await self._get_auth_headers()
-
-            # Vault API doesn't have a dedicated validate endpoint,
-            # so we use LIMIT 0 to validate without returning results
-            validation_query = query
-            import re
-
-            # Remove existing LIMIT
-            validation_query = re.sub(
-                r"\s+LIMIT\s+\d+", "", validation_query, flags=re.IGNORECASE
-            )
-            validation_query += " LIMIT 0"
-
-            # Execute validation query using POST (required by Vault API)
-            path = self._build_api_path("/query")
-
-            # Add Content-Type header for form-encoded data
-            query_headers = {
-                **headers,
-                "Content-Type": "application/x-www-form-urlencoded",
-            }
-
-            response = await self.http_client.post(
-                path=path,
-                headers=query_headers,
-                data={"q": validation_query},
-            )
-
-            self.logger.info("vql_validated", query_length=len(query))
-
-            return ToolResult(
-                success=True,
-                data={
-                    "valid": True,
-                    "query": query,
-                    "message": "Query syntax is valid",
-                },
-                metadata={"validation": "passed"},
-            )
-
-        except APIError as e:
-            # Validation failed - query has syntax errors
-            self.logger.warning(
-                "vql_validation_failed",
-                query=query[:100],
-                error=e.message,
-            )
-
-            return ToolResult(
-                success=False,
-                error=f"Query validation failed: {e.message}",
-                data={
-                    "valid": False,
-                    "query": query,
-                    "error": e.message,
-                },
-                metadata={"validation": "failed", "error_code": e.error_code},
-            )
+            parsed = parse_vql(query)
+        except QuerySyntaxError as e:
+            return self._invalid(query, [e])
+
+        result_data = {
+            "valid": True,
+            "query": query,
+            "target": parsed.target,
+            "fields": sorted({ref.name for ref in parsed.fields()}),
+            "message": "Query syntax is valid",
+            "fields_checked": False,
+        }
+        if parsed.clauses:
+            result_data["clauses"] = parsed.clauses
+
+        path = metadata_path(parsed.target, self.API_VERSION)
+        if check_fields and path is not None:
+            try:
+                metadata = await self._get_metadata(path)
+            except NotFoundError as e:
+                return self._invalid(query, [e], target=parsed.target)
+            except APIError as e:
+                if e.status_code == 404:
+                    return self._invalid(query, [e], target=parsed.target)
+                # Metadata is unavailable; the syntax check still stands
+                self.logger.warning(
+                    "vql_field_check_skipped", target=parsed.target, error=e.message
+                )
+                result_data["warnings"] = [f"Fields not checked: {e.message}"]
+            else:
+                field_names, relationship_names = metadata_names(metadata)
+                errors = check_fields_against(parsed, field_names, relationship_names)
+                if errors:
+                    return self._invalid(query, errors, target=parsed.target)
+                result_data["fields_checked"] = True
+                result_data["message"] = "Query syntax and fields are valid"
+
+        self.logger.info(
+            "vql_validated",
+            query_length=len(query),
+            target=parsed.target,
+            fields_checked=result_data["fields_checked"],
+        )
+
+        return ToolResult(
+            success=True,
+            data=result_data,
+            metadata={"validation": "passed"},
+        )
+
+    async def _get_metadata(self, path: str) -> dict[str, Any]:
+        """Fetch target metadata; the HTTP client caches metadata responses."""
+        headers = await self._get_auth_headers()
+        return await self.http_client.get(path=path, headers=headers)
+
+    def _invalid(
+        self, query: str, errors: list, target: Optional[str] = None
+    ) -> ToolResult:
+        """Build the result for an invalid query."""
+        messages = [e.message for e in errors]
+        self.logger.warning(
+            "vql_validation_failed",
+            query=query[:100],
+            error=messages[0],
+        )
+
+        data = {
+            "valid": False,
+            "query": query,
+            "error": messages[0],
+            "errors": [{"message": e.message, **e.context} for e in errors],
+        }
+        if target is not None:
+            data["target"] = target
+
+        return ToolResult(
+            success=False,
+            error=f"Query validation failed: {messages[0]}",
+            data=data,
+            metadata={"validation": "failed", "error_code": errors[0].error_code},
+        )
@@ -12,6 +12,9 @@ from .errors import (
     CacheError,
     TimeoutError,
 )
+from .cache import MemoryCache
+from .content_cache import ContentCache
+from .rate_limit import AsyncRateLimiter
 from .http import VaultHTTPClient
 
 __all__ = [
@@ -25,5 +28,8 @@ __all__ = [
     "ConfigurationError",
     "CacheError",
     "TimeoutError",
+    "MemoryCache",
+    "ContentCache",
+    "AsyncRateLimiter",
     "VaultHTTPClient",
 ]
@@ -0,0 +1,137 @@
+"""
+Response caching for Veeva Vault API requests.
+"""
+
+import copy
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+from urllib.parse import urlencode
+
+import structlog
+
+from ..config import Config
+
+logger = structlog.get_logger(__name__)
+
+
+class MemoryCache:
+    """
+    In-process TTL cache with least-recently-used eviction.
+
+    Values are deep-copied on read and write so callers can mutate cached
+    responses without affecting other readers.
+    """
+
+    backend = "memory"
+
+    def __init__(self, ttl: int = 300, max_entries: int = 1024):
+        """
+        Initialize cache.
+
+        Args:
+            ttl: Default time-to-live in seconds
+            max_entries: Maximum number of entries before LRU eviction
+        """
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[dict[str, Any]] = None) -> str:
+        """
+        Build a cache key for a request.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Optional query parameters
+
+        Returns:
+            Cache key string
+        """
+        key = f"{method.upper()} {path}"
+        if params:
+            key += "?" + urlencode(sorted(params.items()), doseq=True)
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Copy of the cached value, or None if missing or expired
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return copy.deepcopy(value)
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None) -> None:
+        """
+        Store a value.
+
+        Args:
+            key: Cache key
+            value: Value to cache
+            ttl: Time-to-live in seconds (uses default TTL if None)
+        """
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        self._entries[key] = (expires_at, copy.deepcopy(value))
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        """Remove a value if present."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all values."""
+        self._entries.clear()
+
+    def __contains__(self, key: str) -> bool:
+        entry = self._entries.get(key)
+        return entry is not None and entry[0] > time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def create_cache(config: Config) -> Optional[MemoryCache]:
+    """
+    Create the response cache configured for the server.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        Cache instance, or None if caching is disabled
+    """
+    if not config.enable_caching:
+        return None
+
+    if config.cache_backend != "memory":
+        logger.warning(
+            "cache_backend_unavailable",
+            backend=config.cache_backend,
+            fallback="memory",
+        )
+
+    return MemoryCache(ttl=config.cache_ttl)
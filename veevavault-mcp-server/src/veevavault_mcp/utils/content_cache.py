@@ -0,0 +1,239 @@
+"""
+On-disk cache of immutable downloads, such as the files of a document version.
+"""
+
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any, Optional
+
+import structlog
+
+from ..config import Config
+
+logger = structlog.get_logger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    sha256 TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    content_type TEXT NOT NULL,
+    filename TEXT NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_sha256 ON entries (sha256);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+"""
+
+
+class ContentCache:
+    """
+    Content-addressed file cache with least-recently-used eviction.
+
+    Entries map a key (e.g. document, version and rendition) to a blob named
+    by the SHA-256 of its content, so identical files are stored once. An
+    SQLite index in write-ahead logging mode records each entry's hash and
+    last access. Blobs are written to a temporary file and renamed into
+    place, so concurrent readers and writers in any process never see a
+    partial file. Only use keys whose content never changes.
+
+    Methods block on disk I/O; call them from a worker thread in async code.
+    """
+
+    def __init__(self, directory: str, max_bytes: int = 5 * 1024**3):
+        """
+        Initialize cache.
+
+        Args:
+            directory: Cache directory; created if missing
+            max_bytes: Maximum total size of the cached content
+        """
+        self.directory = Path(directory)
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+
+        self._blob_dir = self.directory / "blobs"
+        self._blob_dir.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            self.directory / "index.sqlite3",
+            timeout=30,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        self._lock = threading.Lock()
+
+    def get(self, key: str, destination: Path) -> Optional[dict[str, Any]]:
+        """
+        Copy a cached file to a destination.
+
+        Args:
+            key: Cache key
+            destination: File to write
+
+        Returns:
+            Dict with sha256, size, content_type and filename, or None on a miss
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT sha256, size, content_type, filename FROM entries WHERE key = ?",
+                (key,),
+            ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+
+        sha256, size, content_type, filename = row
+        blob = self._blob_path(sha256)
+        try:
+            if blob.stat().st_size != size:
+                raise FileNotFoundError(blob)
+            _copy_atomically(blob, destination)
+        except FileNotFoundError:
+            # Evicted by another process since the lookup
+            self.misses += 1
+            with self._lock:
+                self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return None
+
+        with self._lock:
+            self._conn.execute(
+                "UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key)
+            )
+        self.hits += 1
+        return {"sha256": sha256, "size": size, "content_type": content_type, "filename": filename}
+
+    def put(
+        self,
+        key: str,
+        source: Path,
+        sha256: str,
+        size: int,
+        content_type: str = "",
+        filename: str = "",
+    ) -> None:
+        """
+        Add a downloaded file to the cache.
+
+        Args:
+            key: Cache key
+            source: Downloaded file; it is copied, not moved
+            sha256: Hex SHA-256 of the file
+            size: File size in bytes
+            content_type: Content-Type of the download
+            filename: File name reported by Vault
+        """
+        if size > self.max_bytes:
+            return
+
+        blob = self._blob_path(sha256)
+        try:
+            if not blob.exists():
+                _copy_atomically(source, blob)
+        except OSError as e:
+            logger.warning("content_cache_write_failed", key=key, error=str(e))
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, sha256, size, content_type, filename, time.time()),
+                )
+                orphans = self._evict()
+                self._conn.execute("COMMIT")
+            except BaseException:
+                self._conn.execute("ROLLBACK")
+                raise
+        for orphan in orphans:
+            self._blob_path(orphan).unlink(missing_ok=True)
+
+    def size(self) -> int:
+        """Total size in bytes of the cached content."""
+        with self._lock:
+            return self._total_size()
+
+    def clear(self) -> None:
+        """Remove all cached files."""
+        with self._lock:
+            hashes = [row[0] for row in self._conn.execute("SELECT DISTINCT sha256 FROM entries")]
+            self._conn.execute("DELETE FROM entries")
+        for sha256 in hashes:
+            self._blob_path(sha256).unlink(missing_ok=True)
+
+    def close(self) -> None:
+        """Close the cache index."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self) -> list[str]:
+        """Delete least recently used entries until the content fits; return orphaned hashes."""
+        total = self._total_size()
+        orphans: list[str] = []
+        if total <= self.max_bytes:
+            return orphans
+
+        rows = self._conn.execute(
+            "SELECT key, sha256, size FROM entries ORDER BY last_access"
+        ).fetchall()
+        for key, sha256, size in rows:
+            if total <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+            referenced = self._conn.execute(
+                "SELECT 1 FROM entries WHERE sha256 = ? LIMIT 1", (sha256,)
+            ).fetchone()
+            if referenced is None:
+                orphans.append(sha256)
+                total -= size
+        logger.debug("content_cache_evicted", files=len(orphans))
+        return orphans
+
+    def _total_size(self) -> int:
+        row = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM entries GROUP BY sha256)"
+        ).fetchone()
+        return row[0]
+
+    def _blob_path(self, sha256: str) -> Path:
+        return self._blob_dir / sha256[:2] / sha256
+
+
+def _copy_atomically(source: Path, destination: Path) -> None:
+    """Copy a file through a temporary file in the destination directory."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=destination.parent, suffix=".part")
+    os.close(fd)
+    try:
+        shutil.copyfile(source, temp_path)
+        os.replace(temp_path, destination)
+    except BaseException:
+        Path(temp_path).unlink(missing_ok=True)
+        raise
+
+
+def create_content_cache(config: Config) -> Optional[ContentCache]:
+    """
+    Create the download cache selected by configuration.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        ContentCache, or None when download caching is disabled
+    """
+    if not config.download_cache_enabled:
+        return None
+    return ContentCache(
+        config.download_cache_dir, max_bytes=config.download_cache_max_bytes
+    )
@@ -2,7 +2,15 @@
 HTTP client utilities for Veeva Vault API.
 """
 
-from typing import Any, Optional
+import asyncio
+import hashlib
+import os
+import re
+import tempfile
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any, AsyncIterator, Optional, Union
+from urllib.parse import unquote
 import httpx
 from tenacity import (
     retry,
@@ -12,27 +20,50 @@ from tenacity import (
 )
 import structlog
 
+from . import jsonlib
+from .cache import MemoryCache
+from .content_cache import ContentCache
+from .json_stream import DataStream
+from .rate_limit import AsyncRateLimiter
 from .errors import (
     APIError,
     RateLimitError,
     TimeoutError,
     NetworkError,
+    ValidationError,
     create_error_from_response,
 )
 
 logger = structlog.get_logger(__name__)
 
+# filename*=UTF-8''name or filename="name" in a Content-Disposition header
+_FILENAME = re.compile(r"filename\*=(?:[\w-]+'[^']*')?([^;]+)|filename=\"?([^\";]+)\"?", re.IGNORECASE)
+
 
 class VaultHTTPClient:
     """
     HTTP client for Veeva Vault API with retry logic and error handling.
+
+    When a cache is provided, successful GET responses for metadata paths
+    (see ``CACHEABLE_PATHS``) are served from the cache until they expire.
+    Files are downloaded with ``stream``, which writes the body to disk and
+    serves repeat downloads of immutable content from ``content_cache``.
     """
 
+    # Path fragments whose GET responses are cached; configuration metadata
+    # changes rarely compared with records and documents
+    CACHEABLE_PATHS = ("/metadata/", "/objects/picklists")
+
     def __init__(
         self,
         base_url: str,
         timeout: int = 30,
         max_retries: int = 3,
+        cache: Optional[MemoryCache] = None,
+        rate_limiter: Optional[AsyncRateLimiter] = None,
+        content_cache: Optional[ContentCache] = None,
+        download_dir: Optional[str] = None,
+        download_chunk_size: int = 1024 * 1024,
     ):
         """
         Initialize HTTP client.
@@ -41,10 +72,22 @@ class VaultHTTPClient:
             base_url: Base URL for Veeva Vault (e.g., https://vault.veevavault.com)
             timeout: Request timeout in seconds
             max_retries: Maximum number of retry attempts
+            cache: Optional response cache for metadata GET requests
+            rate_limiter: Optional limiter applied to every request sent to Vault
+            content_cache: Optional on-disk cache for downloads with a cache key
+            download_dir: Directory that downloads are written to
+            download_chunk_size: Bytes read and written per step of a download
         """
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.max_retries = max_retries
+        self.cache = cache
+        self.rate_limiter = rate_limiter
+        self.content_cache = content_cache
+        self.download_dir = Path(
+            download_dir or os.path.join(tempfile.gettempdir(), "veevavault-mcp", "downloads")
+        )
+        self.download_chunk_size = download_chunk_size
         self.logger = logger.bind(base_url=base_url)
 
         # Create async HTTP client
@@ -79,6 +122,7 @@ class VaultHTTPClient:
         json: Optional[dict[str, Any]] = None,
         params: Optional[dict[str, Any]] = None,
         data: Optional[dict[str, Any]] = None,
+        use_cache: bool = True,
     ) -> dict[str, Any]:
         """
         Make HTTP request to Vault API with retry logic.
@@ -90,6 +134,8 @@ class VaultHTTPClient:
             json: Optional JSON body
             params: Optional query parameters
             data: Optional form data
+            use_cache: Serve a cacheable request from the cache. With False the
+                request always goes to Vault and its response replaces the cached one.
 
         Returns:
             Parsed JSON response
@@ -105,6 +151,17 @@ class VaultHTTPClient:
         url = path if path.startswith("http") else path
         request_headers = headers or {}
 
+        cache_key = None
+        if self.cache is not None and self._is_cacheable(method, path):
+            cache_key = self.cache.make_key(method, path, params)
+            cached = self.cache.get(cache_key) if use_cache else None
+            if cached is not None:
+                self.logger.debug("http_cache_hit", path=path)
+                return cached
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
         self.logger.debug(
             "http_request",
             method=method,
@@ -139,11 +196,7 @@ class VaultHTTPClient:
                     context={"path": path, "method": method},
                 )
 
-            # Parse JSON response
-            try:
-                response_data = response.json()
-            except Exception:
-                response_data = {"response": response.text}
+            response_data = self._decode_response(response)
 
             # Handle error responses
             if response.status_code >= 400:
@@ -165,6 +218,9 @@ class VaultHTTPClient:
                         status_code=response.status_code,
                     )
 
+            if cache_key is not None:
+                self.cache.set(cache_key, response_data)
+
             return response_data
 
         except httpx.TimeoutException as e:
@@ -181,6 +237,299 @@ class VaultHTTPClient:
                 context={"path": path},
             )
 
+    def stream_data(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[dict[str, str]] = None,
+        json: Optional[dict[str, Any]] = None,
+        params: Optional[dict[str, Any]] = None,
+        data: Optional[dict[str, Any]] = None,
+        array_key: str = "data",
+    ) -> DataStream:
+        """
+        Stream the ``data`` items of a large JSON response.
+
+        Unlike ``request``, the body is never decoded whole: items are yielded
+        as they arrive, with the other top-level members (e.g.
+        ``responseDetails``) collected in the stream's ``envelope``. Streamed
+        responses are neither cached nor retried.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE)
+            path: API path (e.g., /api/v25.2/query)
+            headers: Optional HTTP headers
+            json: Optional JSON body
+            params: Optional query parameters
+            data: Optional form data
+            array_key: Top-level key of the array to stream
+
+        Returns:
+            Async iterator over the array items
+
+        Raises:
+            APIError: If API returns error response (raised while iterating)
+            RateLimitError: If rate limit exceeded
+            TimeoutError: If request times out
+        """
+
+        def check_failure(envelope: dict[str, Any], key: str, value: Any) -> None:
+            if key == "errors" and envelope.get("responseStatus") == "FAILURE":
+                raise create_error_from_response(response_data=envelope, status_code=200)
+
+        return DataStream(
+            lambda: self._open_stream(method, path, headers, json, params, data),
+            array_key=array_key,
+            on_value=check_failure,
+        )
+
+    async def stream(
+        self,
+        path: str,
+        destination: Optional[Union[str, Path]] = None,
+        headers: Optional[dict[str, str]] = None,
+        params: Optional[dict[str, Any]] = None,
+        method: str = "GET",
+        cache_key: Optional[str] = None,
+        overwrite: bool = False,
+    ) -> dict[str, Any]:
+        """
+        Download a response body to a file.
+
+        The body is read in chunks of ``download_chunk_size`` bytes, each
+        hashed and written to disk in a worker thread, so memory use does not
+        grow with the file. The file is written under a temporary name and
+        renamed once complete. Streamed downloads are not retried.
+
+        With a ``cache_key`` (only for content that never changes, such as a
+        specific document version) and a ``content_cache``, repeat downloads
+        are copied from the cache without a request.
+
+        Args:
+            path: API path (e.g., /api/v25.2/objects/documents/1/file)
+            destination: File, or existing directory, to write inside
+                ``download_dir``; relative paths are taken from it. Defaults to
+                ``download_dir``. In a directory the file is named after the
+                Content-Disposition file name.
+            headers: Optional HTTP headers
+            params: Optional query parameters
+            method: HTTP method
+            cache_key: Optional key of immutable content in ``content_cache``
+            overwrite: Replace an existing file instead of failing
+
+        Returns:
+            Dict with path, filename, size, sha256, content_type and cached
+
+        Raises:
+            ValidationError: If the destination is outside ``download_dir``, or
+                the file exists and overwrite is False
+            APIError: If API returns error response
+            RateLimitError: If rate limit exceeded
+            TimeoutError: If request times out
+        """
+        directory, filename = self._split_destination(destination)
+        if cache_key is not None:
+            # One cache directory may serve several vaults
+            cache_key = f"{self.base_url}{cache_key}"
+
+        if cache_key is not None and self.content_cache is not None:
+            cached = await asyncio.to_thread(
+                self._cached_download, cache_key, directory, filename, overwrite
+            )
+            if cached is not None:
+                self.logger.debug("http_download_cache_hit", path=path)
+                return cached
+
+        request_headers = {"Accept": "*/*", **(headers or {})}
+        async with self._open_stream(method, path, request_headers, None, params, None) as response:
+            content_type = response.headers.get("Content-Type", "")
+            if content_type.lower().startswith("application/json"):
+                # Vault reports some download errors as a JSON body with status 200
+                await response.aread()
+                response_data = self._decode_response(response)
+                if isinstance(response_data, dict) and response_data.get("responseStatus") == "FAILURE":
+                    raise create_error_from_response(
+                        response_data=response_data, status_code=response.status_code
+                    )
+
+            filename = filename or _disposition_filename(
+                response.headers.get("Content-Disposition", "")
+            ) or Path(path.rstrip("/")).name
+            target = directory / filename
+            if not overwrite and await asyncio.to_thread(target.exists):
+                raise _file_exists_error(target)
+            await asyncio.to_thread(directory.mkdir, parents=True, exist_ok=True)
+            fd, temp_name = await asyncio.to_thread(
+                tempfile.mkstemp, dir=directory, suffix=".part"
+            )
+            digest = hashlib.sha256()
+            size = 0
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    async for chunk in response.aiter_bytes(self.download_chunk_size):
+                        digest.update(chunk)
+                        size += len(chunk)
+                        await asyncio.to_thread(f.write, chunk)
+                await asyncio.to_thread(_move_into_place, temp_name, target, overwrite)
+            except BaseException:
+                Path(temp_name).unlink(missing_ok=True)
+                raise
+
+        result = {
+            "path": str(target),
+            "filename": filename,
+            "size": size,
+            "sha256": digest.hexdigest(),
+            "content_type": content_type,
+            "cached": False,
+        }
+        if cache_key is not None and self.content_cache is not None:
+            await asyncio.to_thread(
+                self.content_cache.put,
+                cache_key,
+                target,
+                result["sha256"],
+                size,
+                content_type,
+                filename,
+            )
+        self.logger.info("http_download_complete", path=path, size=size)
+        return result
+
+    def _split_destination(
+        self, destination: Optional[Union[str, Path]]
+    ) -> tuple[Path, Optional[str]]:
+        """
+        Return the directory and, unless it is a directory, the file name of a destination.
+
+        Destinations come from tool arguments, so they are confined to
+        ``download_dir`` after resolving ``..`` and symbolic links.
+        """
+        root = self.download_dir.resolve()
+        if destination is None:
+            return root, None
+        resolved = (root / Path(destination).expanduser()).resolve()
+        if not resolved.is_relative_to(root):
+            raise ValidationError(
+                f"Download destination must be inside {root}",
+                context={"destination": str(destination)},
+            )
+        if resolved == root or resolved.is_dir() or str(destination).endswith(("/", os.sep)):
+            return resolved, None
+        return resolved.parent, resolved.name
+
+    def _cached_download(
+        self, cache_key: str, directory: Path, filename: Optional[str], overwrite: bool
+    ) -> Optional[dict[str, Any]]:
+        """Copy a cached download into place, or return None on a miss."""
+        temp_target = directory / f".{hashlib.sha1(cache_key.encode()).hexdigest()}.cached"
+        entry = self.content_cache.get(cache_key, temp_target)
+        if entry is None:
+            return None
+        filename = filename or entry["filename"] or "download"
+        target = directory / filename
+        try:
+            _move_into_place(temp_target, target, overwrite)
+        except BaseException:
+            temp_target.unlink(missing_ok=True)
+            raise
+        return {"path": str(target), **entry, "filename": filename, "cached": True}
+
+    @asynccontextmanager
+    async def _open_stream(
+        self,
+        method: str,
+        path: str,
+        headers: Optional[dict[str, str]],
+        json: Optional[dict[str, Any]],
+        params: Optional[dict[str, Any]],
+        data: Optional[dict[str, Any]],
+    ) -> AsyncIterator[httpx.Response]:
+        """Send a streamed request and yield the response once its status is checked."""
+        if self._client is None:
+            raise RuntimeError("Client not initialized. Use 'async with' context manager.")
+
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        self.logger.debug("http_stream_request", method=method, path=path)
+
+        try:
+            async with self._client.stream(
+                method=method,
+                url=path,
+                headers=headers or {},
+                json=json,
+                params=params,
+                data=data,
+            ) as response:
+                self.logger.debug(
+                    "http_stream_response",
+                    status_code=response.status_code,
+                    path=path,
+                )
+
+                if response.status_code == 429:
+                    raise RateLimitError(
+                        message="API rate limit exceeded",
+                        retry_after=int(response.headers.get("Retry-After", 60)),
+                        context={"path": path, "method": method},
+                    )
+
+                if response.status_code >= 400:
+                    await response.aread()
+                    response_data = self._decode_response(response)
+                    raise APIError(
+                        message=self._extract_error_message(response_data),
+                        status_code=response.status_code,
+                        response_data=response_data,
+                        context={"path": path, "method": method},
+                    )
+
+                yield response
+
+        except httpx.TimeoutException as e:
+            self.logger.error("http_timeout", path=path, error=str(e))
+            raise TimeoutError(
+                message=f"Request to {path} timed out",
+                context={"path": path, "timeout": self.timeout},
+            )
+
+        except (httpx.ConnectError, httpx.NetworkError) as e:
+            self.logger.error("http_network_error", path=path, error=str(e))
+            raise NetworkError(
+                message=f"Network error: {str(e)}",
+                context={"path": path},
+            )
+
+    def _decode_response(self, response: httpx.Response) -> Any:
+        """
+        Decode a response body once, according to its content type.
+
+        JSON bodies are decoded with the selected JSON backend. Text bodies
+        (e.g. CSV) are returned as ``{"response": text}``. Binary bodies are
+        not decoded; their content type and size are returned instead.
+        """
+        content_type = response.headers.get("Content-Type", "")
+        kind = jsonlib.content_kind(content_type)
+
+        if kind == "binary":
+            return {"content_type": content_type, "size": len(response.content)}
+
+        if kind == "json":
+            try:
+                return jsonlib.loads(response.content)
+            except ValueError:
+                pass
+
+        return {"response": response.text}
+
+    def _is_cacheable(self, method: str, path: str) -> bool:
+        """Check whether a request's response may be served from the cache."""
+        return method.upper() == "GET" and any(
+            fragment in path for fragment in self.CACHEABLE_PATHS
+        )
+
     def _extract_error_message(self, response_data: dict) -> str:
         """Extract error message from Vault API response."""
         # Try to get error message from errors array
@@ -210,3 +559,39 @@ class VaultHTTPClient:
     async def delete(self, path: str, **kwargs) -> dict[str, Any]:
         """Make DELETE request."""
         return await self.request("DELETE", path, **kwargs)
+
+
+def _move_into_place(source: Union[str, Path], target: Path, overwrite: bool) -> None:
+    """Rename a finished download to its target; unless overwrite is set, never replace a file."""
+    if overwrite:
+        os.replace(source, target)
+        return
+    try:
+        # Unlike a rename, a hard link fails if the target exists
+        os.link(source, target)
+    except FileExistsError:
+        raise _file_exists_error(target) from None
+    except OSError:
+        # File system without hard links
+        if target.exists():
+            raise _file_exists_error(target) from None
+        os.replace(source, target)
+        return
+    os.unlink(source)
+
+
+def _file_exists_error(target: Path) -> ValidationError:
+    return ValidationError(
+        f"File already exists: {target}; set overwrite to replace it",
+        context={"path": str(target)},
+    )
+
+
+def _disposition_filename(disposition: str) -> Optional[str]:
+    """Return the file name of a Content-Disposition header, without any directories."""
+    match = _FILENAME.search(disposition)
+    if match is None:
+        return None
+    name = unquote(match.group(1)) if match.group(1) else match.group(2)
+    name = os.path.basename(name.strip().replace("\\", "/"))
+    return name if name not in ("", ".", "..") else None
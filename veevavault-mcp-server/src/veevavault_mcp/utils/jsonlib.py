@@ -0,0 +1,108 @@
+"""
+JSON decoding of Veeva Vault API responses.
+
+Response bodies are decoded once, with the fastest installed backend.
+"""
+
+import importlib
+import json
+from typing import Any, Callable, Optional, Union
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Backend name -> loader of its decode function, in order of preference
+BACKENDS: dict[str, Callable[[], Callable[[Union[bytes, str]], Any]]] = {
+    "orjson": lambda: importlib.import_module("orjson").loads,
+    "ujson": lambda: importlib.import_module("ujson").loads,
+    "json": lambda: json.loads,
+}
+
+# Content types whose bodies are never decoded as JSON
+BINARY_CONTENT_TYPES = (
+    "application/octet-stream",
+    "application/zip",
+    "application/x-zip-compressed",
+    "application/pdf",
+    "image/",
+    "audio/",
+    "video/",
+)
+
+# Non-JSON text content types returned as text
+TEXT_CONTENT_TYPES = ("text/csv", "text/plain", "text/html")
+
+_loads: Callable[[Union[bytes, str]], Any] = json.loads
+_backend_name = "json"
+
+
+def set_json_backend(backend: str = "auto") -> str:
+    """
+    Select the JSON decoder used for Vault API responses.
+
+    Args:
+        backend: 'auto' (the fastest installed of orjson, ujson and json) or a backend name
+
+    Returns:
+        Name of the selected backend
+
+    Raises:
+        ValueError: If the backend name is unknown
+        ImportError: If the named backend is not installed
+    """
+    global _loads, _backend_name
+
+    if backend == "auto":
+        for name, load in BACKENDS.items():
+            try:
+                _loads = load()
+            except ImportError:
+                continue
+            _backend_name = name
+            break
+    elif backend in BACKENDS:
+        _loads = BACKENDS[backend]()
+        _backend_name = backend
+    else:
+        raise ValueError(
+            f"Invalid json_backend: {backend}. Must be 'auto' or one of {tuple(BACKENDS)}"
+        )
+
+    logger.debug("json_backend_selected", backend=_backend_name)
+    return _backend_name
+
+
+def get_json_backend() -> str:
+    """Return the name of the selected JSON backend."""
+    return _backend_name
+
+
+def loads(data: Union[bytes, str]) -> Any:
+    """
+    Decode a JSON document with the selected backend.
+
+    Raises:
+        ValueError: If the body is not valid JSON
+    """
+    return _loads(data)
+
+
+def content_kind(content_type: Optional[str]) -> str:
+    """
+    Classify a response body by its Content-Type header.
+
+    Bodies without a content type are treated as JSON, as Vault returns JSON by default.
+
+    Returns:
+        'json', 'text' or 'binary'
+    """
+    content_type = (content_type or "").lower()
+    if content_type.startswith(BINARY_CONTENT_TYPES):
+        return "binary"
+    if content_type.startswith(TEXT_CONTENT_TYPES):
+        return "text"
+    return "json"
+
+
+set_json_backend("auto")
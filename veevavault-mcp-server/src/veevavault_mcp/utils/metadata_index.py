@@ -0,0 +1,458 @@
+"""
+In-memory search index over Vault metadata.
+
+Answers "which object/field/picklist is this?" from memory instead of walking
+object schemas one API call at a time. The index holds compact entries for
+objects, object fields, document types, document fields, picklists and
+picklist values, and supports prefix, label-word and fuzzy (trigram) search.
+
+Entries are grouped into segments (one per object, picklist or document
+listing). A refresh re-reads the cheap listings, fetches new segments, drops
+removed ones and re-fetches a batch of the stalest, so the index converges on
+Vault's configuration without rebuilding everything.
+"""
+
+import asyncio
+import bisect
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from typing import Any, Awaitable, Callable, Iterable, Optional
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+# Fetches a Vault API path and returns the parsed response
+Fetcher = Callable[[str], Awaitable[dict[str, Any]]]
+
+KINDS = ("object", "field", "document_type", "document_field", "picklist", "picklist_value")
+
+# Listing sources: segment name -> API path (relative to /api/{version})
+LISTING_PATHS = {
+    "objects": "/metadata/vobjects",
+    "document_types": "/metadata/objects/documents/types",
+    "document_fields": "/metadata/objects/documents/properties",
+    "picklists": "/objects/picklists",
+}
+
+SEARCH_MODES = ("auto", "prefix", "label", "fuzzy")
+
+# Minimum similarity of a fuzzy match
+FUZZY_THRESHOLD = 0.6
+
+# Fuzzy candidates scored per query
+_FUZZY_CANDIDATES = 200
+
+
+@dataclass(frozen=True)
+class IndexEntry:
+    """
+    One searchable piece of metadata.
+
+    Attributes:
+        kind: One of KINDS
+        name: API name (e.g., product__v, status__v)
+        label: UI label
+        parent: Owning object or picklist, if any
+        type: Field type, if a field
+        picklist: Picklist a field uses, if any
+    """
+
+    kind: str
+    name: str
+    label: str = ""
+    parent: Optional[str] = None
+    type: Optional[str] = None
+    picklist: Optional[str] = None
+
+    def to_hit(self, score: float, match: str) -> dict[str, Any]:
+        """Convert to a compact search hit."""
+        hit: dict[str, Any] = {"kind": self.kind, "name": self.name, "label": self.label}
+        if self.parent:
+            hit["parent"] = self.parent
+        if self.type:
+            hit["type"] = self.type
+        if self.picklist:
+            hit["picklist"] = self.picklist
+        hit["score"] = round(score, 3)
+        hit["match"] = match
+        return hit
+
+
+@dataclass
+class _Segment:
+    entries: list[IndexEntry]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+
+class MetadataIndex:
+    """
+    Searchable index of Vault metadata, built and refreshed from the API.
+
+    Lookups never call Vault; they run against lookup tables rebuilt after
+    each refresh, so a search takes milliseconds even for tens of thousands
+    of entries.
+    """
+
+    def __init__(
+        self,
+        fetch: Fetcher,
+        max_concurrency: int = 8,
+        refresh_batch: int = 25,
+        include_picklist_values: bool = True,
+    ):
+        """
+        Initialize index.
+
+        Args:
+            fetch: Coroutine function fetching an API path relative to /api/{version}
+            max_concurrency: Maximum concurrent metadata requests
+            refresh_batch: Existing segments re-fetched per incremental refresh
+            include_picklist_values: Index the values of every picklist
+        """
+        self.fetch = fetch
+        self.max_concurrency = max_concurrency
+        self.refresh_batch = refresh_batch
+        self.include_picklist_values = include_picklist_values
+
+        self.built_at: Optional[float] = None
+        self.refreshed_at: Optional[float] = None
+        self._segments: dict[str, _Segment] = {}
+        self._entries: list[IndexEntry] = []
+        self._name_keys: list[tuple[str, int]] = []
+        self._word_keys: list[tuple[str, int]] = []
+        self._trigrams: dict[str, list[int]] = {}
+        self._refresh_lock = asyncio.Lock()
+        self._refresh_task: Optional[asyncio.Task] = None
+        self.logger = logger.bind(component="metadata_index")
+
+    @property
+    def ready(self) -> bool:
+        """Whether the index has been built."""
+        return self.built_at is not None
+
+    def stats(self) -> dict[str, Any]:
+        """Return index size and age."""
+        now = time.monotonic()
+        counts = Counter(entry.kind for entry in self._entries)
+        return {
+            "entries": len(self._entries),
+            "by_kind": dict(counts),
+            "segments": len(self._segments),
+            "age_seconds": round(now - self.refreshed_at, 1) if self.refreshed_at else None,
+            "refreshing": self._refresh_task is not None and not self._refresh_task.done(),
+        }
+
+    # ------------------------------------------------------------------
+    # Building
+    # ------------------------------------------------------------------
+
+    async def refresh(self, full: bool = False) -> None:
+        """
+        Bring the index up to date with Vault.
+
+        Re-reads the listings, fetches new segments and drops removed ones.
+        Existing segments are re-fetched all at once when full is set (or on
+        the first build), and otherwise refresh_batch at a time, stalest first.
+
+        Args:
+            full: Re-fetch every segment
+        """
+        async with self._refresh_lock:
+            start = time.perf_counter()
+            full = full or not self.ready
+            semaphore = asyncio.Semaphore(self.max_concurrency)
+
+            async def fetch(path: str) -> dict[str, Any]:
+                async with semaphore:
+                    return await self.fetch(path)
+
+            listings = dict(
+                zip(
+                    LISTING_PATHS,
+                    await asyncio.gather(*(fetch(path) for path in LISTING_PATHS.values())),
+                    strict=True,
+                )
+            )
+
+            segments: dict[str, _Segment] = {
+                "document_types": _Segment(_document_type_entries(listings["document_types"])),
+                "document_fields": _Segment(_document_field_entries(listings["document_fields"])),
+            }
+            wanted: dict[str, str] = {}
+
+            for obj in listings["objects"].get("objects") or []:
+                name = obj.get("name")
+                if not name:
+                    continue
+                segments[f"object:{name}"] = _Segment(
+                    [IndexEntry("object", name, obj.get("label") or "")]
+                )
+                wanted[f"fields:{name}"] = f"/metadata/vobjects/{name}"
+
+            for picklist in listings["picklists"].get("picklists") or []:
+                name = picklist.get("name")
+                if not name:
+                    continue
+                segments[f"picklist:{name}"] = _Segment(
+                    [IndexEntry("picklist", name, picklist.get("label") or "")]
+                )
+                if self.include_picklist_values:
+                    wanted[f"values:{name}"] = f"/objects/picklists/{name}"
+
+            # Detail segments: keep current ones unless stale enough to re-fetch
+            existing = {key: self._segments[key] for key in wanted if key in self._segments}
+            to_fetch = [key for key in wanted if key not in existing]
+            if full:
+                to_fetch = list(wanted)
+            else:
+                stalest = sorted(existing, key=lambda key: existing[key].fetched_at)
+                to_fetch += stalest[: self.refresh_batch]
+
+            async def fetch_segment(key: str) -> tuple[str, Optional[_Segment]]:
+                try:
+                    response = await fetch(wanted[key])
+                except Exception as e:
+                    self.logger.warning("metadata_segment_failed", segment=key, error=str(e))
+                    return key, existing.get(key)
+                if key.startswith("fields:"):
+                    return key, _Segment(_field_entries(key[len("fields:"):], response))
+                return key, _Segment(_picklist_value_entries(key[len("values:"):], response))
+
+            fetched = dict(await asyncio.gather(*(fetch_segment(key) for key in to_fetch)))
+            for key in wanted:
+                segment = fetched.get(key) or existing.get(key)
+                if segment is not None:
+                    segments[key] = segment
+
+            self._segments = segments
+            self._rebuild()
+            now = time.monotonic()
+            self.refreshed_at = now
+            if self.built_at is None or full:
+                self.built_at = now
+
+            self.logger.info(
+                "metadata_index_refreshed",
+                full=full,
+                segments=len(segments),
+                fetched=len(to_fetch),
+                entries=len(self._entries),
+                duration_seconds=round(time.perf_counter() - start, 3),
+            )
+
+    def start_background_refresh(self, interval: float) -> None:
+        """
+        Refresh incrementally every ``interval`` seconds until stopped.
+
+        Args:
+            interval: Seconds between refreshes
+        """
+        if self._refresh_task is not None and not self._refresh_task.done():
+            return
+
+        async def loop() -> None:
+            while True:
+                await asyncio.sleep(interval)
+                try:
+                    await self.refresh()
+                except Exception as e:
+                    self.logger.warning("metadata_index_refresh_failed", error=str(e))
+
+        self._refresh_task = asyncio.create_task(loop())
+
+    async def stop(self) -> None:
+        """Stop the background refresh."""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+
+    def _rebuild(self) -> None:
+        """Rebuild the lookup tables from the segments."""
+        entries = [entry for segment in self._segments.values() for entry in segment.entries]
+        name_keys: list[tuple[str, int]] = []
+        word_keys: list[tuple[str, int]] = []
+        trigrams: dict[str, list[int]] = {}
+
+        for i, entry in enumerate(entries):
+            name = entry.name.lower()
+            stem = _stem(name)
+            label = entry.label.lower()
+            for key in {name, stem, label} | set(stem.split("_")):
+                if key:
+                    name_keys.append((key, i))
+            for word in set(label.split()):
+                word_keys.append((word, i))
+            for gram in _trigrams(stem) | _trigrams(label):
+                trigrams.setdefault(gram, []).append(i)
+
+        name_keys.sort()
+        word_keys.sort()
+        self._entries, self._name_keys, self._word_keys, self._trigrams = (
+            entries,
+            name_keys,
+            word_keys,
+            trigrams,
+        )
+
+    # ------------------------------------------------------------------
+    # Searching
+    # ------------------------------------------------------------------
+
+    def search(
+        self,
+        query: str,
+        mode: str = "auto",
+        kinds: Optional[Iterable[str]] = None,
+        parent: Optional[str] = None,
+        limit: int = 20,
+    ) -> list[dict[str, Any]]:
+        """
+        Search the index.
+
+        Args:
+            query: Name, name prefix, label words or misspelling
+            mode: auto (all strategies), prefix, label or fuzzy
+            kinds: Only entries of these kinds
+            parent: Only entries of this object or picklist (or the object itself)
+            limit: Maximum hits
+
+        Returns:
+            Compact hits, best first
+        """
+        text = query.strip().lower()
+        if not text:
+            return []
+        kind_filter = set(kinds) if kinds else None
+        parent = parent.lower() if parent else None
+
+        def allowed(entry: IndexEntry) -> bool:
+            if kind_filter is not None and entry.kind not in kind_filter:
+                return False
+            if parent is not None:
+                owner = entry.parent if entry.parent else entry.name
+                return owner.lower() == parent
+            return True
+
+        scores: dict[int, tuple[float, str]] = {}
+
+        def add(i: int, score: float, match: str) -> None:
+            if score > scores.get(i, (0.0, ""))[0] and allowed(self._entries[i]):
+                scores[i] = (score, match)
+
+        if mode in ("auto", "prefix"):
+            for key, i in _prefix_scan(self._name_keys, text):
+                add(i, 1.0 if key == text else 0.9, "exact" if key == text else "prefix")
+
+        if mode in ("auto", "label"):
+            for i in self._label_matches(text.split()):
+                add(i, 0.8, "label")
+
+        if mode == "fuzzy" or (mode == "auto" and len(scores) < limit):
+            for i, score in self._fuzzy_matches(text):
+                add(i, 0.7 * score, "fuzzy")
+
+        ranked = sorted(
+            scores.items(),
+            key=lambda item: (-item[1][0], KINDS.index(self._entries[item[0]].kind), self._entries[item[0]].name),
+        )
+        return [self._entries[i].to_hit(score, match) for i, (score, match) in ranked[:limit]]
+
+    def _label_matches(self, words: list[str]) -> set[int]:
+        """Entries whose label has a word starting with each query word."""
+        matches: Optional[set[int]] = None
+        for word in words:
+            found = {i for _, i in _prefix_scan(self._word_keys, word)}
+            matches = found if matches is None else matches & found
+            if not matches:
+                return set()
+        return matches or set()
+
+    def _fuzzy_matches(self, text: str) -> list[tuple[int, float]]:
+        """Entries whose name stem or label is similar to the text."""
+        stem = _stem(text)
+        counts: Counter = Counter()
+        for gram in _trigrams(stem):
+            counts.update(self._trigrams.get(gram, ()))
+
+        matches = []
+        for i, _ in counts.most_common(_FUZZY_CANDIDATES):
+            entry = self._entries[i]
+            score = max(
+                SequenceMatcher(None, stem, _stem(entry.name.lower())).ratio(),
+                SequenceMatcher(None, text, entry.label.lower()).ratio(),
+            )
+            if score >= FUZZY_THRESHOLD:
+                matches.append((i, score))
+        return matches
+
+
+def _prefix_scan(keys: list[tuple[str, int]], prefix: str) -> Iterable[tuple[str, int]]:
+    """Yield (key, entry index) pairs whose key starts with prefix."""
+    start = bisect.bisect_left(keys, (prefix, -1))
+    for key, i in keys[start:]:
+        if not key.startswith(prefix):
+            break
+        yield key, i
+
+
+def _stem(name: str) -> str:
+    """Strip the namespace suffix of an API name (product__v -> product)."""
+    return name.split("__", 1)[0]
+
+
+def _trigrams(text: str) -> set[str]:
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def _field_entries(object_name: str, response: dict[str, Any]) -> list[IndexEntry]:
+    obj = response.get("object") or {}
+    return [
+        IndexEntry(
+            "field",
+            f["name"],
+            f.get("label") or "",
+            parent=object_name,
+            type=f.get("type"),
+            picklist=f.get("picklist"),
+        )
+        for f in obj.get("fields") or []
+        if f.get("name")
+    ]
+
+
+def _document_type_entries(response: dict[str, Any]) -> list[IndexEntry]:
+    return [
+        IndexEntry("document_type", t["name"], t.get("label") or "")
+        for t in response.get("types") or []
+        if t.get("name")
+    ]
+
+
+def _document_field_entries(response: dict[str, Any]) -> list[IndexEntry]:
+    return [
+        IndexEntry(
+            "document_field",
+            p["name"],
+            p.get("label") or "",
+            parent="documents",
+            type=p.get("type"),
+        )
+        for p in response.get("properties") or []
+        if p.get("name")
+    ]
+
+
+def _picklist_value_entries(picklist: str, response: dict[str, Any]) -> list[IndexEntry]:
+    return [
+        IndexEntry("picklist_value", v["name"], v.get("label") or "", parent=picklist)
+        for v in response.get("picklistValues") or []
+        if v.get("name")
+    ]
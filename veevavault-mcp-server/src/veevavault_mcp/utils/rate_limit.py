@@ -0,0 +1,85 @@
+"""
+Rate limiting for outbound Veeva Vault API requests.
+"""
+
+import asyncio
+import time
+from typing import Optional
+
+import structlog
+
+from ..config import Config
+
+logger = structlog.get_logger(__name__)
+
+
+class AsyncRateLimiter:
+    """
+    Token bucket shared by every request made through one HTTP client.
+
+    The bucket starts full, so up to ``max_calls`` requests may burst before
+    requests are spaced out evenly over ``period`` seconds. Concurrent
+    fan-out tools therefore cannot exhaust Vault's burst limit on their own.
+    """
+
+    def __init__(self, max_calls: int, period: float):
+        """
+        Initialize rate limiter.
+
+        Args:
+            max_calls: Maximum number of requests per period
+            period: Period length in seconds
+
+        Raises:
+            ValueError: If max_calls or period is not positive
+        """
+        if max_calls < 1 or period <= 0:
+            raise ValueError("max_calls and period must be positive")
+
+        self.max_calls = max_calls
+        self.period = period
+        self._rate = max_calls / period
+        self._tokens = float(max_calls)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> float:
+        """
+        Wait until a request may start.
+
+        Returns:
+            Seconds spent waiting
+        """
+        waited = 0.0
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.max_calls, self._tokens + (now - self._updated) * self._rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    break
+                delay = (1 - self._tokens) / self._rate
+                await asyncio.sleep(delay)
+                waited += delay
+
+        if waited:
+            logger.debug("rate_limit_wait", seconds=round(waited, 3))
+        return waited
+
+
+def create_rate_limiter(config: Config) -> Optional[AsyncRateLimiter]:
+    """
+    Create the outbound rate limiter configured for the server.
+
+    Args:
+        config: Server configuration
+
+    Returns:
+        Rate limiter, or None if rate limiting is disabled
+    """
+    if not config.rate_limit_enabled:
+        return None
+    return AsyncRateLimiter(config.api_rate_limit_calls, config.api_rate_limit_period)
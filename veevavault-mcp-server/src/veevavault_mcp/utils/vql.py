@@ -0,0 +1,717 @@
+"""
+VQL (Vault Query Language) tokenizer, parser and validator.
+
+Queries are parsed locally into a small AST so that syntax errors, unknown
+fields and clause rewrites (LIMIT, PAGESIZE, extra WHERE conditions) are
+handled without a round trip to Vault. Rewrites work on the original query
+text using the spans recorded by the parser, so string literals and
+subqueries are never touched by accident.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional, Union
+
+from .errors import FieldNotFoundError, QuerySyntaxError
+
+KEYWORDS = frozenset(
+    {
+        "SELECT", "FROM", "WHERE", "AND", "OR", "NOT", "IN", "LIKE", "CONTAINS",
+        "BETWEEN", "IS", "NULL", "TRUE", "FALSE", "ORDER", "BY", "ASC", "DESC",
+        "NULLS", "FIRST", "LAST", "FIND", "SCOPE", "MAXROWS", "SKIP", "LIMIT",
+        "OFFSET", "PAGESIZE", "PAGEOFFSET", "ALLVERSIONS", "LATESTVERSION",
+    }
+)
+
+# ORDER BY terms that are not fields of the target, e.g. ORDER BY RANK after FIND
+ORDER_BY_PSEUDO_FIELDS = frozenset({"RANK"})
+
+# Clauses taking a number that may end a query, in any order
+TAIL_CLAUSES = ("MAXROWS", "SKIP", "LIMIT", "OFFSET", "PAGESIZE", "PAGEOFFSET")
+
+_TOKEN_PATTERN = re.compile(
+    r"""
+    (?P<ws>\s+)
+    |(?P<string>'(?:[^'\\]|\\.)*')
+    |(?P<number>-?\d+(?:\.\d+)?)
+    |(?P<ident>[A-Za-z_][A-Za-z0-9_]*(?:\.[A-Za-z_][A-Za-z0-9_]*)*)
+    |(?P<op><=|>=|!=|<>|=|<|>)
+    |(?P<punct>[(),*])
+    """,
+    re.VERBOSE,
+)
+
+
+@dataclass(frozen=True)
+class Token:
+    """One lexical token of a VQL query."""
+
+    kind: str
+    value: str
+    start: int
+    end: int
+
+    @property
+    def keyword(self) -> Optional[str]:
+        """Upper-cased keyword, or None if the token is not a keyword."""
+        if self.kind == "ident" and self.value.upper() in KEYWORDS:
+            return self.value.upper()
+        return None
+
+
+def tokenize(text: str) -> list[Token]:
+    """
+    Split a VQL query into tokens.
+
+    Args:
+        text: VQL query
+
+    Returns:
+        Tokens, ending with an ``eof`` token
+
+    Raises:
+        QuerySyntaxError: If the query contains an unterminated string or unknown character
+    """
+    tokens = []
+    pos = 0
+    while pos < len(text):
+        match = _TOKEN_PATTERN.match(text, pos)
+        if match is None:
+            if text[pos] == "'":
+                raise _syntax_error("Unterminated string literal", text, pos)
+            raise _syntax_error(f"Unexpected character '{text[pos]}'", text, pos)
+        kind = match.lastgroup
+        if kind != "ws":
+            tokens.append(Token(kind, match.group(), pos, match.end()))
+        pos = match.end()
+    tokens.append(Token("eof", "", len(text), len(text)))
+    return tokens
+
+
+# ==========================================
+# AST
+# ==========================================
+
+
+@dataclass
+class Field:
+    """Reference to a field, possibly through relationships (e.g. product__vr.name__v)."""
+
+    name: str
+    start: int
+
+    @property
+    def relationship(self) -> Optional[str]:
+        """First path segment for relationship references, else None."""
+        return self.name.split(".", 1)[0] if "." in self.name else None
+
+
+@dataclass
+class Literal:
+    """String, number, boolean or null value."""
+
+    value: Any
+
+
+@dataclass
+class FunctionCall:
+    """Function such as LONGTEXT(field) or STATETYPE('state')."""
+
+    name: str
+    args: list["Operand"]
+
+
+@dataclass
+class ValueList:
+    """Parenthesized list of values, e.g. for IN and CONTAINS."""
+
+    values: list["Operand"]
+
+
+@dataclass
+class Subquery:
+    """Nested query, in the select list or in an IN condition."""
+
+    query: "VQLQuery"
+
+
+Operand = Union[Field, Literal, FunctionCall, ValueList, Subquery]
+
+
+@dataclass
+class Condition:
+    """Comparison such as ``status__v = 'active__v'`` or ``id IN (...)``."""
+
+    left: Operand
+    operator: str
+    right: Optional[Operand] = None
+    upper: Optional[Operand] = None
+
+
+@dataclass
+class BoolOp:
+    """AND or OR of two or more expressions."""
+
+    operator: str
+    operands: list["Expression"]
+
+
+@dataclass
+class Not:
+    """Negated expression."""
+
+    operand: "Expression"
+
+
+Expression = Union[Condition, BoolOp, Not]
+
+
+@dataclass
+class OrderItem:
+    """One ORDER BY item."""
+
+    expression: Operand
+    direction: str = "ASC"
+
+
+@dataclass
+class VQLQuery:
+    """
+    Parsed VQL query.
+
+    Attributes:
+        text: Query text the query was parsed from
+        select: Select list items
+        target: Query target (object name, documents, relationship for subqueries)
+        version_filter: ALLVERSIONS, if given
+        find: Text of the FIND clause, if any
+        where: WHERE expression, if any
+        order_by: ORDER BY items
+        clauses: Numeric trailing clauses, e.g. {"PAGESIZE": 1000}
+        span: (start, end) of the query in text
+    """
+
+    text: str
+    select: list[Operand]
+    target: str
+    version_filter: Optional[str] = None
+    find: Optional[str] = None
+    where: Optional[Expression] = None
+    order_by: list[OrderItem] = field(default_factory=list)
+    clauses: dict[str, int] = field(default_factory=dict)
+    span: tuple[int, int] = (0, 0)
+    where_span: Optional[tuple[int, int]] = None
+    from_start: int = 0
+    where_insert_at: int = 0
+    order_start: int = 0
+    tail_start: int = 0
+
+    def fields(self) -> list[Field]:
+        """
+        Field references of this query, excluding those inside subqueries.
+
+        Returns:
+            Fields in the select list, WHERE and ORDER BY, in query order.
+            ORDER BY pseudo-fields such as RANK are not included.
+        """
+        refs: list[Field] = []
+        for item in self.select:
+            refs.extend(_operand_fields(item))
+        if self.where is not None:
+            refs.extend(_expression_fields(self.where))
+        for item in self.order_by:
+            refs.extend(
+                ref
+                for ref in _operand_fields(item.expression)
+                if ref.relationship is not None or ref.name.upper() not in ORDER_BY_PSEUDO_FIELDS
+            )
+        return refs
+
+    def subqueries(self) -> list["VQLQuery"]:
+        """Nested queries of the select list and WHERE clause."""
+        found = [item.query for item in self.select if isinstance(item, Subquery)]
+        if self.where is not None:
+            found.extend(_expression_subqueries(self.where))
+        return found
+
+    def with_clause(self, name: str, value: Optional[int]) -> str:
+        """
+        Return the query text with a trailing clause set, replaced or removed.
+
+        Args:
+            name: Clause name (LIMIT, PAGESIZE, MAXROWS, SKIP, OFFSET, PAGEOFFSET)
+            value: Clause value, or None to remove the clause
+
+        Returns:
+            Rewritten VQL
+        """
+        name = name.upper()
+        if name not in TAIL_CLAUSES:
+            raise ValueError(f"Unsupported clause: {name}")
+        clauses = dict(self.clauses)
+        if value is None:
+            clauses.pop(name, None)
+        else:
+            clauses[name] = int(value)
+        head = self.text[self.span[0] : self.tail_start].rstrip()
+        tail = "".join(f" {clause} {number}" for clause, number in clauses.items())
+        return head + tail
+
+    def without_tail(self) -> str:
+        """
+        Return the query text without its ORDER BY and trailing clauses.
+
+        Returns:
+            VQL ending with the WHERE (or FIND, or FROM) clause
+        """
+        return self.text[self.span[0] : self.order_start].rstrip()
+
+    def with_select(self, fields: str) -> str:
+        """
+        Return the query text selecting other fields, without ORDER BY and trailing clauses.
+
+        Args:
+            fields: Select list, e.g. ``id``
+
+        Returns:
+            Rewritten VQL
+        """
+        return f"SELECT {fields} {self.text[self.from_start : self.order_start].rstrip()}"
+
+    def and_where(self, condition: str) -> str:
+        """
+        Return the query text with a condition ANDed to its WHERE clause.
+
+        Args:
+            condition: VQL condition, e.g. ``id >= 'V0B000000000001'``
+
+        Returns:
+            Rewritten VQL
+        """
+        start, end = self.span
+        if self.where_span is None:
+            at = self.where_insert_at
+            return f"{self.text[start:at].rstrip()} WHERE {condition} {self.text[at:end].lstrip()}".rstrip()
+        where_start, where_end = self.where_span
+        return (
+            f"{self.text[start:where_start]}({self.text[where_start:where_end]}) "
+            f"AND {condition}{self.text[where_end:end]}"
+        )
+
+
+# ==========================================
+# Parser
+# ==========================================
+
+
+class _Parser:
+    """Recursive descent parser over VQL tokens."""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = tokenize(text)
+        self.index = 0
+
+    @property
+    def current(self) -> Token:
+        return self.tokens[self.index]
+
+    def peek(self, offset: int = 1) -> Token:
+        return self.tokens[min(self.index + offset, len(self.tokens) - 1)]
+
+    def advance(self) -> Token:
+        token = self.current
+        if token.kind != "eof":
+            self.index += 1
+        return token
+
+    def at_keyword(self, *keywords: str) -> bool:
+        return self.current.keyword in keywords
+
+    def accept_keyword(self, *keywords: str) -> Optional[Token]:
+        if self.at_keyword(*keywords):
+            return self.advance()
+        return None
+
+    def expect_keyword(self, keyword: str) -> Token:
+        if not self.at_keyword(keyword):
+            raise self.error(f"Expected {keyword}")
+        return self.advance()
+
+    def at_punct(self, value: str) -> bool:
+        return self.current.kind == "punct" and self.current.value == value
+
+    def expect_punct(self, value: str) -> Token:
+        if not self.at_punct(value):
+            raise self.error(f"Expected '{value}'")
+        return self.advance()
+
+    def error(self, message: str, token: Optional[Token] = None) -> QuerySyntaxError:
+        token = token or self.current
+        found = "end of query" if token.kind == "eof" else f"'{token.value}'"
+        return _syntax_error(f"{message}, found {found}", self.text, token.start)
+
+    def parse(self) -> VQLQuery:
+        query = self.parse_query()
+        if self.current.kind != "eof":
+            raise self.error("Unexpected text after query")
+        return query
+
+    def parse_query(self) -> VQLQuery:
+        start = self.expect_keyword("SELECT").start
+
+        select = [self.parse_select_item()]
+        while self.at_punct(","):
+            self.advance()
+            select.append(self.parse_select_item())
+
+        from_start = self.expect_keyword("FROM").start
+        version_filter = None
+        if self.at_keyword("ALLVERSIONS"):
+            version_filter = self.advance().keyword
+        target_token = self.current
+        if target_token.kind != "ident" or target_token.keyword:
+            raise self.error("Expected query target after FROM")
+        self.advance()
+
+        query = VQLQuery(
+            text=self.text,
+            select=select,
+            target=target_token.value,
+            version_filter=version_filter,
+        )
+        query.from_start = from_start
+        query.where_insert_at = target_token.end
+
+        if self.at_keyword("FIND"):
+            query.find = self.parse_find()
+            query.where_insert_at = self.tokens[self.index - 1].end
+
+        if self.accept_keyword("WHERE"):
+            where_start = self.current.start
+            query.where = self.parse_expression()
+            query.where_span = (where_start, self.tokens[self.index - 1].end)
+
+        if self.at_keyword("FIND") and query.find is None:
+            query.find = self.parse_find()
+
+        query.order_start = self.current.start
+        if self.at_keyword("ORDER"):
+            self.advance()
+            self.expect_keyword("BY")
+            query.order_by.append(self.parse_order_item())
+            while self.at_punct(","):
+                self.advance()
+                query.order_by.append(self.parse_order_item())
+
+        query.tail_start = self.tokens[self.index - 1].end
+        while self.at_keyword(*TAIL_CLAUSES):
+            clause = self.advance()
+            if clause.keyword in query.clauses:
+                raise self.error(f"Duplicate {clause.keyword} clause", clause)
+            number = self.current
+            if number.kind != "number" or "." in number.value or number.value.startswith("-"):
+                raise self.error(f"Expected a non-negative integer after {clause.keyword}")
+            self.advance()
+            query.clauses[clause.keyword] = int(number.value)
+
+        query.span = (start, self.tokens[self.index - 1].end)
+        return query
+
+    def parse_find(self) -> str:
+        start = self.expect_keyword("FIND").start
+        self.expect_punct("(")
+        depth = 1
+        while depth:
+            token = self.advance()
+            if token.kind == "eof":
+                raise self.error("Unclosed FIND clause", token)
+            if token.kind == "punct" and token.value == "(":
+                depth += 1
+            elif token.kind == "punct" and token.value == ")":
+                depth -= 1
+        return self.text[start : self.tokens[self.index - 1].end]
+
+    def parse_select_item(self) -> Operand:
+        # LATESTVERSION marks fields of the latest version in ALLVERSIONS queries
+        self.accept_keyword("LATESTVERSION")
+        if self.at_punct("*"):
+            raise self.error("VQL does not support SELECT *; list the fields to return")
+        if self.at_punct("(") and self.peek().keyword == "SELECT":
+            return self.parse_subquery()
+        token = self.current
+        if token.kind != "ident" or token.keyword:
+            raise self.error("Expected a field name")
+        return self.parse_operand()
+
+    def parse_subquery(self) -> Subquery:
+        self.expect_punct("(")
+        query = self.parse_query()
+        self.expect_punct(")")
+        return Subquery(query)
+
+    def parse_order_item(self) -> OrderItem:
+        expression = self.parse_operand()
+        direction = "ASC"
+        if self.at_keyword("ASC", "DESC"):
+            direction = self.advance().keyword
+        if self.accept_keyword("NULLS"):
+            if not self.accept_keyword("FIRST", "LAST"):
+                raise self.error("Expected FIRST or LAST after NULLS")
+        return OrderItem(expression, direction)
+
+    def parse_expression(self) -> Expression:
+        operands = [self.parse_and()]
+        while self.accept_keyword("OR"):
+            operands.append(self.parse_and())
+        return operands[0] if len(operands) == 1 else BoolOp("OR", operands)
+
+    def parse_and(self) -> Expression:
+        operands = [self.parse_not()]
+        while self.accept_keyword("AND"):
+            operands.append(self.parse_not())
+        return operands[0] if len(operands) == 1 else BoolOp("AND", operands)
+
+    def parse_not(self) -> Expression:
+        if self.accept_keyword("NOT"):
+            return Not(self.parse_not())
+        if self.at_punct("(") and self.peek().keyword != "SELECT":
+            self.advance()
+            expression = self.parse_expression()
+            self.expect_punct(")")
+            return expression
+        return self.parse_condition()
+
+    def parse_condition(self) -> Condition:
+        left = self.parse_operand()
+        token = self.current
+
+        if token.kind == "op":
+            self.advance()
+            return Condition(left, token.value, self.parse_operand())
+
+        negated = self.accept_keyword("NOT") is not None
+        prefix = "NOT " if negated else ""
+
+        if self.accept_keyword("IN"):
+            if self.at_punct("(") and self.peek().keyword == "SELECT":
+                return Condition(left, prefix + "IN", self.parse_subquery())
+            return Condition(left, prefix + "IN", self.parse_value_list())
+        if self.accept_keyword("LIKE"):
+            return Condition(left, prefix + "LIKE", self.parse_operand())
+        if self.accept_keyword("CONTAINS"):
+            return Condition(left, prefix + "CONTAINS", self.parse_value_list())
+        if self.accept_keyword("BETWEEN"):
+            lower = self.parse_operand()
+            self.expect_keyword("AND")
+            return Condition(left, prefix + "BETWEEN", lower, self.parse_operand())
+        if not negated and self.accept_keyword("IS"):
+            operator = "IS NOT" if self.accept_keyword("NOT") else "IS"
+            self.expect_keyword("NULL")
+            return Condition(left, operator, Literal(None))
+
+        raise self.error("Expected a comparison operator")
+
+    def parse_value_list(self) -> ValueList:
+        self.expect_punct("(")
+        values = [self.parse_operand()]
+        while self.at_punct(","):
+            self.advance()
+            values.append(self.parse_operand())
+        self.expect_punct(")")
+        return ValueList(values)
+
+    def parse_operand(self) -> Operand:
+        token = self.current
+        if token.kind == "string":
+            self.advance()
+            return Literal(_unquote(token.value))
+        if token.kind == "number":
+            self.advance()
+            number = float(token.value) if "." in token.value else int(token.value)
+            return Literal(number)
+        if token.keyword in ("TRUE", "FALSE"):
+            self.advance()
+            return Literal(token.keyword == "TRUE")
+        if token.keyword == "NULL":
+            self.advance()
+            return Literal(None)
+        if token.kind == "ident" and not token.keyword:
+            self.advance()
+            if self.at_punct("("):
+                return self.parse_function(token)
+            return Field(token.value, token.start)
+        raise self.error("Expected a field, value or function")
+
+    def parse_function(self, name: Token) -> FunctionCall:
+        self.expect_punct("(")
+        args: list[Operand] = []
+        if not self.at_punct(")"):
+            args.append(self.parse_operand())
+            while self.at_punct(","):
+                self.advance()
+                args.append(self.parse_operand())
+        self.expect_punct(")")
+        return FunctionCall(name.value.upper(), args)
+
+
+def parse_vql(text: str) -> VQLQuery:
+    """
+    Parse a VQL query.
+
+    Args:
+        text: VQL query
+
+    Returns:
+        Parsed query
+
+    Raises:
+        QuerySyntaxError: If the query is not valid VQL; ``context`` holds the
+            character ``position`` and a ``snippet`` of the query around it
+    """
+    return _Parser(text).parse()
+
+
+def check_fields(
+    query: VQLQuery,
+    field_names: set[str],
+    relationship_names: Optional[set[str]] = None,
+) -> list[FieldNotFoundError]:
+    """
+    Check the field references of a query against the target's metadata.
+
+    Fields inside subqueries are not checked, as they belong to other targets.
+    Relationship paths are checked on their first segment when relationship
+    names are known.
+
+    Args:
+        query: Parsed query
+        field_names: Field names of the query target
+        relationship_names: Relationship names of the query target, if known
+
+    Returns:
+        One error per unknown field or relationship (empty if all are known)
+    """
+    errors = []
+    seen = set()
+    for ref in query.fields():
+        if ref.name in seen:
+            continue
+        seen.add(ref.name)
+        relationship = ref.relationship
+        if relationship is None:
+            if ref.name not in field_names:
+                errors.append(
+                    FieldNotFoundError(
+                        message=f"Unknown field '{ref.name}' on {query.target}",
+                        context={"field": ref.name, "position": ref.start},
+                    )
+                )
+        elif relationship_names and relationship not in relationship_names:
+            errors.append(
+                FieldNotFoundError(
+                    message=f"Unknown relationship '{relationship}' on {query.target}",
+                    context={"field": ref.name, "position": ref.start},
+                )
+            )
+    return errors
+
+
+def metadata_path(target: str, api_version: str) -> Optional[str]:
+    """
+    Metadata endpoint describing the fields of a query target.
+
+    Args:
+        target: Query target
+        api_version: Vault API version (e.g. v25.2)
+
+    Returns:
+        API path, or None for targets without field metadata (e.g. users, relationships)
+    """
+    if target == "documents":
+        return f"/api/{api_version}/metadata/objects/documents/properties"
+    if re.search(r"__(v|c|sys)$", target):
+        return f"/api/{api_version}/metadata/vobjects/{target}"
+    return None
+
+
+def metadata_names(response: dict[str, Any]) -> tuple[set[str], set[str]]:
+    """
+    Extract field and relationship names from a metadata response.
+
+    Args:
+        response: Response of the endpoint returned by ``metadata_path``
+
+    Returns:
+        (field names, relationship names)
+    """
+    fields: set[str] = set()
+    relationships: set[str] = set()
+
+    if "properties" in response:
+        for prop in response.get("properties") or []:
+            if prop.get("name"):
+                fields.add(prop["name"])
+        return fields, relationships
+
+    obj = response.get("object") or {}
+    for obj_field in obj.get("fields") or []:
+        if obj_field.get("name"):
+            fields.add(obj_field["name"])
+        for key in ("relationship_outbound_name", "relationship_inbound_name"):
+            if obj_field.get(key):
+                relationships.add(obj_field[key])
+    for relationship in obj.get("relationships") or []:
+        if relationship.get("relationship_name"):
+            relationships.add(relationship["relationship_name"])
+    return fields, relationships
+
+
+# ==========================================
+# Helpers
+# ==========================================
+
+
+def _unquote(literal: str) -> str:
+    return re.sub(r"\\(.)", r"\1", literal[1:-1])
+
+
+def _syntax_error(message: str, text: str, position: int) -> QuerySyntaxError:
+    snippet = text[max(0, position - 20) : position + 20]
+    return QuerySyntaxError(
+        message=f"{message} at position {position}",
+        context={"position": position, "snippet": snippet},
+    )
+
+
+def _operand_fields(operand: Operand) -> Iterator[Field]:
+    if isinstance(operand, Field):
+        yield operand
+    elif isinstance(operand, FunctionCall):
+        for arg in operand.args:
+            yield from _operand_fields(arg)
+    elif isinstance(operand, ValueList):
+        for value in operand.values:
+            yield from _operand_fields(value)
+
+
+def _expression_fields(expression: Expression) -> Iterator[Field]:
+    if isinstance(expression, BoolOp):
+        for operand in expression.operands:
+            yield from _expression_fields(operand)
+    elif isinstance(expression, Not):
+        yield from _expression_fields(expression.operand)
+    else:
+        for operand in (expression.left, expression.right, expression.upper):
+            if operand is not None:
+                yield from _operand_fields(operand)
+
+
+def _expression_subqueries(expression: Expression) -> Iterator[VQLQuery]:
+    if isinstance(expression, BoolOp):
+        for operand in expression.operands:
+            yield from _expression_subqueries(operand)
+    elif isinstance(expression, Not):
+        yield from _expression_subqueries(expression.operand)
+    elif isinstance(expression.right, Subquery):
+        yield expression.right.query
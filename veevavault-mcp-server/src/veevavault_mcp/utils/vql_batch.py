@@ -0,0 +1,151 @@
+"""
+Fetching many records by ID with batched VQL IN-lists.
+
+Per-ID GET requests cost one round trip per record, and one query listing
+every ID breaks Vault's 50,000-character VQL limit. The helpers here pack
+IDs into as few ``WHERE id CONTAINS (...)`` queries as fit and run them
+concurrently.
+"""
+
+import asyncio
+from typing import Any, Iterable, Optional, Sequence
+
+import structlog
+
+from .http import VaultHTTPClient
+from .vql_shard import vql_literal
+
+logger = structlog.get_logger(__name__)
+
+# Longest VQL statement Vault accepts
+MAX_VQL_LENGTH = 50000
+
+
+def pack_in_lists(
+    prefix: str,
+    values: Iterable[Any],
+    suffix: str = "",
+    max_length: int = MAX_VQL_LENGTH,
+) -> list[list[Any]]:
+    """
+    Pack values into as few IN-lists as fit the VQL length limit.
+
+    Each batch renders as ``prefix + "(v1,v2,...)" + suffix`` with at most
+    max_length characters. Values keep their order; duplicates are dropped.
+
+    Args:
+        prefix: Query text before the list
+        values: Values for the list
+        suffix: Query text after the list
+        max_length: Maximum statement length
+
+    Returns:
+        Batches of values
+
+    Raises:
+        ValueError: If a single value does not fit the limit
+    """
+    budget = max_length - len(prefix) - len(suffix) - 2
+    batches: list[list[Any]] = []
+    batch: list[Any] = []
+    used = 0
+    seen: set[str] = set()
+    for value in values:
+        key = str(value)
+        if key in seen:
+            continue
+        seen.add(key)
+        size = len(vql_literal(value))
+        if size > budget:
+            raise ValueError(f"Value {value!r} does not fit in a {max_length}-character query")
+        # Every value after the first in a batch is preceded by a comma
+        if batch and used + 1 + size > budget:
+            batches.append(batch)
+            batch, used = [], 0
+        used += size + (1 if batch else 0)
+        batch.append(value)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+async def fetch_by_ids(
+    http_client: VaultHTTPClient,
+    path: str,
+    headers: dict[str, str],
+    target: str,
+    ids: Sequence[Any],
+    fields: Sequence[str] = ("id",),
+    id_field: str = "id",
+    where: Optional[str] = None,
+    max_concurrency: int = 4,
+    max_length: int = MAX_VQL_LENGTH,
+) -> dict[str, Any]:
+    """
+    Fetch records by ID with concurrent batched IN-list queries.
+
+    Args:
+        http_client: HTTP client for API requests
+        path: Query API path (e.g., /api/v25.2/query)
+        headers: Request headers including authorization
+        target: Query target (e.g., documents, product__v)
+        ids: IDs to fetch; ints for documents, strings for object records
+        fields: Fields to select; id_field is always selected
+        id_field: Field the IDs refer to
+        where: Additional VQL condition for every batch
+        max_concurrency: Maximum concurrent queries
+        max_length: Maximum statement length
+
+    Returns:
+        Dictionary with records keyed by str(ID), the missing IDs in request
+        order, and the number of queries run
+    """
+    fields = [id_field] + [f for f in fields if f != id_field]
+    condition = f"({where}) AND " if where else ""
+    prefix = f"SELECT {', '.join(fields)} FROM {target} WHERE {condition}{id_field} CONTAINS "
+    queries = [
+        prefix + "(" + ",".join(vql_literal(v) for v in batch) + ")"
+        for batch in pack_in_lists(prefix, ids, max_length=max_length)
+    ]
+
+    query_headers = {**headers, "Content-Type": "application/x-www-form-urlencoded"}
+    semaphore = asyncio.Semaphore(max(max_concurrency, 1))
+
+    async def fetch_all(vql: str) -> list[dict[str, Any]]:
+        async with semaphore:
+            response = await http_client.post(path=path, headers=query_headers, data={"q": vql})
+            rows = list(response.get("data") or [])
+            next_page = _next_page(response)
+            while next_page:
+                response = await http_client.post(path=next_page, headers=query_headers, data={})
+                rows.extend(response.get("data") or [])
+                next_page = _next_page(response)
+            return rows
+
+    records: dict[str, dict[str, Any]] = {}
+    for rows in await asyncio.gather(*(fetch_all(vql) for vql in queries)):
+        for row in rows:
+            records[str(row.get(id_field))] = row
+
+    missing = []
+    seen: set[str] = set()
+    for value in ids:
+        key = str(value)
+        if key not in records and key not in seen:
+            missing.append(value)
+        seen.add(key)
+
+    logger.info(
+        "vql_batch_fetched",
+        target=target,
+        requested=len(seen),
+        found=len(records),
+        missing=len(missing),
+        queries=len(queries),
+    )
+    return {"records": records, "missing": missing, "batches": len(queries)}
+
+
+def _next_page(response: dict[str, Any]) -> Optional[str]:
+    details = response.get("responseDetails") or {}
+    return details.get("next_page", response.get("next_page"))
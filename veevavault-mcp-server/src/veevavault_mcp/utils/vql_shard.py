@@ -0,0 +1,345 @@
+"""
+Sharded execution of large VQL extracts.
+
+A single VQL cursor is limited by how fast Vault serves its pages. The
+executor here splits one query into disjoint ranges of a monotonic field
+(``id`` by default) and fetches the ranges concurrently.
+"""
+
+import asyncio
+import math
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Optional
+
+import structlog
+
+from .errors import ValidationError
+from .http import VaultHTTPClient
+from .vql import parse_vql
+
+logger = structlog.get_logger(__name__)
+
+# Characters of Vault record IDs and other keys, in ASCII (sort) order
+_DIGITS_UPPER = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+_DIGITS_MIXED = _DIGITS_UPPER + "abcdefghijklmnopqrstuvwxyz"
+
+# Clauses that have no meaning across shards
+UNSHARDABLE_CLAUSES = ("MAXROWS", "SKIP", "LIMIT", "OFFSET", "PAGEOFFSET")
+
+
+def split_range(lower: Any, upper: Any, parts: int) -> list[Any]:
+    """
+    Return boundaries splitting [lower, upper] into roughly equal parts.
+
+    Integers and ISO datetimes are split arithmetically. Other strings, such
+    as object record IDs, are split as numbers in base 36 (or 62 with
+    lowercase letters) after their common prefix.
+
+    Args:
+        lower: Smallest value
+        upper: Largest value
+        parts: Number of parts
+
+    Returns:
+        Ascending boundaries strictly above lower and at most upper; fewer than
+        ``parts - 1`` (possibly none) when the range cannot be split that finely
+    """
+    if parts < 2 or lower is None or upper is None or type(lower) is not type(upper):
+        return []
+    if not lower < upper:
+        return []
+
+    if isinstance(lower, int):
+        return _split_numbers(lower, upper, parts)
+
+    if isinstance(lower, str):
+        lower_time, upper_time = _parse_datetime(lower), _parse_datetime(upper)
+        if lower_time is not None and upper_time is not None:
+            lower_ms = int(lower_time.timestamp() * 1000)
+            upper_ms = int(upper_time.timestamp() * 1000)
+            return [_format_datetime(ms) for ms in _split_numbers(lower_ms, upper_ms, parts)]
+        return _split_strings(lower, upper, parts)
+
+    return []
+
+
+def vql_literal(value: Any) -> str:
+    """Format a value as a VQL literal."""
+    if isinstance(value, bool):
+        return str(value).lower()
+    if isinstance(value, (int, float)):
+        return str(value)
+    escaped = str(value).replace("\\", "\\\\").replace("'", "\\'")
+    return f"'{escaped}'"
+
+
+class ShardedVQLExecutor:
+    """
+    Run one large VQL query as many concurrent range queries.
+
+    1. A probe learns the smallest and largest value of the shard field and
+       the total row count (two single-row queries).
+    2. The query is rewritten into disjoint shards with
+       ``WHERE (original) AND field >= a AND field < b``. The first and last
+       shards are open-ended, so rows created after the probe are not missed.
+    3. At most ``max_concurrency`` shard pages are fetched at once; every
+       request goes through the HTTP client's rate limiter.
+    4. Records are yielded as each page arrives, in no particular order.
+    5. A shard whose first page reports more than ``skew_factor`` times its
+       expected rows is split again and its sub-shards are queued instead.
+    """
+
+    def __init__(
+        self,
+        http_client: VaultHTTPClient,
+        path: str,
+        headers: dict[str, str],
+        query: str,
+        shards: int = 8,
+        shard_field: str = "id",
+        page_size: int = 1000,
+        max_concurrency: int = 4,
+        skew_factor: float = 2.0,
+        max_splits: int = 3,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            http_client: HTTP client for API requests
+            path: Query API path (e.g., /api/v25.2/query)
+            headers: Request headers including authorization
+            query: VQL query to run
+            shards: Number of shards to plan
+            shard_field: Monotonic integer, datetime or ID field supporting range comparisons
+            page_size: PAGESIZE of each shard query
+            max_concurrency: Maximum concurrent requests
+            skew_factor: How many times its expected rows a shard may hold before it is split
+            max_splits: How many times a shard may be split again
+
+        Raises:
+            QuerySyntaxError: If the query is not valid VQL
+            ValidationError: If the query cannot be sharded
+        """
+        parsed = parse_vql(query)
+        unsupported = [c for c in UNSHARDABLE_CLAUSES if c in parsed.clauses]
+        if unsupported:
+            raise ValidationError(
+                message=f"Cannot shard a query with {', '.join(unsupported)}",
+                context={"query": query},
+            )
+
+        self.http_client = http_client
+        self.path = path
+        self.headers = headers
+        self.shards = max(shards, 1)
+        self.shard_field = shard_field
+        self.page_size = page_size
+        self.max_concurrency = max(max_concurrency, 1)
+        self.skew_factor = skew_factor
+        self.max_splits = max_splits
+        self.base_query = parsed.without_tail()
+        self.bounds: Optional[tuple[Any, Any]] = None
+        self.total: Optional[int] = None
+        self.stats: dict[str, int] = {}
+        self.logger = logger.bind(shard_field=shard_field)
+
+    async def probe(self) -> tuple[Any, Any, int]:
+        """
+        Learn the range of the shard field and the total row count.
+
+        Returns:
+            (smallest value, largest value, total rows); the values are None if
+            the query matches no rows
+        """
+        probe_query = parse_vql(self.base_query).with_select(self.shard_field)
+
+        first = await self._query(f"{probe_query} ORDER BY {self.shard_field} ASC PAGESIZE 1")
+        rows = first.get("data") or []
+        total = int(_response_detail(first, "total", len(rows)))
+        if not rows:
+            self.bounds, self.total = (None, None), 0
+            return None, None, 0
+
+        last = await self._query(f"{probe_query} ORDER BY {self.shard_field} DESC PAGESIZE 1")
+        lower = rows[0].get(self.shard_field)
+        upper = ((last.get("data") or [{}])[0]).get(self.shard_field)
+
+        self.bounds, self.total = (lower, upper), total
+        self.logger.info("vql_shard_probe", total=total, lower=lower, upper=upper)
+        return lower, upper, total
+
+    async def plan(self) -> list[tuple[Any, Any]]:
+        """
+        Split the probed range into shards.
+
+        Returns:
+            (lower, upper) bounds per shard; lower is inclusive, upper
+            exclusive, and None means unbounded
+        """
+        if self.bounds is None:
+            await self.probe()
+        lower, upper = self.bounds
+        if lower is None:
+            return []
+        edges = [None] + split_range(lower, upper, self.shards) + [None]
+        return list(zip(edges[:-1], edges[1:], strict=True))
+
+    def shard_query(self, lower: Any, upper: Any) -> str:
+        """Return the VQL of the shard with the given bounds."""
+        conditions = []
+        if lower is not None:
+            conditions.append(f"{self.shard_field} >= {vql_literal(lower)}")
+        if upper is not None:
+            conditions.append(f"{self.shard_field} < {vql_literal(upper)}")
+        query = self.base_query
+        if conditions:
+            query = parse_vql(query).and_where(" AND ".join(conditions))
+        return f"{query} PAGESIZE {self.page_size}"
+
+    async def iter_records(self) -> AsyncIterator[dict[str, Any]]:
+        """
+        Run the shards and yield their records as pages arrive.
+
+        Yields:
+            Query records, in no particular order
+        """
+        shards = await self.plan()
+        self.stats = {"shards": len(shards), "splits": 0, "pages": 0, "records": 0}
+        if not shards:
+            return
+
+        expected = max(1, math.ceil(self.total / len(shards)))
+        range_lower, range_upper = self.bounds
+        pending: list[tuple[str, Any, Any, Optional[str], int]] = [
+            ("shard", lower, upper, None, 0) for lower, upper in shards
+        ]
+        in_flight: dict[asyncio.Task, tuple] = {}
+
+        def submit_pending() -> None:
+            while pending and len(in_flight) < self.max_concurrency:
+                task = pending.pop(0)
+                kind, lower, upper, next_page, _ = task
+                if kind == "shard":
+                    coro = self._query(self.shard_query(lower, upper))
+                else:
+                    coro = self._query_page(next_page)
+                in_flight[asyncio.ensure_future(coro)] = task
+
+        try:
+            submit_pending()
+            while in_flight:
+                done, _ = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    kind, lower, upper, _, depth = in_flight.pop(future)
+                    response = future.result()
+                    next_page = _response_detail(response, "next_page")
+
+                    if kind == "shard" and depth < self.max_splits:
+                        shard_total = int(_response_detail(response, "total", 0))
+                        if shard_total > self.skew_factor * expected:
+                            boundaries = [
+                                b
+                                for b in split_range(
+                                    range_lower if lower is None else lower,
+                                    range_upper if upper is None else upper,
+                                    math.ceil(shard_total / expected),
+                                )
+                                if (lower is None or b > lower) and (upper is None or b < upper)
+                            ]
+                            if boundaries:
+                                edges = [lower] + boundaries + [upper]
+                                pending[:0] = [
+                                    ("shard", a, b, None, depth + 1)
+                                    for a, b in zip(edges[:-1], edges[1:], strict=True)
+                                ]
+                                self.stats["splits"] += 1
+                                self.stats["shards"] += len(edges) - 2
+                                self.logger.info(
+                                    "vql_shard_split",
+                                    lower=lower,
+                                    upper=upper,
+                                    shard_total=shard_total,
+                                    parts=len(edges) - 1,
+                                )
+                                submit_pending()
+                                continue
+
+                    if next_page:
+                        pending.insert(0, ("page", lower, upper, next_page, depth))
+                    submit_pending()
+
+                    rows = response.get("data") or []
+                    self.stats["pages"] += 1
+                    self.stats["records"] += len(rows)
+                    for row in rows:
+                        yield row
+        finally:
+            for future in in_flight:
+                future.cancel()
+
+    async def _query(self, vql: str) -> dict[str, Any]:
+        return await self.http_client.post(
+            path=self.path,
+            headers={**self.headers, "Content-Type": "application/x-www-form-urlencoded"},
+            data={"q": vql},
+        )
+
+    async def _query_page(self, next_page: str) -> dict[str, Any]:
+        return await self.http_client.post(
+            path=next_page,
+            headers={**self.headers, "Content-Type": "application/x-www-form-urlencoded"},
+            data={},
+        )
+
+
+def _response_detail(response: dict[str, Any], key: str, default: Any = None) -> Any:
+    """Read a responseDetails value, also accepting it at the top level."""
+    details = response.get("responseDetails") or {}
+    return details.get(key, response.get(key, default))
+
+
+def _split_numbers(lower: int, upper: int, parts: int) -> list[int]:
+    boundaries = {lower + (upper - lower) * i // parts for i in range(1, parts)}
+    return sorted(b for b in boundaries if lower < b <= upper)
+
+
+def _parse_datetime(value: str) -> Optional[datetime]:
+    if len(value) < 10 or value[4:5] != "-":
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _format_datetime(milliseconds: int) -> str:
+    value = datetime.fromtimestamp(milliseconds / 1000, tz=timezone.utc)
+    return value.strftime("%Y-%m-%dT%H:%M:%S.") + f"{value.microsecond // 1000:03d}Z"
+
+
+def _split_strings(lower: str, upper: str, parts: int) -> list[str]:
+    prefix = 0
+    while prefix < min(len(lower), len(upper)) and lower[prefix] == upper[prefix]:
+        prefix += 1
+    width = max(len(lower), len(upper)) - prefix
+    digits = _DIGITS_MIXED if any(c.islower() for c in lower + upper) else _DIGITS_UPPER
+    if width == 0 or any(c not in digits for c in lower[prefix:] + upper[prefix:]):
+        return []
+
+    def to_number(value: str) -> int:
+        number = 0
+        for char in value[prefix:].ljust(width, digits[0]):
+            number = number * len(digits) + digits.index(char)
+        return number
+
+    def to_string(number: int) -> str:
+        chars = []
+        for _ in range(width):
+            number, remainder = divmod(number, len(digits))
+            chars.append(digits[remainder])
+        return lower[:prefix] + "".join(reversed(chars))
+
+    boundaries = [to_string(n) for n in _split_numbers(to_number(lower), to_number(upper), parts)]
+    return [b for b in boundaries if lower < b <= upper]
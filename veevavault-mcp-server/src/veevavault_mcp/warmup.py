@@ -0,0 +1,241 @@
+"""
+Startup warm-up for the VeevaVault MCP Server.
+
+Moves the cost of the first tool call (DNS, TLS handshake, /auth and the
+first metadata lookups) out of the user's request:
+
+1. Open pooled connections to the Vault
+2. Authenticate
+3. Prefetch hot metadata into the response cache
+4. Report readiness
+"""
+
+import asyncio
+import json
+import os
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Optional
+
+import structlog
+
+from .auth.manager import AuthenticationManager
+from .config import Config
+from .utils.errors import APIError
+from .utils.http import VaultHTTPClient
+
+logger = structlog.get_logger(__name__)
+
+API_VERSION = "v25.2"
+
+# Prefetch target -> API path
+PREFETCH_PATHS = {
+    "objects": f"/api/{API_VERSION}/metadata/vobjects",
+    "document_types": f"/api/{API_VERSION}/metadata/objects/documents/types",
+}
+
+
+@dataclass
+class ReadinessReport:
+    """
+    Outcome of the warm-up phase.
+
+    The server is ready when the connection and authentication steps
+    succeeded. Prefetch failures are reported but do not block readiness;
+    those lookups simply go to Vault on first use.
+
+    Attributes:
+        ready: Whether the server can serve tool calls without cold-start cost
+        steps: Step name -> {"status", "duration_seconds", optional "error"}
+        started_at: When warm-up started
+        completed_at: When warm-up finished
+    """
+
+    ready: bool = False
+    steps: dict[str, dict[str, Any]] = field(default_factory=dict)
+    started_at: datetime = field(default_factory=datetime.utcnow)
+    completed_at: Optional[datetime] = None
+
+    REQUIRED_STEPS = ("connect", "authenticate")
+
+    def record(
+        self, step: str, status: str, duration: float, error: Optional[str] = None
+    ) -> None:
+        """Record the outcome of one warm-up step."""
+        entry: dict[str, Any] = {
+            "status": status,
+            "duration_seconds": round(duration, 4),
+        }
+        if error:
+            entry["error"] = error
+        self.steps[step] = entry
+
+    def finish(self) -> None:
+        """Mark warm-up complete and compute readiness."""
+        self.completed_at = datetime.utcnow()
+        self.ready = all(
+            self.steps.get(step, {}).get("status") == "ok"
+            for step in self.REQUIRED_STEPS
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert report to dictionary."""
+        duration = None
+        if self.completed_at:
+            duration = (self.completed_at - self.started_at).total_seconds()
+        return {
+            "ready": self.ready,
+            "started_at": self.started_at.isoformat(),
+            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "duration_seconds": duration,
+            "steps": self.steps,
+        }
+
+
+class ServerWarmup:
+    """
+    Runs the warm-up steps for a server's auth manager and HTTP client.
+    """
+
+    def __init__(
+        self,
+        config: Config,
+        auth_manager: AuthenticationManager,
+        http_client: VaultHTTPClient,
+    ):
+        """
+        Initialize warm-up.
+
+        Args:
+            config: Server configuration (prefetch targets, timeout)
+            auth_manager: Authentication manager to create the session with
+            http_client: HTTP client whose pool and cache are warmed
+        """
+        self.config = config
+        self.auth_manager = auth_manager
+        self.http_client = http_client
+        self.report = ReadinessReport()
+        self.logger = logger.bind(component="warmup")
+
+    async def run(self) -> ReadinessReport:
+        """
+        Run all warm-up steps.
+
+        Never raises; failures and a timeout are recorded in the report.
+
+        Returns:
+            ReadinessReport for this run
+        """
+        self.logger.info("warmup_starting")
+
+        try:
+            await asyncio.wait_for(self._run_steps(), timeout=self.config.warmup_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning("warmup_timed_out", timeout=self.config.warmup_timeout)
+            self.report.record(
+                "timeout",
+                "failed",
+                float(self.config.warmup_timeout),
+                error=f"Warm-up exceeded {self.config.warmup_timeout}s",
+            )
+
+        self.report.finish()
+        self.logger.info(
+            "warmup_complete",
+            ready=self.report.ready,
+            steps={name: step["status"] for name, step in self.report.steps.items()},
+        )
+        return self.report
+
+    async def _run_steps(self) -> None:
+        """Connect and authenticate concurrently, then prefetch metadata."""
+        await asyncio.gather(
+            self._step("connect", self._connect),
+            self._step("authenticate", self._authenticate),
+        )
+
+        if self.report.steps["authenticate"]["status"] != "ok":
+            for name, _ in self._prefetch_steps():
+                self.report.record(name, "skipped", 0.0)
+            return
+
+        await asyncio.gather(*(self._step(name, fn) for name, fn in self._prefetch_steps()))
+
+    async def _step(self, name: str, fn: Callable[[], Awaitable[None]]) -> None:
+        """Run one step and record its outcome."""
+        start = time.perf_counter()
+        try:
+            await fn()
+        except Exception as e:
+            self.report.record(
+                name, "failed", time.perf_counter() - start, error=f"{type(e).__name__}: {e}"
+            )
+            self.logger.warning("warmup_step_failed", step=name, error=str(e))
+        else:
+            self.report.record(name, "ok", time.perf_counter() - start)
+
+    def _prefetch_steps(self) -> list[tuple[str, Callable[[], Awaitable[None]]]]:
+        """Build the prefetch steps configured for this server."""
+        steps = []
+        for target in self.config.warmup_prefetch_targets:
+            steps.append((f"prefetch:{target}", self._prefetch(PREFETCH_PATHS[target])))
+        for picklist in self.config.warmup_picklist_names:
+            path = f"/api/{API_VERSION}/objects/picklists/{picklist}"
+            steps.append((f"prefetch:picklist:{picklist}", self._prefetch(path)))
+        return steps
+
+    async def _connect(self) -> None:
+        """
+        Open a pooled connection (DNS, TCP and TLS) to the Vault.
+
+        Uses the unauthenticated Retrieve API Versions endpoint.
+        """
+        try:
+            await self.http_client.get("/api")
+        except APIError:
+            # Any HTTP response means the connection is open
+            pass
+
+    async def _authenticate(self) -> None:
+        """Create the Vault session."""
+        await self.auth_manager.get_session()
+
+    def _prefetch(self, path: str) -> Callable[[], Awaitable[None]]:
+        """Build a step that GETs ``path`` so its response lands in the cache."""
+
+        async def prefetch() -> None:
+            session = await self.auth_manager.get_session()
+            headers = self.auth_manager.get_auth_headers(session)
+            await self.http_client.get(path, headers=headers)
+
+        return prefetch
+
+
+def write_readiness_file(path: str, report: ReadinessReport) -> None:
+    """
+    Write the readiness report for an exec readiness probe.
+
+    The file is written atomically, and only when the server is ready, so a
+    probe such as ``test -f <path>`` passes exactly when the server is ready.
+
+    Args:
+        path: Readiness file path
+        report: Readiness report to write
+    """
+    if not report.ready:
+        remove_readiness_file(path)
+        return
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(report.to_dict(), f, indent=2)
+    os.replace(tmp_path, path)
+
+
+def remove_readiness_file(path: str) -> None:
+    """Remove the readiness file if it exists."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
@@ -0,0 +1,397 @@
+"""
+Tests for response body decoding, streaming and downloads in VaultHTTPClient.
+"""
+
+import hashlib
+import json
+import time
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock
+
+from veevavault_mcp.utils import jsonlib
+from veevavault_mcp.utils.cache import MemoryCache
+from veevavault_mcp.utils.content_cache import ContentCache
+from veevavault_mcp.utils.errors import APIError, ValidationError, VeevaVaultError
+from veevavault_mcp.utils.http import VaultHTTPClient
+from veevavault_mcp.utils.json_stream import JsonItemParser
+
+
+def make_client(response: httpx.Response) -> VaultHTTPClient:
+    client = VaultHTTPClient("https://test-vault.veevavault.com")
+    client._client = AsyncMock()
+    client._client.request = AsyncMock(return_value=response)
+    return client
+
+
+class TestResponseDecoding:
+    """Tests for content-type aware decoding."""
+
+    @pytest.mark.asyncio
+    async def test_json_body_is_decoded(self):
+        """JSON bodies are decoded into Python objects."""
+        client = make_client(
+            httpx.Response(
+                200,
+                content=b'{"responseStatus": "SUCCESS", "data": [{"id": 1}]}',
+                headers={"Content-Type": "application/json;charset=UTF-8"},
+            )
+        )
+
+        result = await client.get("/api/v25.2/query")
+
+        assert result == {"responseStatus": "SUCCESS", "data": [{"id": 1}]}
+
+    @pytest.mark.asyncio
+    async def test_binary_body_is_not_decoded(self):
+        """Binary bodies are summarized instead of decoded."""
+        client = make_client(
+            httpx.Response(
+                200,
+                content=b"%PDF-1.7 binary",
+                headers={"Content-Type": "application/pdf"},
+            )
+        )
+
+        result = await client.get("/api/v25.2/objects/documents/1/file")
+
+        assert result == {"content_type": "application/pdf", "size": 15}
+
+    @pytest.mark.asyncio
+    async def test_csv_body_is_returned_as_text(self):
+        """CSV bodies are returned as text."""
+        client = make_client(
+            httpx.Response(
+                200, content=b"id,name\n1,a\n", headers={"Content-Type": "text/csv"}
+            )
+        )
+
+        result = await client.get("/api/v25.2/query")
+
+        assert result == {"response": "id,name\n1,a\n"}
+
+    @pytest.mark.asyncio
+    async def test_invalid_json_falls_back_to_text(self):
+        """Bodies that are not valid JSON are returned as text."""
+        client = make_client(
+            httpx.Response(
+                200, content=b"not json", headers={"Content-Type": "application/json"}
+            )
+        )
+
+        assert await client.get("/api/v25.2/query") == {"response": "not json"}
+
+
+class TestResponseCache:
+    """Tests for the metadata response cache."""
+
+    @pytest.mark.asyncio
+    async def test_use_cache_false_refreshes_cached_response(self):
+        """Requests with use_cache=False go to Vault and replace the cached response."""
+        path = "/api/v25.2/metadata/vobjects"
+        client = make_client(
+            httpx.Response(
+                200, content=b'{"objects": [2]}', headers={"Content-Type": "application/json"}
+            )
+        )
+        client.cache = MemoryCache()
+        client.cache.set(client.cache.make_key("GET", path, None), {"objects": [1]})
+
+        assert await client.get(path) == {"objects": [1]}
+        assert await client.get(path, use_cache=False) == {"objects": [2]}
+        assert await client.get(path) == {"objects": [2]}
+        assert client._client.request.await_count == 1
+
+
+class TestJsonBackend:
+    """Tests for JSON backend selection."""
+
+    def teardown_method(self):
+        jsonlib.set_json_backend("auto")
+
+    def test_select_stdlib_backend(self):
+        assert jsonlib.set_json_backend("json") == "json"
+        assert jsonlib.get_json_backend() == "json"
+        assert jsonlib.loads(b'{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_auto_selects_installed_backend(self):
+        assert jsonlib.set_json_backend("auto") in jsonlib.BACKENDS
+
+    def test_unknown_backend_rejected(self):
+        with pytest.raises(ValueError):
+            jsonlib.set_json_backend("simplejson")
+
+    def test_content_kind(self):
+        assert jsonlib.content_kind("application/json") == "json"
+        assert jsonlib.content_kind(None) == "json"
+        assert jsonlib.content_kind("application/octet-stream") == "binary"
+        assert jsonlib.content_kind("text/csv;charset=UTF-8") == "text"
+
+
+class TestJsonItemParser:
+    """Tests for incremental parsing of data items."""
+
+    DOCUMENT = {
+        "responseStatus": "SUCCESS",
+        "responseDetails": {"size": 4, "total": 4},
+        "data": [{"id": 1, "name__v": "é" * 3}, 2.5, [1, [2]], None],
+        "facets": [],
+    }
+
+    @pytest.mark.parametrize("chunk_size", [1, 2, 7, 4096])
+    def test_items_and_envelope(self, chunk_size):
+        """Items are yielded whatever the chunk boundaries."""
+        body = json.dumps(self.DOCUMENT, ensure_ascii=False).encode()
+        parser = JsonItemParser()
+
+        items = []
+        for start in range(0, len(body), chunk_size):
+            items.extend(parser.feed(body[start : start + chunk_size]))
+        items.extend(parser.close())
+
+        assert items == self.DOCUMENT["data"]
+        assert parser.envelope == {
+            "responseStatus": "SUCCESS",
+            "responseDetails": {"size": 4, "total": 4},
+            "facets": [],
+        }
+
+    def test_items_are_yielded_before_the_end(self):
+        """Each item is available as soon as it is complete."""
+        parser = JsonItemParser()
+
+        assert parser.feed(b'{"data": [{"id": 1}, {"id"') == [{"id": 1}]
+        assert parser.feed(b': 2}]}') == [{"id": 2}]
+        assert parser.close() == []
+
+    @pytest.mark.parametrize(
+        "body", [b"[1, 2]", b'{"data": [1, 2}', b'{"data": [1, 2]', b'{"a": 1} x']
+    )
+    def test_invalid_documents_rejected(self, body):
+        parser = JsonItemParser()
+        with pytest.raises(ValueError):
+            parser.feed(body)
+            parser.close()
+
+
+class TestStreamData:
+    """Tests for VaultHTTPClient.stream_data."""
+
+    @staticmethod
+    def make_streaming_client(status_code: int, body: bytes) -> VaultHTTPClient:
+        client = VaultHTTPClient("https://test-vault.veevavault.com")
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url,
+            transport=httpx.MockTransport(
+                lambda request: httpx.Response(
+                    status_code,
+                    content=body,
+                    headers={"Content-Type": "application/json"},
+                )
+            ),
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_streams_data_items(self):
+        body = b'{"responseStatus": "SUCCESS", "responseDetails": {"total": 2}, "data": [{"id": 1}, {"id": 2}]}'
+        client = self.make_streaming_client(200, body)
+
+        stream = client.stream_data("GET", "/api/v25.2/query")
+        items = [item async for item in stream]
+
+        assert items == [{"id": 1}, {"id": 2}]
+        assert stream.response_details == {"total": 2}
+
+    @pytest.mark.asyncio
+    async def test_failure_response_raises(self):
+        body = b'{"responseStatus": "FAILURE", "errors": [{"type": "INVALID_DATA", "message": "Bad VQL"}]}'
+        client = self.make_streaming_client(200, body)
+
+        with pytest.raises(VeevaVaultError):
+            [item async for item in client.stream_data("GET", "/api/v25.2/query")]
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self):
+        body = b'{"responseStatus": "FAILURE", "errors": [{"message": "Not allowed"}]}'
+        client = self.make_streaming_client(403, body)
+
+        with pytest.raises(APIError) as exc_info:
+            [item async for item in client.stream_data("GET", "/api/v25.2/query")]
+        assert exc_info.value.message == "Not allowed"
+
+
+class TestStream:
+    """Tests for VaultHTTPClient.stream."""
+
+    @staticmethod
+    def make_download_client(
+        status_code: int, body: bytes, headers: dict, tmp_path, content_cache=None
+    ) -> tuple[VaultHTTPClient, list]:
+        requests = []
+
+        def respond(request):
+            requests.append(request)
+            return httpx.Response(status_code, content=body, headers=headers)
+
+        client = VaultHTTPClient(
+            "https://test-vault.veevavault.com",
+            content_cache=content_cache,
+            download_dir=str(tmp_path / "downloads"),
+            download_chunk_size=4096,
+        )
+        client._client = httpx.AsyncClient(
+            base_url=client.base_url, transport=httpx.MockTransport(respond)
+        )
+        return client, requests
+
+    @pytest.mark.asyncio
+    async def test_writes_body_to_file(self, tmp_path):
+        """The body is written to disk and summarized, not returned."""
+        body = bytes(range(256)) * 1000
+        client, _ = self.make_download_client(
+            200,
+            body,
+            {"Content-Type": "application/pdf", "Content-Disposition": 'attachment;filename="report.pdf"'},
+            tmp_path,
+        )
+
+        result = await client.stream("/api/v25.2/objects/documents/1/file")
+
+        assert result["filename"] == "report.pdf"
+        assert result["size"] == len(body)
+        assert result["sha256"] == hashlib.sha256(body).hexdigest()
+        assert result["cached"] is False
+        assert open(result["path"], "rb").read() == body
+        assert not list((tmp_path / "downloads").glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_destination_file_and_unsafe_filename(self, tmp_path):
+        """An explicit file wins; directory parts of a reported file name are dropped."""
+        client, _ = self.make_download_client(
+            200,
+            b"data",
+            {"Content-Type": "application/octet-stream", "Content-Disposition": 'attachment;filename="../../evil.txt"'},
+            tmp_path,
+        )
+        downloads = tmp_path / "downloads"
+
+        to_dir = await client.stream("/api/v25.2/objects/documents/1/file", destination="sub/")
+        to_file = await client.stream(
+            "/api/v25.2/objects/documents/1/file", destination=downloads / "out" / "copy.bin"
+        )
+
+        assert to_dir["path"] == str(downloads / "sub" / "evil.txt")
+        assert to_file["path"] == str(downloads / "out" / "copy.bin")
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("destination", ["/etc/passwd", "../escape.bin", "link/escape.bin"])
+    async def test_destination_outside_download_dir_rejected(self, tmp_path, destination):
+        """Destinations that resolve outside download_dir are refused before any request."""
+        client, requests = self.make_download_client(
+            200, b"data", {"Content-Type": "application/octet-stream"}, tmp_path
+        )
+        (tmp_path / "downloads").mkdir()
+        (tmp_path / "downloads" / "link").symlink_to(tmp_path)
+
+        with pytest.raises(ValidationError):
+            await client.stream("/api/v25.2/objects/documents/1/file", destination=destination)
+        assert requests == []
+        assert not (tmp_path / "escape.bin").exists()
+
+    @pytest.mark.asyncio
+    async def test_existing_file_is_not_overwritten(self, tmp_path):
+        """An existing file is kept unless overwrite is set."""
+        client, _ = self.make_download_client(
+            200, b"new", {"Content-Type": "application/octet-stream"}, tmp_path
+        )
+        target = tmp_path / "downloads" / "copy.bin"
+        target.parent.mkdir()
+        target.write_bytes(b"old")
+
+        with pytest.raises(ValidationError):
+            await client.stream("/api/v25.2/objects/documents/1/file", destination="copy.bin")
+        assert target.read_bytes() == b"old"
+
+        await client.stream(
+            "/api/v25.2/objects/documents/1/file", destination="copy.bin", overwrite=True
+        )
+        assert target.read_bytes() == b"new"
+        assert not list(target.parent.glob("*.part"))
+
+    @pytest.mark.asyncio
+    async def test_failure_body_raises(self, tmp_path):
+        """A JSON failure body is raised as an error and nothing is written."""
+        body = b'{"responseStatus": "FAILURE", "errors": [{"type": "INVALID_DATA", "message": "No file"}]}'
+        client, _ = self.make_download_client(
+            200, body, {"Content-Type": "application/json"}, tmp_path
+        )
+
+        with pytest.raises(VeevaVaultError):
+            await client.stream("/api/v25.2/objects/documents/1/file")
+        assert not (tmp_path / "downloads").exists()
+
+    @pytest.mark.asyncio
+    async def test_error_status_raises(self, tmp_path):
+        body = b'{"responseStatus": "FAILURE", "errors": [{"message": "Not allowed"}]}'
+        client, _ = self.make_download_client(
+            403, body, {"Content-Type": "application/json"}, tmp_path
+        )
+
+        with pytest.raises(APIError) as exc_info:
+            await client.stream("/api/v25.2/objects/documents/1/file")
+        assert exc_info.value.message == "Not allowed"
+
+    @pytest.mark.asyncio
+    async def test_cache_key_serves_repeat_downloads(self, tmp_path):
+        """Downloads with a cache key are copied from the content cache the second time."""
+        body = b"%PDF-1.7 " * 5000
+        cache = ContentCache(str(tmp_path / "cache"))
+        client, requests = self.make_download_client(
+            200,
+            body,
+            {"Content-Type": "application/pdf", "Content-Disposition": 'attachment;filename="v1.pdf"'},
+            tmp_path,
+            content_cache=cache,
+        )
+        path = "/api/v25.2/objects/documents/1/versions/1/0/file"
+        key = "/objects/documents/1/versions/1/0/file"
+
+        first = await client.stream(path, cache_key=key)
+        second = await client.stream(path, destination="again.pdf", cache_key=key)
+
+        assert len(requests) == 1
+        assert second["cached"] is True
+        assert second["sha256"] == first["sha256"]
+        assert (tmp_path / "downloads" / "again.pdf").read_bytes() == body
+        assert cache.size() == len(body)
+
+
+class TestContentCache:
+    """Tests for the on-disk content cache."""
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ContentCache(str(tmp_path / "cache"), max_bytes=2500)
+        for name in ("a", "b", "c"):
+            source = tmp_path / name
+            source.write_bytes(name.encode() * 1000)
+            cache.put(name, source, hashlib.sha256(source.read_bytes()).hexdigest(), 1000)
+            time.sleep(0.01)
+
+        assert cache.get("a", tmp_path / "out") is None
+        assert cache.get("c", tmp_path / "out") is not None
+        assert (tmp_path / "out").read_bytes() == b"c" * 1000
+        assert cache.size() == 2000
+
+    def test_identical_content_is_stored_once(self, tmp_path):
+        cache = ContentCache(str(tmp_path / "cache"))
+        source = tmp_path / "file"
+        source.write_bytes(b"same")
+        digest = hashlib.sha256(b"same").hexdigest()
+
+        cache.put("one", source, digest, 4)
+        cache.put("two", source, digest, 4)
+
+        assert cache.size() == 4
+        assert len(list((tmp_path / "cache" / "blobs").rglob("*"))) == 2  # one dir, one blob
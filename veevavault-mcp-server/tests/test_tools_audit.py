@@ -0,0 +1,184 @@
+"""
+Tests for audit trail tools and outbound rate limiting.
+"""
+
+import asyncio
+import time
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from veevavault_mcp.tools.audit import BulkAuditHistoryTool
+from veevavault_mcp.utils.errors import APIError, NotFoundError
+from veevavault_mcp.utils.rate_limit import AsyncRateLimiter, create_rate_limiter
+
+
+@pytest.fixture
+def mock_auth_manager():
+    """Mock authentication manager."""
+    auth_manager = AsyncMock()
+    auth_manager.get_session = AsyncMock(return_value=MagicMock(session_id="test-session"))
+    auth_manager.get_auth_headers = MagicMock(
+        return_value={"Authorization": "test-session"}
+    )
+    return auth_manager
+
+
+@pytest.fixture
+def mock_http_client():
+    """Mock HTTP client."""
+    return AsyncMock()
+
+
+class TestBulkAuditHistoryTool:
+    """Tests for BulkAuditHistoryTool."""
+
+    @pytest.mark.asyncio
+    async def test_merges_paginated_histories(self, mock_auth_manager, mock_http_client):
+        """Every page of every ID is fetched and tagged with its ID."""
+
+        async def get(path, headers=None, params=None):
+            if path.endswith("page2"):
+                return {"data": [{"id": "3"}]}
+            if "/documents/1/" in path:
+                return {
+                    "data": [{"id": "1"}, {"id": "2"}],
+                    "responseDetails": {"next_page": "/api/v25.2/page2"},
+                }
+            return {"data": [{"id": "4"}]}
+
+        mock_http_client.get = AsyncMock(side_effect=get)
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=[1, 2, 2])
+
+        assert result.success
+        assert result.data["counts"] == {"1": 3, "2": 1}
+        assert result.data["count"] == 4
+        assert {r["record_id"] for r in result.data["audit_records"]} == {"1", "2"}
+        assert mock_http_client.get.await_count == 3
+        first_calls = [
+            call
+            for call in mock_http_client.get.await_args_list
+            if call.kwargs["path"].endswith("/objects/documents/1/audittrail")
+        ]
+        assert len(first_calls) == 1
+        assert first_calls[0].kwargs["params"]["limit"] == 1000
+
+    @pytest.mark.asyncio
+    async def test_object_record_paths(self, mock_auth_manager, mock_http_client):
+        """object_name switches to object record audit history."""
+        mock_http_client.get = AsyncMock(return_value={"data": []})
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        await tool.execute(record_ids=["V1"], object_name="product__v", events="Edit")
+
+        call = mock_http_client.get.await_args
+        assert call.kwargs["path"].endswith("/vobjects/product__v/V1/audittrail")
+        assert call.kwargs["params"]["events"] == "Edit"
+
+    @pytest.mark.asyncio
+    async def test_per_id_errors(self, mock_auth_manager, mock_http_client):
+        """Failed IDs are reported without failing the others."""
+
+        async def get(path, headers=None, params=None):
+            if "/documents/9/" in path:
+                raise NotFoundError("Document not found")
+            return {"data": [{"id": "1"}]}
+
+        mock_http_client.get = AsyncMock(side_effect=get)
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=[1, 9])
+
+        assert result.success
+        assert result.data["errors"] == {"9": "Document not found"}
+        assert result.data["counts"] == {"1": 1}
+
+    @pytest.mark.asyncio
+    async def test_all_ids_failed(self, mock_auth_manager, mock_http_client):
+        """The result fails when no history could be retrieved."""
+        mock_http_client.get = AsyncMock(side_effect=APIError("Server error", status_code=500))
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=[1, 2])
+
+        assert not result.success
+        assert set(result.data["errors"]) == {"1", "2"}
+
+    @pytest.mark.asyncio
+    async def test_concurrency_is_bounded(self, mock_auth_manager, mock_http_client):
+        """No more than max_concurrency histories are fetched at once."""
+        active = 0
+        peak = 0
+
+        async def get(path, headers=None, params=None):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return {"data": [{"id": "1"}]}
+
+        mock_http_client.get = AsyncMock(side_effect=get)
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=list(range(20)), max_concurrency=3)
+
+        assert result.data["count"] == 20
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_max_records_truncates(self, mock_auth_manager, mock_http_client):
+        """Merged records are capped at max_records."""
+        mock_http_client.get = AsyncMock(return_value={"data": [{"id": "1"}, {"id": "2"}]})
+
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=[1, 2, 3], max_records=5)
+
+        assert result.data["count"] == 5
+        assert result.data["truncated"] is True
+
+    @pytest.mark.asyncio
+    async def test_too_many_ids(self, mock_auth_manager, mock_http_client):
+        """ID lists over the limit are rejected."""
+        tool = BulkAuditHistoryTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(record_ids=list(range(BulkAuditHistoryTool.MAX_IDS + 1)))
+
+        assert not result.success
+        mock_http_client.get.assert_not_called()
+
+
+class TestAsyncRateLimiter:
+    """Tests for AsyncRateLimiter."""
+
+    @pytest.mark.asyncio
+    async def test_burst_then_paced(self):
+        """The bucket allows a burst, then spaces calls at the configured rate."""
+        limiter = AsyncRateLimiter(max_calls=5, period=0.25)
+
+        start = time.monotonic()
+        for _ in range(5):
+            await limiter.acquire()
+        burst = time.monotonic() - start
+        for _ in range(2):
+            await limiter.acquire()
+        total = time.monotonic() - start
+
+        assert burst < 0.04
+        assert total >= 0.09
+
+    def test_invalid_arguments(self):
+        """Non-positive limits are rejected."""
+        with pytest.raises(ValueError):
+            AsyncRateLimiter(max_calls=0, period=1)
+
+    def test_created_from_config(self, config_username_password):
+        """The limiter follows the configured outbound limit."""
+        limiter = create_rate_limiter(config_username_password)
+
+        assert limiter.max_calls == config_username_password.api_rate_limit_calls
+        assert limiter.period == config_username_password.api_rate_limit_period
+
+        config_username_password.rate_limit_enabled = False
+        assert create_rate_limiter(config_username_password) is None
@@ -8,6 +8,7 @@ from unittest.mock import AsyncMock, MagicMock
 from veevavault_mcp.tools.documents import (
     DocumentsQueryTool,
     DocumentsGetTool,
+    DocumentsGetManyTool,
     DocumentsCreateTool,
     DocumentsUpdateTool,
     DocumentsDeleteTool,
@@ -160,6 +161,25 @@ class TestDocumentsGetTool:
         assert "/documents/123/versions/1/0" in call_args.kwargs["path"]
 
 
+class TestDocumentsGetManyTool:
+    """Tests for DocumentsGetManyTool."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_reports_missing(self, mock_auth_manager, mock_http_client):
+        """Test merged results keyed by ID with missing IDs reported."""
+        mock_http_client.post = AsyncMock(
+            return_value={"data": [{"id": 1, "name__v": "One"}, {"id": 3, "name__v": "Three"}]}
+        )
+
+        tool = DocumentsGetManyTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(document_ids=[1, 2, 3, 3], fields=["id", "name__v"])
+
+        assert result.success
+        assert set(result.data["documents"]) == {"1", "3"}
+        assert result.data["missing"] == [2]
+        query = mock_http_client.post.call_args.kwargs["data"]["q"]
+        assert query == "SELECT id, name__v FROM documents WHERE id CONTAINS (1,2,3)"
+
 class TestDocumentsCreateTool:
     """Tests for DocumentsCreateTool."""
 
@@ -323,26 +343,31 @@ class TestDocumentsDownloadFileTool:
         """Test downloading document file."""
         from veevavault_mcp.tools.documents import DocumentsDownloadFileTool
         
-        mock_http_client.get = AsyncMock(
+        mock_http_client.stream = AsyncMock(
             return_value={
-                "responseStatus": "SUCCESS",
-                "file": "test.pdf",
-                "url": "https://vault.example.com/files/test.pdf",
+                "path": "/tmp/downloads/test.pdf",
+                "filename": "test.pdf",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
             }
         )
 
         tool = DocumentsDownloadFileTool(mock_auth_manager, mock_http_client)
-        result = await tool.execute(document_id=123)
+        result = await tool.execute(document_id=123, save_path="/tmp/downloads/")
 
         assert result.success
         assert result.data["document_id"] == 123
         assert "download_url" in result.data
-        assert "response" in result.data
-        assert result.data["response"]["url"] == "https://vault.example.com/files/test.pdf"
+        assert result.data["file"]["filename"] == "test.pdf"
+        assert result.data["file"]["size"] == 1024
 
-        # Verify correct endpoint
-        call_args = mock_http_client.get.call_args
-        assert "/documents/123/file" in call_args.kwargs["path"]
+        # Verify correct endpoint; the latest version is never cached
+        call_args = mock_http_client.stream.call_args
+        assert call_args.kwargs["path"].endswith("/objects/documents/123/file")
+        assert call_args.kwargs["destination"] == "/tmp/downloads/"
+        assert call_args.kwargs.get("cache_key") is None
 
 
 class TestDocumentsDownloadVersionFileTool:
@@ -353,11 +378,14 @@ class TestDocumentsDownloadVersionFileTool:
         """Test downloading specific version file."""
         from veevavault_mcp.tools.documents import DocumentsDownloadVersionFileTool
         
-        mock_http_client.get = AsyncMock(
+        mock_http_client.stream = AsyncMock(
             return_value={
-                "responseStatus": "SUCCESS",
-                "file": "test_v1.0.pdf",
-                "url": "https://vault.example.com/files/test_v1.0.pdf",
+                "path": "/tmp/downloads/test_v1.0.pdf",
+                "filename": "test_v1.0.pdf",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
             }
         )
 
@@ -368,12 +396,12 @@ class TestDocumentsDownloadVersionFileTool:
         assert result.data["document_id"] == 123
         assert result.data["version"] == "1.0"
         assert "download_url" in result.data
-        assert "response" in result.data
-
-        # Verify correct endpoint
-        call_args = mock_http_client.get.call_args
-        assert "/documents/123/versions/1/0/file" in call_args.kwargs["path"]
+        assert result.data["file"]["filename"] == "test_v1.0.pdf"
 
+        # Verify correct endpoint and that the version is cacheable
+        call_args = mock_http_client.stream.call_args
+        assert "/objects/documents/123/versions/1/0/file" in call_args.kwargs["path"]
+        assert call_args.kwargs["cache_key"] == "/objects/documents/123/versions/1/0/file"
 
 class TestDocumentsBatchCreateTool:
     """Tests for DocumentsBatchCreateTool."""
@@ -726,10 +754,14 @@ class TestDocumentsAttachmentsDownloadTool:
         """Test downloading document attachment."""
         from veevavault_mcp.tools.documents import DocumentsAttachmentsDownloadTool
         
-        mock_http_client.get = AsyncMock(
+        mock_http_client.stream = AsyncMock(
             return_value={
-                "responseStatus": "SUCCESS",
-                "file": "data.xlsx",
+                "path": "/tmp/downloads/data.xlsx",
+                "filename": "data.xlsx",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
             }
         )
 
@@ -739,11 +771,11 @@ class TestDocumentsAttachmentsDownloadTool:
         assert result.success
         assert result.data["attachment_id"] == "A001"
         assert "download_url" in result.data
+        assert result.data["file"]["filename"] == "data.xlsx"
 
         # Verify correct endpoint
-        call_args = mock_http_client.get.call_args
-        assert "/objects/documents/123/attachments/A001" in call_args.kwargs["path"]
-
+        call_args = mock_http_client.stream.call_args
+        assert "/objects/documents/123/attachments/A001/file" in call_args.kwargs["path"]
 
 class TestDocumentsAttachmentsDeleteTool:
     """Tests for DocumentsAttachmentsDeleteTool."""
@@ -857,10 +889,14 @@ class TestDocumentsRenditionsDownloadTool:
         """Test downloading document rendition."""
         from veevavault_mcp.tools.documents import DocumentsRenditionsDownloadTool
         
-        mock_http_client.get = AsyncMock(
+        mock_http_client.stream = AsyncMock(
             return_value={
-                "responseStatus": "SUCCESS",
-                "file": "document.pdf",
+                "path": "/tmp/downloads/document.pdf",
+                "filename": "document.pdf",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
             }
         )
 
@@ -870,11 +906,53 @@ class TestDocumentsRenditionsDownloadTool:
         assert result.success
         assert result.data["rendition_type"] == "pdf"
         assert "download_url" in result.data
+        assert result.data["file"]["filename"] == "document.pdf"
 
-        # Verify correct endpoint
-        call_args = mock_http_client.get.call_args
-        assert "/objects/documents/123/renditions/pdf/file" in call_args.kwargs["path"]
+        # Verify correct endpoint; the latest version is never cached
+        call_args = mock_http_client.stream.call_args
+        assert call_args.kwargs["path"].endswith("/objects/documents/123/renditions/pdf")
+        assert call_args.kwargs["cache_key"] is None
+
+    @pytest.mark.asyncio
+    async def test_download_version_rendition(self, mock_auth_manager, mock_http_client):
+        """Test downloading a rendition of a specific version."""
+        from veevavault_mcp.tools.documents import DocumentsRenditionsDownloadTool
 
+        mock_http_client.stream = AsyncMock(
+            return_value={
+                "path": "/tmp/downloads/document.pdf",
+                "filename": "document.pdf",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
+            }
+        )
+
+        tool = DocumentsRenditionsDownloadTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(
+            document_id=123, rendition_type="viewable_rendition__v", doc_version="2.1"
+        )
+
+        assert result.success
+        call_args = mock_http_client.stream.call_args
+        expected = "/objects/documents/123/versions/2/1/renditions/viewable_rendition__v"
+        assert call_args.kwargs["path"].endswith(expected)
+        assert call_args.kwargs["cache_key"] == expected
+
+    @pytest.mark.asyncio
+    async def test_invalid_doc_version(self, mock_auth_manager, mock_http_client):
+        """Test that a malformed doc_version is rejected without a request."""
+        from veevavault_mcp.tools.documents import DocumentsRenditionsDownloadTool
+
+        mock_http_client.stream = AsyncMock()
+
+        tool = DocumentsRenditionsDownloadTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(document_id=123, rendition_type="pdf", doc_version="latest")
+
+        assert not result.success
+        assert "doc_version" in result.error
+        mock_http_client.stream.assert_not_called()
 
 class TestDocumentsRenditionsDeleteTool:
     """Tests for DocumentsRenditionsDeleteTool."""
@@ -112,10 +112,14 @@ class TestFileStagingDownloadTool:
     @pytest.mark.asyncio
     async def test_download_file_success(self, mock_auth_manager, mock_http_client):
         """Test downloading file from staging."""
-        mock_http_client.get = AsyncMock(
+        mock_http_client.stream = AsyncMock(
             return_value={
-                "responseStatus": "SUCCESS",
-                "file": "test.pdf",
+                "path": "/tmp/downloads/test.pdf",
+                "filename": "test.pdf",
+                "size": 1024,
+                "sha256": "ab" * 32,
+                "content_type": "application/pdf",
+                "cached": False,
             }
         )
 
@@ -125,11 +129,11 @@ class TestFileStagingDownloadTool:
         assert result.success
         assert result.data["staging_path"] == "u123/test.pdf"
         assert "download_url" in result.data
+        assert result.data["file"]["size"] == 1024
 
         # Verify correct endpoint
-        call_args = mock_http_client.get.call_args
-        assert "/services/file_staging/u123/test.pdf" in call_args.kwargs["path"]
-
+        call_args = mock_http_client.stream.call_args
+        assert "/services/file_staging/items/content/u123/test.pdf" in call_args.kwargs["path"]
 
 class TestFileStagingDeleteTool:
     """Tests for FileStagingDeleteTool."""
@@ -0,0 +1,164 @@
+"""
+Tests for metadata tools.
+"""
+
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+
+from veevavault_mcp.tools.metadata import MetadataSearchTool
+from veevavault_mcp.utils.metadata_index import MetadataIndex
+
+
+METADATA = {
+    "/api/v25.2/metadata/vobjects": {
+        "objects": [
+            {"name": "product__v", "label": "Product"},
+            {"name": "study_country__v", "label": "Study Country"},
+        ]
+    },
+    "/api/v25.2/metadata/vobjects/product__v": {
+        "object": {
+            "fields": [
+                {"name": "name__v", "label": "Product Name", "type": "String"},
+                {"name": "product_family__c", "label": "Product Family", "type": "Picklist",
+                 "picklist": "product_family__c"},
+                {"name": "lifecycle_state__v", "label": "Lifecycle State", "type": "Component"},
+            ]
+        }
+    },
+    "/api/v25.2/metadata/vobjects/study_country__v": {
+        "object": {
+            "fields": [{"name": "country__v", "label": "Country", "type": "Object"}],
+        }
+    },
+    "/api/v25.2/metadata/objects/documents/types": {
+        "types": [{"name": "protocol__c", "label": "Protocol"}]
+    },
+    "/api/v25.2/metadata/objects/documents/properties": {
+        "properties": [{"name": "title__v", "label": "Title", "type": "String"}]
+    },
+    "/api/v25.2/objects/picklists": {
+        "picklists": [{"name": "product_family__c", "label": "Product Family"}]
+    },
+    "/api/v25.2/objects/picklists/product_family__c": {
+        "picklistValues": [{"name": "oncology__c", "label": "Oncology"}]
+    },
+}
+
+
+@pytest.fixture
+def mock_auth_manager():
+    """Mock authentication manager."""
+    auth_manager = AsyncMock()
+    auth_manager.get_session = AsyncMock(return_value=MagicMock(session_id="test-session"))
+    auth_manager.get_auth_headers = MagicMock(
+        return_value={"Authorization": "test-session"}
+    )
+    return auth_manager
+
+
+@pytest.fixture
+def mock_http_client():
+    """Mock HTTP client serving the metadata above."""
+    http_client = AsyncMock()
+    http_client.get = AsyncMock(side_effect=lambda path, headers, **kwargs: METADATA[path])
+    return http_client
+
+
+class TestMetadataSearchTool:
+    """Tests for MetadataSearchTool."""
+
+    @pytest.mark.asyncio
+    async def test_search_builds_index_once(self, mock_auth_manager, mock_http_client):
+        """Test that the index is built on first use and reused."""
+        tool = MetadataSearchTool(mock_auth_manager, mock_http_client)
+        try:
+            first = await tool.execute(query="product")
+            calls = mock_http_client.get.call_count
+            second = await tool.execute(query="country")
+        finally:
+            await tool.close()
+
+        assert first.success and second.success
+        assert calls == len(METADATA)
+        assert mock_http_client.get.call_count == calls
+        assert first.data["hits"][0] == {
+            "kind": "object",
+            "name": "product__v",
+            "label": "Product",
+            "score": 1.0,
+            "match": "exact",
+        }
+        assert first.metadata["index"]["entries"] == 10
+
+    @pytest.mark.asyncio
+    async def test_search_modes_and_filters(self, mock_auth_manager, mock_http_client):
+        """Test prefix, label, fuzzy and filtered searches."""
+        tool = MetadataSearchTool(mock_auth_manager, mock_http_client)
+        try:
+            prefix = await tool.execute(query="prod", mode="prefix", kinds=["field"])
+            label = await tool.execute(query="study cou", mode="label")
+            fuzzy = await tool.execute(query="lifecyle stat", mode="fuzzy")
+            values = await tool.execute(query="onc", parent="product_family__c")
+        finally:
+            await tool.close()
+
+        # Names and labels both match prefixes ("Product Name")
+        assert {h["name"] for h in prefix.data["hits"]} == {"name__v", "product_family__c"}
+        assert prefix.data["hits"][1]["picklist"] == "product_family__c"
+        assert [h["name"] for h in label.data["hits"]] == ["study_country__v"]
+        assert fuzzy.data["hits"][0]["name"] == "lifecycle_state__v"
+        assert fuzzy.data["hits"][0]["parent"] == "product__v"
+        assert [(h["kind"], h["name"]) for h in values.data["hits"]] == [
+            ("picklist_value", "oncology__c")
+        ]
+
+    @pytest.mark.asyncio
+    async def test_refresh_bypasses_response_cache(self, mock_auth_manager, mock_http_client):
+        """Test that only the first build may be served from the response cache."""
+        tool = MetadataSearchTool(mock_auth_manager, mock_http_client)
+        try:
+            await tool.execute(query="product")
+            calls = mock_http_client.get.call_count
+            await tool.execute(query="product", refresh=True)
+        finally:
+            await tool.close()
+
+        use_cache = [c.kwargs["use_cache"] for c in mock_http_client.get.call_args_list]
+        assert use_cache[:calls] == [True] * calls
+        assert use_cache[calls:] and not any(use_cache[calls:])
+
+
+class TestMetadataIndex:
+    """Tests for incremental index refresh."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_refresh(self):
+        """Test that refresh picks up new objects and drops removed ones."""
+        metadata = {path[len("/api/v25.2"):]: value for path, value in METADATA.items()}
+        fetched = []
+
+        async def fetch(path):
+            fetched.append(path)
+            return metadata[path]
+
+        index = MetadataIndex(fetch, refresh_batch=0)
+        await index.refresh()
+        assert index.search("study_country__v")
+
+        metadata["/metadata/vobjects"] = {
+            "objects": [
+                {"name": "product__v", "label": "Product"},
+                {"name": "site__v", "label": "Site"},
+            ]
+        }
+        metadata["/metadata/vobjects/site__v"] = {
+            "object": {"fields": [{"name": "site_number__v", "label": "Site Number"}]}
+        }
+        fetched.clear()
+        await index.refresh()
+
+        assert "/metadata/vobjects/product__v" not in fetched
+        assert "/metadata/vobjects/site__v" in fetched
+        assert not index.search("study_country__v", mode="prefix")
+        assert index.search("site num", mode="label")[0]["name"] == "site_number__v"
@@ -2,12 +2,15 @@
 Tests for object management tools.
 """
 
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
 from veevavault_mcp.tools.objects import (
     ObjectsQueryTool,
     ObjectsGetTool,
+    ObjectsGetManyTool,
     ObjectsCreateTool,
     ObjectsUpdateTool,
 )
@@ -154,6 +157,36 @@ class TestObjectsGetTool:
         assert result.metadata["record_id"] == "456"
 
 
+class TestObjectsGetManyTool:
+    """Tests for ObjectsGetManyTool."""
+
+    @pytest.mark.asyncio
+    async def test_get_many_packs_ids_under_vql_limit(self, mock_auth_manager, mock_http_client):
+        """Test that IDs are batched under 50,000 characters and merged by ID."""
+        queries = []
+
+        async def post(path, headers, data):
+            queries.append(data["q"])
+            ids = re.findall(r"'([^']+)'", data["q"])
+            return {"data": [{"id": i, "name__v": f"Product {i}"} for i in ids if not i.endswith("7")]}
+
+        mock_http_client.post = AsyncMock(side_effect=post)
+        record_ids = [f"V0P{n:012d}" for n in range(10000)]
+
+        tool = ObjectsGetManyTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(object_name="product__v", record_ids=record_ids, fields=["name__v"])
+
+        assert result.success
+        assert len(queries) == 4
+        assert all(len(q) <= 50000 for q in queries)
+        assert queries[0].startswith("SELECT id, name__v FROM product__v WHERE id CONTAINS (")
+        assert result.data["count"] == 9000
+        assert result.data["records"]["V0P000000000001"]["name__v"] == "Product V0P000000000001"
+        assert len(result.data["missing"]) == 1000
+        assert result.data["missing"][0] == "V0P000000000007"
+        assert result.metadata["queries"] == 4
+
+
 class TestObjectsCreateTool:
     """Tests for ObjectsCreateTool."""
 
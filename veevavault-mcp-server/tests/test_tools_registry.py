@@ -0,0 +1,129 @@
+"""
+Tests for the tool registry and lazy tool loading in the server.
+"""
+
+import pytest
+
+from veevavault_mcp.server import VeevaVaultMCPServer
+from veevavault_mcp.tools.base import BaseTool
+from veevavault_mcp.tools.registry import (
+    TOOL_CLASSES,
+    ToolSpec,
+    build_tool_specs,
+    load_tool_specs,
+    write_manifest,
+)
+from veevavault_mcp.tools.vql import VQLExecuteTool
+
+
+class TestToolRegistry:
+    """Tests for the tool manifest and specs."""
+
+    def test_manifest_is_up_to_date(self):
+        """The checked-in manifest must match the tool classes."""
+        assert load_tool_specs() == build_tool_specs(), (
+            "tools/manifest.json is stale; run "
+            "'python -m veevavault_mcp.tools.registry' to regenerate it"
+        )
+
+    def test_manifest_covers_every_tool_class(self):
+        """Every registered class appears exactly once with a unique name."""
+        specs = load_tool_specs()
+        expected = sum(len(classes) for classes in TOOL_CLASSES.values())
+
+        assert len(specs) == expected
+        assert len({spec.name for spec in specs}) == expected
+
+    def test_spec_loads_tool_class(self):
+        """Specs resolve to the class that reports the same name."""
+        spec = next(s for s in load_tool_specs() if s.name == "vault_vql_execute")
+
+        tool_class = spec.load_class()
+
+        assert tool_class is VQLExecuteTool
+        assert tool_class(None, None).name == spec.name
+
+    def test_spec_round_trip(self):
+        """Specs survive conversion to and from manifest entries."""
+        spec = ToolSpec(
+            name="vault_example",
+            module="vql",
+            class_name="VQLExecuteTool",
+            description="Example",
+            input_schema={"type": "object"},
+        )
+
+        assert ToolSpec.from_dict(spec.to_dict()) == spec
+
+    def test_missing_manifest_falls_back_to_classes(self, tmp_path):
+        """Without a manifest, specs are built from the tool classes."""
+        specs = load_tool_specs(tmp_path / "missing.json")
+
+        assert specs == build_tool_specs()
+
+    def test_write_manifest(self, tmp_path):
+        """Written manifests load back to the same specs."""
+        path = tmp_path / "manifest.json"
+
+        written = write_manifest(path)
+
+        assert load_tool_specs(path) == written
+
+
+class TestServerToolLoading:
+    """Tests for lazy tool instantiation and cached descriptors."""
+
+    @pytest.fixture
+    def server(self, config_username_password):
+        server = VeevaVaultMCPServer(config_username_password)
+        server._register_tools()
+        return server
+
+    def test_register_tools_does_not_instantiate(self, server):
+        """Registration only records specs."""
+        assert len(server.tool_specs) == len(load_tool_specs())
+        assert server.tools == {}
+
+    def test_get_tool_instantiates_once(self, server):
+        """Tools are created on first lookup and then reused."""
+        tool = server.get_tool("vault_vql_execute")
+
+        assert isinstance(tool, VQLExecuteTool)
+        assert server.get_tool("vault_vql_execute") is tool
+        assert list(server.tools) == ["vault_vql_execute"]
+
+    def test_get_unknown_tool(self, server):
+        """Unknown tool names return None."""
+        assert server.get_tool("vault_does_not_exist") is None
+
+    def test_tool_descriptors_are_cached(self, server):
+        """Descriptors are built once and match the specs."""
+        descriptors = server.get_tool_descriptors()
+
+        assert server.get_tool_descriptors() is descriptors
+        assert [d.name for d in descriptors] == list(server.tool_specs)
+        assert server.tools == {}
+
+    def test_register_tool_adds_descriptor(self, server):
+        """Tools registered directly are listed and instantiated immediately."""
+
+        class ExtraTool(BaseTool):
+            @property
+            def name(self) -> str:
+                return "vault_extra"
+
+            @property
+            def description(self) -> str:
+                return "Extra tool"
+
+            def get_parameters_schema(self) -> dict:
+                return {"type": "object", "properties": {}}
+
+            async def execute(self, **kwargs):
+                return None
+
+        server.get_tool_descriptors()
+        server._register_tool(ExtraTool)
+
+        assert isinstance(server.get_tool("vault_extra"), ExtraTool)
+        assert "vault_extra" in [d.name for d in server.get_tool_descriptors()]
@@ -2,6 +2,8 @@
 Tests for VQL execution tools.
 """
 
+import re
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -10,7 +12,10 @@ from veevavault_mcp.tools.vql import (
     VQLValidateTool,
 )
 from veevavault_mcp.tools.base import ToolResult
-from veevavault_mcp.utils.errors import APIError
+from veevavault_mcp.utils.cache import MemoryCache
+from veevavault_mcp.utils.errors import APIError, QuerySyntaxError
+from veevavault_mcp.utils.vql import check_fields, parse_vql
+from veevavault_mcp.utils.vql_shard import ShardedVQLExecutor, split_range
 
 
 @pytest.fixture
@@ -121,21 +126,49 @@ class TestVQLExecuteTool:
         assert result.metadata["error_code"] == "MALFORMED_URL"
 
 
+    @pytest.mark.asyncio
+    async def test_execute_vql_syntax_error_not_sent(self, mock_auth_manager, mock_http_client):
+        """Malformed queries are rejected locally."""
+        tool = VQLExecuteTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(query="SELECT id FROM documents WHERE")
+
+        assert not result.success
+        assert "VQL query failed" in result.error
+        mock_http_client.post.assert_not_called()
+
+
+    @pytest.mark.asyncio
+    async def test_execute_vql_unknown_cached_field_not_sent(
+        self, mock_auth_manager, mock_http_client
+    ):
+        """Unknown fields are rejected when the target's metadata is cached."""
+        cache = MemoryCache()
+        cache.set(
+            cache.make_key("GET", "/api/v25.2/metadata/objects/documents/properties"),
+            {"properties": [{"name": "id"}]},
+        )
+        mock_http_client.cache = cache
+
+        tool = VQLExecuteTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(query="SELECT id, nmae__v FROM documents")
+
+        assert not result.success
+        assert "Unknown field 'nmae__v'" in result.error
+        mock_http_client.post.assert_not_called()
+
+
 class TestVQLValidateTool:
     """Tests for VQLValidateTool."""
 
+    DOCUMENT_PROPERTIES = {
+        "responseStatus": "SUCCESS",
+        "properties": [{"name": "id"}, {"name": "name__v"}, {"name": "type__v"}],
+    }
+
     @pytest.mark.asyncio
     async def test_validate_vql_success(self, mock_auth_manager, mock_http_client):
-        """Test successful VQL validation."""
-        mock_http_client.post = AsyncMock(
-            return_value={
-                "responseStatus": "SUCCESS",
-                "data": [],
-                "responseDetails": {},
-                "total": 3,
-                "pagesize": 100,
-            }
-        )
+        """Valid queries are checked locally and against metadata, never executed."""
+        mock_http_client.get = AsyncMock(return_value=self.DOCUMENT_PROPERTIES)
 
         tool = VQLValidateTool(mock_auth_manager, mock_http_client)
         result = await tool.execute(
@@ -145,55 +178,168 @@ class TestVQLValidateTool:
         assert result.success
         assert result.data["valid"] is True
         assert result.data["query"] == "SELECT id, name__v FROM documents WHERE type__v = 'protocol__c'"
-        assert result.data["message"] == "Query syntax is valid"
+        assert result.data["target"] == "documents"
+        assert result.data["fields_checked"] is True
+        assert result.data["message"] == "Query syntax and fields are valid"
 
-        # Verify validation used LIMIT 0
-        call_args = mock_http_client.post.call_args
-        executed_query = call_args.kwargs["data"]["q"]
-        assert "LIMIT 0" in executed_query
+        mock_http_client.post.assert_not_called()
+        call_args = mock_http_client.get.call_args
+        assert call_args.kwargs["path"].endswith("/metadata/objects/documents/properties")
 
     @pytest.mark.asyncio
-    async def test_validate_vql_removes_existing_limit(self, mock_auth_manager, mock_http_client):
-        """Test that validation removes existing LIMIT clause."""
-        mock_http_client.post = AsyncMock(
-            return_value={"responseStatus": "SUCCESS", "data": [], "responseDetails": {}}
-        )
-
+    async def test_validate_vql_syntax_only(self, mock_auth_manager, mock_http_client):
+        """check_fields=False validates offline."""
         tool = VQLValidateTool(mock_auth_manager, mock_http_client)
         result = await tool.execute(
-            query="SELECT id FROM documents LIMIT 100"
+            query="SELECT id FROM documents LIMIT 100", check_fields=False
         )
 
         assert result.success
-
-        # Verify original LIMIT was removed and replaced with LIMIT 0
-        call_args = mock_http_client.post.call_args
-        executed_query = call_args.kwargs["data"]["q"]
-        assert "LIMIT 0" in executed_query
-        assert "LIMIT 100" not in executed_query
+        assert result.data["message"] == "Query syntax is valid"
+        assert result.data["clauses"] == {"LIMIT": 100}
+        mock_http_client.get.assert_not_called()
+        mock_http_client.post.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_validate_vql_syntax_error(self, mock_auth_manager, mock_http_client):
-        """Test VQL validation with syntax error."""
-        # Mock an APIError being raised for invalid syntax
-        async def raise_api_error(*args, **kwargs):
-            raise APIError(
-                message="Invalid field name: invalid_field",
-                error_code="MALFORMED_URL",
-                status_code=400
-            )
+        """Syntax errors are reported with their position without calling Vault."""
+        tool = VQLValidateTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(query="SELECT id name__v FROM documents")
 
-        mock_http_client.post = AsyncMock(side_effect=raise_api_error)
+        assert not result.success
+        assert "Query validation failed" in result.error
+        assert result.data["valid"] is False
+        assert result.data["query"] == "SELECT id name__v FROM documents"
+        assert result.data["errors"][0]["position"] == 10
+        assert result.metadata["validation"] == "failed"
+        mock_http_client.get.assert_not_called()
+        mock_http_client.post.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_validate_vql_unknown_field(self, mock_auth_manager, mock_http_client):
+        """Fields missing from the target's metadata are reported."""
+        mock_http_client.get = AsyncMock(return_value=self.DOCUMENT_PROPERTIES)
 
         tool = VQLValidateTool(mock_auth_manager, mock_http_client)
         result = await tool.execute(query="SELECT invalid_field FROM documents")
 
         assert not result.success
-        assert "Query validation failed" in result.error
         assert result.data["valid"] is False
-        assert result.data["query"] == "SELECT invalid_field FROM documents"
-        assert "Invalid field name" in result.data["error"]
-        assert result.metadata["validation"] == "failed"
+        assert "Unknown field 'invalid_field'" in result.data["error"]
+        assert result.metadata["error_code"] == "ATTRIBUTE_NOT_SUPPORTED"
+
+    @pytest.mark.asyncio
+    async def test_validate_vql_find_order_by_rank(self, mock_auth_manager, mock_http_client):
+        """ORDER BY RANK in a FIND query is not reported as an unknown field."""
+        mock_http_client.get = AsyncMock(return_value=self.DOCUMENT_PROPERTIES)
+
+        tool = VQLValidateTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(
+            query="SELECT id, name__v FROM documents FIND ('abc') ORDER BY RANK"
+        )
+
+        assert result.success
+        assert result.data["valid"] is True
+        assert result.data["fields_checked"] is True
+
+    @pytest.mark.asyncio
+    async def test_validate_vql_object_relationships(self, mock_auth_manager, mock_http_client):
+        """Relationship paths are checked against the object's relationships."""
+        mock_http_client.get = AsyncMock(
+            return_value={
+                "object": {
+                    "fields": [
+                        {"name": "id"},
+                        {"name": "product__c", "relationship_outbound_name": "product__cr"},
+                    ],
+                    "relationships": [{"relationship_name": "sites__cr"}],
+                }
+            }
+        )
+
+        tool = VQLValidateTool(mock_auth_manager, mock_http_client)
+        valid = await tool.execute(query="SELECT id, product__cr.name__v FROM study__c")
+        invalid = await tool.execute(query="SELECT id, country__cr.name__v FROM study__c")
+
+        assert valid.success
+        assert not invalid.success
+        assert "Unknown relationship 'country__cr'" in invalid.data["error"]
+
+    @pytest.mark.asyncio
+    async def test_validate_vql_metadata_unavailable(self, mock_auth_manager, mock_http_client):
+        """A metadata failure leaves the syntax check standing, with a warning."""
+        mock_http_client.get = AsyncMock(
+            side_effect=APIError(message="Server error", status_code=500)
+        )
+
+        tool = VQLValidateTool(mock_auth_manager, mock_http_client)
+        result = await tool.execute(query="SELECT id FROM documents")
+
+        assert result.success
+        assert result.data["fields_checked"] is False
+        assert result.data["warnings"]
+
+
+class TestVQLParser:
+    """Tests for the local VQL parser."""
+
+    def test_parse_clauses_and_target(self):
+        parsed = parse_vql(
+            "SELECT id, LONGTEXT(description__c), (SELECT id FROM documents__sysr) "
+            "FROM product__v WHERE status__v = 'active__v' ORDER BY name__v DESC PAGESIZE 50"
+        )
+
+        assert parsed.target == "product__v"
+        assert [ref.name for ref in parsed.fields()] == [
+            "id",
+            "description__c",
+            "status__v",
+            "name__v",
+        ]
+        assert parsed.clauses == {"PAGESIZE": 50}
+        assert parsed.subqueries()[0].target == "documents__sysr"
+
+    def test_order_by_rank_is_not_a_field(self):
+        parsed = parse_vql("SELECT id, name__v FROM documents FIND ('abc') ORDER BY rank DESC")
+
+        assert [ref.name for ref in parsed.fields()] == ["id", "name__v"]
+        assert check_fields(parsed, {"id", "name__v"}) == []
+
+    def test_limit_rewrite_ignores_strings_and_subqueries(self):
+        parsed = parse_vql(
+            "SELECT id FROM documents WHERE id IN (SELECT id FROM x__c LIMIT 5) "
+            "AND name__v = 'LIMIT 10' LIMIT 100"
+        )
+
+        assert parsed.with_clause("LIMIT", 50) == (
+            "SELECT id FROM documents WHERE id IN (SELECT id FROM x__c LIMIT 5) "
+            "AND name__v = 'LIMIT 10' LIMIT 50"
+        )
+
+    def test_and_where(self):
+        assert (
+            parse_vql("SELECT id FROM product__v ORDER BY id").and_where("id > 'A'")
+            == "SELECT id FROM product__v WHERE id > 'A' ORDER BY id"
+        )
+        assert (
+            parse_vql("SELECT id FROM product__v WHERE a__c = 1 OR b__c = 2").and_where("id > 'A'")
+            == "SELECT id FROM product__v WHERE (a__c = 1 OR b__c = 2) AND id > 'A'"
+        )
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "SELECT * FROM documents",
+            "SELECT id FROM",
+            "SELECT id FROM documents WHERE name__v = 'unterminated",
+            "SELECT id FROM documents LIMIT 5 LIMIT 6",
+            "SELECT id FROM documents WHERE name__v",
+            "SELECT id FROM documents extra",
+        ],
+    )
+    def test_syntax_errors(self, query):
+        with pytest.raises(QuerySyntaxError):
+            parse_vql(query)
 
 
 class TestVQLExecuteToolEnhancements:
@@ -347,3 +493,128 @@ class TestVQLExecuteToolEnhancements:
         assert "X-VaultAPI-DescribeQuery" not in headers
         assert "X-VaultAPI-RecordProperties" not in headers
         assert "X-VaultAPI-Facets" not in headers
+
+
+class FakeVaultQuery:
+    """Serves VQL range queries over an in-memory list of records."""
+
+    def __init__(self, ids, page_size_limit=None):
+        self.records = [{"id": record_id} for record_id in sorted(ids)]
+        self.page_size_limit = page_size_limit
+        self.pages = {}
+        self.queries = []
+
+    async def post(self, path, headers, data):
+        if path in self.pages:
+            return self.pages.pop(path)
+
+        query = data["q"]
+        self.queries.append(query)
+        rows = self.records
+        for op, value in re.findall(r"id (>=|<) '([^']*)'", query):
+            rows = [r for r in rows if (r["id"] >= value if op == ">=" else r["id"] < value)]
+        if "DESC" in query:
+            rows = rows[::-1]
+        page_size = int(re.search(r"PAGESIZE (\d+)", query).group(1))
+        return self._page(rows, page_size, len(rows))
+
+    def _page(self, rows, page_size, total):
+        details = {"total": total}
+        if len(rows) > page_size:
+            next_page = f"/api/v25.2/query/page-{len(self.pages)}-{rows[page_size]['id']}"
+            self.pages[next_page] = self._page(rows[page_size:], page_size, total)
+            details["next_page"] = next_page
+        return {"responseStatus": "SUCCESS", "data": rows[:page_size], "responseDetails": details}
+
+
+class TestVQLSharding:
+    """Tests for sharded VQL execution."""
+
+    def test_split_range(self):
+        """Test range boundaries for numbers, IDs and datetimes."""
+        assert split_range(0, 100, 4) == [25, 50, 75]
+        assert split_range(5, 5, 4) == []
+
+        ids = split_range("V0B000000000001", "V0B000000000Z00", 4)
+        assert ids == sorted(ids)
+        assert all("V0B000000000001" < b <= "V0B000000000Z00" for b in ids)
+        assert len(ids) == 3
+
+        dates = split_range("2025-01-01T00:00:00.000Z", "2025-01-05T00:00:00.000Z", 4)
+        assert dates == [
+            "2025-01-02T00:00:00.000Z",
+            "2025-01-03T00:00:00.000Z",
+            "2025-01-04T00:00:00.000Z",
+        ]
+
+    @pytest.mark.asyncio
+    async def test_shards_return_every_record_once(self):
+        """Test that shard ranges are disjoint and cover the whole range."""
+        ids = [f"V0B{n:012d}" for n in range(1, 401)]
+        vault = FakeVaultQuery(ids)
+
+        executor = ShardedVQLExecutor(
+            vault, "/api/v25.2/query", {}, "SELECT id FROM product__v WHERE status__v = 'active__v'",
+            shards=4, page_size=50,
+        )
+        records = [record["id"] async for record in executor.iter_records()]
+
+        assert sorted(records) == ids
+        assert executor.total == 400
+        assert executor.stats["records"] == 400
+        assert all("status__v = 'active__v'" in q for q in vault.queries)
+
+    @pytest.mark.asyncio
+    async def test_skewed_shard_is_split(self):
+        """Test that a shard holding most rows is split again."""
+        ids = [f"V0B{n:012d}" for n in range(1, 11)] + [f"V0B0000000{n:05d}" for n in range(90000, 90500)]
+        ids.append("V0BZZZZZZZZZZZZ")
+        vault = FakeVaultQuery(ids)
+
+        executor = ShardedVQLExecutor(
+            vault, "/api/v25.2/query", {}, "SELECT id FROM product__v", shards=4, page_size=100
+        )
+        records = [record["id"] async for record in executor.iter_records()]
+
+        assert sorted(records) == sorted(ids)
+        assert executor.stats["splits"] >= 1
+        assert executor.stats["shards"] > 4
+
+    @pytest.mark.asyncio
+    async def test_execute_tool_with_shards(self, mock_auth_manager):
+        """Test the execute tool's shards parameter."""
+        ids = [f"V0B{n:012d}" for n in range(1, 101)]
+        tool = VQLExecuteTool(mock_auth_manager, FakeVaultQuery(ids))
+
+        result = await tool.execute(query="SELECT id FROM product__v", shards=4)
+
+        assert result.success
+        assert result.data["count"] == 100
+        assert result.data["pagination"]["is_complete"]
+        assert result.data["sharding"]["shard_field"] == "id"
+
+    @pytest.mark.asyncio
+    async def test_execute_tool_shards_stop_at_max_rows(self, mock_auth_manager):
+        """Test that a sharded query returns at most max_rows rows and says it is incomplete."""
+        ids = [f"V0B{n:012d}" for n in range(1, 401)]
+        tool = VQLExecuteTool(mock_auth_manager, FakeVaultQuery(ids))
+
+        result = await tool.execute(query="SELECT id FROM product__v", shards=4, max_rows=120)
+
+        assert result.success
+        assert result.data["count"] == 120
+        assert len({r["id"] for r in result.data["results"]}) == 120
+        assert result.data["total"] == 400
+        assert not result.data["pagination"]["is_complete"]
+
+    @pytest.mark.asyncio
+    async def test_execute_tool_rejects_unshardable_query(self, mock_auth_manager, mock_http_client):
+        """Test that shards cannot be combined with ORDER BY or paging clauses."""
+        tool = VQLExecuteTool(mock_auth_manager, mock_http_client)
+
+        ordered = await tool.execute(query="SELECT id FROM product__v ORDER BY id", shards=4)
+        limited = await tool.execute(query="SELECT id FROM product__v LIMIT 10", shards=4)
+
+        assert not ordered.success
+        assert not limited.success
+        mock_http_client.post.assert_not_called()
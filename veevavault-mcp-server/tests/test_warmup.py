@@ -0,0 +1,319 @@
+"""
+Tests for the response cache, startup warm-up and readiness reporting.
+"""
+
+import asyncio
+import json
+import sqlite3
+from unittest.mock import AsyncMock, MagicMock
+
+import httpx
+import pytest
+
+from veevavault_mcp.server import VeevaVaultMCPServer
+from veevavault_mcp.utils.cache import MemoryCache, create_cache
+from veevavault_mcp.utils.errors import APIError, AuthenticationError
+from veevavault_mcp.utils.http import VaultHTTPClient
+from veevavault_mcp.warmup import (
+    PREFETCH_PATHS,
+    ReadinessReport,
+    ServerWarmup,
+    remove_readiness_file,
+    write_readiness_file,
+)
+
+
+@pytest.fixture
+def mock_auth_manager():
+    """Create mock auth manager."""
+    auth_manager = AsyncMock()
+    auth_manager.get_session = AsyncMock(return_value=MagicMock(session_id="test-session"))
+    auth_manager.get_auth_headers = MagicMock(return_value={"Authorization": "test-session"})
+    return auth_manager
+
+
+@pytest.fixture
+def mock_http_client():
+    """Create mock HTTP client."""
+    http_client = AsyncMock()
+    http_client.get = AsyncMock(return_value={"responseStatus": "SUCCESS"})
+    http_client.content_cache = None
+    return http_client
+
+
+class TestMemoryCache:
+    """Tests for MemoryCache."""
+
+    def test_get_and_set(self):
+        """Stored values are returned as copies."""
+        cache = MemoryCache(ttl=60)
+        value = {"data": [1, 2]}
+        cache.set("key", value)
+
+        cached = cache.get("key")
+        cached["data"].append(3)
+
+        assert cache.get("key") == {"data": [1, 2]}
+        assert cache.hits == 2
+
+    def test_expired_entries_are_misses(self):
+        """Entries past their TTL are dropped."""
+        cache = MemoryCache(ttl=60)
+        cache.set("key", "value", ttl=0)
+
+        assert cache.get("key") is None
+        assert "key" not in cache
+        assert cache.misses == 1
+
+    def test_lru_eviction(self):
+        """The least recently used entry is evicted first."""
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert "a" in cache
+        assert "b" not in cache
+        assert len(cache) == 2
+
+    def test_make_key_sorts_params(self):
+        """Keys do not depend on parameter order."""
+        assert MemoryCache.make_key("get", "/x", {"b": 1, "a": 2}) == MemoryCache.make_key(
+            "GET", "/x", {"a": 2, "b": 1}
+        )
+
+    def test_create_cache_disabled(self, config_username_password):
+        """No cache is created when caching is disabled."""
+        config_username_password.enable_caching = False
+
+        assert create_cache(config_username_password) is None
+
+    def test_create_cache_uses_ttl(self, config_username_password):
+        """The cache uses the configured TTL."""
+        cache = create_cache(config_username_password)
+
+        assert cache.ttl == config_username_password.cache_ttl
+
+
+class TestHTTPClientCaching:
+    """Tests for metadata response caching in VaultHTTPClient."""
+
+    @pytest.fixture
+    def client(self):
+        client = VaultHTTPClient("https://test-vault.veevavault.com", cache=MemoryCache())
+        client._client = AsyncMock()
+        client._client.request = AsyncMock(
+            return_value=httpx.Response(200, json={"responseStatus": "SUCCESS", "data": []})
+        )
+        return client
+
+    @pytest.mark.asyncio
+    async def test_metadata_get_is_cached(self, client):
+        """Repeated metadata GETs are served from the cache."""
+        path = PREFETCH_PATHS["objects"]
+
+        first = await client.get(path)
+        second = await client.get(path)
+
+        assert first == second
+        assert client._client.request.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_record_get_is_not_cached(self, client):
+        """Non-metadata GETs always go to Vault."""
+        await client.get("/api/v25.2/objects/documents/1")
+        await client.get("/api/v25.2/objects/documents/1")
+
+        assert client._client.request.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failures_are_not_cached(self, client):
+        """Error responses are not stored."""
+        client._client.request = AsyncMock(
+            return_value=httpx.Response(500, json={"responseStatus": "FAILURE"})
+        )
+
+        with pytest.raises(APIError):
+            await client.get(PREFETCH_PATHS["objects"])
+
+        assert len(client.cache) == 0
+
+
+class TestServerWarmup:
+    """Tests for ServerWarmup."""
+
+    @pytest.mark.asyncio
+    async def test_successful_warmup(
+        self, config_username_password, mock_auth_manager, mock_http_client
+    ):
+        """All steps succeed and the server is ready."""
+        config_username_password.warmup_picklists = "country__v"
+        warmup = ServerWarmup(config_username_password, mock_auth_manager, mock_http_client)
+
+        report = await warmup.run()
+
+        assert report.ready is True
+        assert set(report.steps) == {
+            "connect",
+            "authenticate",
+            "prefetch:objects",
+            "prefetch:document_types",
+            "prefetch:picklist:country__v",
+        }
+        assert all(step["status"] == "ok" for step in report.steps.values())
+        fetched = [call.args[0] for call in mock_http_client.get.await_args_list]
+        assert PREFETCH_PATHS["objects"] in fetched
+        assert "/api/v25.2/objects/picklists/country__v" in fetched
+
+    @pytest.mark.asyncio
+    async def test_connect_ignores_http_errors(
+        self, config_username_password, mock_auth_manager, mock_http_client
+    ):
+        """An HTTP error response still proves the connection is open."""
+        mock_http_client.get = AsyncMock(
+            side_effect=[APIError("Not found", status_code=404)]
+            + [{"responseStatus": "SUCCESS"}] * 2
+        )
+        warmup = ServerWarmup(config_username_password, mock_auth_manager, mock_http_client)
+
+        report = await warmup.run()
+
+        assert report.steps["connect"]["status"] == "ok"
+        assert report.ready is True
+
+    @pytest.mark.asyncio
+    async def test_auth_failure_skips_prefetch(
+        self, config_username_password, mock_auth_manager, mock_http_client
+    ):
+        """Prefetch is skipped and the server is not ready when auth fails."""
+        mock_auth_manager.get_session = AsyncMock(
+            side_effect=AuthenticationError("Invalid credentials")
+        )
+        warmup = ServerWarmup(config_username_password, mock_auth_manager, mock_http_client)
+
+        report = await warmup.run()
+
+        assert report.ready is False
+        assert report.steps["authenticate"]["status"] == "failed"
+        assert "Invalid credentials" in report.steps["authenticate"]["error"]
+        assert report.steps["prefetch:objects"]["status"] == "skipped"
+
+    @pytest.mark.asyncio
+    async def test_prefetch_failure_does_not_block_readiness(
+        self, config_username_password, mock_auth_manager, mock_http_client
+    ):
+        """A failed prefetch is reported but the server is still ready."""
+
+        async def get(path, **kwargs):
+            if path == PREFETCH_PATHS["document_types"]:
+                raise APIError("Server error", status_code=500)
+            return {"responseStatus": "SUCCESS"}
+
+        mock_http_client.get = AsyncMock(side_effect=get)
+        warmup = ServerWarmup(config_username_password, mock_auth_manager, mock_http_client)
+
+        report = await warmup.run()
+
+        assert report.ready is True
+        assert report.steps["prefetch:document_types"]["status"] == "failed"
+
+    @pytest.mark.asyncio
+    async def test_timeout(self, config_username_password, mock_auth_manager, mock_http_client):
+        """Warm-up stops at the timeout and reports not ready."""
+
+        async def hang():
+            await asyncio.sleep(10)
+
+        mock_auth_manager.get_session = AsyncMock(side_effect=hang)
+        config_username_password.warmup_timeout = 0.05
+        warmup = ServerWarmup(config_username_password, mock_auth_manager, mock_http_client)
+
+        report = await warmup.run()
+
+        assert report.ready is False
+        assert report.steps["timeout"]["status"] == "failed"
+
+
+class TestReadinessFile:
+    """Tests for the readiness file."""
+
+    def test_written_when_ready(self, tmp_path):
+        """A ready report is written as JSON."""
+        path = tmp_path / "ready"
+        report = ReadinessReport()
+        report.record("connect", "ok", 0.1)
+        report.record("authenticate", "ok", 0.2)
+        report.finish()
+
+        write_readiness_file(str(path), report)
+
+        assert json.loads(path.read_text())["ready"] is True
+
+    def test_removed_when_not_ready(self, tmp_path):
+        """A stale file is removed when the server is not ready."""
+        path = tmp_path / "ready"
+        path.write_text("{}")
+        report = ReadinessReport()
+        report.record("connect", "ok", 0.1)
+        report.finish()
+
+        write_readiness_file(str(path), report)
+
+        assert not path.exists()
+
+    def test_remove_missing_file(self, tmp_path):
+        """Removing a missing file is a no-op."""
+        remove_readiness_file(str(tmp_path / "ready"))
+
+
+class TestServerReadiness:
+    """Tests for readiness reporting in the server."""
+
+    @pytest.mark.asyncio
+    async def test_ready_immediately_without_warmup(self, config_username_password):
+        """Without warm-up the server reports ready after initialize."""
+        server = VeevaVaultMCPServer(config_username_password)
+        await server.initialize()
+        try:
+            report = await server.wait_until_ready(timeout=1)
+
+            assert report.ready is True
+            assert isinstance(server.http_client.cache, MemoryCache)
+        finally:
+            await server.cleanup()
+
+    @pytest.mark.asyncio
+    async def test_cleanup_closes_download_cache(self, config_username_password, tmp_path):
+        """Cleanup closes the download cache index."""
+        config_username_password.download_cache_enabled = True
+        config_username_password.download_cache_dir = str(tmp_path / "cache")
+        server = VeevaVaultMCPServer(config_username_password)
+        await server.initialize()
+        content_cache = server.http_client.content_cache
+
+        await server.cleanup()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            content_cache.size()
+
+    @pytest.mark.asyncio
+    async def test_warmup_writes_readiness_file(
+        self, config_username_password, mock_auth_manager, mock_http_client, tmp_path
+    ):
+        """Warm-up publishes its report to the readiness file in Kubernetes mode."""
+        config_username_password.kubernetes_mode = True
+        config_username_password.readiness_file = str(tmp_path / "ready")
+        server = VeevaVaultMCPServer(config_username_password)
+        server.auth_manager = mock_auth_manager
+        server.http_client = mock_http_client
+
+        await server._warm_up()
+
+        assert server.readiness.ready is True
+        assert (tmp_path / "ready").exists()
+        assert (await server.wait_until_ready(timeout=1)) is server.readiness
+
+        await server.cleanup()
+
+        assert not (tmp_path / "ready").exists()